@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+PyBit Bot Market Data Publisher - Run the shared market data feed for all bots on this host
+
+Engines read from it when their config sets
+`general.data.shared_memory.role` to "subscriber".
+"""
+import os
+import sys
+import argparse
+import asyncio
+import signal
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClientTransport
+from pybit_bot.managers.market_data_publisher import MarketDataPublisher
+from pybit_bot.utils.config_loader import ConfigLoader
+from pybit_bot.utils.credentials import load_credentials
+from pybit_bot.utils.logger import Logger
+
+async def run_publisher(config_dir, symbols=None):
+    """Run the publisher until SIGINT or SIGTERM"""
+    logger = Logger("PublisherRunner")
+    
+    config = ConfigLoader(config_dir, logger=logger).load_configs()
+    trading_config = config.get('general', {}).get('trading', {})
+    system_config = config.get('general', {}).get('system', {})
+    
+    client = BybitClientTransport(
+        load_credentials(logger=logger),
+        recv_window=system_config.get('recv_window', 5000),
+        base_url=system_config.get('rest_url')
+    )
+    publisher = MarketDataPublisher(client, config, logger=logger)
+    publisher.subscribe(symbols or trading_config.get('symbols', []), trading_config.get('timeframes', []))
+    
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+        
+    try:
+        if not await publisher.start():
+            logger.warning("Initial market data load incomplete; continuing with the stream")
+        logger.info("Market data publisher running")
+        await stop.wait()
+        logger.info("Received termination signal. Shutting down...")
+    finally:
+        await publisher.stop()
+        await client.close()
+        logger.info("Market data publisher stopped.")
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="PyBit Bot Market Data Publisher")
+    parser.add_argument("--config", "-c", default=None, help="Path to config directory")
+    parser.add_argument("--symbols", "-s", nargs="*", help="Symbols to publish (default: trading.symbols)")
+    
+    args = parser.parse_args()
+    asyncio.run(run_publisher(args.config, args.symbols))
+
+if __name__ == "__main__":
+    main()
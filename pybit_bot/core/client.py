@@ -5,36 +5,55 @@ This module provides reliable API communication with error handling,
 retry logic, and rate limiting. It serves as the foundation for all
 exchange interactions.
 
+All async methods share one long-lived aiohttp session with a bounded,
+keep-alive connection pool. The blocking requests session is only used
+by the synchronous helpers (e.g. sync_get_instruments_info).
+
 Example usage:
     credentials = APICredentials(api_key="your_key", api_secret="your_secret", testnet=True)
     client = BybitClient(credentials)
     
+    # Sign with the exchange clock (re-synced in the background)
+    await client.start_clock_sync()
+    
     # Use async methods
     server_time = await client.get_server_time()
     
     # Or make raw requests
     params = {"category": "linear", "symbol": "BTCUSDT"}
     ticker = await client.raw_request("GET", "/v5/market/tickers", params)
+    
+    # Release pooled connections when done
+    await client.close()
 """
 
 import time
-import hmac
-import hashlib
-import json
 import urllib.parse
 import aiohttp
 import asyncio
 import requests
-from typing import Dict, List, Optional, Any, Union
+import numpy as np
+from yarl import URL
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass
 import logging
 
 from ..utils.logger import Logger
+from .rate_limiter import RateLimiter
+from .request_scheduler import RequestScheduler, RequestPriority
+from .request_coalescer import RequestCoalescer
+from .retry_policy import RetryPolicy, CircuitBreaker
+from .clock_sync import ClockSync
+from . import codec
+from .pagination import iter_cursor, iter_windows, split_time_range, to_bybit_interval, interval_to_ms
 from ..exceptions import (
     BybitAPIError, 
     AuthenticationError, 
     RateLimitError, 
-    ConnectionError
+    ConnectionError,
+    ServerError,
+    CircuitOpenError,
+    TimestampError
 )
 
 @dataclass
@@ -55,34 +74,81 @@ class BybitClient:
     MAINNET_REST_URL = "https://api.bybit.com"
     TESTNET_REST_URL = "https://api-testnet.bybit.com"
     
-    def __init__(self, credentials: APICredentials, logger: Optional[Logger] = None):
+    # Failures worth retrying (if the request is idempotent)
+    TRANSIENT_ERRORS = (ServerError, aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+    
+    def __init__(self, credentials: APICredentials, logger: Optional[Logger] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 coalescer: Optional[RequestCoalescer] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 recv_window: int = 5000,
+                 clock_sync_interval: float = 60.0,
+                 base_url: Optional[str] = None):
         """
         Initialize the client with API credentials
         
         Args:
             credentials: API credentials for authentication
             logger: Optional logger instance
+            rate_limiter: Optional shared rate limiter for the async transport
+            scheduler: Optional priority scheduler for the async transport
+            coalescer: Optional single-flight coalescer for async GET requests
+            retry_policy: Optional retry/backoff policy
+            circuit_breaker: Optional circuit breaker shared by all requests
+            recv_window: Milliseconds a signed request stays valid on the exchange
+            clock_sync_interval: Seconds between background server-time syncs
+            base_url: Optional REST URL override (e.g. a local mock exchange)
         """
         self.api_key = credentials.api_key
         self.api_secret = credentials.api_secret
         self.testnet = credentials.testnet
-        self.base_url = self.TESTNET_REST_URL if self.testnet else self.MAINNET_REST_URL
+        self.base_url = base_url or (self.TESTNET_REST_URL if self.testnet else self.MAINNET_REST_URL)
         self.logger = logger or Logger("BybitTransport")
+        self._signer = codec.HmacSigner(self.api_secret)
         
-        # Setup session for HTTP requests
+        # Setup session for synchronous HTTP requests
         self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'X-BAPI-API-KEY': self.api_key
-        })
+        self.session.headers.update(self._default_headers())
+        
+        # Async transport: one pooled aiohttp session, created lazily on the
+        # event loop that first uses it
+        self.pool_size = 100  # Max open connections in total
+        self.pool_size_per_host = 50  # Max open connections to the API host
+        self.dns_cache_ttl = 300  # seconds
+        self.keepalive_timeout = 30.0  # seconds
+        self.request_timeout = 10.0  # seconds
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Rate limiting settings
+        # Rate limiting settings for the sync path
         self.request_interval = 0.05  # 50ms minimum between requests (20 requests per second max)
         self.last_request_time = 0
         
-        # Retry settings
-        self.max_retries = 3
-        self.retry_delay = 1.0  # seconds
+        # Token-bucket rate limiting per endpoint group for the async path
+        self.rate_limiter = rate_limiter or RateLimiter(logger=self.logger)
+        
+        # Priority scheduling so order calls pre-empt market-data polling
+        self.scheduler = scheduler or RequestScheduler(logger=self.logger)
+        
+        # Identical concurrent GETs share one round trip (plus a short TTL
+        # for endpoints polled by several components)
+        self.coalescer = coalescer or RequestCoalescer(logger=self.logger)
+        
+        # Retry settings: jittered backoff, only idempotent requests are repeated
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        # Fail fast while the exchange keeps returning 5xx or timing out
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(logger=self.logger)
+        
+        # Signed timestamps come from the exchange clock estimate
+        self.recv_window = recv_window
+        self.clock = ClockSync(
+            lambda: self._send_request("GET", "/v5/server/time", {}, False),
+            interval=clock_sync_interval,
+            logger=self.logger
+        )
         
         # Log initialization
         network_type = "testnet" if self.testnet else "mainnet"
@@ -106,7 +172,7 @@ class BybitClient:
         Args:
             category: Product category (linear, inverse, spot)
             symbol: Trading symbol (e.g., BTCUSDT)
-            interval: Kline interval (1m, 5m, 1h, etc.)
+            interval: Kline interval (1m, 5m, 1h, etc. or Bybit's 1, 5, 60)
             limit: Number of candles to return (default 200, max 1000)
             start: Start timestamp in milliseconds
             end: End timestamp in milliseconds
@@ -120,7 +186,7 @@ class BybitClient:
         params = {
             "category": category,
             "symbol": symbol,
-            "interval": interval,
+            "interval": to_bybit_interval(interval),
             "limit": limit
         }
         
@@ -130,7 +196,48 @@ class BybitClient:
         if end:
             params["end"] = end
             
-        return await self.raw_request("GET", "/v5/market/klines", params, auth_required=False)
+        return await self.raw_request("GET", "/v5/market/kline", params, auth_required=False)
+        
+    async def get_klines_array(self, category: str, symbol: str, interval: str,
+                               limit: int = 200, start: Optional[int] = None,
+                               end: Optional[int] = None) -> np.ndarray:
+        """
+        Get candlestick/kline data decoded straight into a numpy array
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval (1m, 5m, 1h, etc. or Bybit's 1, 5, 60)
+            limit: Number of candles to return (default 200, max 1000)
+            start: Start timestamp in milliseconds
+            end: End timestamp in milliseconds
+            
+        Returns:
+            float64 array of shape (n, 7) with columns codec.KLINE_COLUMNS,
+            oldest bar first (empty on API error)
+        """
+        params = {
+            "category": category,
+            "symbol": symbol,
+            "interval": to_bybit_interval(interval),
+            "limit": limit
+        }
+        
+        if start:
+            params["start"] = start
+            
+        if end:
+            params["end"] = end
+            
+        response = await self.raw_request(
+            "GET", "/v5/market/kline", params, auth_required=False,
+            decoder=codec.decode_klines_response
+        )
+        
+        if response.get("retCode") != 0 or not response.get("result"):
+            return codec.klines_to_array(None)
+            
+        return response["result"]["list"]
     
     async def get_orderbook(self, category: str, symbol: str, limit: int = 50) -> Dict:
         """
@@ -206,13 +313,15 @@ class BybitClient:
             
         return self._sync_raw_request("GET", "/v5/market/instruments-info", params, auth_required=False)
     
-    async def get_positions(self, category: str = "linear", symbol: Optional[str] = None) -> Dict:
+    async def get_positions(self, category: str = "linear", symbol: Optional[str] = None,
+                            cursor: Optional[str] = None) -> Dict:
         """
-        Get current positions
+        Get current positions (one page)
         
         Args:
             category: Product category (linear, inverse, spot)
             symbol: Optional trading symbol to filter
+            cursor: Optional nextPageCursor from the previous page
             
         Returns:
             Dictionary with position information
@@ -225,6 +334,9 @@ class BybitClient:
         if symbol:
             params["symbol"] = symbol
             
+        if cursor:
+            params["cursor"] = cursor
+            
         return await self.raw_request("GET", "/v5/position/list", params)
     
     async def get_wallet_balance(self, account_type: str = "UNIFIED") -> Dict:
@@ -240,13 +352,22 @@ class BybitClient:
         params = {"accountType": account_type}
         return await self.raw_request("GET", "/v5/account/wallet-balance", params)
     
-    async def get_open_orders(self, category: str = "linear", symbol: Optional[str] = None) -> Dict:
+    async def get_open_orders(self, category: str = "linear", symbol: Optional[str] = None,
+                              cursor: Optional[str] = None, settle_coin: Optional[str] = None,
+                              order_id: Optional[str] = None, order_link_id: Optional[str] = None) -> Dict:
         """
-        Get active orders
+        Get active orders (one page)
+        
+        Linear and inverse queries need a symbol, a settle coin or an order ID.
+        Queried by ID, recently closed orders are returned as well.
         
         Args:
             category: Product category (linear, inverse, spot)
             symbol: Optional trading symbol to filter
+            cursor: Optional nextPageCursor from the previous page
+            settle_coin: Optional settle coin (e.g. "USDT") to query all its symbols
+            order_id: Optional order ID to filter
+            order_link_id: Optional client order ID to filter
             
         Returns:
             Dictionary with open orders
@@ -256,18 +377,31 @@ class BybitClient:
         if symbol:
             params["symbol"] = symbol
             
+        if settle_coin:
+            params["settleCoin"] = settle_coin
+            
+        if order_id:
+            params["orderId"] = order_id
+        elif order_link_id:
+            params["orderLinkId"] = order_link_id
+            
+        if cursor:
+            params["cursor"] = cursor
+            
         return await self.raw_request("GET", "/v5/order/realtime", params)
     
     async def get_order_history(self, category: str = "linear", symbol: Optional[str] = None, 
-                                limit: int = 50, order_id: Optional[str] = None) -> Dict:
+                                limit: int = 50, order_id: Optional[str] = None,
+                                cursor: Optional[str] = None) -> Dict:
         """
-        Get historical orders
+        Get historical orders (one page)
         
         Args:
             category: Product category (linear, inverse, spot)
             symbol: Optional trading symbol to filter
             limit: Number of orders to return
             order_id: Optional order ID to filter
+            cursor: Optional nextPageCursor from the previous page
             
         Returns:
             Dictionary with order history
@@ -283,8 +417,168 @@ class BybitClient:
         if order_id:
             params["orderId"] = order_id
             
+        if cursor:
+            params["cursor"] = cursor
+            
         return await self.raw_request("GET", "/v5/order/history", params)
     
+    async def get_executions(self, category: str = "linear", symbol: Optional[str] = None,
+                             limit: int = 100, start_time: Optional[int] = None,
+                             end_time: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
+        """
+        Get trade executions (one page)
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Optional trading symbol to filter
+            limit: Number of executions to return (max 100)
+            start_time: Optional start timestamp in milliseconds
+            end_time: Optional end timestamp in milliseconds
+            cursor: Optional nextPageCursor from the previous page
+            
+        Returns:
+            Dictionary with executions
+        """
+        params = {
+            "category": category,
+            "limit": limit
+        }
+        
+        if symbol:
+            params["symbol"] = symbol
+            
+        if start_time:
+            params["startTime"] = start_time
+            
+        if end_time:
+            params["endTime"] = end_time
+            
+        if cursor:
+            params["cursor"] = cursor
+            
+        return await self.raw_request("GET", "/v5/execution/list", params)
+    
+    async def iter_klines(self, category: str, symbol: str, interval: str,
+                          start: int, end: int, limit: int = 1000,
+                          concurrency: int = 4) -> AsyncIterator[np.ndarray]:
+        """
+        Stream klines for a time range of any length
+        
+        The range is split into windows of `limit` bars that are fetched
+        concurrently (at most `concurrency` at a time) and yielded in order.
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval (1m, 5m, 1h, etc. or Bybit's 1, 5, 60)
+            start: Start timestamp in milliseconds
+            end: End timestamp in milliseconds (inclusive)
+            limit: Bars per request (max 1000)
+            concurrency: Maximum number of windows in flight
+            
+        Yields:
+            float64 arrays of shape (n, 7) (codec.KLINE_COLUMNS), oldest first
+            
+        Raises:
+            BybitAPIError: If a window returns an API error
+        """
+        bybit_interval = to_bybit_interval(interval)
+        windows = split_time_range(start, end, interval_to_ms(interval) * limit)
+        
+        async def fetch_window(window_start: int, window_end: int) -> np.ndarray:
+            params = {
+                "category": category,
+                "symbol": symbol,
+                "interval": bybit_interval,
+                "start": window_start,
+                "end": window_end,
+                "limit": limit
+            }
+            response = await self.raw_request(
+                "GET", "/v5/market/kline", params, auth_required=False,
+                decoder=codec.decode_klines_response
+            )
+            if response.get("retCode") != 0:
+                raise BybitAPIError(f"Error fetching klines for {symbol} {interval}: {response.get('retMsg')}")
+            return (response.get("result") or {}).get("list", codec.klines_to_array(None))
+            
+        async for page in iter_windows(fetch_window, windows, concurrency):
+            if len(page):
+                yield page
+                
+    def iter_order_history(self, category: str = "linear", symbol: Optional[str] = None,
+                           limit: int = 50) -> AsyncIterator[Dict]:
+        """
+        Stream all historical orders, following nextPageCursor
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Optional trading symbol to filter
+            limit: Orders per page (max 50)
+            
+        Returns:
+            Async iterator of order dictionaries
+        """
+        return iter_cursor(
+            lambda cursor: self.get_order_history(category, symbol, limit, cursor=cursor),
+            "order history"
+        )
+        
+    def iter_executions(self, category: str = "linear", symbol: Optional[str] = None,
+                        limit: int = 100, start_time: Optional[int] = None,
+                        end_time: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Stream all executions, following nextPageCursor
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Optional trading symbol to filter
+            limit: Executions per page (max 100)
+            start_time: Optional start timestamp in milliseconds
+            end_time: Optional end timestamp in milliseconds
+            
+        Returns:
+            Async iterator of execution dictionaries
+        """
+        return iter_cursor(
+            lambda cursor: self.get_executions(category, symbol, limit, start_time, end_time, cursor),
+            "executions"
+        )
+        
+    def iter_open_orders(self, category: str = "linear", symbol: Optional[str] = None,
+                         settle_coin: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Stream all active orders, following nextPageCursor
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Optional trading symbol to filter
+            settle_coin: Optional settle coin (e.g. "USDT") to query all its symbols
+            
+        Returns:
+            Async iterator of order dictionaries
+        """
+        return iter_cursor(
+            lambda cursor: self.get_open_orders(category, symbol, cursor=cursor, settle_coin=settle_coin),
+            "open orders"
+        )
+        
+    def iter_positions(self, category: str = "linear", symbol: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Stream all positions, following nextPageCursor
+        
+        Args:
+            category: Product category (linear, inverse, spot)
+            symbol: Optional trading symbol to filter
+            
+        Returns:
+            Async iterator of position dictionaries
+        """
+        return iter_cursor(
+            lambda cursor: self.get_positions(category, symbol, cursor=cursor),
+            "positions"
+        )
+    
     async def place_order(self, params: Dict) -> Dict:
         """
         Place an order
@@ -336,6 +630,72 @@ class BybitClient:
         """
         return await self.raw_request("POST", "/v5/order/amend", params)
     
+    async def place_batch_order(self, category: str, requests: List[Dict]) -> Dict:
+        """
+        Place multiple orders in one request
+        
+        Args:
+            category: Product category (linear, inverse, spot, option)
+            requests: List of order parameter dictionaries (without category)
+            
+        Returns:
+            Dictionary with per-order results in result.list and
+            per-order status codes in retExtInfo.list
+            
+        References:
+            https://bybit-exchange.github.io/docs/v5/order/batch-place
+        """
+        params = {
+            "category": category,
+            "request": requests
+        }
+        
+        return await self.raw_request("POST", "/v5/order/create-batch", params)
+    
+    async def amend_batch_order(self, category: str, requests: List[Dict]) -> Dict:
+        """
+        Amend multiple orders in one request
+        
+        Args:
+            category: Product category (linear, inverse, spot, option)
+            requests: List of amendment dictionaries, each with orderId or orderLinkId
+            
+        Returns:
+            Dictionary with per-order results in result.list and
+            per-order status codes in retExtInfo.list
+            
+        References:
+            https://bybit-exchange.github.io/docs/v5/order/batch-amend
+        """
+        params = {
+            "category": category,
+            "request": requests
+        }
+        
+        return await self.raw_request("POST", "/v5/order/amend-batch", params)
+    
+    async def cancel_batch_order(self, category: str, requests: List[Dict]) -> Dict:
+        """
+        Cancel multiple orders in one request
+        
+        Args:
+            category: Product category (linear, inverse, spot, option)
+            requests: List of dictionaries with symbol and orderId or orderLinkId
+            
+        Returns:
+            Dictionary with per-order results in result.list and
+            per-order status codes in retExtInfo.list
+            
+        References:
+            https://bybit-exchange.github.io/docs/v5/order/batch-cancel
+        """
+        params = {
+            "category": category,
+            "request": requests
+        }
+        
+        return await self.raw_request("POST", "/v5/order/cancel-batch", params)
+    
     async def set_trading_stop(self, params: Dict) -> Dict:
         """
         Set trading stop (take profit, stop loss) for a position
@@ -349,7 +709,10 @@ class BybitClient:
         return await self.raw_request("POST", "/v5/position/trading-stop", params)
 
     async def raw_request(self, method: str, path: str, params: Dict, 
-                         auth_required: bool = True) -> Dict:
+                         auth_required: bool = True,
+                         priority: Optional[RequestPriority] = None,
+                         deadline: Optional[float] = None,
+                         decoder: Optional[Callable[[bytes], Dict]] = None) -> Dict:
         """
         Make a raw API request to Bybit
         
@@ -358,6 +721,10 @@ class BybitClient:
             path: API endpoint path
             params: Request parameters
             auth_required: Whether authentication is required
+            priority: Optional priority class (derived from the path if omitted)
+            deadline: Optional seconds after which the request is dropped
+                if it is still queued
+            decoder: Optional response body decoder (default codec.loads)
             
         Returns:
             Dictionary with API response
@@ -367,116 +734,387 @@ class BybitClient:
             AuthenticationError: On authentication error
             RateLimitError: On rate limit exceeded
             ConnectionError: On connection error
+            RequestDroppedError: If the request was dropped by the scheduler
         """
-        # Convert to async implementation
-        try:
-            return await asyncio.to_thread(
-                self._sync_raw_request, method, path, params, auth_required
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+            
+        if priority is None:
+            priority = self.scheduler.classify(path)
+            
+        def send() -> Any:
+            return self.scheduler.submit(
+                lambda: self._send_request(method, path, params, auth_required, decoder),
+                priority,
+                deadline
             )
-        except Exception as e:
-            self.logger.error(f"Error in raw_request: {str(e)}")
-            raise
-
-    def _sync_raw_request(self, method: str, path: str, params: Dict, 
-                         auth_required: bool = True) -> Dict:
+            
+        if method == "GET":
+            key = self.coalescer.make_key(path, params, auth_required, decoder)
+            return await self.coalescer.run(key, path, send)
+            
+        try:
+            return await send()
+        finally:
+            # Reads issued after a write must not see pre-write state
+            self.coalescer.invalidate(path)
+    
+    async def _send_request(self, method: str, path: str, params: Dict,
+                            auth_required: bool,
+                            decoder: Optional[Callable[[bytes], Dict]] = None) -> Dict:
         """
-        Synchronous implementation of raw API request
+        Send a request, re-syncing the clock once if the timestamp is rejected
         
         Args:
-            method: HTTP method (GET, POST, etc.)
+            method: HTTP method (GET or POST)
             path: API endpoint path
             params: Request parameters
             auth_required: Whether authentication is required
+            decoder: Optional response body decoder
             
         Returns:
             Dictionary with API response
         """
-        # Apply rate limiting
-        self._apply_rate_limit()
+        try:
+            return await self._send_with_retries(method, path, params, auth_required, decoder)
+        except TimestampError as e:
+            # The request was rejected before execution, so even
+            # non-idempotent requests are safe to send again
+            self.logger.warning(f"Timestamp rejected for {path}, re-syncing clock: {str(e)}")
+            await self.clock.sync()
+            return await self._send_with_retries(method, path, params, auth_required, decoder)
+            
+    async def _send_with_retries(self, method: str, path: str, params: Dict,
+                                 auth_required: bool,
+                                 decoder: Optional[Callable[[bytes], Dict]] = None) -> Dict:
+        """
+        Sign and send a request over the pooled session, with retries
+        
+        Args:
+            method: HTTP method (GET or POST)
+            path: API endpoint path
+            params: Request parameters
+            auth_required: Whether authentication is required
+            decoder: Optional response body decoder
+            
+        Returns:
+            Dictionary with API response
+        """
+        session = await self._get_async_session()
+        
+        retryable = self.retry_policy.is_retryable(method, path, params)
+        max_attempts = self.retry_policy.max_attempts if retryable else 1
+        
+        # Make request with retry logic
+        for attempt in range(1, max_attempts + 1):
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open, not sending {method} {path}")
+                
+            try:
+                # Wait for the endpoint group's rate budget without blocking the loop
+                await self.rate_limiter.acquire(path)
+                
+                # Sign per attempt so retries carry a fresh timestamp
+                url, full_url, payload = self._prepare_request(method, path, params, auth_required)
+                self.logger.debug(f"Request: {method} {full_url}")
+                
+                if method == "GET":
+                    request_ctx = session.get(URL(full_url, encoded=True))
+                else:
+                    request_ctx = session.post(url, data=payload)
+                
+                async with request_ctx as response:
+                    self.rate_limiter.update_from_headers(path, response.headers)
+                    body = await response.read()
+                    status = response.status
+                    
+                result = self._handle_response(status, body, decoder)
+                self.circuit_breaker.record_success()
+                return result
+                
+            except self.TRANSIENT_ERRORS as e:
+                # Server errors, timeouts and broken responses count against the breaker
+                self.circuit_breaker.record_failure()
+                
+                if attempt < max_attempts:
+                    retry_delay = self.retry_policy.compute_delay(attempt)
+                    self.logger.warning(f"Request failed, retrying in {retry_delay:.2f}s: {str(e)}")
+                    await asyncio.sleep(retry_delay)
+                else:
+                    if not retryable:
+                        self.logger.error(f"{method} {path} failed and is not safe to retry: {str(e)}")
+                    else:
+                        self.logger.error(f"Request failed after {max_attempts} attempts: {str(e)}")
+                    raise ConnectionError(f"Failed to connect to Bybit API: {str(e)}")
+                
+            except RateLimitError:
+                # Exchange is responding; don't retry, hold back this endpoint group
+                self.circuit_breaker.record_success()
+                self.rate_limiter.penalize(path)
+                raise
+                
+            except BybitAPIError:
+                # Auth and other client errors are not transient
+                self.circuit_breaker.record_success()
+                raise
+                
+            except asyncio.CancelledError:
+                self.circuit_breaker.abandon()
+                raise
+    
+    def get_transport_metrics(self) -> Dict[str, Any]:
+        """
+        Get scheduler, rate limiter, coalescing, circuit breaker and clock metrics
+        
+        Returns:
+            Dictionary with 'scheduler', 'rate_limiter', 'coalescer',
+            'circuit_breaker' and 'clock' (skew/RTT) metrics
+        """
+        return {
+            "scheduler": self.scheduler.get_metrics(),
+            "rate_limiter": self.rate_limiter.get_stats(),
+            "coalescer": dict(self.coalescer.stats),
+            "circuit_breaker": self.circuit_breaker.get_stats(),
+            "clock": self.clock.get_stats()
+        }
+    
+    async def start_clock_sync(self) -> bool:
+        """
+        Sync with the exchange clock now and keep re-syncing in the background
+        
+        Must be called on the event loop that sends the requests; close()
+        stops the background task.
+        
+        Returns:
+            True if the initial sync succeeded
+        """
+        synced = await self.clock.sync()
+        self.clock.start()
+        return synced
+    
+    async def close(self) -> None:
+        """
+        Close the pooled async HTTP session and the sync session
+        """
+        await self.clock.stop()
+        
+        session = self._async_session
+        self._async_session = None
+        self.coalescer.clear()
+        
+        if session is not None and not session.closed:
+            try:
+                current_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                current_loop = None
+                
+            if current_loop is self._async_session_loop:
+                await session.close()
+            else:
+                # The owning loop is gone or different; its connections
+                # cannot be awaited from here, so just drop the session
+                self.logger.warning("Dropping async session created on another event loop")
+                
+        self._async_session_loop = None
+        self.session.close()
+        self.logger.info("BybitClient connections closed")
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled aiohttp session, creating it on first use
+        
+        A session is bound to the event loop it was created on, so a new
+        one is created if the client is used from a different loop.
+        
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            if self._async_session is not None and self._async_session_loop is not loop:
+                self.logger.debug("Event loop changed, creating a new async session")
+                
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._default_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+            self._async_session_loop = loop
+            
+        return self._async_session
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """
+        Headers sent with every request
         
-        # Setup request URL and params
+        Returns:
+            Dictionary of HTTP headers
+        """
+        return {
+            'Content-Type': 'application/json',
+            'X-BAPI-API-KEY': self.api_key
+        }
+    
+    def _prepare_request(self, method: str, path: str, params: Dict,
+                         auth_required: bool) -> Tuple[str, str, Optional[str]]:
+        """
+        Build URL, signed query string and body for a request
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Request parameters
+            auth_required: Whether authentication is required
+            
+        Returns:
+            Tuple of (url, full_url, payload)
+        """
         url = f"{self.base_url}{path}"
         request_params = params.copy()
         
         # Add authentication if required
         if auth_required:
-            timestamp = str(int(time.time() * 1000))
             request_params["api_key"] = self.api_key
-            request_params["timestamp"] = timestamp
+            request_params["timestamp"] = str(self.clock.now_ms())
+            request_params["recv_window"] = str(self.recv_window)
             
             # Generate signature
             param_str = self._build_param_string(request_params)
             signature = self._generate_signature(param_str)
             request_params["sign"] = signature
         
-        # Prepare for request
         if method == "GET":
             query_string = urllib.parse.urlencode(request_params)
             full_url = f"{url}?{query_string}"
             payload = None
         else:  # POST, PUT, DELETE
             full_url = url
-            payload = json.dumps(request_params)
+            payload = codec.dumps(request_params)
+            
+        return url, full_url, payload
+    
+    def _handle_response(self, status_code: int, body: Union[str, bytes],
+                         decoder: Optional[Callable[[bytes], Dict]] = None) -> Dict:
+        """
+        Validate an HTTP response and parse the JSON body
+        
+        Args:
+            status_code: HTTP status code
+            body: Raw response body
+            decoder: Optional body decoder (default codec.loads)
+            
+        Returns:
+            Parsed API response
+            
+        Raises:
+            AuthenticationError: On authentication error
+            RateLimitError: On rate limit exceeded
+            BybitAPIError: On other HTTP errors
+        """
+        # Check for errors
+        if status_code != 200:
+            if isinstance(body, bytes):
+                body = body.decode('utf-8', errors='replace')
+            error_msg = f"HTTP Error {status_code}: {body}"
+            self.logger.error(error_msg)
+            
+            # Handle specific error codes
+            if status_code == 401:
+                raise AuthenticationError(error_msg)
+            elif status_code == 429:
+                raise RateLimitError(error_msg)
+            elif status_code >= 500:
+                raise ServerError(error_msg)
+            else:
+                raise BybitAPIError(error_msg)
+        
+        # Parse JSON response
+        result = (decoder or codec.loads)(body)
+        
+        # Check for API error codes
+        if "retCode" in result and result["retCode"] != 0:
+            error_code = result["retCode"]
+            error_msg = result.get("retMsg", "Unknown API error")
+            
+            self.logger.warning(f"API Error {error_code}: {error_msg}")
+            
+            # Handle specific API errors
+            if error_code == 10002:  # Timestamp outside recv_window
+                raise TimestampError(f"API Error {error_code}: {error_msg}")
+            elif error_code in [10003, 10004]:  # Auth errors
+                raise AuthenticationError(f"API Error {error_code}: {error_msg}")
+            elif error_code in [10006, 10007]:  # Rate limit errors
+                raise RateLimitError(f"API Error {error_code}: {error_msg}")
+            
+            # For other errors, just return the response with error code
+            # This allows the caller to handle business logic errors
+        
+        return result
+
+    def _sync_raw_request(self, method: str, path: str, params: Dict, 
+                         auth_required: bool = True) -> Dict:
+        """
+        Synchronous implementation of raw API request
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Request parameters
+            auth_required: Whether authentication is required
+            
+        Returns:
+            Dictionary with API response
+        """
+        retryable = self.retry_policy.is_retryable(method, path, params)
+        max_attempts = self.retry_policy.max_attempts if retryable else 1
         
         # Make request with retry logic
-        for attempt in range(1, self.max_retries + 1):
+        for attempt in range(1, max_attempts + 1):
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open, not sending {method} {path}")
+                
             try:
+                # Apply rate limiting
+                self._apply_rate_limit()
+                
+                url, full_url, payload = self._prepare_request(method, path, params, auth_required)
                 self.logger.debug(f"Request: {method} {full_url}")
                 
                 if method == "GET":
-                    response = self.session.get(full_url)
+                    response = self.session.get(full_url, timeout=self.request_timeout)
                 elif method == "POST":
-                    response = self.session.post(url, data=payload)
+                    response = self.session.post(url, data=payload, timeout=self.request_timeout)
                 else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                # Check for errors
-                if response.status_code != 200:
-                    error_msg = f"HTTP Error {response.status_code}: {response.text}"
-                    self.logger.error(error_msg)
-                    
-                    # Handle specific error codes
-                    if response.status_code == 401:
-                        raise AuthenticationError(error_msg)
-                    elif response.status_code == 429:
-                        raise RateLimitError(error_msg)
-                    else:
-                        raise BybitAPIError(error_msg)
-                
-                # Parse JSON response
-                result = response.json()
-                
-                # Check for API error codes
-                if "retCode" in result and result["retCode"] != 0:
-                    error_code = result["retCode"]
-                    error_msg = result.get("retMsg", "Unknown API error")
-                    
-                    self.logger.warning(f"API Error {error_code}: {error_msg}")
-                    
-                    # Handle specific API errors
-                    if error_code in [10003, 10004]:  # Auth errors
-                        raise AuthenticationError(f"API Error {error_code}: {error_msg}")
-                    elif error_code in [10006, 10007]:  # Rate limit errors
-                        raise RateLimitError(f"API Error {error_code}: {error_msg}")
-                    
-                    # For other errors, just return the response with error code
-                    # This allows the caller to handle business logic errors
+                    raise BybitAPIError(f"Unsupported HTTP method: {method}")
                 
+                result = self._handle_response(response.status_code, response.content)
+                self.circuit_breaker.record_success()
                 return result
                 
-            except (AuthenticationError, RateLimitError) as e:
-                # Don't retry auth/rate limit errors
-                raise
+            except (ServerError, requests.RequestException, ValueError) as e:
+                self.circuit_breaker.record_failure()
                 
-            except Exception as e:
-                # For network/connection errors, retry with exponential backoff
-                if attempt < self.max_retries:
-                    retry_delay = self.retry_delay * (2 ** (attempt - 1))
-                    self.logger.warning(f"Request failed, retrying in {retry_delay}s: {str(e)}")
+                if attempt < max_attempts:
+                    retry_delay = self.retry_policy.compute_delay(attempt)
+                    self.logger.warning(f"Request failed, retrying in {retry_delay:.2f}s: {str(e)}")
                     time.sleep(retry_delay)
                 else:
-                    self.logger.error(f"Request failed after {self.max_retries} attempts: {str(e)}")
+                    self.logger.error(f"Request failed after {attempt} attempts: {str(e)}")
                     raise ConnectionError(f"Failed to connect to Bybit API: {str(e)}")
+                
+            except BybitAPIError:
+                # Auth, rate limit and other client errors are not transient
+                self.circuit_breaker.record_success()
+                raise
     
     def _build_param_string(self, params: Dict) -> str:
         """
@@ -488,18 +1126,7 @@ class BybitClient:
         Returns:
             Parameter string
         """
-        # Sort parameters by key
-        sorted_params = sorted(params.items())
-        
-        # Build parameter string
-        param_str = ""
-        for key, value in sorted_params:
-            param_str += f"{key}={value}&"
-            
-        # Remove trailing '&'
-        param_str = param_str[:-1]
-        
-        return param_str
+        return codec.build_param_string(params)
     
     def _generate_signature(self, param_str: str) -> str:
         """
@@ -511,18 +1138,12 @@ class BybitClient:
         Returns:
             HMAC signature
         """
-        # Create HMAC-SHA256 signature
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            param_str.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
+        # HMAC-SHA256 with the key schedule precomputed in __init__
+        return self._signer.sign(param_str)
     
     def _apply_rate_limit(self) -> None:
         """
-        Apply rate limiting to avoid hitting API limits
+        Apply rate limiting to avoid hitting API limits (sync path)
         """
         current_time = time.time()
         elapsed = current_time - self.last_request_time
@@ -0,0 +1,191 @@
+"""
+Clock Sync - Server clock-offset tracking for request signing
+
+Bybit rejects signed requests whose timestamp is outside the receive
+window (retCode 10002). Instead of trusting the local wall clock, the
+offset to the exchange clock is measured by sampling /v5/server/time,
+correcting each sample by half its round-trip time and keeping the
+sample with the lowest RTT. The offset is anchored to the monotonic
+clock, so timestamps are not affected by local wall-clock jumps.
+
+A background task re-syncs periodically; the client also re-syncs on
+demand after a timestamp rejection.
+
+Example usage:
+    clock = ClockSync(lambda: client.get_server_time())
+    await clock.sync()
+    clock.start()
+    
+    timestamp = clock.now_ms()
+"""
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..utils.logger import Logger
+
+
+class ClockSync:
+    """
+    Tracks the offset between the local monotonic clock and the exchange clock
+    """
+    
+    def __init__(self, fetch_server_time: Callable[[], Awaitable[Dict]],
+                 interval: float = 60.0, samples: int = 3,
+                 skew_warning_ms: float = 1000.0, logger: Optional[Logger] = None):
+        """
+        Initialize with the local wall clock as the initial estimate
+        
+        Args:
+            fetch_server_time: Zero-argument coroutine function returning a
+                /v5/server/time response
+            interval: Seconds between background re-syncs
+            samples: Server time samples taken per sync
+            skew_warning_ms: Log a warning when local and server clocks differ by more
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("ClockSync")
+        self.fetch_server_time = fetch_server_time
+        
+        self.interval = interval
+        self.samples = max(1, samples)
+        self.skew_warning_ms = skew_warning_ms
+        
+        # Server time in ms = monotonic ms + offset (local wall clock until synced)
+        self._offset_ms = time.time() * 1000 - time.monotonic() * 1000
+        self._task: Optional[asyncio.Task] = None
+        
+        # Metrics
+        self.stats = {
+            "syncs": 0,
+            "failures": 0,
+            "skew_ms": 0.0,  # server clock minus local wall clock
+            "rtt_ms": 0.0,  # RTT of the sample used for the offset
+            "last_sync": 0.0,  # monotonic time of the last successful sync
+        }
+        
+    def now_ms(self) -> int:
+        """
+        Get the current exchange time estimate
+        
+        Returns:
+            Exchange time in milliseconds
+        """
+        return int(time.monotonic() * 1000 + self._offset_ms)
+        
+    @property
+    def synced(self) -> bool:
+        """True once at least one sync succeeded"""
+        return self.stats["syncs"] > 0
+        
+    async def sync(self) -> bool:
+        """
+        Measure the offset to the exchange clock
+        
+        Returns:
+            True if at least one sample succeeded
+        """
+        best = None  # (rtt_ms, offset_ms, skew_ms)
+        
+        for _ in range(self.samples):
+            try:
+                sent = time.monotonic() * 1000
+                response = await self.fetch_server_time()
+                received = time.monotonic() * 1000
+                wall = time.time() * 1000
+                
+                server_ms = self._parse_server_time(response)
+                if server_ms is None:
+                    continue
+                    
+                rtt = received - sent
+                # The server stamped the response roughly half an RTT ago
+                offset = server_ms + rtt / 2 - received
+                skew = server_ms + rtt / 2 - wall
+                
+                if best is None or rtt < best[0]:
+                    best = (rtt, offset, skew)
+                    
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Server time sample failed: {str(e)}")
+                
+        if best is None:
+            self.stats["failures"] += 1
+            return False
+            
+        rtt, self._offset_ms, skew = best
+        self.stats["syncs"] += 1
+        self.stats["rtt_ms"] = rtt
+        self.stats["skew_ms"] = skew
+        self.stats["last_sync"] = time.monotonic()
+        
+        if abs(skew) > self.skew_warning_ms:
+            self.logger.warning(f"Local clock is {skew:+.0f}ms off the exchange clock (rtt {rtt:.0f}ms)")
+        else:
+            self.logger.debug(f"Clock synced: skew {skew:+.1f}ms, rtt {rtt:.1f}ms")
+            
+        return True
+        
+    def start(self) -> None:
+        """Start periodic re-syncing on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run())
+        
+    async def stop(self) -> None:
+        """Stop periodic re-syncing"""
+        task = self._task
+        self._task = None
+        if task is None or task.done():
+            return
+            
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+                
+    async def _run(self) -> None:
+        """Background sync loop; the caller has just synced, so wait first"""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.sync()
+            
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get skew, RTT and sync statistics
+        
+        Returns:
+            Dictionary of clock metrics
+        """
+        last_sync = self.stats["last_sync"]
+        return dict(
+            self.stats,
+            offset_ms=self._offset_ms,
+            sync_age=time.monotonic() - last_sync if last_sync else None,
+        )
+        
+    @staticmethod
+    def _parse_server_time(response: Dict) -> Optional[float]:
+        """
+        Extract the server time from a /v5/server/time response
+        
+        Args:
+            response: Parsed API response
+            
+        Returns:
+            Server time in milliseconds or None if missing
+        """
+        result = response.get("result") or {}
+        if result.get("timeNano"):
+            return int(result["timeNano"]) / 1e6
+        if result.get("timeSecond"):
+            return float(result["timeSecond"]) * 1000
+        if response.get("time"):
+            return float(response["time"])
+        return None
@@ -0,0 +1,246 @@
+"""
+Codec - JSON encoding/decoding and request signing helpers
+
+Uses orjson or msgspec when installed and falls back to the standard
+library json module otherwise. All decoders accept bytes, so response
+bodies can be parsed without decoding them to str first.
+
+Kline pages can be decoded straight into a float64 numpy array of shape
+(n, 7) with columns KLINE_COLUMNS, oldest bar first. With msgspec the
+rows are parsed directly into floats; otherwise the string rows are
+converted by numpy in one pass.
+
+Public trades decode into a numpy structured array of TRADE_DTYPE
+(timestamp, price, size, side), side being BUY or SELL for the taker.
+
+Example usage:
+    signer = HmacSigner(api_secret)
+    param_str = build_param_string(params)
+    params["sign"] = signer.sign(param_str)
+    
+    body = dumps(params)
+    response = decode_klines_response(raw_bytes)
+"""
+
+import hmac
+import json
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# Column order of a decoded kline array (Bybit v5 kline row layout)
+KLINE_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover')
+
+# Decoded public trade; side is the taker side
+TRADE_DTYPE = np.dtype([('timestamp', np.int64), ('price', np.float64), ('size', np.float64), ('side', np.int8)])
+BUY, SELL = 1, -1
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+else:
+    JSON_BACKEND = "json"
+
+
+if msgspec is not None:
+    _KlineRow = Tuple[float, float, float, float, float, float, float]
+    
+    class _KlineResult(msgspec.Struct):
+        """Kline result with rows parsed straight to floats"""
+        list: List[_KlineRow] = []
+        symbol: str = ""
+        category: str = ""
+        
+    class _KlineResponse(msgspec.Struct):
+        """Typed /v5/market/kline response"""
+        retCode: int = 0
+        retMsg: str = ""
+        result: Optional[_KlineResult] = None
+        time: int = 0
+        
+    _json_encoder = msgspec.json.Encoder()
+    _json_decoder = msgspec.json.Decoder()
+    # strict=False lets msgspec parse Bybit's numeric strings as floats
+    _kline_decoder = msgspec.json.Decoder(type=_KlineResponse, strict=False)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    if msgspec is not None:
+        return _json_encoder.encode(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON from str or bytes
+    
+    Args:
+        data: JSON document
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return _json_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def build_param_string(params: Dict) -> str:
+    """
+    Build the sorted key=value string that is signed
+    
+    Args:
+        params: Request parameters
+        
+    Returns:
+        Parameter string
+    """
+    return "&".join([f"{key}={value}" for key, value in sorted(params.items())])
+
+
+class HmacSigner:
+    """
+    HMAC-SHA256 signer with the key schedule computed once
+    """
+    
+    def __init__(self, secret: str):
+        """
+        Initialize the signer
+        
+        Args:
+            secret: API secret
+        """
+        self._base = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
+    def sign(self, payload: Union[str, bytes]) -> str:
+        """
+        Sign a payload
+        
+        Args:
+            payload: String or bytes to sign
+            
+        Returns:
+            Hex digest
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        mac = self._base.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+
+
+def klines_to_array(rows: Any) -> np.ndarray:
+    """
+    Convert Bybit kline rows (newest first) to a float64 array
+    
+    Args:
+        rows: Sequence of [start, open, high, low, close, volume, turnover]
+            rows as strings or numbers
+            
+    Returns:
+        Array of shape (n, 7), oldest bar first
+    """
+    if rows is None or len(rows) == 0:
+        return np.empty((0, len(KLINE_COLUMNS)), dtype=np.float64)
+        
+    array = np.asarray(rows, dtype=np.float64)
+    if array.ndim != 2 or array.shape[1] != len(KLINE_COLUMNS):
+        raise ValueError(f"Unexpected kline row shape {array.shape}")
+        
+    # Bybit returns newest first
+    if len(array) > 1 and array[0, 0] > array[-1, 0]:
+        array = array[::-1]
+        
+    return np.ascontiguousarray(array)
+
+
+def trades_to_array(trades: Any) -> np.ndarray:
+    """
+    Convert Bybit publicTrade entries to a structured array
+    
+    Args:
+        trades: Sequence of trade dicts with 'T' (ms), 'p', 'v' and 'S'
+            ('Buy' or 'Sell') as strings or numbers
+            
+    Returns:
+        Array of TRADE_DTYPE, oldest trade first
+    """
+    array = np.empty(len(trades) if trades is not None else 0, dtype=TRADE_DTYPE)
+    if len(array) == 0:
+        return array
+        
+    array['timestamp'] = [int(trade['T']) for trade in trades]
+    array['price'] = np.asarray([trade['p'] for trade in trades], dtype=np.float64)
+    array['size'] = np.asarray([trade['v'] for trade in trades], dtype=np.float64)
+    array['side'] = [BUY if trade['S'] == 'Buy' else SELL for trade in trades]
+    
+    if len(array) > 1 and np.any(np.diff(array['timestamp']) < 0):
+        array = array[np.argsort(array['timestamp'], kind='stable')]
+    return array
+
+
+def decode_klines_response(data: Union[str, bytes]) -> Dict:
+    """
+    Decode a /v5/market/kline response with result.list as a numpy array
+    
+    Args:
+        data: Raw response body
+        
+    Returns:
+        Response dictionary; result.list is a (n, 7) float64 array
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if msgspec is not None:
+        try:
+            decoded = _kline_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+            
+        result = None
+        if decoded.result is not None:
+            result = {
+                "symbol": decoded.result.symbol,
+                "category": decoded.result.category,
+                "list": klines_to_array(decoded.result.list),
+            }
+        return {"retCode": decoded.retCode, "retMsg": decoded.retMsg, "result": result, "time": decoded.time}
+        
+    response = loads(data)
+    result = response.get("result") if isinstance(response, dict) else None
+    if isinstance(result, dict) and "list" in result:
+        result["list"] = klines_to_array(result["list"])
+    return response
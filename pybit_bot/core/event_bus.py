@@ -0,0 +1,163 @@
+"""
+Event Bus - In-process publish/subscribe for market data events
+
+DataManager publishes a typed MarketEvent whenever the data it holds
+changes; consumers subscribe to the event types (and optionally the
+symbols) they care about and await them from their own queue, so work
+runs when data arrives instead of on a polling timer.
+
+Publishing never blocks: each subscription has a bounded queue and a
+subscriber that falls behind loses its oldest events, counted in
+`dropped`. Event data is a snapshot taken at publish time.
+
+Example usage:
+    bus = EventBus()
+    subscription = bus.subscribe({EventType.BAR_CLOSED}, symbols={"BTCUSDT"})
+    bus.publish(MarketEvent(EventType.BAR_CLOSED, "BTCUSDT", "1m", start, bar))
+    async for event in subscription:
+        ...
+"""
+
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class EventType(str, Enum):
+    """Market data event types"""
+    BAR_CLOSED = "bar_closed"    # A bar ended; data is the final bar
+    BAR_UPDATED = "bar_updated"  # The forming bar changed; data is the bar so far
+    TICKER = "ticker"            # Ticker fields changed; data is the full ticker
+    BOOK_TOP = "book_top"        # Best bid or ask changed; data is the top of book
+
+
+@dataclass(frozen=True)
+class MarketEvent:
+    """A change in market data"""
+    type: EventType
+    symbol: str
+    timeframe: Optional[str] = None  # Bar events only
+    timestamp: int = 0  # Bar start, or exchange time of the update (ms)
+    data: Any = None
+
+
+class Subscription:
+    """
+    Queue of the events matching a subscriber's filter
+    """
+    
+    def __init__(self, bus: "EventBus", types: Iterable[EventType], symbols: Optional[Iterable[str]], maxsize: int):
+        """
+        Initialize a subscription (use EventBus.subscribe)
+        
+        Args:
+            bus: Bus the subscription belongs to
+            types: Event types to receive
+            symbols: Symbols to receive, or None for all
+            maxsize: Queued events kept before the oldest are dropped
+        """
+        self._bus = bus
+        self.types = frozenset(EventType(t) for t in types)
+        self.symbols = frozenset(symbols) if symbols is not None else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+        
+    def matches(self, event: MarketEvent) -> bool:
+        """Whether the event passes this subscription's filter"""
+        return event.type in self.types and (self.symbols is None or event.symbol in self.symbols)
+        
+    def put(self, event: MarketEvent) -> None:
+        """Queue an event, dropping the oldest if the queue is full"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+        
+    async def get(self) -> MarketEvent:
+        """Wait for the next event"""
+        return await self.queue.get()
+        
+    def __aiter__(self) -> "Subscription":
+        return self
+        
+    async def __anext__(self) -> MarketEvent:
+        return await self.queue.get()
+        
+    def close(self) -> None:
+        """Stop receiving events"""
+        self._bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    Fan-out of market events to subscriber queues
+    """
+    
+    def __init__(self):
+        """Initialize a bus without subscribers"""
+        self._subscribers: Dict[EventType, List[Subscription]] = {t: [] for t in EventType}
+        self.stats = {"published": 0, "delivered": 0}
+        
+    def subscribe(self, types: Iterable[EventType], symbols: Optional[Iterable[str]] = None,
+                  maxsize: int = 1000) -> Subscription:
+        """
+        Subscribe to events
+        
+        Args:
+            types: Event types to receive
+            symbols: Symbols to receive (default all)
+            maxsize: Queued events kept before the oldest are dropped
+            
+        Returns:
+            Subscription to await events from
+        """
+        subscription = Subscription(self, types, symbols, maxsize)
+        for event_type in subscription.types:
+            self._subscribers[event_type].append(subscription)
+        return subscription
+        
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription
+        
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        for subscribers in self._subscribers.values():
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+                
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Whether anyone receives events of a type
+        
+        Publishers check this before building event data for busy streams.
+        
+        Args:
+            event_type: Event type
+            
+        Returns:
+            True if at least one subscription includes the type
+        """
+        return bool(self._subscribers[event_type])
+        
+    def publish(self, event: MarketEvent) -> int:
+        """
+        Deliver an event to every matching subscription
+        
+        Args:
+            event: Event to publish
+            
+        Returns:
+            Number of subscriptions that received it
+        """
+        delivered = 0
+        for subscription in self._subscribers[event.type]:
+            if subscription.matches(event):
+                subscription.put(event)
+                delivered += 1
+                
+        self.stats["published"] += 1
+        self.stats["delivered"] += delivered
+        return delivered
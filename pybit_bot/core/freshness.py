@@ -0,0 +1,152 @@
+"""
+Freshness - Receive times, feed lag and staleness of cached market data
+
+Every update to a cached stream (a symbol's ticker or order book, a
+kline series) is recorded with the local receive time and, when the
+message carries one, the exchange timestamp. Ages are measured on the
+monotonic clock; feed lag is the exchange clock estimate at receipt
+minus the exchange timestamp, so local clock skew does not show up as
+lag.
+
+Each data type has a freshness SLA in seconds, which single streams may
+override; data older than that is stale and should not be traded on.
+
+Example usage:
+    tracker = FreshnessTracker(sla={"ticker": 5.0}, clock=client.clock.now_ms)
+    tracker.record("ticker", "BTCUSDT", message["ts"])
+    if tracker.is_stale("ticker", "BTCUSDT"):
+        ...
+    print(tracker.report())
+"""
+
+import math
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .latency import LatencyHistogram
+
+
+class FreshnessTracker:
+    """
+    Last receive time and feed lag per stream, checked against an SLA per data type
+    """
+    
+    # Maximum age in seconds before data counts as stale, per data type
+    DEFAULT_SLA = {
+        "ticker": 10.0,
+        "orderbook": 10.0,
+        "kline": 90.0,
+        "trade": 60.0,
+    }
+    
+    def __init__(self, sla: Optional[Dict[str, float]] = None, clock: Optional[Callable[[], int]] = None):
+        """
+        Initialize the tracker
+        
+        Args:
+            sla: Optional overrides of {data type: max age in seconds}
+            clock: Function returning the exchange time in milliseconds
+                (default the local wall clock)
+        """
+        self.sla = dict(self.DEFAULT_SLA)
+        if sla:
+            self.sla.update(sla)
+        self._clock = clock or (lambda: int(time.time() * 1000))
+        
+        # Per stream, format: {(kind, key): (monotonic receive time, lag in ms or None)}
+        self._streams: Dict[Tuple[str, str], Tuple[float, Optional[float]]] = {}
+        self._stream_sla: Dict[Tuple[str, str], float] = {}  # Per-stream overrides
+        self.lag = {kind: LatencyHistogram() for kind in self.sla}
+        
+    def set_sla(self, kind: str, key: str, max_age: float) -> None:
+        """
+        Override the SLA of one stream
+        
+        Args:
+            kind: Data type
+            key: Stream within the type
+            max_age: Maximum age in seconds
+        """
+        self._stream_sla[(kind, key)] = max_age
+        
+    def max_age(self, kind: str, key: str) -> float:
+        """
+        SLA of a stream in seconds (infinity for unknown types)
+        
+        Args:
+            kind: Data type
+            key: Stream within the type
+            
+        Returns:
+            Maximum age in seconds
+        """
+        return self._stream_sla.get((kind, key), self.sla.get(kind, math.inf))
+        
+    def record(self, kind: str, key: str, exchange_ts: Optional[int] = None) -> None:
+        """
+        Record an update
+        
+        Args:
+            kind: Data type (ticker, orderbook, kline, trade)
+            key: Stream within the type, e.g. "BTCUSDT" or "BTCUSDT 1m"
+            exchange_ts: Exchange timestamp of the update in milliseconds
+        """
+        lag = None
+        if exchange_ts:
+            lag = self._clock() - int(exchange_ts)
+            self.lag.setdefault(kind, LatencyHistogram()).record(max(lag, 0) / 1000)
+        self._streams[(kind, key)] = (time.monotonic(), lag)
+        
+    def age(self, kind: str, key: str) -> float:
+        """
+        Seconds since the last update
+        
+        Args:
+            kind: Data type
+            key: Stream within the type
+            
+        Returns:
+            Age in seconds, or infinity if never updated
+        """
+        stream = self._streams.get((kind, key))
+        return time.monotonic() - stream[0] if stream else math.inf
+        
+    def is_stale(self, kind: str, key: str) -> bool:
+        """
+        Whether a stream is older than its SLA
+        
+        Args:
+            kind: Data type
+            key: Stream within the type
+            
+        Returns:
+            True if the stream was never updated or is too old
+        """
+        return self.age(kind, key) > self.max_age(kind, key)
+        
+    def report(self) -> Dict:
+        """
+        Aggregated freshness of all streams
+        
+        Returns:
+            Dictionary with per-type 'streams' ({key: age_s, lag_ms, stale}),
+            'stale' keys, the 'sla' and feed lag statistics, plus the
+            total number of stale streams
+        """
+        report = {"stale": 0, "types": {}}
+        
+        for (kind, key), (received, lag) in sorted(self._streams.items()):
+            entry = report["types"].setdefault(kind, {
+                "sla": self.sla.get(kind),
+                "streams": {},
+                "stale": [],
+                "lag": self.lag[kind].get_stats() if kind in self.lag else {},
+            })
+            age = time.monotonic() - received
+            stale = age > self.max_age(kind, key)
+            entry["streams"][key] = {"age_s": age, "lag_ms": lag, "stale": stale}
+            if stale:
+                entry["stale"].append(key)
+                report["stale"] += 1
+                
+        return report
@@ -0,0 +1,70 @@
+"""
+Kline Aggregator - Derive higher timeframe bars from lower ones
+
+Bybit aligns every fixed-length interval up to one day to the Unix
+epoch (UTC), so a higher timeframe bar is the aggregate of the base
+bars whose start falls in its window: first open, highest high, lowest
+low, last close and summed volume and turnover. Aggregating the base
+stream locally keeps every timeframe consistent with it and needs no
+separate subscription.
+
+Example usage:
+    if can_aggregate("1m", "1h"):
+        hourly = aggregate_klines(minute_rows, interval_to_ms("1h"))
+"""
+
+import numpy as np
+
+from .codec import KLINE_COLUMNS
+from .pagination import interval_to_ms
+
+DAY_MS = 86_400_000
+
+
+def can_aggregate(base: str, target: str) -> bool:
+    """
+    Whether `target` bars can be built from `base` bars
+    
+    Args:
+        base: Base interval (e.g. "1m")
+        target: Target interval (e.g. "1h")
+        
+    Returns:
+        True if target is a longer multiple of base that divides a day
+    """
+    try:
+        base_ms = interval_to_ms(base)
+        target_ms = interval_to_ms(target)
+    except ValueError:
+        return False
+    return target_ms > base_ms and target_ms % base_ms == 0 and DAY_MS % target_ms == 0
+
+
+def aggregate_klines(rows: np.ndarray, interval_ms: int) -> np.ndarray:
+    """
+    Aggregate bars into epoch-aligned bars of a longer interval
+    
+    Args:
+        rows: Base bars of shape (n, 7) in KLINE_COLUMNS order, oldest first
+        interval_ms: Target interval in milliseconds
+        
+    Returns:
+        Array of shape (m, 7), oldest first; the last bar is partial if
+        its window is not complete yet
+    """
+    if len(rows) == 0:
+        return np.empty((0, len(KLINE_COLUMNS)), dtype=np.float64)
+        
+    starts = rows[:, 0] - rows[:, 0] % interval_ms
+    first = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    last = np.r_[first[1:] - 1, len(rows) - 1]
+    
+    bars = np.empty((len(first), len(KLINE_COLUMNS)), dtype=np.float64)
+    bars[:, 0] = starts[first]
+    bars[:, 1] = rows[first, 1]
+    bars[:, 2] = np.maximum.reduceat(rows[:, 2], first)
+    bars[:, 3] = np.minimum.reduceat(rows[:, 3], first)
+    bars[:, 4] = rows[last, 4]
+    bars[:, 5] = np.add.reduceat(rows[:, 5], first)
+    bars[:, 6] = np.add.reduceat(rows[:, 6], first)
+    return bars
@@ -0,0 +1,200 @@
+"""
+Kline Buffer - Fixed-capacity columnar ring buffer for klines
+
+Stores the columns in KLINE_COLUMNS (timestamp, OHLCV, turnover) in one
+preallocated float64 array. Every row is written twice, at `i` and
+`i + capacity`, so the latest bars are always one contiguous slice of
+each column and views need no copy however often the buffer wraps.
+
+The forming bar is updated in place and a new bar is appended in O(1);
+only bars older than the last one take the slow merge path. A
+DataFrame is built on request and cached until the next write.
+
+Example usage:
+    buffer = KlineBuffer(capacity=1000)
+    buffer.extend(klines_to_array(rows))
+    buffer.upsert((start, open, high, low, close, volume, turnover))
+    closes = buffer.column("close")        # zero-copy view
+    df = buffer.to_dataframe()
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .codec import KLINE_COLUMNS
+
+_COLUMN_INDEX = {name: i for i, name in enumerate(KLINE_COLUMNS)}
+
+
+class KlineBuffer:
+    """
+    Ring buffer of the latest `capacity` bars, oldest first
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer
+        
+        Args:
+            capacity: Maximum number of bars kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+            
+        self.capacity = capacity
+        self._data = np.zeros((len(KLINE_COLUMNS), 2 * capacity), dtype=np.float64)
+        self._end = 0  # Slot after the newest bar, in [0, capacity)
+        self._size = 0
+        self.version = 0  # Incremented on every write
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+        
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Start time of the newest bar in milliseconds, or None if empty"""
+        if not self._size:
+            return None
+        return int(self._data[0, self._end - 1 + self.capacity])
+        
+    @property
+    def first_timestamp(self) -> Optional[int]:
+        """Start time of the oldest bar in milliseconds, or None if empty"""
+        if not self._size:
+            return None
+        return int(self._data[0, self._end + self.capacity - self._size])
+        
+    def clear(self) -> None:
+        """Remove all bars"""
+        self._end = 0
+        self._size = 0
+        self.version += 1
+        
+    def _write(self, row: Sequence[float], slot: int) -> None:
+        self._data[:, slot] = row
+        self._data[:, slot + self.capacity] = row
+        
+    def upsert(self, row: Sequence[float]) -> None:
+        """
+        Update the newest bar in place or append a newer one
+        
+        Args:
+            row: Values in KLINE_COLUMNS order
+        """
+        last = self.last_timestamp
+        timestamp = row[0]
+        
+        if last is not None and timestamp == last:
+            self._write(row, self._end - 1 if self._end else self.capacity - 1)
+        elif last is None or timestamp > last:
+            self._write(row, self._end)
+            self._end = (self._end + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+        else:
+            # Older than the newest bar
+            self._merge(np.asarray([row], dtype=np.float64))
+            return
+        self.version += 1
+        
+    def extend(self, rows: np.ndarray) -> None:
+        """
+        Merge bars, replacing any with the same start time
+        
+        Args:
+            rows: Array of shape (n, 7) in KLINE_COLUMNS order, oldest first
+        """
+        if len(rows) == 0:
+            return
+            
+        last = self.last_timestamp
+        if (last is not None and rows[0, 0] < last) or np.any(np.diff(rows[:, 0]) <= 0):
+            # Older, unsorted or duplicate bars
+            self._merge(rows)
+            return
+            
+        if last is not None and rows[0, 0] == last:
+            # Overwrite the forming bar, append the rest
+            self.upsert(rows[0])
+            rows = rows[1:]
+        self._append(rows[-self.capacity:])
+        
+    def _append(self, rows: np.ndarray) -> None:
+        """Write bars newer than the newest one"""
+        if len(rows) == 0:
+            return
+        slots = (self._end + np.arange(len(rows))) % self.capacity
+        self._data[:, slots] = rows.T
+        self._data[:, slots + self.capacity] = rows.T
+        self._end = int(slots[-1] + 1) % self.capacity
+        self._size = min(self._size + len(rows), self.capacity)
+        self.version += 1
+        
+    def _merge(self, rows: np.ndarray) -> None:
+        """Rebuild from existing and new bars; new bars win on duplicate start times"""
+        combined = np.concatenate([rows, self.view().T])
+        _, first = np.unique(combined[:, 0], return_index=True)
+        merged = combined[first][-self.capacity:]
+        
+        self._size = len(merged)
+        self._end = self._size % self.capacity
+        self._data[:, :self._size] = merged.T
+        self._data[:, self.capacity:self.capacity + self._size] = merged.T
+        self.version += 1
+        
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Latest bars as a (7, n) array; each column row is contiguous
+        
+        Args:
+            n: Number of bars (default all)
+            
+        Returns:
+            Read-only view into the buffer, valid until the next write
+        """
+        n = self._size if n is None else min(n, self._size)
+        stop = self._end + self.capacity
+        view = self._data[:, stop - n:stop]
+        view.flags.writeable = False
+        return view
+        
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        One column of the latest bars as a contiguous read-only view
+        
+        Args:
+            name: Column name from KLINE_COLUMNS
+            n: Number of bars (default all)
+            
+        Returns:
+            1-D view, oldest first
+        """
+        return self.view(n)[_COLUMN_INDEX[name]]
+        
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Bars as a DataFrame indexed by start timestamp
+        
+        Built on first call after a write and cached; callers should
+        treat it as read-only.
+        
+        Returns:
+            DataFrame with open, high, low, close, volume and turnover
+        """
+        if self._frame is None or self._frame_version != self.version:
+            view = self.view()
+            self._frame = pd.DataFrame(
+                view[1:].T,
+                index=pd.Index(view[0].astype(np.int64), name='timestamp'),
+                columns=list(KLINE_COLUMNS[1:]),
+                copy=True
+            )
+            self._frame_version = self.version
+        return self._frame
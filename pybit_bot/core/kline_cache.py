@@ -0,0 +1,213 @@
+"""
+Kline Cache - Persistent on-disk store of closed klines
+
+One file per (symbol, timeframe) holds a 16-byte header (magic and the
+interval in milliseconds) followed by float64 rows in KLINE_COLUMNS
+order, oldest first. Closed bars are appended as they arrive, so a
+restart only has to fetch the bars since the last cached one.
+
+Files are memory-mapped on load and checked before use: a partial
+trailing row left by a crash is dropped, and rows are kept only up to
+the first one that is not finite, not increasing or not aligned to the
+interval. Files are compacted to the newest `max_bars` rows once they
+grow past `compact_factor` times that.
+
+Example usage:
+    cache = KlineCache("cache/klines")
+    rows = cache.load("BTCUSDT", "1m", max_bars=4000)
+    ...
+    cache.append("BTCUSDT", "1m", closed_rows, max_bars=4000)
+"""
+
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .codec import KLINE_COLUMNS
+from .pagination import interval_to_ms
+from ..utils.logger import Logger
+
+_MAGIC = b"PBKLINE1"
+_HEADER = struct.Struct("<8sq")
+_ROW_BYTES = len(KLINE_COLUMNS) * 8
+
+
+class KlineCache:
+    """
+    Append-only kline files with integrity checks and compaction
+    """
+    
+    def __init__(self, directory: str, compact_factor: float = 2.0, logger: Optional[Logger] = None):
+        """
+        Initialize the cache
+        
+        Args:
+            directory: Directory for the cache files (created if missing)
+            compact_factor: Rewrite a file once it holds this many times max_bars
+            logger: Optional logger instance
+        """
+        self.directory = directory
+        self.compact_factor = compact_factor
+        self.logger = logger or Logger("KlineCache")
+        os.makedirs(directory, exist_ok=True)
+        
+        # Last cached start time and row count, format: {(symbol, timeframe): (timestamp, rows)}
+        self._tails: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self.stats = {"loaded": 0, "appended": 0, "compactions": 0, "repaired": 0}
+        
+    def path(self, symbol: str, timeframe: str) -> str:
+        """
+        File path for a series
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            Path of the cache file
+        """
+        return os.path.join(self.directory, f"{symbol}_{timeframe}.klines")
+        
+    def load(self, symbol: str, timeframe: str, max_bars: Optional[int] = None) -> np.ndarray:
+        """
+        Load cached bars, dropping anything that fails the integrity checks
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            max_bars: Return at most the newest this many bars
+            
+        Returns:
+            float64 array of shape (n, 7), oldest first (empty if nothing is cached)
+        """
+        key = (symbol, timeframe)
+        interval_ms = interval_to_ms(timeframe)
+        path = self.path(symbol, timeframe)
+        self._tails.pop(key, None)
+        
+        rows = self._read(path, interval_ms)
+        if rows is None:
+            return np.empty((0, len(KLINE_COLUMNS)), dtype=np.float64)
+            
+        valid = self._valid_prefix(rows, interval_ms)
+        if valid < len(rows):
+            self.logger.warning(f"Kline cache {path}: keeping {valid} of {len(rows)} rows after integrity check")
+            self.stats["repaired"] += 1
+            rows = np.array(rows[:valid])
+            self._write(path, interval_ms, rows)
+            
+        if len(rows):
+            self._tails[key] = (int(rows[-1, 0]), len(rows))
+        tail = np.array(rows[-max_bars:] if max_bars else rows)
+        self.stats["loaded"] += len(tail)
+        return tail
+        
+    def append(self, symbol: str, timeframe: str, rows: np.ndarray, max_bars: int) -> int:
+        """
+        Append closed bars newer than the last cached one
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            rows: Closed bars of shape (n, 7), oldest first
+            max_bars: Bars to keep when the file is compacted
+            
+        Returns:
+            Number of rows written
+        """
+        key = (symbol, timeframe)
+        interval_ms = interval_to_ms(timeframe)
+        path = self.path(symbol, timeframe)
+        
+        if key not in self._tails and os.path.exists(path):
+            self.load(symbol, timeframe, max_bars=1)
+        last, count = self._tails.get(key, (None, 0))
+        
+        if last is not None:
+            rows = rows[rows[:, 0] > last]
+        if len(rows) == 0:
+            return 0
+            
+        merged = None
+        if last is not None and rows[0, 0] == last + interval_ms and count + len(rows) > self.compact_factor * max_bars:
+            existing = self._read(path, interval_ms)
+            # The file may have been removed or repaired since its tail was read
+            if existing is not None and len(existing) and existing[-1, 0] == last:
+                merged = np.concatenate([existing, rows])[-max_bars:]
+            else:
+                last = None
+                
+        if merged is not None:
+            self._write(path, interval_ms, merged)
+            count = len(merged)
+            self.stats["compactions"] += 1
+        elif last is None or rows[0, 0] != last + interval_ms or not os.path.exists(path):
+            # New or removed file, or not contiguous with it; start over from these rows
+            self._write(path, interval_ms, rows[-max_bars:])
+            count = min(len(rows), max_bars)
+        else:
+            with open(path, "ab") as f:
+                f.write(np.ascontiguousarray(rows, dtype="<f8").tobytes())
+            count += len(rows)
+            
+        self._tails[key] = (int(rows[-1, 0]), count)
+        self.stats["appended"] += len(rows)
+        return len(rows)
+        
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[int]:
+        """
+        Start time of the newest cached bar, if known
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            Timestamp in milliseconds or None
+        """
+        tail = self._tails.get((symbol, timeframe))
+        return tail[0] if tail else None
+        
+    def _read(self, path: str, interval_ms: int) -> Optional[np.ndarray]:
+        """Memory-map a cache file, or None if it is missing or has a bad header"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+            
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header) != (_MAGIC, interval_ms):
+            self.logger.warning(f"Kline cache {path}: bad header, discarding")
+            self.stats["repaired"] += 1
+            os.remove(path)
+            return None
+            
+        # A crash mid-append can leave a partial row
+        n, partial = divmod(size - _HEADER.size, _ROW_BYTES)
+        if partial:
+            self.logger.warning(f"Kline cache {path}: dropping a partial row")
+            self.stats["repaired"] += 1
+            os.truncate(path, _HEADER.size + n * _ROW_BYTES)
+        if n == 0:
+            return np.empty((0, len(KLINE_COLUMNS)), dtype=np.float64)
+        return np.memmap(path, dtype="<f8", mode="r", offset=_HEADER.size, shape=(n, len(KLINE_COLUMNS)))
+        
+    @staticmethod
+    def _valid_prefix(rows: np.ndarray, interval_ms: int) -> int:
+        """Number of leading rows that are finite, increasing and interval-aligned"""
+        if len(rows) == 0:
+            return 0
+        bad = ~np.isfinite(rows).all(axis=1) | (rows[:, 0] % interval_ms != 0)
+        bad[1:] |= np.diff(rows[:, 0]) <= 0
+        return int(np.argmax(bad)) if bad.any() else len(rows)
+        
+    def _write(self, path: str, interval_ms: int, rows: np.ndarray) -> None:
+        """Atomically replace a cache file"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, interval_ms))
+            f.write(np.ascontiguousarray(rows, dtype="<f8").tobytes())
+        os.replace(tmp_path, path)
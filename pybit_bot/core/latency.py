@@ -0,0 +1,93 @@
+"""
+Latency - Fixed-bucket latency histograms
+
+Records round-trip times into log-spaced millisecond buckets and keeps
+a bounded window of recent samples for percentiles, so transports can
+be compared side by side (e.g. WebSocket trade API vs REST).
+
+Example usage:
+    histogram = LatencyHistogram()
+    started = time.perf_counter()
+    await send_order()
+    histogram.record(time.perf_counter() - started)
+    print(histogram.get_stats())
+"""
+
+import bisect
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with percentiles over recent samples
+    """
+    
+    # Upper bucket edges in milliseconds; the last bucket is unbounded
+    DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    
+    # Number of recent samples kept for percentiles
+    MAX_SAMPLES = 1000
+    
+    def __init__(self, buckets_ms: Optional[Sequence[float]] = None, max_samples: int = MAX_SAMPLES):
+        """
+        Initialize the histogram
+        
+        Args:
+            buckets_ms: Optional ascending upper bucket edges in milliseconds
+            max_samples: Recent samples kept for percentiles
+        """
+        self.buckets_ms = tuple(buckets_ms or self.DEFAULT_BUCKETS_MS)
+        self.counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency sample
+        
+        Args:
+            seconds: Latency in seconds
+        """
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self._samples.append(ms)
+        
+    def percentile(self, fraction: float) -> float:
+        """
+        Nearest-rank percentile of the recent samples
+        
+        Args:
+            fraction: Percentile as a fraction (0-1)
+            
+        Returns:
+            Latency in milliseconds, or 0 without samples
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+        
+    def get_stats(self) -> Dict:
+        """
+        Get the histogram and summary statistics
+        
+        Returns:
+            Dictionary with count, mean/p50/p90/p99/max in milliseconds and
+            the bucket counts keyed by upper edge ("+inf" for the last)
+        """
+        labels = [f"<={edge}ms" for edge in self.buckets_ms] + ["+inf"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p90_ms": self.percentile(0.90),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -28,15 +28,24 @@ Example usage:
     positions = await order_client.get_positions("BTCUSDT")
     orders = await order_client.get_open_orders("BTCUSDT")
     cancel_result = await order_client.cancel_order("BTCUSDT", order_id)
+    
+    # Optionally send create/amend/cancel over the WebSocket trade API;
+    # REST is used whenever the socket is down
+    await order_client.start_trade_stream()
+    response = await order_client.create_order({"category": "linear", "symbol": "BTCUSDT", ...})
+    print(order_client.get_latency_stats())
 """
 
 import time
+import uuid
 import asyncio
 from decimal import Decimal
 from typing import Dict, List, Optional, Any, Union, Tuple
 import json
 
 from .client import BybitClient
+from .latency import LatencyHistogram
+from .websocket_client import TradeWebSocket
 from ..utils.logger import Logger
 from ..exceptions import (
     BybitAPIError,
@@ -99,7 +108,348 @@ class OrderManagerClient:
         # Cache for instrument info
         self._instrument_info_cache = {}
         
+        # Optional WebSocket trade API transport with per-transport latency
+        self.trade_ws = None
+        self.latency = {"ws": LatencyHistogram(), "rest": LatencyHistogram()}
+        self.ws_fallbacks = 0
+        
         self.logger.debug(f"EXIT __init__ completed")
         
+    # REST retry replies meaning the request may already have been applied
+    # over the WebSocket: duplicate orderLinkId, order does not exist
+    ALREADY_APPLIED_CODES = {
+        "order.create": 110072,
+        "order.amend": 110001,
+        "order.cancel": 110001,
+    }
+    
+    # REST path of each trade API operation (for rate limiting)
+    TRADE_PATHS = {
+        "order.create": "/v5/order/create",
+        "order.amend": "/v5/order/amend",
+        "order.cancel": "/v5/order/cancel",
+    }
+    
+    # Maximum orders per batch request by category
+    BATCH_ORDER_LIMITS = {
+        "linear": 20,
+        "inverse": 20,
+        "option": 20,
+        "spot": 10
+    }
+    
+    async def place_batch_orders(self, orders: List[Dict], category: str = "linear") -> List[Dict]:
+        """
+        Place up to BATCH_ORDER_LIMITS[category] orders in one round trip
+        
+        Args:
+            orders: List of Bybit order dictionaries (symbol, side, orderType, qty, ...)
+            category: Product category
+            
+        Returns:
+            List of per-order results in request order (see _parse_batch_response)
+        """
+        self.logger.debug(f"ENTER place_batch_orders(count={len(orders)}, category={category})")
+        
+        response = await self.transport.place_batch_order(category, orders)
+        results = self._parse_batch_response(orders, response)
+        
+        self.logger.debug(f"EXIT place_batch_orders returned {len(results)} results")
+        return results
+    
+    async def amend_batch_orders(self, amendments: List[Dict], category: str = "linear") -> List[Dict]:
+        """
+        Amend up to BATCH_ORDER_LIMITS[category] orders in one round trip
+        
+        Args:
+            amendments: List of amendment dictionaries with symbol and orderId or orderLinkId
+            category: Product category
+            
+        Returns:
+            List of per-order results in request order (see _parse_batch_response)
+        """
+        self.logger.debug(f"ENTER amend_batch_orders(count={len(amendments)}, category={category})")
+        
+        response = await self.transport.amend_batch_order(category, amendments)
+        results = self._parse_batch_response(amendments, response)
+        
+        self.logger.debug(f"EXIT amend_batch_orders returned {len(results)} results")
+        return results
+    
+    async def cancel_batch_orders(self, cancels: List[Dict], category: str = "linear") -> List[Dict]:
+        """
+        Cancel up to BATCH_ORDER_LIMITS[category] orders in one round trip
+        
+        Args:
+            cancels: List of dictionaries with symbol and orderId or orderLinkId
+            category: Product category
+            
+        Returns:
+            List of per-order results in request order (see _parse_batch_response)
+        """
+        self.logger.debug(f"ENTER cancel_batch_orders(count={len(cancels)}, category={category})")
+        
+        response = await self.transport.cancel_batch_order(category, cancels)
+        results = self._parse_batch_response(cancels, response)
+        
+        self.logger.debug(f"EXIT cancel_batch_orders returned {len(results)} results")
+        return results
+    
+    def _parse_batch_response(self, requests: List[Dict], response: Dict) -> List[Dict]:
+        """
+        Pair each request of a batch with its result and status code
+        
+        Bybit returns results in result.list and per-order codes in
+        retExtInfo.list, both in request order.
+        
+        Args:
+            requests: Order dictionaries that were sent
+            response: Raw batch API response
+            
+        Returns:
+            List of dictionaries with orderId, orderLinkId, symbol, success, code and msg
+        """
+        if not response or response.get("retCode") != 0:
+            # Whole batch rejected
+            code = response.get("retCode", -1) if response else -1
+            msg = response.get("retMsg", "No response") if response else "No response"
+            self.logger.error(f"Batch request failed: {code} {msg}")
+            return [
+                {
+                    "orderId": request.get("orderId", ""),
+                    "orderLinkId": request.get("orderLinkId", ""),
+                    "symbol": request.get("symbol", ""),
+                    "success": False,
+                    "code": code,
+                    "msg": msg
+                }
+                for request in requests
+            ]
+        
+        items = (response.get("result") or {}).get("list", []) or []
+        statuses = (response.get("retExtInfo") or {}).get("list", []) or []
+        
+        results = []
+        for index, request in enumerate(requests):
+            item = items[index] if index < len(items) else {}
+            status = statuses[index] if index < len(statuses) else {"code": -1, "msg": "Missing result"}
+            code = status.get("code", 0)
+            
+            results.append({
+                "orderId": item.get("orderId") or request.get("orderId", ""),
+                "orderLinkId": item.get("orderLinkId") or request.get("orderLinkId", ""),
+                "symbol": item.get("symbol") or request.get("symbol", ""),
+                "success": code == 0,
+                "code": code,
+                "msg": status.get("msg", "")
+            })
+            
+        failed = sum(1 for result in results if not result["success"])
+        if failed:
+            self.logger.warning(f"{failed}/{len(results)} orders in batch were rejected")
+            
+        return results
+        
+    async def start_trade_stream(self, url: Optional[str] = None, request_timeout: float = 5.0) -> bool:
+        """
+        Open the WebSocket trade API connection used for order entry
+        
+        Args:
+            url: Optional URL override (e.g. a local mock exchange)
+            request_timeout: Seconds to wait for each reply
+            
+        Returns:
+            True if the connection task was started, False otherwise
+        """
+        self.logger.debug(f"ENTER start_trade_stream(url={url}, request_timeout={request_timeout})")
+        
+        try:
+            if self.trade_ws is None:
+                clock = getattr(self.transport, "clock", None)
+                self.trade_ws = TradeWebSocket(
+                    self.transport.api_key,
+                    self.transport.api_secret,
+                    testnet=getattr(self.transport, "testnet", True),
+                    url=url,
+                    recv_window=getattr(self.transport, "recv_window", 5000),
+                    request_timeout=request_timeout,
+                    clock=clock.now_ms if clock is not None else None,
+                    max_reconnect_attempts=0,  # keep trying; REST covers the outage
+                    logger=self.logger
+                )
+            self.trade_ws.start()
+            
+            self.logger.debug(f"EXIT start_trade_stream returned True")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error starting trade stream: {str(e)}")
+            self.logger.debug(f"EXIT start_trade_stream returned False (error)")
+            return False
+    
+    async def stop_trade_stream(self) -> None:
+        """Close the WebSocket trade API connection; orders go over REST afterwards"""
+        if self.trade_ws is not None:
+            await self.trade_ws.stop()
+            self.trade_ws = None
+    
+    async def create_order(self, params: Dict) -> Dict:
+        """
+        Place an order over the trade WebSocket, or REST if it is down
+        
+        An orderLinkId is added if missing so that a REST fallback after
+        an unanswered WebSocket request cannot create a second order.
+        
+        Args:
+            params: Bybit order parameters (category, symbol, side, orderType, qty, ...)
+            
+        Returns:
+            REST-style response with retCode, retMsg and result
+        """
+        params = dict(params)
+        if not params.get("orderLinkId"):
+            params["orderLinkId"] = f"pb-{uuid.uuid4().hex[:30]}"
+        return await self._send_order_request("order.create", params, self.transport.place_order)
+    
+    async def amend_order(self, params: Dict) -> Dict:
+        """
+        Amend an order over the trade WebSocket, or REST if it is down
+        
+        Args:
+            params: Amend parameters with symbol and orderId or orderLinkId
+            
+        Returns:
+            REST-style response with retCode, retMsg and result
+        """
+        return await self._send_order_request("order.amend", dict(params), self.transport.amend_order)
+    
+    async def cancel_order(self, symbol: str, order_id: Optional[str] = None,
+                           order_link_id: Optional[str] = None, category: str = "linear") -> Dict:
+        """
+        Cancel an order over the trade WebSocket, or REST if it is down
+        
+        Args:
+            symbol: Trading symbol
+            order_id: Order ID
+            order_link_id: Client order ID (used if order_id is not given)
+            category: Product category
+            
+        Returns:
+            REST-style response with retCode, retMsg and result
+        """
+        params = {"category": category, "symbol": symbol}
+        if order_id:
+            params["orderId"] = order_id
+        elif order_link_id:
+            params["orderLinkId"] = order_link_id
+            
+        async def rest_cancel(params: Dict) -> Dict:
+            return await self.transport.cancel_order(category, symbol, order_id=order_id,
+                                                     order_link_id=order_link_id)
+            
+        return await self._send_order_request("order.cancel", params, rest_cancel)
+    
+    async def _send_order_request(self, op: str, params: Dict, rest_call) -> Dict:
+        """
+        Route an order request to the trade WebSocket with REST fallback
+        
+        Args:
+            op: Trade API operation
+            params: Request parameters
+            rest_call: Coroutine function sending the same request over REST
+            
+        Returns:
+            REST-style response with retCode, retMsg and result
+        """
+        self.logger.debug(f"ENTER _send_order_request(op={op}, symbol={params.get('symbol')})")
+        
+        fell_back = False
+        if self.trade_ws is not None and self.trade_ws.connected:
+            await self.transport.rate_limiter.acquire(self.TRADE_PATHS[op])
+            started = time.perf_counter()
+            try:
+                reply = await self.trade_ws.request(op, params)
+                self.latency["ws"].record(time.perf_counter() - started)
+                self.logger.debug(f"EXIT _send_order_request returned retCode={reply.get('retCode')} (ws)")
+                return {
+                    "retCode": reply.get("retCode", -1),
+                    "retMsg": reply.get("retMsg", ""),
+                    "result": reply.get("data") or {},
+                    "retExtInfo": reply.get("retExtInfo") or {},
+                    "time": int(time.time() * 1000)
+                }
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                self.ws_fallbacks += 1
+                fell_back = True
+                self.logger.warning(f"Trade WebSocket {op} failed ({str(e) or type(e).__name__}), falling back to REST")
+                
+        started = time.perf_counter()
+        response = await rest_call(params)
+        self.latency["rest"].record(time.perf_counter() - started)
+        
+        # The unanswered WebSocket request may have reached the exchange
+        if fell_back and response.get("retCode") == self.ALREADY_APPLIED_CODES[op]:
+            order = await self._find_applied_order(op, params)
+            if order is not None:
+                self.logger.info(f"{op} for {order.get('orderId')} went through over the WebSocket before the fallback")
+                response = {
+                    "retCode": 0,
+                    "retMsg": "OK",
+                    "result": {"orderId": order.get("orderId", ""), "orderLinkId": order.get("orderLinkId", "")},
+                    "retExtInfo": {},
+                    "time": int(time.time() * 1000)
+                }
+        
+        self.logger.debug(f"EXIT _send_order_request returned retCode={response.get('retCode')} (rest)")
+        return response
+    
+    async def _find_applied_order(self, op: str, params: Dict) -> Optional[Dict]:
+        """
+        Look up an order to see whether a trade API request took effect
+        
+        Args:
+            op: Trade API operation
+            params: Request parameters with orderId or orderLinkId
+            
+        Returns:
+            The order if the request was applied to it, otherwise None
+        """
+        try:
+            response = await self.transport.get_open_orders(
+                params.get("category", "linear"), params.get("symbol"),
+                order_id=params.get("orderId"), order_link_id=params.get("orderLinkId")
+            )
+            orders = response.get("result", {}).get("list", [])
+        except Exception as e:
+            self.logger.error(f"Error looking up order after {op} fallback: {str(e)}")
+            return None
+            
+        if not orders:
+            return None
+        order = orders[0]
+        
+        if op == "order.cancel" and order.get("orderStatus") not in ("Cancelled", "Deactivated"):
+            return None
+        if op == "order.amend":
+            for key in ("qty", "price", "triggerPrice"):
+                if params.get(key) is not None and Decimal(str(params[key])) != Decimal(str(order.get(key) or 0)):
+                    return None
+        return order
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """
+        Get order-entry latency histograms per transport
+        
+        Returns:
+            Dictionary with "ws" and "rest" histogram stats, the number of
+            REST fallbacks and whether the trade WebSocket is connected
+        """
+        return {
+            "ws": self.latency["ws"].get_stats(),
+            "rest": self.latency["rest"].get_stats(),
+            "ws_fallbacks": self.ws_fallbacks,
+            "ws_connected": self.trade_ws is not None and self.trade_ws.connected,
+        }
+        
     # Rest of the class implementation remains the same, just ensure all references to BybitClientTransport are changed to BybitClient
     # ...
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+Order Book - Incremental L2 order book
+
+Keeps each side of the book as preallocated, sorted numpy price/size
+arrays with the best level at index 0, so snapshots and deltas from the
+orderbook stream are applied in place and best bid/ask, mid, spread and
+cumulative depth are read without parsing or sorting.
+
+Deltas are validated against the update ID (`u`), which is consecutive
+per topic, and the cross sequence (`seq`). A gap or a crossed book marks
+the book out of sync; deltas are then ignored until the next snapshot,
+which the owner requests by resubscribing or fetching over REST.
+
+Example usage:
+    book = OrderBook("BTCUSDT")
+    book.apply("snapshot", message["data"], message["ts"])
+    if not book.apply("delta", delta["data"], delta["ts"]) and not book.synced:
+        resync()
+    print(book.best_bid, book.best_ask, book.depth("b", 10))
+"""
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class _BookSide:
+    """
+    One side of the book, sorted best first
+    
+    Bid prices are stored negated so that both sides sort ascending.
+    """
+    
+    def __init__(self, sign: float, capacity: int):
+        self.sign = sign
+        self.keys = np.empty(capacity, dtype=np.float64)
+        self.sizes = np.empty(capacity, dtype=np.float64)
+        self.n = 0
+        self._cumulative: Optional[np.ndarray] = None
+        
+    def clear(self) -> None:
+        self.n = 0
+        self._cumulative = None
+        
+    def set(self, price: float, size: float) -> None:
+        """Insert, update or (size 0) remove a level"""
+        key = price * self.sign
+        n = self.n
+        i = int(np.searchsorted(self.keys[:n], key))
+        found = i < n and self.keys[i] == key
+        
+        if size == 0:
+            if found:
+                self.keys[i:n - 1] = self.keys[i + 1:n]
+                self.sizes[i:n - 1] = self.sizes[i + 1:n]
+                self.n = n - 1
+        elif found:
+            self.sizes[i] = size
+        else:
+            if n == len(self.keys):
+                self.keys = np.resize(self.keys, 2 * n)
+                self.sizes = np.resize(self.sizes, 2 * n)
+            self.keys[i + 1:n + 1] = self.keys[i:n]
+            self.sizes[i + 1:n + 1] = self.sizes[i:n]
+            self.keys[i] = key
+            self.sizes[i] = size
+            self.n = n + 1
+        self._cumulative = None
+        
+    def best(self) -> float:
+        return float(self.keys[0] * self.sign) if self.n else math.nan
+        
+    def depth(self, levels: int) -> float:
+        if not self.n or levels <= 0:
+            return 0.0
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.sizes[:self.n])
+        return float(self._cumulative[min(levels, self.n) - 1])
+        
+    def levels(self, depth: int) -> np.ndarray:
+        n = min(depth, self.n)
+        return np.column_stack((self.keys[:n] * self.sign, self.sizes[:n]))
+
+
+class OrderBook:
+    """
+    L2 order book for one symbol, updated from snapshots and deltas
+    """
+    
+    def __init__(self, symbol: str, capacity: int = 256):
+        """
+        Initialize an empty, unsynced book
+        
+        Args:
+            symbol: Trading symbol
+            capacity: Initial levels allocated per side (grows if exceeded)
+        """
+        self.symbol = symbol
+        self.bids = _BookSide(-1.0, capacity)
+        self.asks = _BookSide(1.0, capacity)
+        self.update_id = 0
+        self.seq = 0
+        self.timestamp = 0
+        self.synced = False
+        self.stats = {"snapshots": 0, "deltas": 0, "gaps": 0, "crossed": 0, "stale": 0}
+        
+    def apply(self, message_type: str, data: Dict, ts: Optional[int] = None) -> bool:
+        """
+        Apply an orderbook message
+        
+        Args:
+            message_type: 'snapshot' or 'delta'
+            data: Message data with 'b'/'a' [price, size] levels, 'u' and 'seq'
+            ts: Message timestamp in milliseconds
+            
+        Returns:
+            True if the book changed, False if the message was ignored or
+            left the book out of sync
+        """
+        if message_type == "snapshot":
+            return self.apply_snapshot(data, ts)
+        return self.apply_delta(data, ts)
+        
+    def apply_snapshot(self, data: Dict, ts: Optional[int] = None) -> bool:
+        """
+        Replace the book with a snapshot
+        
+        Args:
+            data: Snapshot with 'b'/'a' levels, 'u' and 'seq'
+            ts: Snapshot timestamp in milliseconds
+            
+        Returns:
+            True if the snapshot left a valid book
+        """
+        self.bids.clear()
+        self.asks.clear()
+        self._apply_levels(data)
+        self.update_id = int(data.get("u") or 0)
+        self.seq = int(data.get("seq") or 0)
+        self.timestamp = ts or data.get("ts") or 0
+        self.stats["snapshots"] += 1
+        self.synced = True
+        return self._check_crossed()
+        
+    def apply_delta(self, data: Dict, ts: Optional[int] = None) -> bool:
+        """
+        Apply a delta in place after validating its sequence
+        
+        Args:
+            data: Delta with changed 'b'/'a' levels (size "0" removes), 'u' and 'seq'
+            ts: Delta timestamp in milliseconds
+            
+        Returns:
+            True if the delta was applied
+        """
+        if not self.synced:
+            return False
+            
+        update_id = int(data.get("u") or 0)
+        seq = int(data.get("seq") or 0)
+        if update_id <= self.update_id or seq < self.seq:
+            # Duplicate or reordered message
+            self.stats["stale"] += 1
+            return False
+        if update_id != self.update_id + 1:
+            self.stats["gaps"] += 1
+            self.synced = False
+            return False
+            
+        self._apply_levels(data)
+        self.update_id = update_id
+        self.seq = seq
+        self.timestamp = ts or self.timestamp
+        self.stats["deltas"] += 1
+        return self._check_crossed()
+        
+    def _apply_levels(self, data: Dict) -> None:
+        for price, size in data.get("b", ()):
+            self.bids.set(float(price), float(size))
+        for price, size in data.get("a", ()):
+            self.asks.set(float(price), float(size))
+            
+    def _check_crossed(self) -> bool:
+        """Mark the book out of sync if best bid >= best ask"""
+        if self.bids.n and self.asks.n and self.bids.best() >= self.asks.best():
+            self.stats["crossed"] += 1
+            self.synced = False
+            return False
+        return True
+        
+    @property
+    def best_bid(self) -> float:
+        """Best bid price (NaN if empty)"""
+        return self.bids.best()
+        
+    @property
+    def best_ask(self) -> float:
+        """Best ask price (NaN if empty)"""
+        return self.asks.best()
+        
+    @property
+    def mid(self) -> float:
+        """Mid price (NaN unless both sides have levels)"""
+        return (self.bids.best() + self.asks.best()) / 2
+        
+    @property
+    def spread(self) -> float:
+        """Best ask minus best bid (NaN unless both sides have levels)"""
+        return self.asks.best() - self.bids.best()
+        
+    def depth(self, side: str, levels: int) -> float:
+        """
+        Cumulative size of the best levels on one side
+        
+        Args:
+            side: 'b' for bids, 'a' for asks
+            levels: Number of levels from the top
+            
+        Returns:
+            Total size
+        """
+        return (self.bids if side == "b" else self.asks).depth(levels)
+        
+    def levels(self, side: str, depth: int) -> np.ndarray:
+        """
+        Top levels of one side as a (n, 2) float array of price, size
+        
+        Args:
+            side: 'b' for bids, 'a' for asks
+            depth: Maximum number of levels
+            
+        Returns:
+            Levels, best first
+        """
+        return (self.bids if side == "b" else self.asks).levels(depth)
+        
+    def to_dict(self, depth: int) -> Dict:
+        """
+        Top of the book in the cached orderbook format
+        
+        Args:
+            depth: Maximum number of levels per side
+            
+        Returns:
+            Dictionary with 'bids'/'asks' [price, size] float lists,
+            'timestamp', 'u', 'seq' and 'synced'
+        """
+        return {
+            "bids": self.levels("b", depth).tolist(),
+            "asks": self.levels("a", depth).tolist(),
+            "timestamp": self.timestamp,
+            "u": self.update_id,
+            "seq": self.seq,
+            "synced": self.synced,
+        }
+        
+    def __len__(self) -> int:
+        return self.bids.n + self.asks.n
@@ -0,0 +1,199 @@
+"""
+Pagination - Async iteration over paged and time-sliced v5 endpoints
+
+Cursor-paged endpoints (order history, executions, open orders,
+positions) are followed through nextPageCursor; the next page is
+requested while the caller is still processing the current one.
+
+Time-ranged endpoints (klines) are split into fixed windows that are
+fetched with bounded concurrency and yielded in time order.
+
+Example usage:
+    async for order in client.iter_order_history(symbol="BTCUSDT"):
+        ...
+        
+    async for page in client.iter_klines("linear", "BTCUSDT", "1m", start, end):
+        ...
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..exceptions import BybitAPIError
+
+
+# Bybit v5 kline intervals, accepting both the config style ("1m", "1h")
+# and the API style ("1", "60"), with their length in milliseconds
+KLINE_INTERVALS = {
+    "1": ("1", 60_000),
+    "3": ("3", 180_000),
+    "5": ("5", 300_000),
+    "15": ("15", 900_000),
+    "30": ("30", 1_800_000),
+    "60": ("60", 3_600_000),
+    "120": ("120", 7_200_000),
+    "240": ("240", 14_400_000),
+    "360": ("360", 21_600_000),
+    "720": ("720", 43_200_000),
+    "D": ("D", 86_400_000),
+    "W": ("W", 604_800_000),
+    "1m": ("1", 60_000),
+    "3m": ("3", 180_000),
+    "5m": ("5", 300_000),
+    "15m": ("15", 900_000),
+    "30m": ("30", 1_800_000),
+    "1h": ("60", 3_600_000),
+    "2h": ("120", 7_200_000),
+    "4h": ("240", 14_400_000),
+    "6h": ("360", 21_600_000),
+    "12h": ("720", 43_200_000),
+    "1d": ("D", 86_400_000),
+    "1w": ("W", 604_800_000),
+}
+
+
+def to_bybit_interval(interval: str) -> str:
+    """
+    Convert an interval to the value the v5 API expects
+    
+    Args:
+        interval: Interval such as "1m", "1h" or "60"
+        
+    Returns:
+        Bybit interval string (unknown values are passed through)
+    """
+    entry = KLINE_INTERVALS.get(interval)
+    return entry[0] if entry else interval
+
+
+def interval_to_ms(interval: str) -> int:
+    """
+    Get the length of a kline interval
+    
+    Args:
+        interval: Interval such as "1m", "1h" or "60"
+        
+    Returns:
+        Interval length in milliseconds
+        
+    Raises:
+        ValueError: For unknown or variable-length intervals (e.g. "M")
+    """
+    entry = KLINE_INTERVALS.get(interval)
+    if entry is None:
+        raise ValueError(f"Unsupported kline interval: {interval}")
+    return entry[1]
+
+
+def split_time_range(start: int, end: int, step: int) -> List[Tuple[int, int]]:
+    """
+    Split [start, end] into consecutive inclusive windows
+    
+    Args:
+        start: Range start in milliseconds
+        end: Range end in milliseconds (inclusive)
+        step: Window length in milliseconds
+        
+    Returns:
+        List of (window_start, window_end) tuples
+    """
+    windows = []
+    window_start = start
+    while window_start <= end:
+        window_end = min(end, window_start + step - 1)
+        windows.append((window_start, window_end))
+        window_start += step
+    return windows
+
+
+def _check_response(response: Dict, what: str) -> Dict:
+    """
+    Get the result of a page response, raising on API errors
+    
+    Args:
+        response: Parsed API response
+        what: Description for the error message
+        
+    Returns:
+        The response's result dictionary
+    """
+    if not response or response.get("retCode") != 0:
+        error_msg = response.get("retMsg", "Unknown error") if response else "No response"
+        raise BybitAPIError(f"Error fetching {what}: {error_msg}")
+    return response.get("result") or {}
+
+
+async def iter_cursor(fetch_page: Callable[[Optional[str]], Awaitable[Dict]],
+                      what: str = "page") -> AsyncIterator[Dict]:
+    """
+    Yield the items of a cursor-paged endpoint, prefetching the next page
+    
+    Args:
+        fetch_page: Coroutine function taking a cursor (None for the first
+            page) and returning the parsed API response
+        what: Description for error messages
+        
+    Yields:
+        Items of result.list, page by page
+        
+    Raises:
+        BybitAPIError: If a page returns an API error
+    """
+    loop = asyncio.get_running_loop()
+    task = loop.create_task(fetch_page(None))
+    seen_cursors = set()
+    
+    try:
+        while task is not None:
+            result = _check_response(await task, what)
+            items = result.get("list") or []
+            cursor = result.get("nextPageCursor")
+            
+            task = None
+            if items and cursor and cursor not in seen_cursors:
+                seen_cursors.add(cursor)
+                task = loop.create_task(fetch_page(cursor))
+                
+            for item in items:
+                yield item
+    finally:
+        # Caller stopped early or a page failed
+        if task is not None and not task.done():
+            task.cancel()
+
+
+async def iter_windows(fetch_window: Callable[[int, int], Awaitable[Any]],
+                       windows: List[Tuple[int, int]],
+                       concurrency: int = 4) -> AsyncIterator[Any]:
+    """
+    Fetch time windows concurrently and yield the results in window order
+    
+    Args:
+        fetch_window: Coroutine function taking (window_start, window_end)
+        windows: Windows from split_time_range()
+        concurrency: Maximum number of windows fetched at once
+        
+    Yields:
+        Result of each window, in the order of `windows`
+    """
+    loop = asyncio.get_running_loop()
+    remaining = iter(windows)
+    pending: Deque[asyncio.Task] = deque()
+    
+    def schedule_next() -> None:
+        window = next(remaining, None)
+        if window is not None:
+            pending.append(loop.create_task(fetch_window(*window)))
+            
+    try:
+        for _ in range(max(1, concurrency)):
+            schedule_next()
+            
+        while pending:
+            result = await pending.popleft()
+            schedule_next()
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,350 @@
+"""
+Rate Limiter - Non-blocking token-bucket rate limiting for the Bybit API
+
+Each endpoint group (market data, order mutation, order queries, position,
+account) has its own token bucket sized to Bybit's per-UID limits. All
+groups also draw from a shared per-IP bucket, but market data may only
+use it down to a reserve, so order traffic always keeps its full budget.
+
+Buckets are re-synchronised from the X-Bapi-Limit-Status and
+X-Bapi-Limit-Reset-Timestamp response headers, and callers await
+instead of sleeping a thread.
+
+Example usage:
+    limiter = RateLimiter()
+    
+    await limiter.acquire("/v5/order/create")
+    response = await session.post(...)
+    limiter.update_from_headers("/v5/order/create", response.headers)
+"""
+
+import time
+import asyncio
+from typing import Dict, Optional, Mapping, Any
+
+from ..utils.logger import Logger
+
+
+class TokenBucket:
+    """
+    Token bucket with continuous refill
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket
+        
+        Args:
+            capacity: Maximum number of tokens
+            refill_rate: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0  # monotonic time before which nothing is granted
+        
+    def _refill(self, now: float) -> None:
+        """
+        Add tokens for the time elapsed since the last refill
+        
+        Args:
+            now: Current monotonic time
+        """
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.last_refill = now
+            
+    def available(self, now: Optional[float] = None) -> float:
+        """
+        Get the number of tokens currently available
+        
+        Args:
+            now: Optional current monotonic time
+            
+        Returns:
+            Available tokens
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        return self.tokens
+        
+    def wait_time(self, tokens: float = 1.0, reserve: float = 0.0, now: Optional[float] = None) -> float:
+        """
+        Get the time until `tokens` can be taken while leaving `reserve` behind
+        
+        Args:
+            tokens: Number of tokens needed
+            reserve: Tokens that must remain in the bucket afterwards
+            now: Optional current monotonic time
+            
+        Returns:
+            Seconds to wait (0 if tokens are available now)
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        
+        if now < self.blocked_until:
+            return self.blocked_until - now
+            
+        deficit = tokens + reserve - self.tokens
+        if deficit <= 0:
+            return 0.0
+            
+        return deficit / self.refill_rate
+        
+    def consume(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens from the bucket (may go negative when re-synchronised)
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        self.tokens -= tokens
+        
+    def sync(self, remaining: int, limit: Optional[int] = None,
+             reset_at: Optional[float] = None) -> None:
+        """
+        Align the bucket with the exchange's view of the limit
+        
+        Args:
+            remaining: Requests remaining in the current window
+            limit: Window size reported by the exchange
+            reset_at: Monotonic time at which the window resets
+        """
+        now = time.monotonic()
+        self._refill(now)
+        
+        if limit and limit > 0 and limit != self.capacity:
+            # Keep the refill period, scale to the exchange's limit
+            period = self.capacity / self.refill_rate
+            self.capacity = float(limit)
+            self.refill_rate = self.capacity / period
+            
+        self.tokens = min(self.tokens, float(remaining))
+        
+        if remaining <= 0 and reset_at is not None and reset_at > now:
+            self.blocked_until = max(self.blocked_until, reset_at)
+
+
+class RateLimiter:
+    """
+    Per-endpoint-group rate limiter for the async transport
+    """
+    
+    # Endpoint groups, matched by longest path prefix
+    ENDPOINT_GROUPS = {
+        "/v5/market/": "market",
+        "/v5/server/time": "market",
+        "/v5/order/create": "order",
+        "/v5/order/amend": "order",
+        "/v5/order/cancel": "order",
+        "/v5/order/create-batch": "order",
+        "/v5/order/amend-batch": "order",
+        "/v5/order/cancel-batch": "order",
+        "/v5/order/cancel-all": "order",
+        "/v5/order/": "order_query",
+        "/v5/execution/": "order_query",
+        "/v5/position/": "position",
+        "/v5/account/": "account",
+        "/v5/asset/": "account",
+    }
+    
+    # (capacity, refill per second) per group, from Bybit's default per-UID limits
+    DEFAULT_LIMITS = {
+        "market": (120, 120.0),
+        "order": (10, 10.0),
+        "order_query": (50, 50.0),
+        "position": (50, 50.0),
+        "account": (50, 50.0),
+        "default": (20, 20.0),
+    }
+    
+    # Shared per-IP budget (600 requests per 5 seconds)
+    IP_LIMIT = (600, 120.0)
+    
+    # Share of the IP budget that market data may never consume
+    MARKET_RESERVE_RATIO = 0.2
+    
+    # Groups that are limited to the IP budget above the reserve
+    LOW_PRIORITY_GROUPS = {"market"}
+    
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None, logger: Optional[Logger] = None,
+                 ip_limit: Optional[tuple] = None):
+        """
+        Initialize the limiter
+        
+        Args:
+            limits: Optional overrides of {group: (capacity, refill_per_second)}
+            logger: Optional logger instance
+            ip_limit: Optional override of the shared (capacity, refill_per_second)
+        """
+        self.logger = logger or Logger("RateLimiter")
+        
+        group_limits = dict(self.DEFAULT_LIMITS)
+        if limits:
+            group_limits.update(limits)
+            
+        self.buckets = {
+            group: TokenBucket(capacity, rate)
+            for group, (capacity, rate) in group_limits.items()
+        }
+        self.ip_bucket = TokenBucket(*(ip_limit or self.IP_LIMIT))
+        
+        # Longest prefixes first so specific endpoints win
+        self._prefixes = sorted(self.ENDPOINT_GROUPS.items(), key=lambda item: len(item[0]), reverse=True)
+        self._group_cache: Dict[str, str] = {}
+        
+        # Statistics
+        self.stats = {group: {"requests": 0, "waits": 0, "wait_time": 0.0} for group in self.buckets}
+        
+    def get_group(self, path: str) -> str:
+        """
+        Map an endpoint path to its rate-limit group
+        
+        Args:
+            path: API endpoint path
+            
+        Returns:
+            Group name
+        """
+        group = self._group_cache.get(path)
+        if group is None:
+            group = "default"
+            for prefix, candidate in self._prefixes:
+                if path.startswith(prefix):
+                    group = candidate
+                    break
+            self._group_cache[path] = group
+        return group
+        
+    def _reserve(self, group: str) -> float:
+        """
+        Take a token for the group if possible
+        
+        Args:
+            group: Rate-limit group
+            
+        Returns:
+            0 if a token was taken, otherwise the seconds to wait before retrying
+        """
+        now = time.monotonic()
+        bucket = self.buckets.get(group, self.buckets["default"])
+        
+        reserve = 0.0
+        if group in self.LOW_PRIORITY_GROUPS:
+            reserve = self.ip_bucket.capacity * self.MARKET_RESERVE_RATIO
+            
+        wait = max(bucket.wait_time(1.0, now=now), self.ip_bucket.wait_time(1.0, reserve, now=now))
+        if wait > 0:
+            return wait
+            
+        bucket.consume()
+        self.ip_bucket.consume()
+        return 0.0
+        
+    async def acquire(self, path: str) -> float:
+        """
+        Wait until a request to `path` is allowed
+        
+        Args:
+            path: API endpoint path
+            
+        Returns:
+            Total seconds spent waiting
+        """
+        group = self.get_group(path)
+        stats = self.stats.setdefault(group, {"requests": 0, "waits": 0, "wait_time": 0.0})
+        waited = 0.0
+        
+        while True:
+            wait = self._reserve(group)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+            
+        stats["requests"] += 1
+        if waited > 0:
+            stats["waits"] += 1
+            stats["wait_time"] += waited
+            
+        return waited
+        
+    def update_from_headers(self, path: str, headers: Mapping[str, Any]) -> None:
+        """
+        Re-synchronise the group's bucket from Bybit rate-limit headers
+        
+        Args:
+            path: API endpoint path the response belongs to
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining = self._header_value(headers, "X-Bapi-Limit-Status")
+        if remaining is None:
+            return
+            
+        limit = self._header_value(headers, "X-Bapi-Limit")
+        reset_ms = self._header_value(headers, "X-Bapi-Limit-Reset-Timestamp")
+        
+        reset_at = None
+        if reset_ms is not None:
+            # Convert the wall-clock reset time to monotonic time
+            reset_at = time.monotonic() + max(0.0, reset_ms / 1000.0 - time.time())
+            
+        group = self.get_group(path)
+        bucket = self.buckets.get(group, self.buckets["default"])
+        bucket.sync(int(remaining), int(limit) if limit else None, reset_at)
+        
+        if remaining <= 0:
+            self.logger.warning(f"Rate limit exhausted for {group} ({path}), pausing until reset")
+            
+    def penalize(self, path: str, delay: float = 1.0) -> None:
+        """
+        Block a group after the exchange rejected a request for rate limiting
+        
+        Args:
+            path: API endpoint path
+            delay: Seconds to block the group
+        """
+        group = self.get_group(path)
+        bucket = self.buckets.get(group, self.buckets["default"])
+        bucket.tokens = min(bucket.tokens, 0.0)
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-group request, wait and token statistics
+        
+        Returns:
+            Dictionary of statistics by group
+        """
+        now = time.monotonic()
+        result = {}
+        for group, stats in self.stats.items():
+            bucket = self.buckets.get(group, self.buckets["default"])
+            result[group] = dict(stats, tokens=bucket.available(now), capacity=bucket.capacity)
+        result["ip"] = {"tokens": self.ip_bucket.available(now), "capacity": self.ip_bucket.capacity}
+        return result
+        
+    @staticmethod
+    def _header_value(headers: Mapping[str, Any], name: str) -> Optional[float]:
+        """
+        Read a numeric header value
+        
+        Args:
+            headers: Response headers
+            name: Header name
+            
+        Returns:
+            Numeric value or None if missing/invalid
+        """
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.lower())
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
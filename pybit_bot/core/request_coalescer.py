@@ -0,0 +1,159 @@
+"""
+Request Coalescer - Single-flight sharing of identical GET requests
+
+Several components poll the same endpoints in one loop iteration (e.g.
+/v5/position/list from the engine, the TP/SL manager and signal
+validation). Concurrent identical GETs are collapsed into one HTTP round
+trip, and all callers receive the same parsed result. Endpoints can
+additionally keep a successful result for a short TTL.
+
+Results are shared between callers and must be treated as read-only.
+
+Writes invalidate cached reads that they affect, so a position or order
+query issued after an order is placed never sees pre-order state.
+"""
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from ..utils.logger import Logger
+
+
+class RequestCoalescer:
+    """
+    Single-flight coalescing with optional per-endpoint TTL caching
+    """
+    
+    # Seconds a successful result is reused, per endpoint path
+    DEFAULT_TTLS = {
+        "/v5/position/list": 0.25,
+        "/v5/order/realtime": 0.25,
+    }
+    
+    # POST prefixes and the GET paths whose results they invalidate
+    INVALIDATIONS = (
+        ("/v5/order/", ("/v5/order/realtime", "/v5/order/history", "/v5/position/list", "/v5/execution/list")),
+        ("/v5/position/", ("/v5/position/list",)),
+        ("/v5/account/", ("/v5/account/wallet-balance",)),
+    )
+    
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, logger: Optional[Logger] = None):
+        """
+        Initialize the coalescer
+        
+        Args:
+            ttls: Optional overrides of the per-endpoint TTLs in seconds (0 disables caching)
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("RequestCoalescer")
+        
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+            
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        
+        self.stats = {"requests": 0, "shared": 0, "cached": 0}
+        
+    @staticmethod
+    def make_key(path: str, params: Dict, auth_required: bool, variant: Hashable = None) -> Hashable:
+        """
+        Build the identity of a GET request (before signing)
+        
+        Args:
+            path: API endpoint path
+            params: Request parameters
+            auth_required: Whether the request is signed
+            variant: Optional extra identity, e.g. the response decoder
+            
+        Returns:
+            Hashable request key
+        """
+        return (path, auth_required, tuple(sorted((k, str(v)) for k, v in params.items())), variant)
+        
+    async def run(self, key: Hashable, path: str, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached or in-flight result for `key`, or send the request
+        
+        Args:
+            key: Request key from make_key()
+            path: API endpoint path (for TTL lookup)
+            request: Zero-argument coroutine function that sends the request
+            
+        Returns:
+            Parsed API response (shared, read-only)
+        """
+        self.stats["requests"] += 1
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if time.monotonic() < expires_at:
+                self.stats["cached"] += 1
+                return result
+            del self._cache[key]
+            
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.stats["shared"] += 1
+        else:
+            task = loop.create_task(request())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t, k=key, p=path: self._on_done(k, p, t))
+            
+        # Shield so one caller's cancellation does not cancel the shared request
+        return await asyncio.shield(task)
+        
+    def _on_done(self, key: Hashable, path: str, task: asyncio.Task) -> None:
+        """
+        Remove a finished request and cache a successful result
+        
+        Args:
+            key: Request key
+            path: API endpoint path
+            task: Finished request task
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        else:
+            # Invalidated while in flight, do not cache the stale result
+            return
+            
+        if task.cancelled() or task.exception() is not None:
+            return
+            
+        ttl = self.ttls.get(path, 0)
+        result = task.result()
+        if ttl > 0 and isinstance(result, dict) and result.get("retCode") == 0:
+            self._cache[key] = (time.monotonic() + ttl, result)
+            
+    def invalidate(self, path: str) -> None:
+        """
+        Drop cached and in-flight reads affected by a write to `path`
+        
+        In-flight requests still complete for their current callers, but
+        later callers start a fresh request.
+        
+        Args:
+            path: Path of the write request (POST)
+        """
+        affected = set()
+        for prefix, paths in self.INVALIDATIONS:
+            if path.startswith(prefix):
+                affected.update(paths)
+                
+        if not affected:
+            return
+            
+        for store in (self._cache, self._in_flight):
+            for key in [k for k in store if k[0] in affected]:
+                del store[key]
+                
+    def clear(self) -> None:
+        """Drop all cached results and in-flight entries"""
+        self._cache.clear()
+        self._in_flight.clear()
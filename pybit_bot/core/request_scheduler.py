@@ -0,0 +1,316 @@
+"""
+Request Scheduler - Priority scheduling of REST requests
+
+Sits in front of BybitClient's HTTP transport so that order placement
+and cancellation never queue behind market-data polling. Requests are
+grouped into priority classes, each with a bounded queue. A request may
+carry a deadline: if it is still queued when the deadline passes it is
+dropped instead of being sent late.
+
+Queue depth and wait-time metrics are recorded per class so the effect
+on order-path latency can be measured.
+
+Example usage:
+    scheduler = RequestScheduler(max_in_flight=10)
+    
+    result = await scheduler.submit(
+        lambda: client.send(...),
+        RequestPriority.MARKET_DATA,
+        deadline=1.0
+    )
+"""
+
+import time
+import asyncio
+from collections import deque
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from ..utils.logger import Logger
+from ..exceptions import RequestDroppedError
+
+
+class RequestPriority(IntEnum):
+    """Priority classes, lower value is served first"""
+    ORDER_MUTATION = 0  # Create, amend, cancel, trading stop
+    ORDER_QUERY = 1  # Order, execution, position and account queries
+    MARKET_DATA = 2  # Public market data
+
+
+class RequestScheduler:
+    """
+    Priority scheduler with bounded per-class queues and deadlines
+    """
+    
+    # Endpoint prefixes that mutate orders or positions
+    MUTATION_PREFIXES = (
+        "/v5/order/create",
+        "/v5/order/amend",
+        "/v5/order/cancel",
+        "/v5/position/trading-stop",
+        "/v5/position/set-leverage",
+        "/v5/position/switch-mode",
+    )
+    
+    # Endpoint prefixes for public market data
+    MARKET_DATA_PREFIXES = (
+        "/v5/market/",
+        "/v5/server/time",
+    )
+    
+    # Maximum queued requests per class
+    DEFAULT_QUEUE_SIZES = {
+        RequestPriority.ORDER_MUTATION: 100,
+        RequestPriority.ORDER_QUERY: 200,
+        RequestPriority.MARKET_DATA: 200,
+    }
+    
+    # Deadline (seconds) applied when the caller gives none
+    DEFAULT_DEADLINES = {
+        RequestPriority.ORDER_MUTATION: None,
+        RequestPriority.ORDER_QUERY: None,
+        RequestPriority.MARKET_DATA: 2.0,
+    }
+    
+    # Number of recent wait times kept per class for percentiles
+    WAIT_SAMPLES = 1000
+    
+    def __init__(self, max_in_flight: int = 10, reserved_slots: int = 2,
+                 queue_sizes: Optional[Dict[RequestPriority, int]] = None,
+                 logger: Optional[Logger] = None):
+        """
+        Initialize the scheduler
+        
+        Args:
+            max_in_flight: Maximum number of requests sent concurrently
+            reserved_slots: In-flight slots market data may never occupy
+            queue_sizes: Optional overrides of the per-class queue sizes
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("RequestScheduler")
+        
+        self.max_in_flight = max_in_flight
+        self.queue_sizes = dict(self.DEFAULT_QUEUE_SIZES)
+        if queue_sizes:
+            self.queue_sizes.update(queue_sizes)
+        self.deadlines = dict(self.DEFAULT_DEADLINES)
+        
+        # Per-class cap on in-flight requests, so slow market-data requests
+        # (e.g. waiting for rate budget) cannot starve the order path
+        self.class_limits = {
+            RequestPriority.ORDER_MUTATION: max_in_flight,
+            RequestPriority.ORDER_QUERY: max_in_flight,
+            RequestPriority.MARKET_DATA: max(1, max_in_flight - reserved_slots),
+        }
+        
+        # Queue entries are (future, absolute deadline, enqueue time)
+        self._queues: Dict[RequestPriority, Deque[Tuple[asyncio.Future, Optional[float], float]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._in_flight = 0
+        self._class_in_flight = {priority: 0 for priority in RequestPriority}
+        
+        # Metrics
+        self._metrics = {
+            priority: {
+                "submitted": 0,
+                "completed": 0,
+                "dropped_full": 0,
+                "dropped_expired": 0,
+                "max_queue_depth": 0,
+            }
+            for priority in RequestPriority
+        }
+        self._wait_times: Dict[RequestPriority, Deque[float]] = {
+            priority: deque(maxlen=self.WAIT_SAMPLES) for priority in RequestPriority
+        }
+        
+    def classify(self, path: str) -> RequestPriority:
+        """
+        Get the priority class for an endpoint path
+        
+        Args:
+            path: API endpoint path
+            
+        Returns:
+            RequestPriority for the path
+        """
+        if path.startswith(self.MUTATION_PREFIXES):
+            return RequestPriority.ORDER_MUTATION
+        if path.startswith(self.MARKET_DATA_PREFIXES):
+            return RequestPriority.MARKET_DATA
+        return RequestPriority.ORDER_QUERY
+        
+    async def submit(self, request: Callable[[], Awaitable[Any]], priority: RequestPriority,
+                     deadline: Optional[float] = None) -> Any:
+        """
+        Run a request once a slot is available for its priority class
+        
+        Args:
+            request: Zero-argument coroutine function that sends the request
+            priority: Priority class of the request
+            deadline: Seconds after submission after which the request is
+                dropped if it has not been sent (None = class default)
+                
+        Returns:
+            Result of the request
+            
+        Raises:
+            RequestDroppedError: If the queue is full or the deadline passed
+        """
+        metrics = self._metrics[priority]
+        metrics["submitted"] += 1
+        
+        enqueue_time = time.monotonic()
+        if deadline is None:
+            deadline = self.deadlines.get(priority)
+        expires_at = enqueue_time + deadline if deadline is not None else None
+        
+        if self._can_start(priority) and not self._has_waiting(priority):
+            self._start(priority)
+        else:
+            await self._wait_for_slot(priority, expires_at, enqueue_time)
+            
+        self._wait_times[priority].append(time.monotonic() - enqueue_time)
+        
+        try:
+            return await request()
+        finally:
+            metrics["completed"] += 1
+            self._release(priority)
+            
+    async def _wait_for_slot(self, priority: RequestPriority, expires_at: Optional[float],
+                             enqueue_time: float) -> None:
+        """
+        Queue the caller until the dispatcher hands it a slot
+        
+        Args:
+            priority: Priority class of the request
+            expires_at: Absolute monotonic deadline or None
+            enqueue_time: Monotonic submission time
+        """
+        queue = self._queues[priority]
+        metrics = self._metrics[priority]
+        
+        if len(queue) >= self.queue_sizes[priority]:
+            metrics["dropped_full"] += 1
+            raise RequestDroppedError(f"{priority.name} queue full ({len(queue)} requests)")
+            
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, expires_at, enqueue_time)
+        queue.append(entry)
+        metrics["max_queue_depth"] = max(metrics["max_queue_depth"], len(queue))
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Slot was granted just before cancellation, hand it back
+                self._release(priority)
+            elif entry in queue:
+                queue.remove(entry)
+            raise
+            
+    def _has_waiting(self, priority: RequestPriority) -> bool:
+        """
+        Check whether requests of equal or higher priority are queued
+        
+        Args:
+            priority: Priority class to check against
+            
+        Returns:
+            True if a request at or above this priority is waiting
+        """
+        return any(self._queues[p] for p in RequestPriority if p <= priority)
+        
+    def _can_start(self, priority: RequestPriority) -> bool:
+        """
+        Check whether a request of this class may start now
+        
+        Args:
+            priority: Priority class
+            
+        Returns:
+            True if a slot is free for the class
+        """
+        return (self._in_flight < self.max_in_flight
+                and self._class_in_flight[priority] < self.class_limits[priority])
+                
+    def _start(self, priority: RequestPriority) -> None:
+        """Take an in-flight slot"""
+        self._in_flight += 1
+        self._class_in_flight[priority] += 1
+        
+    def _release(self, priority: RequestPriority) -> None:
+        """Return an in-flight slot and hand free slots to queued requests"""
+        self._in_flight -= 1
+        self._class_in_flight[priority] -= 1
+        self._dispatch()
+        
+    def _dispatch(self) -> None:
+        """
+        Grant free slots to queued requests in priority order
+        
+        Requests whose deadline has passed are dropped here.
+        """
+        now = time.monotonic()
+        
+        for priority in RequestPriority:
+            queue = self._queues[priority]
+            
+            while queue and self._can_start(priority):
+                future, expires_at, _ = queue.popleft()
+                
+                if future.done():
+                    # Caller was cancelled while waiting
+                    continue
+                    
+                if expires_at is not None and now > expires_at:
+                    self._metrics[priority]["dropped_expired"] += 1
+                    future.set_exception(RequestDroppedError(f"{priority.name} request deadline passed"))
+                    continue
+                    
+                self._start(priority)
+                future.set_result(None)
+                
+            if self._in_flight >= self.max_in_flight:
+                break
+                
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue-depth and wait-time metrics per priority class
+        
+        Returns:
+            Dictionary of metrics keyed by class name; wait times in milliseconds
+        """
+        result = {}
+        
+        for priority in RequestPriority:
+            waits = sorted(self._wait_times[priority])
+            result[priority.name] = dict(
+                self._metrics[priority],
+                queue_depth=len(self._queues[priority]),
+                in_flight=self._class_in_flight[priority],
+                wait_p50_ms=self._percentile(waits, 0.50) * 1000,
+                wait_p99_ms=self._percentile(waits, 0.99) * 1000,
+                wait_max_ms=(waits[-1] if waits else 0.0) * 1000,
+            )
+            
+        return result
+        
+    @staticmethod
+    def _percentile(sorted_values: list, fraction: float) -> float:
+        """
+        Nearest-rank percentile of a sorted list
+        
+        Args:
+            sorted_values: Values sorted ascending
+            fraction: Percentile as a fraction (0-1)
+            
+        Returns:
+            Percentile value or 0 if empty
+        """
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+        return sorted_values[index]
@@ -0,0 +1,205 @@
+"""
+Retry Policy - Jittered backoff, idempotency rules and a circuit breaker
+
+RetryPolicy decides whether a failed request may be sent again and how
+long to wait first. Reads are always retryable; writes only when a
+repeat cannot create a duplicate (cancels, amends, trading stops, and
+order creation that carries a client orderLinkId).
+
+CircuitBreaker stops sending requests after repeated server errors or
+timeouts, fails fast while open, and lets a limited number of half-open
+probe requests through to detect recovery.
+
+Example usage:
+    policy = RetryPolicy(max_attempts=3)
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=10.0)
+    
+    if policy.is_retryable("POST", "/v5/order/create", params):
+        await asyncio.sleep(policy.compute_delay(attempt))
+"""
+
+import time
+import random
+from typing import Dict, Optional
+
+from ..utils.logger import Logger
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter and per-endpoint idempotency rules
+    """
+    
+    # Writes that are safe to repeat: a duplicate cancel/amend fails harmlessly
+    IDEMPOTENT_POSTS = {
+        "/v5/order/cancel",
+        "/v5/order/cancel-all",
+        "/v5/order/cancel-batch",
+        "/v5/order/amend",
+        "/v5/order/amend-batch",
+        "/v5/position/trading-stop",
+        "/v5/position/set-leverage",
+    }
+    
+    # Writes that are safe to repeat only with a client order ID, which
+    # the exchange rejects as a duplicate instead of opening a second order
+    CLIENT_ID_POSTS = {
+        "/v5/order/create",
+        "/v5/order/create-batch",
+    }
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 2.0):
+        """
+        Initialize the policy
+        
+        Args:
+            max_attempts: Maximum number of attempts including the first
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound for any backoff, in seconds
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        
+    def compute_delay(self, attempt: int) -> float:
+        """
+        Get the backoff before the next attempt ("full jitter")
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+        
+    def is_retryable(self, method: str, path: str, params: Optional[Dict] = None) -> bool:
+        """
+        Check whether a request may be sent again after a transient failure
+        
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            params: Request parameters
+            
+        Returns:
+            True if repeating the request cannot cause a duplicate action
+        """
+        if method == "GET":
+            return True
+            
+        if path in self.IDEMPOTENT_POSTS:
+            return True
+            
+        if path in self.CLIENT_ID_POSTS:
+            params = params or {}
+            if "request" in params:
+                # Batch: every order needs a client ID
+                requests = params.get("request") or []
+                return bool(requests) and all(item.get("orderLinkId") for item in requests)
+            return bool(params.get("orderLinkId"))
+            
+        return False
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for the exchange connection
+    """
+    
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0,
+                 half_open_max_calls: int = 1, logger: Optional[Logger] = None):
+        """
+        Initialize the breaker in the closed state
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before probing
+            half_open_max_calls: Concurrent probe requests allowed while half-open
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("CircuitBreaker")
+        
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        
+        self.stats = {"opened": 0, "rejected": 0, "failures": 0, "successes": 0}
+        
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now
+        
+        Moves an open circuit to half-open once the recovery timeout has
+        elapsed, and counts granted probes while half-open.
+        
+        Returns:
+            True if the request may be sent
+        """
+        if self.state == self.CLOSED:
+            return True
+            
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.stats["rejected"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self.half_open_calls = 0
+            self.logger.info("Circuit half-open, probing exchange")
+            
+        if self.half_open_calls < self.half_open_max_calls:
+            self.half_open_calls += 1
+            return True
+            
+        self.stats["rejected"] += 1
+        return False
+        
+    def record_success(self) -> None:
+        """Record a successful request (closes a half-open circuit)"""
+        self.stats["successes"] += 1
+        self.consecutive_failures = 0
+        
+        if self.state != self.CLOSED:
+            self.logger.info("Circuit closed, exchange recovered")
+            self.state = self.CLOSED
+            self.half_open_calls = 0
+            
+    def record_failure(self) -> None:
+        """Record a server error or timeout (may open the circuit)"""
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.stats["opened"] += 1
+                self.logger.warning(
+                    f"Circuit opened after {self.consecutive_failures} consecutive failures, "
+                    f"failing fast for {self.recovery_timeout}s"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.half_open_calls = 0
+            
+    def abandon(self) -> None:
+        """Return a half-open probe slot for a request that never completed"""
+        if self.state == self.HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+            
+    def get_stats(self) -> Dict:
+        """
+        Get breaker state and counters
+        
+        Returns:
+            Dictionary with state and statistics
+        """
+        return dict(self.stats, state=self.state, consecutive_failures=self.consecutive_failures)
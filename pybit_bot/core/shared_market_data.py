@@ -0,0 +1,531 @@
+"""
+Shared Market Data - Kline rings and ticker/book records in shared memory
+
+A market data publisher process owns the exchange feeds and writes into
+named `multiprocessing.shared_memory` segments; every bot process on the
+host attaches to them and reads without copying or decoding anything.
+
+Segments are named "<prefix>_<symbol>_<stream>", the stream being a
+kline timeframe, "ticker" or "book":
+
+- SharedKlineBuffer is a KlineBuffer whose column array and ring
+  header (end, size, version) live in a segment.
+- SharedRecord is a fixed list of float64 fields, e.g. one ticker or
+  the top of one order book.
+
+Both are guarded by a seqlock: the writer makes the sequence number odd
+before a write and even again after it, and a reader retries until it
+saw the same even number before and after reading. Writers never wait
+for readers, so there is exactly one writer per segment.
+
+Kline views stay zero-copy. Because every bar is written twice, appending
+a bar does not touch the slots of an existing view of fewer than
+`capacity` bars; only the forming (newest) bar of a view can change, or
+be read half-written, while the publisher updates it. Bars merged in
+out of order (a backfill) rewrite the ring. to_dataframe() copies under
+the seqlock and is always consistent.
+
+Example usage:
+    # Publisher
+    buffer = SharedKlineBuffer.create(segment_name("pybit_md", "BTCUSDT", "1m"), capacity=1000)
+    buffer.upsert(row)
+    ticker = SharedRecord.create(segment_name("pybit_md", "BTCUSDT", "ticker"), TICKER_FIELDS)
+    ticker.write({"lastPrice": "50000.5", "ts": 1700000000000})
+    
+    # Subscriber
+    buffer = SharedKlineBuffer.attach(segment_name("pybit_md", "BTCUSDT", "1m"))
+    closes = buffer.column("close")        # zero-copy view
+    seq, values = SharedRecord.attach(segment_name("pybit_md", "BTCUSDT", "ticker"), TICKER_FIELDS).read()
+"""
+
+import math
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .codec import KLINE_COLUMNS
+from .kline_buffer import KlineBuffer
+
+# Ticker fields shared by the publisher, plus the exchange timestamp "ts"
+TICKER_FIELDS = (
+    "ts", "lastPrice", "markPrice", "indexPrice", "prevPrice24h", "price24hPcnt",
+    "highPrice24h", "lowPrice24h", "prevPrice1h", "openInterest", "openInterestValue",
+    "turnover24h", "volume24h", "fundingRate", "nextFundingTime",
+    "bid1Price", "bid1Size", "ask1Price", "ask1Size",
+)
+
+# Top of the order book
+BOOK_TOP_FIELDS = ("ts", "bid", "bid_size", "ask", "ask_size")
+
+# Reads attempted before giving up on a segment that is being written
+MAX_READ_RETRIES = 10000
+
+# Kline ring header, int64 slots
+_SEQ, _END, _SIZE, _VERSION, _CAPACITY, _CLOSED = range(6)
+_HEADER_BYTES = 64
+
+# Record header, int64 slots
+_RECORD_HEADER_BYTES = 16
+
+# Segments created by this process; they stay registered with the resource tracker
+_created = set()
+
+# Closed segments, kept mapped until exit: numpy views handed out do not pin
+# the mapping, and unmapping it under a live view would crash the reader
+_retired = []
+
+
+def segment_name(prefix: str, symbol: str, stream: str) -> str:
+    """
+    Name of a shared memory segment
+    
+    Args:
+        prefix: Name of the market data bus
+        symbol: Trading symbol
+        stream: Kline timeframe, "ticker" or "book"
+        
+    Returns:
+        Segment name
+    """
+    return f"{prefix}_{symbol}_{stream}"
+
+
+def _create_segment(name: str, size: int) -> SharedMemory:
+    """Create a segment, replacing one left behind by a publisher that crashed"""
+    try:
+        shm = SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        stale = SharedMemory(name=name)
+        stale.close()
+        stale.unlink()
+        shm = SharedMemory(name=name, create=True, size=size)
+    _created.add(shm.name)
+    return shm
+
+
+def _attach_segment(name: str) -> SharedMemory:
+    """Attach to an existing segment (FileNotFoundError if there is none)"""
+    shm = SharedMemory(name=name)
+    if shm.name not in _created:
+        # Before Python 3.13 the resource tracker also claims attached
+        # segments and would unlink the publisher's segment when we exit
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _release(shm: Optional[SharedMemory], unlink: bool) -> None:
+    """Retire a segment and optionally remove its name"""
+    if shm is None:
+        return
+    _retired.append(shm)
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+        _created.discard(shm.name)
+
+
+class SharedKlineBuffer(KlineBuffer):
+    """
+    KlineBuffer stored in a shared memory segment, one writer and any number of readers
+    """
+    
+    def __init__(self, shm: SharedMemory, writable: bool):
+        """
+        Initialize over a segment (use create() or attach())
+        
+        Args:
+            shm: Segment holding the header and columns
+            writable: Whether this process is the writer
+        """
+        self._shm = shm
+        self.writable = writable
+        self._header = np.ndarray((_HEADER_BYTES // 8,), dtype=np.int64, buffer=shm.buf)
+        self.capacity = int(self._header[_CAPACITY])
+        self._data = np.ndarray((len(KLINE_COLUMNS), 2 * self.capacity), dtype=np.float64,
+                                buffer=shm.buf, offset=_HEADER_BYTES)
+        if not writable:
+            self._header.flags.writeable = False
+            self._data.flags.writeable = False
+        self._depth = 0  # Nesting of write operations
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+        
+    @staticmethod
+    def segment_size(capacity: int) -> int:
+        """Bytes needed for a buffer of `capacity` bars"""
+        return _HEADER_BYTES + len(KLINE_COLUMNS) * 2 * capacity * 8
+        
+    @classmethod
+    def create(cls, name: str, capacity: int) -> "SharedKlineBuffer":
+        """
+        Create an empty buffer as its writer
+        
+        Args:
+            name: Segment name
+            capacity: Maximum number of bars kept
+            
+        Returns:
+            Writable buffer
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+            
+        shm = _create_segment(name, cls.segment_size(capacity))
+        header = np.ndarray((_HEADER_BYTES // 8,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_CAPACITY] = capacity
+        del header
+        return cls(shm, writable=True)
+        
+    @classmethod
+    def attach(cls, name: str) -> "SharedKlineBuffer":
+        """
+        Attach to a publisher's buffer as a reader
+        
+        Args:
+            name: Segment name
+            
+        Returns:
+            Read-only buffer
+            
+        Raises:
+            FileNotFoundError: If the publisher has not created the segment
+        """
+        return cls(_attach_segment(name), writable=False)
+        
+    # Ring state lives in the shared header
+    
+    @property
+    def _end(self) -> int:
+        return int(self._header[_END])
+        
+    @_end.setter
+    def _end(self, value: int) -> None:
+        self._header[_END] = value
+        
+    @property
+    def _size(self) -> int:
+        return int(self._header[_SIZE])
+        
+    @_size.setter
+    def _size(self, value: int) -> None:
+        self._header[_SIZE] = value
+        
+    @property
+    def version(self) -> int:
+        """Incremented on every write"""
+        return int(self._header[_VERSION])
+        
+    @version.setter
+    def version(self, value: int) -> None:
+        self._header[_VERSION] = value
+        
+    @property
+    def seq(self) -> int:
+        """Seqlock sequence number; odd while a write is in progress"""
+        return int(self._header[_SEQ])
+        
+    @property
+    def closed(self) -> bool:
+        """Whether the writer closed the buffer; readers should attach again"""
+        return bool(self._header[_CLOSED])
+        
+    # Writer side
+    
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Hold the seqlock for the outermost write operation"""
+        self._depth += 1
+        if self._depth == 1:
+            self._header[_SEQ] += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._header[_SEQ] += 1
+                
+    def clear(self) -> None:
+        """Remove all bars"""
+        with self._writing():
+            super().clear()
+            
+    def upsert(self, row: Sequence[float]) -> None:
+        """
+        Update the newest bar in place or append a newer one
+        
+        Args:
+            row: Values in KLINE_COLUMNS order
+        """
+        with self._writing():
+            super().upsert(row)
+            
+    def extend(self, rows: np.ndarray) -> None:
+        """
+        Merge bars, replacing any with the same start time
+        
+        Args:
+            rows: Array of shape (n, 7) in KLINE_COLUMNS order, oldest first
+        """
+        with self._writing():
+            super().extend(rows)
+            
+    # Reader side
+    
+    def _read_header(self) -> Tuple[int, int, int, int]:
+        """
+        Consistent (seq, end, size, version) of the ring
+        
+        A writer that died mid-write leaves the sequence odd; the last
+        values read are returned then.
+        """
+        header = self._header
+        if self.writable:
+            # The writer's own writes are never concurrent with its reads
+            return (int(header[_SEQ]), int(header[_END]), int(header[_SIZE]), int(header[_VERSION]))
+        for _ in range(MAX_READ_RETRIES):
+            seq = int(header[_SEQ])
+            if seq & 1:
+                continue
+            state = (seq, int(header[_END]), int(header[_SIZE]), int(header[_VERSION]))
+            if int(header[_SEQ]) == seq:
+                return state
+        return (int(header[_SEQ]), int(header[_END]), int(header[_SIZE]), int(header[_VERSION]))
+        
+    def __len__(self) -> int:
+        return self._read_header()[2]
+        
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+        
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Start time of the newest bar in milliseconds, or None if empty"""
+        _, end, size, _ = self._read_header()
+        if not size:
+            return None
+        return int(self._data[0, end - 1 + self.capacity])
+        
+    @property
+    def first_timestamp(self) -> Optional[int]:
+        """Start time of the oldest bar in milliseconds, or None if empty"""
+        _, end, size, _ = self._read_header()
+        if not size:
+            return None
+        return int(self._data[0, end + self.capacity - size])
+        
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Latest bars as a (7, n) array; each column row is contiguous
+        
+        Args:
+            n: Number of bars (default all)
+            
+        Returns:
+            Read-only view into shared memory; only its newest bar
+            changes until `capacity - n` more bars were appended or
+            older bars are merged in
+        """
+        _, end, size, _ = self._read_header()
+        n = size if n is None else min(n, size)
+        stop = end + self.capacity
+        view = self._data[:, stop - n:stop]
+        view.flags.writeable = False
+        return view
+        
+    def snapshot(self, n: Optional[int] = None) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Consistent copy of the latest bars
+        
+        Args:
+            n: Number of bars (default all)
+            
+        Returns:
+            Tuple of the buffer version and a (7, n) array, or None as the
+            array if no consistent copy could be taken
+        """
+        for _ in range(MAX_READ_RETRIES):
+            seq, end, size, version = self._read_header()
+            if seq & 1:
+                continue
+            count = size if n is None else min(n, size)
+            stop = end + self.capacity
+            rows = self._data[:, stop - count:stop].copy()
+            if int(self._header[_SEQ]) == seq:
+                return version, rows
+        return self.version, None
+        
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Bars as a DataFrame indexed by start timestamp
+        
+        Built from a consistent copy on first call after a write and
+        cached; callers should treat it as read-only. While no consistent
+        copy can be taken the previous frame is returned.
+        
+        Returns:
+            DataFrame with open, high, low, close, volume and turnover
+        """
+        if self._frame is None or self._frame_version != self.version:
+            version, rows = self.snapshot()
+            if rows is None:
+                # Mid-write; the next call retries
+                if self._frame is not None:
+                    return self._frame
+                return pd.DataFrame(columns=list(KLINE_COLUMNS[1:]),
+                                    index=pd.Index([], dtype=np.int64, name='timestamp'))
+            self._frame = pd.DataFrame(
+                rows[1:].T,
+                index=pd.Index(rows[0].astype(np.int64), name='timestamp'),
+                columns=list(KLINE_COLUMNS[1:])
+            )
+            self._frame_version = version
+        return self._frame
+        
+    def close(self, unlink: bool = False) -> None:
+        """
+        Detach from the segment; bars already read stay valid
+        
+        Args:
+            unlink: Also remove the segment (writer only); attached
+                readers are told to attach again
+        """
+        if unlink and self.writable:
+            self._header[_CLOSED] = 1
+        _release(self._shm, unlink)
+        self._shm = None
+
+
+class SharedRecord:
+    """
+    Fixed set of float64 fields in a shared memory segment, one writer and any number of readers
+    """
+    
+    def __init__(self, shm: SharedMemory, fields: Sequence[str], writable: bool):
+        """
+        Initialize over a segment (use create() or attach())
+        
+        Args:
+            shm: Segment holding the header and values
+            fields: Field names in segment order
+            writable: Whether this process is the writer
+        """
+        if shm.size < _RECORD_HEADER_BYTES + 8 * len(fields):
+            raise ValueError(f"Segment {shm.name} is too small for {len(fields)} fields")
+            
+        self._shm = shm
+        self.fields = tuple(fields)
+        self.writable = writable
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._header = np.ndarray((_RECORD_HEADER_BYTES // 8,), dtype=np.int64, buffer=shm.buf)
+        self._values = np.ndarray((len(self.fields),), dtype=np.float64, buffer=shm.buf,
+                                  offset=_RECORD_HEADER_BYTES)
+        if not writable:
+            self._header.flags.writeable = False
+            self._values.flags.writeable = False
+            
+    @classmethod
+    def create(cls, name: str, fields: Sequence[str]) -> "SharedRecord":
+        """
+        Create a record with all fields unset, as its writer
+        
+        Args:
+            name: Segment name
+            fields: Field names
+            
+        Returns:
+            Writable record
+        """
+        record = cls(_create_segment(name, _RECORD_HEADER_BYTES + 8 * len(fields)), fields, writable=True)
+        record._header[:] = 0
+        record._values[:] = np.nan
+        return record
+        
+    @classmethod
+    def attach(cls, name: str, fields: Sequence[str]) -> "SharedRecord":
+        """
+        Attach to a publisher's record as a reader
+        
+        Args:
+            name: Segment name
+            fields: Field names the record was created with
+            
+        Returns:
+            Read-only record
+            
+        Raises:
+            FileNotFoundError: If the publisher has not created the segment
+        """
+        return cls(_attach_segment(name), fields, writable=False)
+        
+    @property
+    def seq(self) -> int:
+        """Seqlock sequence number; odd while a write is in progress"""
+        return int(self._header[0])
+        
+    @property
+    def closed(self) -> bool:
+        """Whether the writer closed the record; readers should attach again"""
+        return bool(self._header[1])
+        
+    def write(self, values: Dict[str, Any]) -> None:
+        """
+        Update fields; fields not given keep their value
+        
+        Args:
+            values: {field: number or numeric string}; unknown fields and
+                values that are not numbers are ignored
+        """
+        updates = []
+        for name, value in values.items():
+            i = self._index.get(name)
+            if i is None or value is None or value == "":
+                continue
+            try:
+                updates.append((i, float(value)))
+            except (TypeError, ValueError):
+                continue
+                
+        self._header[0] += 1
+        for i, value in updates:
+            self._values[i] = value
+        self._header[0] += 1
+        
+    def read(self) -> Tuple[int, Optional[Dict[str, float]]]:
+        """
+        Consistent copy of the set fields
+        
+        Returns:
+            Tuple of the sequence number read and {field: value}, or None
+            as the values if no consistent copy could be taken
+        """
+        for _ in range(MAX_READ_RETRIES):
+            seq = int(self._header[0])
+            if seq & 1:
+                continue
+            values = self._values.copy()
+            if int(self._header[0]) == seq:
+                return seq, {
+                    name: float(value) for name, value in zip(self.fields, values) if not math.isnan(value)
+                }
+        return self.seq, None
+        
+    def close(self, unlink: bool = False) -> None:
+        """
+        Detach from the segment
+        
+        Args:
+            unlink: Also remove the segment (writer only); attached
+                readers are told to attach again
+        """
+        if unlink and self.writable:
+            self._header[1] = 1
+        _release(self._shm, unlink)
+        self._shm = None
@@ -0,0 +1,336 @@
+"""
+Trade Tape - Public trades in a numpy ring buffer, aggregated into order flow
+
+TradeTape keeps the latest `capacity` trades of a symbol as one
+preallocated TRADE_DTYPE structured array (timestamp, price, size,
+taker side; 25 bytes a trade). Like KlineBuffer, every trade is written
+twice so the latest trades are always one contiguous slice.
+
+VolumeDeltaBars folds trades into per-bar taker buy and sell volume,
+turnover and trade counts as they arrive, one vectorized pass per
+message, so true order flow per bar never needs the tape to be kept or
+rescanned. A bar the trades did not fully cover (the one the first
+trade fell into, or one spanning a stream gap) is flagged incomplete.
+
+volume_profile() and footprint() bin a slice of the tape by price on
+demand.
+
+Example usage:
+    tape = TradeTape(capacity=100_000)
+    bars = VolumeDeltaBars(interval_ms=60_000, capacity=1000)
+    trades = trades_to_array(message["data"])
+    tape.extend(trades)
+    bars.update(trades)
+    df = bars.to_dataframe()                # buy_volume, sell_volume, delta, ...
+    profile = volume_profile(tape.between(start), tick_size=0.5)
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .codec import BUY, TRADE_DTYPE
+
+# Rows of a VolumeDeltaBars buffer
+DELTA_COLUMNS = ('timestamp', 'buy_volume', 'sell_volume', 'buy_turnover', 'sell_turnover', 'trades', 'complete')
+_SUMMED = slice(1, 6)  # Columns added up per bar
+_COMPLETE = 6
+
+
+class TradeTape:
+    """
+    Ring buffer of the latest `capacity` trades, oldest first
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty tape
+        
+        Args:
+            capacity: Maximum number of trades kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+            
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=TRADE_DTYPE)
+        self._end = 0  # Slot after the newest trade, in [0, capacity)
+        self._size = 0
+        self.total = 0  # Trades ever added
+        self.version = 0  # Incremented on every write
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Time of the newest trade in milliseconds, or None if empty"""
+        if not self._size:
+            return None
+        return int(self._data['timestamp'][self._end - 1 + self.capacity])
+        
+    def extend(self, trades: np.ndarray) -> None:
+        """
+        Append trades
+        
+        Args:
+            trades: TRADE_DTYPE array, oldest first and not older than the
+                newest trade already kept
+        """
+        if len(trades) == 0:
+            return
+            
+        self.total += len(trades)
+        trades = trades[-self.capacity:]
+        slots = (self._end + np.arange(len(trades))) % self.capacity
+        self._data[slots] = trades
+        self._data[slots + self.capacity] = trades
+        self._end = int(slots[-1] + 1) % self.capacity
+        self._size = min(self._size + len(trades), self.capacity)
+        self.version += 1
+        
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Latest trades
+        
+        Args:
+            n: Number of trades (default all)
+            
+        Returns:
+            Read-only TRADE_DTYPE view into the tape, valid until `capacity - n`
+            more trades were added
+        """
+        n = self._size if n is None else min(n, self._size)
+        stop = self._end + self.capacity
+        view = self._data[stop - n:stop]
+        view.flags.writeable = False
+        return view
+        
+    def between(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """
+        Trades in a time range
+        
+        Args:
+            start: First timestamp included, in milliseconds
+            end: First timestamp excluded (default up to the newest trade)
+            
+        Returns:
+            Read-only TRADE_DTYPE view
+        """
+        view = self.view()
+        timestamps = view['timestamp']
+        i = int(np.searchsorted(timestamps, start))
+        j = len(view) if end is None else int(np.searchsorted(timestamps, end))
+        return view[i:j]
+
+
+class VolumeDeltaBars:
+    """
+    Taker buy/sell volume per bar, updated incrementally from trades
+    """
+    
+    def __init__(self, interval_ms: int, capacity: int):
+        """
+        Initialize without bars
+        
+        Args:
+            interval_ms: Bar length in milliseconds
+            capacity: Maximum number of bars kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+            
+        self.interval_ms = interval_ms
+        self.capacity = capacity
+        self._data = np.zeros((len(DELTA_COLUMNS), 2 * capacity), dtype=np.float64)
+        self._end = 0
+        self._size = 0
+        self.version = 0
+        self._covered_since: Optional[int] = None  # Trades are complete from this time (ms)
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Start time of the newest bar in milliseconds, or None if empty"""
+        if not self._size:
+            return None
+        return int(self._data[0, self._end - 1 + self.capacity])
+        
+    def mark_gap(self, timestamp: int) -> None:
+        """
+        Record that trades before `timestamp` may have been missed
+        
+        The newest bar and the bar containing `timestamp` are incomplete.
+        
+        Args:
+            timestamp: Time the trades are complete again, in milliseconds
+        """
+        self._covered_since = timestamp
+        if self._size:
+            slot = (self._end - 1) % self.capacity
+            self._data[_COMPLETE, slot] = self._data[_COMPLETE, slot + self.capacity] = 0.0
+            self.version += 1
+            
+    def update(self, trades: np.ndarray) -> None:
+        """
+        Add trades to their bars
+        
+        Args:
+            trades: TRADE_DTYPE array, oldest first
+        """
+        if len(trades) == 0:
+            return
+            
+        timestamps = trades['timestamp']
+        if self._covered_since is None:
+            self._covered_since = int(timestamps[0])
+            
+        # One group of consecutive trades per bar
+        starts = timestamps - timestamps % self.interval_ms
+        first = np.concatenate(([0], np.flatnonzero(np.diff(starts)) + 1))
+        
+        buy = trades['side'] == BUY
+        size = trades['size']
+        turnover = size * trades['price']
+        rows = np.empty((len(first), len(DELTA_COLUMNS)))
+        rows[:, 0] = starts[first]
+        rows[:, 1] = np.add.reduceat(np.where(buy, size, 0.0), first)
+        rows[:, 2] = np.add.reduceat(np.where(buy, 0.0, size), first)
+        rows[:, 3] = np.add.reduceat(np.where(buy, turnover, 0.0), first)
+        rows[:, 4] = np.add.reduceat(np.where(buy, 0.0, turnover), first)
+        rows[:, 5] = np.diff(np.append(first, len(trades)))
+        
+        for row in rows:
+            self._add(row)
+        self.version += 1
+        
+    def _add(self, row: np.ndarray) -> None:
+        """Add one bar's sums to the newest bar, a new bar or (late trades) an older bar"""
+        start = row[0]
+        last = self.last_timestamp
+        
+        if last is not None and start == last:
+            slot = (self._end - 1) % self.capacity
+        elif last is None or start > last:
+            slot = self._end
+            row[_COMPLETE] = 1.0 if self._covered_since <= start else 0.0
+            self._data[:, slot] = self._data[:, slot + self.capacity] = row
+            self._end = (self._end + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            return
+        else:
+            timestamps = self.view()[0]
+            i = int(np.searchsorted(timestamps, start))
+            if i == len(timestamps) or timestamps[i] != start:
+                return  # Older than the kept bars
+            slot = (self._end - self._size + i) % self.capacity
+            
+        self._data[_SUMMED, slot] += row[_SUMMED]
+        self._data[_SUMMED, slot + self.capacity] = self._data[_SUMMED, slot]
+        
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Latest bars as a (7, n) array in DELTA_COLUMNS order
+        
+        Args:
+            n: Number of bars (default all)
+            
+        Returns:
+            Read-only view, valid until the next write
+        """
+        n = self._size if n is None else min(n, self._size)
+        stop = self._end + self.capacity
+        view = self._data[:, stop - n:stop]
+        view.flags.writeable = False
+        return view
+        
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Bars as a DataFrame indexed by start timestamp
+        
+        Built on first call after a write and cached; callers should
+        treat it as read-only.
+        
+        Returns:
+            DataFrame with buy_volume, sell_volume, delta, buy_turnover,
+            sell_turnover, trades and complete (bool)
+        """
+        if self._frame is None or self._frame_version != self.version:
+            view = self.view()
+            frame = pd.DataFrame(
+                view[1:_COMPLETE].T,
+                index=pd.Index(view[0].astype(np.int64), name='timestamp'),
+                columns=list(DELTA_COLUMNS[1:_COMPLETE]),
+                copy=True
+            )
+            frame.insert(2, 'delta', frame['buy_volume'] - frame['sell_volume'])
+            frame['trades'] = frame['trades'].astype(np.int64)
+            frame['complete'] = view[_COMPLETE] == 1.0
+            self._frame = frame
+            self._frame_version = self.version
+        return self._frame
+
+
+def _price_levels(trades: np.ndarray, tick_size: float) -> np.ndarray:
+    """Index of the price bin of each trade"""
+    return np.floor(trades['price'] / tick_size + 1e-9).astype(np.int64)
+
+
+def _side_volumes(trades: np.ndarray, groups: np.ndarray, count: int) -> pd.DataFrame:
+    """Buy, sell and delta volume summed per group"""
+    buy = trades['side'] == BUY
+    buy_volume = np.bincount(groups, weights=np.where(buy, trades['size'], 0.0), minlength=count)
+    sell_volume = np.bincount(groups, weights=np.where(buy, 0.0, trades['size']), minlength=count)
+    return pd.DataFrame({
+        'buy_volume': buy_volume,
+        'sell_volume': sell_volume,
+        'delta': buy_volume - sell_volume,
+        'volume': buy_volume + sell_volume,
+    })
+
+
+def volume_profile(trades: np.ndarray, tick_size: float) -> pd.DataFrame:
+    """
+    Taker buy and sell volume per price level
+    
+    Args:
+        trades: TRADE_DTYPE array, e.g. TradeTape.between(start, end)
+        tick_size: Width of a price level
+        
+    Returns:
+        DataFrame indexed by level price (lower bound), ascending, with
+        buy_volume, sell_volume, delta and volume
+    """
+    levels, groups = np.unique(_price_levels(trades, tick_size), return_inverse=True)
+    profile = _side_volumes(trades, groups.ravel(), len(levels))
+    profile.index = pd.Index(np.round(levels * tick_size, 10), name='price')
+    return profile
+
+
+def footprint(trades: np.ndarray, interval_ms: int, tick_size: float) -> pd.DataFrame:
+    """
+    Volume profile of every bar
+    
+    Args:
+        trades: TRADE_DTYPE array, e.g. TradeTape.between(start, end)
+        interval_ms: Bar length in milliseconds
+        tick_size: Width of a price level
+        
+    Returns:
+        DataFrame indexed by (bar start timestamp, level price), with
+        buy_volume, sell_volume, delta and volume
+    """
+    timestamps = trades['timestamp']
+    keys = np.stack([timestamps - timestamps % interval_ms, _price_levels(trades, tick_size)], axis=1)
+    cells, groups = np.unique(keys, axis=0, return_inverse=True)
+    cells = cells.reshape(-1, 2)
+    table = _side_volumes(trades, groups.ravel(), len(cells))
+    table.index = pd.MultiIndex.from_arrays(
+        [cells[:, 0], np.round(cells[:, 1] * tick_size, 10)], names=['timestamp', 'price']
+    )
+    return table
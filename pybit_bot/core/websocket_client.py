@@ -0,0 +1,559 @@
+"""
+WebSocket Client - Bybit v5 streams with heartbeat and reconnects
+
+BybitWebSocket keeps one stream connection alive: it sends the v5
+{"op": "ping"} heartbeat, treats a silent connection as dead, reconnects
+with exponential backoff and jitter, and re-sends all subscriptions
+(10 topics per subscribe request) after every reconnect. Decoded
+messages are passed to a callback; subscribe acknowledgements and pongs
+are handled here.
+
+PublicWebSocket connects to the public linear stream and provides topic
+helpers for kline, tickers, orderbook and publicTrade. PrivateWebSocket
+authenticates on every (re)connect and carries the order, execution,
+position and wallet topics. TradeWebSocket sends order.create, amend and
+cancel requests over the authenticated trade API and matches replies to
+requests by reqId.
+
+Example usage:
+    ws = PublicWebSocket(on_message=handle, testnet=True)
+    ws.subscribe([ws.kline_topic("BTCUSDT", "1m"), ws.ticker_topic("BTCUSDT")])
+    await ws.run()  # until stop() or reconnect attempts are exhausted
+"""
+
+import time
+import uuid
+import random
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+import aiohttp
+
+from ..utils.logger import Logger
+from ..exceptions import AuthenticationError
+from . import codec
+from .pagination import to_bybit_interval
+
+
+MessageHandler = Callable[[Dict], Union[None, Awaitable[None]]]
+
+
+class BybitWebSocket:
+    """
+    Reconnecting Bybit v5 stream connection
+    """
+    
+    # Topics per subscribe request (exchange limit)
+    MAX_ARGS_PER_REQUEST = 10
+    
+    def __init__(self, url: str, on_message: MessageHandler,
+                 ping_interval: float = 20.0, max_reconnect_attempts: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 on_reconnect: Optional[Callable[[], Union[None, Awaitable[None]]]] = None,
+                 on_connect: Optional[Callable[[], Union[None, Awaitable[None]]]] = None,
+                 logger: Optional[Logger] = None):
+        """
+        Initialize the connection (call run() or start() to connect)
+        
+        Args:
+            url: Stream URL
+            on_message: Callback for data messages (sync or async)
+            ping_interval: Seconds between heartbeats; the connection is
+                considered dead after two intervals without any message
+            max_reconnect_attempts: Consecutive failed connects before giving
+                up (0 = retry forever)
+            backoff_base: First reconnect delay in seconds
+            backoff_max: Maximum reconnect delay in seconds
+            on_reconnect: Optional callback after a reconnect succeeded and
+                topics were re-subscribed; like on_connect it delays reading,
+                so long work should be started as a task
+            on_connect: Optional callback after every successful connect,
+                including the first; messages are read after it returns
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("BybitWebSocket")
+        
+        self.url = url
+        self.on_message = on_message
+        self.on_reconnect = on_reconnect
+        self.on_connect = on_connect
+        self.ping_interval = ping_interval
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        
+        self.topics: List[str] = []
+        self.connected = False
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        
+        # Metrics
+        self.stats = {
+            "messages": 0,
+            "connects": 0,
+            "reconnects": 0,
+            "failed_connects": 0,
+            "last_message": 0.0,  # monotonic time
+        }
+        
+    def subscribe(self, topics: Iterable[str]) -> None:
+        """
+        Add topics; they are sent now if connected and after every reconnect
+        
+        Args:
+            topics: Topic names (e.g. "tickers.BTCUSDT")
+        """
+        new_topics = [t for t in topics if t not in self.topics]
+        self.topics.extend(new_topics)
+        
+        if new_topics and self.connected:
+            asyncio.get_running_loop().create_task(self._send_subscribe("subscribe", new_topics))
+            
+    def unsubscribe(self, topics: Iterable[str]) -> None:
+        """
+        Remove topics
+        
+        Args:
+            topics: Topic names
+        """
+        removed = [t for t in topics if t in self.topics]
+        self.topics = [t for t in self.topics if t not in removed]
+        
+        if removed and self.connected:
+            asyncio.get_running_loop().create_task(self._send_subscribe("unsubscribe", removed))
+            
+    def resubscribe(self, topics: Iterable[str]) -> None:
+        """
+        Unsubscribe and subscribe again, e.g. to get a fresh order book snapshot
+        
+        Args:
+            topics: Subscribed topic names
+        """
+        topics = [t for t in topics if t in self.topics]
+        if topics and self.connected:
+            asyncio.get_running_loop().create_task(self._resend_subscribe(topics))
+            
+    def start(self) -> asyncio.Task:
+        """
+        Run the connection in a background task
+        
+        Returns:
+            The connection task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+        
+    async def stop(self) -> None:
+        """Close the connection and stop reconnecting"""
+        self._stopping = True
+        
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+            
+        task = self._task
+        self._task = None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+                
+    async def run(self) -> None:
+        """
+        Connect and process messages until stop() or reconnects are exhausted
+        """
+        self._stopping = False
+        failures = 0
+        connected_before = False
+        
+        try:
+            async with aiohttp.ClientSession() as session:
+                self._session = session
+                
+                while not self._stopping:
+                    try:
+                        async with session.ws_connect(self.url, autoping=True) as ws:
+                            self._ws = ws
+                            await self._on_open(ws)
+                            await self._send_subscribe("subscribe", self.topics)
+                            
+                            self.connected = True
+                            self.stats["connects"] += 1
+                            self.logger.info(f"WebSocket connected: {self.url}")
+                            failures = 0
+                            
+                            if connected_before:
+                                self.stats["reconnects"] += 1
+                                await self._call(self.on_reconnect)
+                            connected_before = True
+                            await self._call(self.on_connect)
+                            
+                            await self._read_loop(ws)
+                            
+                    except asyncio.CancelledError:
+                        raise
+                    except AuthenticationError as e:
+                        # Retrying with the same credentials cannot succeed
+                        self.stats["failed_connects"] += 1
+                        self.logger.error(str(e))
+                        break
+                    except Exception as e:
+                        self.stats["failed_connects"] += 1
+                        self.logger.warning(f"WebSocket error ({self.url}): {str(e)}")
+                        
+                    finally:
+                        self.connected = False
+                        self._ws = None
+                        
+                    if self._stopping:
+                        break
+                        
+                    failures += 1
+                    if self.max_reconnect_attempts and failures > self.max_reconnect_attempts:
+                        self.logger.error(f"WebSocket giving up after {failures - 1} reconnect attempts: {self.url}")
+                        break
+                        
+                    delay = self._backoff(failures)
+                    self.logger.info(f"WebSocket reconnecting in {delay:.1f}s (attempt {failures})")
+                    await asyncio.sleep(delay)
+        finally:
+            self._session = None
+            self.connected = False
+            
+    def _backoff(self, attempt: int) -> float:
+        """
+        Reconnect delay with jitter
+        
+        Args:
+            attempt: Consecutive failure count (1-based)
+            
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+        
+    async def _on_open(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """
+        Hook run after connecting, before subscriptions are sent
+        
+        Args:
+            ws: Open connection
+        """
+        pass
+        
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """
+        Receive messages, send heartbeats and detect dead connections
+        
+        Args:
+            ws: Open connection
+        """
+        loop = asyncio.get_running_loop()
+        next_ping = loop.time() + self.ping_interval
+        last_receive = loop.time()
+        
+        while not self._stopping:
+            timeout = max(0.0, next_ping - loop.time())
+            try:
+                msg = await ws.receive(timeout=timeout)
+            except asyncio.TimeoutError:
+                if loop.time() - last_receive > 2 * self.ping_interval:
+                    raise ConnectionError("No messages within two heartbeat intervals")
+                await ws.send_str(codec.dumps({"op": "ping"}))
+                next_ping = loop.time() + self.ping_interval
+                continue
+                
+            if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+                if not self._stopping:
+                    raise ConnectionError("Connection closed by server")
+                return
+            if msg.type == aiohttp.WSMsgType.ERROR:
+                raise ConnectionError(f"Connection error: {ws.exception()}")
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+                
+            last_receive = loop.time()
+            self.stats["last_message"] = time.monotonic()
+            
+            try:
+                message = codec.loads(msg.data)
+            except ValueError:
+                self.logger.warning(f"Ignoring undecodable WebSocket message: {msg.data[:200]}")
+                continue
+                
+            await self._dispatch(message)
+            
+    async def _dispatch(self, message: Dict) -> None:
+        """
+        Handle control messages and pass data messages on
+        
+        Args:
+            message: Decoded message
+        """
+        op = message.get("op")
+        if op in ("ping", "pong"):
+            return
+            
+        if op is not None:
+            if message.get("success") is False:
+                self.logger.warning(f"WebSocket {op} failed: {message.get('ret_msg')}")
+            return
+            
+        self.stats["messages"] += 1
+        try:
+            await self._call(self.on_message, message)
+        except Exception as e:
+            self.logger.error(f"Error handling WebSocket message: {str(e)}")
+            
+    async def _send_subscribe(self, op: str, topics: List[str]) -> None:
+        """
+        Send (un)subscribe requests in chunks the exchange accepts
+        
+        Args:
+            op: "subscribe" or "unsubscribe"
+            topics: Topic names
+        """
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+            
+        for i in range(0, len(topics), self.MAX_ARGS_PER_REQUEST):
+            chunk = topics[i:i + self.MAX_ARGS_PER_REQUEST]
+            await ws.send_str(codec.dumps({"op": op, "req_id": f"{op}-{i}", "args": chunk}))
+            
+    async def _resend_subscribe(self, topics: List[str]) -> None:
+        """Send unsubscribe and subscribe requests in order"""
+        await self._send_subscribe("unsubscribe", topics)
+        await self._send_subscribe("subscribe", topics)
+        
+    @staticmethod
+    async def _call(callback: Optional[Callable], *args: Any) -> None:
+        """Invoke a sync or async callback"""
+        if callback is None:
+            return
+        result = callback(*args)
+        if asyncio.iscoroutine(result):
+            await result
+            
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection statistics
+        
+        Returns:
+            Dictionary of statistics
+        """
+        last_message = self.stats["last_message"]
+        return dict(
+            self.stats,
+            connected=self.connected,
+            topics=len(self.topics),
+            message_age=time.monotonic() - last_message if last_message else None,
+        )
+
+
+class PublicWebSocket(BybitWebSocket):
+    """
+    Public linear market-data stream
+    """
+    
+    MAINNET_URL = "wss://stream.bybit.com/v5/public/linear"
+    TESTNET_URL = "wss://stream-testnet.bybit.com/v5/public/linear"
+    
+    def __init__(self, on_message: MessageHandler, testnet: bool = True,
+                 url: Optional[str] = None, **kwargs):
+        """
+        Initialize the public stream
+        
+        Args:
+            on_message: Callback for data messages
+            testnet: Whether to use the testnet stream
+            url: Optional URL override (e.g. a local mock exchange)
+            **kwargs: Passed to BybitWebSocket
+        """
+        url = url or (self.TESTNET_URL if testnet else self.MAINNET_URL)
+        kwargs.setdefault("logger", Logger("PublicWebSocket"))
+        super().__init__(url, on_message, **kwargs)
+        
+    @staticmethod
+    def kline_topic(symbol: str, interval: str) -> str:
+        return f"kline.{to_bybit_interval(interval)}.{symbol}"
+        
+    @staticmethod
+    def ticker_topic(symbol: str) -> str:
+        return f"tickers.{symbol}"
+        
+    @staticmethod
+    def orderbook_topic(symbol: str, depth: int = 50) -> str:
+        return f"orderbook.{depth}.{symbol}"
+        
+    @staticmethod
+    def trade_topic(symbol: str) -> str:
+        return f"publicTrade.{symbol}"
+
+
+class PrivateWebSocket(BybitWebSocket):
+    """
+    Authenticated account stream (orders, executions, positions, wallet)
+    """
+    
+    MAINNET_URL = "wss://stream.bybit.com/v5/private"
+    TESTNET_URL = "wss://stream-testnet.bybit.com/v5/private"
+    
+    ACCOUNT_TOPICS = ["order", "execution", "position", "wallet"]
+    
+    def __init__(self, api_key: str, api_secret: str, on_message: MessageHandler,
+                 testnet: bool = True, url: Optional[str] = None,
+                 clock: Optional[Callable[[], int]] = None, auth_expiry_ms: int = 10000, **kwargs):
+        """
+        Initialize the private stream
+        
+        Args:
+            api_key: API key
+            api_secret: API secret
+            on_message: Callback for data messages
+            testnet: Whether to use the testnet stream
+            url: Optional URL override (e.g. a local mock exchange)
+            clock: Optional function returning exchange time in milliseconds
+                (e.g. ClockSync.now_ms); local time is used otherwise
+            auth_expiry_ms: Validity of the auth signature
+            **kwargs: Passed to BybitWebSocket
+        """
+        url = url or (self.TESTNET_URL if testnet else self.MAINNET_URL)
+        kwargs.setdefault("logger", Logger("PrivateWebSocket"))
+        super().__init__(url, on_message, **kwargs)
+        
+        self.api_key = api_key
+        self._signer = codec.HmacSigner(api_secret)
+        self.clock = clock or (lambda: int(time.time() * 1000))
+        self.auth_expiry_ms = auth_expiry_ms
+        
+    async def _on_open(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """
+        Authenticate before subscribing
+        
+        Args:
+            ws: Open connection
+            
+        Raises:
+            AuthenticationError: If the exchange rejects the signature
+        """
+        expires = self.clock() + self.auth_expiry_ms
+        signature = self._signer.sign(f"GET/realtime{expires}")
+        await ws.send_str(codec.dumps({"op": "auth", "args": [self.api_key, expires, signature]}))
+        
+        # Wait for the auth response; nothing else is sent before it
+        while True:
+            msg = await ws.receive(timeout=self.ping_interval)
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                raise ConnectionError(f"Connection closed during authentication ({msg.type})")
+            response = codec.loads(msg.data)
+            if response.get("op") == "auth":
+                break
+                
+        # The private stream replies with success, the trade API with retCode
+        if not (response.get("success") or response.get("retCode") == 0):
+            raise AuthenticationError(
+                f"WebSocket authentication failed: {response.get('ret_msg') or response.get('retMsg')}"
+            )
+        self.logger.debug("WebSocket authenticated")
+
+
+class TradeWebSocket(PrivateWebSocket):
+    """
+    Order entry over the v5 WebSocket trade API
+    """
+    
+    MAINNET_URL = "wss://stream.bybit.com/v5/trade"
+    TESTNET_URL = "wss://stream-testnet.bybit.com/v5/trade"
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True,
+                 url: Optional[str] = None, recv_window: int = 5000,
+                 request_timeout: float = 5.0, **kwargs):
+        """
+        Initialize the trade connection
+        
+        Args:
+            api_key: API key
+            api_secret: API secret
+            testnet: Whether to use the testnet endpoint
+            url: Optional URL override (e.g. a local mock exchange)
+            recv_window: recv_window sent in each request header
+            request_timeout: Seconds to wait for a reply
+            **kwargs: Passed to PrivateWebSocket
+        """
+        kwargs.setdefault("logger", Logger("TradeWebSocket"))
+        super().__init__(api_key, api_secret, self._on_unsolicited, testnet=testnet, url=url, **kwargs)
+        
+        self.recv_window = recv_window
+        self.request_timeout = request_timeout
+        self._pending: Dict[str, asyncio.Future] = {}
+        
+    async def request(self, op: str, params: Dict) -> Dict:
+        """
+        Send one trade request and wait for its reply
+        
+        Args:
+            op: "order.create", "order.amend" or "order.cancel"
+            params: Request parameters (same as the REST body)
+            
+        Returns:
+            Reply with retCode, retMsg, data and retExtInfo
+            
+        Raises:
+            ConnectionError: If the connection is down or drops before the reply
+            asyncio.TimeoutError: If no reply arrives within request_timeout;
+                the request may or may not have been executed
+        """
+        ws = self._ws
+        if not self.connected or ws is None or ws.closed:
+            raise ConnectionError("Trade WebSocket is not connected")
+            
+        req_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        
+        try:
+            await ws.send_str(codec.dumps({
+                "reqId": req_id,
+                "header": {
+                    "X-BAPI-TIMESTAMP": str(self.clock()),
+                    "X-BAPI-RECV-WINDOW": str(self.recv_window),
+                },
+                "op": op,
+                "args": [params],
+            }))
+            return await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            self._pending.pop(req_id, None)
+            
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Fail outstanding requests when the connection ends"""
+        try:
+            await super()._read_loop(ws)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Trade WebSocket disconnected before reply"))
+                    
+    async def _dispatch(self, message: Dict) -> None:
+        """
+        Resolve the request a reply belongs to
+        
+        Args:
+            message: Decoded message
+        """
+        future = self._pending.get(message.get("reqId"))
+        if future is not None:
+            if not future.done():
+                future.set_result(message)
+            return
+        await super()._dispatch(message)
+        
+    def _on_unsolicited(self, message: Dict) -> None:
+        """Log messages that answer no pending request"""
+        self.logger.debug(f"Unmatched trade WebSocket message: {message}")
@@ -7,6 +7,10 @@ This module connects all components of the trading system:
 - Order management
 - Risk management
 - TP/SL execution
+
+Strategies are evaluated when DataManager publishes an event they
+subscribe to (by default each closed bar), not on a polling timer; the
+main loop only keeps positions, TP/SL orders and REST fallback current.
 """
 
 import os
@@ -30,6 +34,7 @@ from .managers.tpsl_manager import TPSLManager
 from .utils.logger import Logger
 from .utils.config_loader import ConfigLoader
 from .strategies.base_strategy import SignalType, TradeSignal
+from .core.event_bus import MarketEvent, Subscription
 
 
 class TradingEngine:
@@ -148,7 +153,13 @@ class TradingEngine:
                 
             # Create client instance - pass the credentials object directly
             # instead of individual parameters
-            self.client = BybitClientTransport(self.credentials)
+            system_config = self.config.get('general', {}).get('system', {})
+            self.client = BybitClientTransport(
+                self.credentials,
+                recv_window=system_config.get('recv_window', 5000),
+                clock_sync_interval=system_config.get('clock_sync_interval', 60),
+                base_url=system_config.get('rest_url')  # e.g. a local MockBybitExchange
+            )
             
             # Set up OrderManagerClient
             self.order_client = OrderManagerClient(self.client, logger=self.logger)
@@ -187,14 +198,19 @@ class TradingEngine:
             )
             
             # Initialize data subscriptions
+            trade_stream = self.config.get('general', {}).get('data', {}).get('trade_stream', False)
             for symbol in self.symbols:
                 self.logger.info(f"Setting up data for {symbol}")
                 for timeframe in self.timeframes:
                     self.market_data_manager.subscribe_klines(symbol, timeframe)
+                self.market_data_manager.subscribe_ticker(symbol)
+                if trade_stream:
+                    # Taker buy/sell volume per bar for the order flow indicators
+                    self.market_data_manager.subscribe_trades(symbol)
                     
             # Warm up indicators and load initial data
             self.logger.info("Loading initial market data")
-            asyncio.run(self.market_data_manager.load_initial_data())
+            asyncio.run(self._warm_up_market_data())
             
             self.logger.debug(f"EXIT initialize returned True")
             return True
@@ -204,6 +220,18 @@ class TradingEngine:
             self.logger.debug(f"EXIT initialize returned False (error)")
             return False
     
+    async def _warm_up_market_data(self) -> None:
+        """
+        Load initial market data on a short-lived event loop
+        
+        The client's pooled session is closed afterwards because it is bound
+        to this loop; the main loop creates its own on first use.
+        """
+        try:
+            await self.market_data_manager.load_initial_data()
+        finally:
+            await self.client.close()
+    
     def start(self) -> bool:
         """
         Start the trading engine
@@ -314,21 +342,42 @@ class TradingEngine:
         """
         self.logger.debug(f"ENTER _main_loop()")
         
+        signal_task = None
+        
         try:
+            # Run strategies on the events they subscribe to, from the first update on
+            triggers = self.strategy_manager.get_event_subscriptions()
+            subscription = self.market_data_manager.events.subscribe(
+                {event_type for event_type, _, _ in triggers},
+                symbols={symbol for _, symbol, _ in triggers}
+            )
+            signal_task = asyncio.create_task(self._signal_loop(subscription))
+            
+            # Keep signed timestamps aligned with the exchange clock
+            await self.client.start_clock_sync()
+            
+            # Stream market data; update_market_data() polls REST only while
+            # the stream is down
+            await self.market_data_manager.start_websocket()
+            
+            # Order, execution and position updates are pushed; REST
+            # reconciliation runs on connect and at a low frequency
+            await self.order_manager.start_private_stream()
+            
+            # Optional order entry over the WebSocket trade API (REST fallback)
+            if self.config.get('execution', {}).get('order_entry_transport', 'rest') == 'websocket':
+                await self.order_manager.get_client().start_trade_stream(
+                    url=self.config.get('general', {}).get('system', {}).get('ws_trade_url')
+                )
+                
             # Initial update of market data
             await self.market_data_manager.update_market_data()
             
-            # Main trading loop
+            # Main trading loop; signals are handled by the signal task
             while not self._stop_event.is_set():
-                # Process market data updates
+                # Process market data updates (REST only while the stream is down)
                 await self.market_data_manager.update_market_data()
                 
-                # Check for signals
-                await self._check_for_signals()
-                
-                # Process pending signals
-                await self._process_signals()
-                
                 # Update position tracking
                 await self._update_positions()
                 
@@ -344,39 +393,68 @@ class TradingEngine:
             self.logger.error(f"Error in main async loop: {str(e)}")
             
         finally:
+            if signal_task is not None:
+                signal_task.cancel()
+                try:
+                    await signal_task
+                except asyncio.CancelledError:
+                    pass
+            if self.market_data_manager:
+                await self.market_data_manager.stop_websocket()
+            if self.order_manager:
+                await self.order_manager.stop_private_stream()
+                await self.order_manager.get_client().stop_trade_stream()
+                
+            # Release pooled connections on the loop that owns them
+            if self.client:
+                await self.client.close()
             self.logger.debug(f"EXIT _main_loop completed")
     
-    async def _check_for_signals(self) -> None:
+    async def _signal_loop(self, subscription: Subscription) -> None:
         """
-        Check for trading signals from strategies
+        Evaluate strategies as market data events arrive
+        
+        Args:
+            subscription: Event bus subscription covering every strategy trigger
         """
-        self.logger.debug(f"ENTER _check_for_signals()")
+        self.logger.debug(f"ENTER _signal_loop()")
         
         try:
-            # Get current market data
-            for symbol in self.symbols:
-                # Get the latest data for the default timeframe
-                market_data = self.market_data_manager.get_klines(
-                    symbol, 
-                    self.default_timeframe
-                )
+            async for event in subscription:
+                await self._on_market_event(event)
                 
-                if not market_data or len(market_data) < 10:
-                    self.logger.warning(f"Insufficient data for {symbol}, skipping signal check")
-                    continue
+        finally:
+            subscription.close()
+            self.logger.debug(f"EXIT _signal_loop completed")
+    
+    async def _on_market_event(self, event: MarketEvent) -> None:
+        """
+        Run the strategies subscribed to an event and execute their signals
+        
+        Args:
+            event: Published market data event
+        """
+        self.logger.debug(f"ENTER _on_market_event(type={event.type.value}, symbol={event.symbol}, timeframe={event.timeframe})")
+        
+        try:
+            strategies = self.strategy_manager.strategies_for_event(event)
+            if not strategies:
+                return
                 
-                # Run strategy evaluation
-                signals = await self.strategy_manager.evaluate(symbol, market_data)
+            # Run strategy evaluation
+            signals = await self.strategy_manager.evaluate(event.symbol, strategies=strategies)
+            
+            # Process signals
+            for signal in signals:
+                self._add_signal(signal)
+            if signals:
+                await self._process_signals()
                 
-                # Process signals
-                for signal in signals:
-                    self._add_signal(signal)
-                    
         except Exception as e:
-            self.logger.error(f"Error checking for signals: {str(e)}")
+            self.logger.error(f"Error handling {event.type.value} event for {event.symbol}: {str(e)}")
             
         finally:
-            self.logger.debug(f"EXIT _check_for_signals completed")
+            self.logger.debug(f"EXIT _on_market_event completed")
     
     def _add_signal(self, signal: TradeSignal) -> None:
         """
@@ -454,6 +532,13 @@ class TradingEngine:
                     self.logger.debug(f"EXIT _validate_signal returned False (expired)")
                     return False
                 
+            # Do not size or price orders from stale market data
+            if self.market_data_manager.is_stale('ticker', symbol):
+                age = self.market_data_manager.freshness.age('ticker', symbol)
+                self.logger.warning(f"Ticker for {symbol} is stale ({age:.1f}s old), skipping signal")
+                self.logger.debug(f"EXIT _validate_signal returned False (stale market data)")
+                return False
+                
             # Check current positions
             positions = await self.order_manager.get_positions(symbol)
             
@@ -519,7 +604,7 @@ class TradingEngine:
             
             # Get current price
             ticker = self.market_data_manager.get_ticker(symbol)
-            current_price = float(ticker.get("last_price", signal.price))
+            current_price = float(ticker.get("lastPrice", ticker.get("last_price", signal.price)))
             
             # Get stop loss and take profit prices from signal
             sl_price = signal.sl_price
@@ -617,7 +702,7 @@ class TradingEngine:
                     self.logger.warning(f"No ticker data for {symbol}, using default size")
                     size = default_size
                 else:
-                    price = float(ticker.get('last_price', 0))
+                    price = float(ticker.get('lastPrice', ticker.get('last_price', 0)))
                     if price <= 0:
                         self.logger.warning(f"Invalid price for {symbol}, using default size")
                         size = default_size
@@ -683,7 +768,8 @@ class TradingEngine:
             "uptime": str(datetime.now() - self.start_time) if self.start_time else "0",
             "symbols": self.symbols,
             "positions": len(self.position_cache),
-            "performance": self.performance
+            "performance": self.performance,
+            "market_data": self.market_data_manager.get_freshness_report() if self.market_data_manager else {}
         }
         
         self.logger.debug(f"EXIT get_status returned status")
@@ -39,4 +39,20 @@ class DataError(Exception):
 
 class StrategyError(Exception):
     """Exception raised for strategy-related errors"""
-    pass
\ No newline at end of file
+    pass
+
+class RequestDroppedError(BybitAPIError):
+    """Exception raised when a scheduled request is dropped (queue full or deadline passed)"""
+    pass
+
+class ServerError(BybitAPIError):
+    """Exception raised for 5xx responses from the exchange"""
+    pass
+
+class CircuitOpenError(ConnectionError):
+    """Exception raised when requests are rejected by an open circuit breaker"""
+    pass
+
+class TimestampError(AuthenticationError):
+    """Exception raised when a request timestamp is outside the receive window"""
+    pass
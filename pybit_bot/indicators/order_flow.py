@@ -0,0 +1,93 @@
+"""
+Order flow indicators from measured taker volume.
+
+CVD and VFI (cvd.py, vfi.py) infer buy and sell volume from candle
+shape. These variants use the taker buy and sell volume measured from
+the trade stream - the 'buy_volume', 'sell_volume' and 'complete'
+columns of DataManager.get_volume_delta() joined onto the klines - and
+fall back to the candle-shape estimate of cvd.py only for bars without
+complete trade data.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def split_volume(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    """
+    Buy and sell volume per bar, measured where available and estimated otherwise.
+    
+    Args:
+        df: DataFrame with 'open', 'high', 'low', 'close', 'volume' and
+            optionally 'buy_volume', 'sell_volume' and 'complete' columns
+            
+    Returns:
+        Tuple of (buy volume, sell volume) Series, index-aligned with df
+    """
+    open_ = df['open'].values
+    high = df['high'].values
+    low = df['low'].values
+    close = df['close'].values
+    volume = df['volume'].values
+    
+    # Candle-shape estimate, as in calculate_cvd
+    spread = high - low
+    spread_safe = np.where(spread == 0, np.nan, spread)
+    upper_wick = np.where(close > open_, high - close, high - open_)
+    lower_wick = np.where(close > open_, open_ - low, close - low)
+    body = np.nan_to_num((spread - upper_wick - lower_wick) / spread_safe) * volume
+    wicks = np.nan_to_num((upper_wick + lower_wick) / spread_safe) / 2 * volume
+    
+    buy = np.where(close > open_, body + wicks, np.where(close < open_, wicks, volume / 2))
+    sell = np.where(close < open_, body + wicks, np.where(close > open_, wicks, volume / 2))
+    
+    if 'buy_volume' in df.columns and 'sell_volume' in df.columns:
+        if 'complete' in df.columns:
+            measured = df['complete'].eq(True).values
+        else:
+            measured = df['buy_volume'].notna().values
+        buy = np.where(measured, df['buy_volume'].values, buy)
+        sell = np.where(measured, df['sell_volume'].values, sell)
+        
+    return pd.Series(buy, index=df.index), pd.Series(sell, index=df.index)
+
+
+def calculate_cvd_from_trades(df: pd.DataFrame, cumulation_length: int = 14) -> pd.Series:
+    """
+    Calculate CVD from measured buy and sell volume.
+    
+    Smoothed like calculate_cvd: an EMA with alpha 2 / (length + 1)
+    seeded with the first value.
+    
+    Args:
+        df: DataFrame as for split_volume
+        cumulation_length: EMA smoothing window (default: 14)
+        
+    Returns:
+        pandas.Series of CVD values
+    """
+    buy, sell = split_volume(df)
+    alpha = 2 / (cumulation_length + 1)
+    return buy.ewm(alpha=alpha, adjust=False).mean() - sell.ewm(alpha=alpha, adjust=False).mean()
+
+
+def calculate_vfi_from_trades(df: pd.DataFrame, lookback: int = 50) -> pd.Series:
+    """
+    Calculate VFI (order flow imbalance) from measured buy and sell volume.
+    
+    Args:
+        df: DataFrame as for split_volume
+        lookback: Window for the volume sums (default: 50)
+        
+    Returns:
+        pandas.Series of VFI values in [-1, 1], NaN where there was no volume
+    """
+    buy, sell = split_volume(df)
+    cum_buy = buy.rolling(window=lookback, min_periods=1).sum()
+    cum_sell = sell.rolling(window=lookback, min_periods=1).sum()
+    
+    denom = cum_buy + cum_sell
+    vfi = np.where(denom == 0, np.nan, (cum_buy - cum_sell) / denom.replace(0, np.nan))
+    return pd.Series(vfi, index=df.index)
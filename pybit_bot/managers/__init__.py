@@ -3,12 +3,14 @@ Manager modules for PyBit Bot
 """
 
 from .data_manager import DataManager
+from .market_data_publisher import MarketDataPublisher
 from .order_manager import OrderManager
 from .strategy_manager import StrategyManager
 from .tpsl_manager import TPSLManager
 
 __all__ = [
     "DataManager",
+    "MarketDataPublisher",
     "OrderManager",
     "StrategyManager",
     "TPSLManager",
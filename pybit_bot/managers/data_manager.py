@@ -4,16 +4,82 @@ Data Manager - Manages market data collection and access
 This module handles the connection to exchange data feeds,
 processes market data, and provides a unified interface for
 strategies to access market data.
+
+While the public WebSocket stream is connected, klines, tickers,
+order books and trades are updated from pushed messages and REST
+polling is skipped; REST is used for the initial load and whenever
+the stream is down. A REST pass refreshes all subscriptions concurrently,
+capped by the market data rate budget, and skips whatever has not
+finished by `data.refresh_deadline`. Tickers of several symbols come
+from a single /v5/market/tickers request for the whole category.
+
+Bars missed while the stream was down are backfilled over REST after
+every reconnect, before live updates resume, and a "data_repaired"
+event is emitted. Series with a gap that could not be repaired yet are
+listed in `kline_gaps`.
+
+Klines are kept in fixed-capacity KlineBuffer ring buffers sized to the
+lookback; get_klines() materializes a DataFrame only when a bar changed.
+With `data.kline_cache_dir` set, closed bars are also persisted to disk
+and a restart only fetches the bars since the last cached one.
+
+Higher timeframes of a symbol that also has base timeframe (1m) klines
+are built locally from the base bars after their initial REST load
+instead of being streamed or polled separately.
+
+Order books are kept as incremental OrderBook structures; a missed
+delta or crossed book triggers a resubscribe for a fresh snapshot.
+
+Public trades are kept per symbol in a TradeTape (a numpy structured
+array ring) and folded into per-bar taker buy/sell volume for every
+subscribed timeframe of the symbol as they arrive. get_volume_delta()
+returns those bars; get_footprint() and get_volume_profile() bin the
+tape by price on demand.
+
+Changes are published on the `events` EventBus: bar_closed once per
+closed bar of every series (after a gap, only the newest closed bar),
+bar_updated for the forming bar, ticker, and book_top when the best bid
+or ask of a synced book changes. Event data is built only for types
+that have subscribers.
+
+Every update is recorded in `freshness` with its receive time and feed
+lag. Data older than its `data.freshness_sla` (seconds per data type;
+for klines, the grace after one bar interval) is stale: is_stale()
+reports it, get_market_price() ignores it and get_orderbook() flags it.
+
+With `data.shared_memory` set, several processes on a host share one
+feed (see core.shared_market_data). In the "publisher" role the kline
+buffers live in shared memory rings that MarketDataPublisher serves
+along with tickers and book tops. In the "subscriber" role nothing is
+fetched or streamed: load_initial_data() attaches to the publisher's
+segments, klines are read from them zero-copy, and start_websocket()
+starts a poll of their sequence numbers that updates the ticker and
+top-of-book caches and publishes the usual events.
 """
 
 import os
+import time
 import asyncio
+from functools import partial
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
 from datetime import datetime, timedelta
 
 from ..utils.logger import Logger
+from ..core.codec import KLINE_COLUMNS, TRADE_DTYPE, klines_to_array, trades_to_array
+from ..core.websocket_client import PublicWebSocket
+from ..core.orderbook import OrderBook
+from ..core.kline_buffer import KlineBuffer
+from ..core.trade_tape import TradeTape, VolumeDeltaBars, footprint, volume_profile
+from ..core.kline_cache import KlineCache
+from ..core.kline_aggregator import aggregate_klines, can_aggregate
+from ..core.event_bus import EventBus, EventType, MarketEvent
+from ..core.freshness import FreshnessTracker
+from ..core.shared_market_data import (
+    BOOK_TOP_FIELDS, TICKER_FIELDS, SharedKlineBuffer, SharedRecord, segment_name
+)
+from ..core.pagination import interval_to_ms
 
 
 class DataManager:
@@ -39,9 +105,11 @@ class DataManager:
         self.order_client = order_client
         
         # Market data cache
-        self.klines = {}  # Format: {symbol: {timeframe: pd.DataFrame}}
+        self.klines = {}  # Format: {symbol: {timeframe: KlineBuffer}}
         self.tickers = {}  # Latest ticker data
-        self.orderbooks = {}  # Latest orderbook data
+        self.orderbooks = {}  # Format: {symbol: OrderBook}
+        self.recent_trades = {}  # Format: {symbol: TradeTape}
+        self.trade_bars = {}  # Taker buy/sell volume per bar, format: {symbol: {timeframe: VolumeDeltaBars}}
         
         # Subscriptions
         self.kline_subscriptions = set()  # Format: {(symbol, timeframe)}
@@ -59,13 +127,66 @@ class DataManager:
             '1d': 30
         })
         
+        self.orderbook_depth = data_config.get('orderbook_depth', 50)
+        self.trade_buffer_size = data_config.get('trade_buffer_size', 100_000)  # Trades kept per symbol
+        self.backfill_concurrency = data_config.get('backfill_concurrency', 4)
+        self.warmup_concurrency = data_config.get('warmup_concurrency', 8)  # Series loaded at once
+        self.refresh_concurrency = data_config.get('refresh_concurrency', 10)  # Requests per REST pass at once
+        self.refresh_deadline = data_config.get('refresh_deadline', 5.0)  # Seconds before a pass gives up
+        self.refresh_stats = {"passes": 0, "failed": 0, "skipped": 0, "last_duration": 0.0}
+        self.bulk_tickers = data_config.get('bulk_tickers', True)  # One request for all ticker subscriptions
+        
+        # Higher timeframes derived from the base timeframe
+        self.base_timeframe = data_config.get('base_timeframe', '1m')
+        self.derive_timeframes = data_config.get('derive_timeframes', True)
+        
+        # On-disk cache of closed bars (disabled without a directory)
+        cache_dir = data_config.get('kline_cache_dir')
+        self.kline_cache = KlineCache(cache_dir, logger=self.logger) if cache_dir else None
+        
+        # Kline gaps not repaired yet, format: {(symbol, timeframe): (start_ms, end_ms)}
+        self.kline_gaps = {}
+        self._backfill_tasks = {}  # Format: {(symbol, timeframe): asyncio.Task}
+        self._queued_klines = {}  # Live bars held during a backfill, format: {(symbol, timeframe): [bars]}
+        
+        # Event handlers, format: {event: [handler]}
+        self._event_handlers = {}
+        
+        # Receive times and feed lag per stream, lag measured on the exchange clock
+        clock = getattr(client, 'clock', None)
+        self.freshness = FreshnessTracker(data_config.get('freshness_sla'), clock.now_ms if clock is not None else None)
+        
+        # Market data events
+        self.events = EventBus()
+        self._closed_bars = {}  # Last published bar_closed start, format: {(symbol, timeframe): start_ms}
+        self._book_tops = {}  # Last published best bid/ask, format: {symbol: (bid, ask)}
+        
+        # Shared-memory market data bus
+        shared_config = data_config.get('shared_memory', {})
+        self.shared_role = shared_config.get('role')  # None, 'publisher' or 'subscriber'
+        self.shared_name = shared_config.get('name', 'pybit_md')  # Segment name prefix
+        self.shared_poll_interval = shared_config.get('poll_interval', 0.05)  # Seconds between subscriber polls
+        self.shared_attach_timeout = shared_config.get('attach_timeout', 30.0)  # Seconds to wait for the publisher
+        self._shared_records = {}  # Attached by a subscriber, format: {(symbol, 'ticker' | 'book'): SharedRecord}
+        
         # WebSocket connection
-        self.ws_connected = False
+        system_config = self.config.get('general', {}).get('system', {})
+        self.ws_url = system_config.get('ws_public_url')  # None = Bybit public linear stream
+        self.ws_testnet = getattr(client, 'testnet', system_config.get('testnet', True))
+        self.ws_ping_interval = system_config.get('ws_ping_interval', 20)
+        self.ws_reconnect_attempts = system_config.get('ws_reconnect_attempts', 5)
+        self.ws = None
         self.ws_task = None
+        self._ws_topics = {}  # Format: {topic: (kind, symbol, timeframe)}
         
         self.logger.info("DataManager initialized")
         self.logger.debug(f"EXIT __init__ completed")
     
+    @property
+    def ws_connected(self) -> bool:
+        """Whether the public stream is currently connected"""
+        return self.ws is not None and self.ws.connected
+    
     def subscribe_klines(self, symbol: str, timeframe: str) -> bool:
         """
         Subscribe to kline (candlestick) data
@@ -85,12 +206,16 @@ class DataManager:
             self.kline_subscriptions.add(subscription)
             
             # Initialize klines container if needed
-            if symbol not in self.klines:
-                self.klines[symbol] = {}
-                
-            if timeframe not in self.klines[symbol]:
-                self.klines[symbol][timeframe] = pd.DataFrame()
+            self._kline_buffer(symbol, timeframe)
+            if symbol in self.recent_trades:
+                self._trade_bars(symbol, timeframe)
                 
+            # Derived timeframes are built from the base stream
+            for subscribed in self._derived_timeframes(symbol):
+                self._remove_ws_topic(PublicWebSocket.kline_topic(symbol, subscribed))
+            if not self._is_derived(symbol, timeframe):
+                self._add_ws_topic(PublicWebSocket.kline_topic(symbol, timeframe), ('kline', symbol, timeframe))
+            
             self.logger.info(f"Subscribed to {symbol} {timeframe} klines")
             self.logger.debug(f"EXIT subscribe_klines returned True")
             return True
@@ -120,6 +245,8 @@ class DataManager:
             if symbol not in self.tickers:
                 self.tickers[symbol] = {}
                 
+            self._add_ws_topic(PublicWebSocket.ticker_topic(symbol), ('ticker', symbol, None))
+            
             self.logger.info(f"Subscribed to {symbol} ticker")
             self.logger.debug(f"EXIT subscribe_ticker returned True")
             return True
@@ -147,12 +274,10 @@ class DataManager:
             
             # Initialize orderbook container if needed
             if symbol not in self.orderbooks:
-                self.orderbooks[symbol] = {
-                    'bids': [],
-                    'asks': [],
-                    'timestamp': 0
-                }
+                self.orderbooks[symbol] = OrderBook(symbol)
                 
+            self._add_ws_topic(PublicWebSocket.orderbook_topic(symbol, self.orderbook_depth), ('orderbook', symbol, None))
+            
             self.logger.info(f"Subscribed to {symbol} orderbook")
             self.logger.debug(f"EXIT subscribe_orderbook returned True")
             return True
@@ -162,6 +287,37 @@ class DataManager:
             self.logger.debug(f"EXIT subscribe_orderbook returned False (error)")
             return False
     
+    def subscribe_trades(self, symbol: str) -> bool:
+        """
+        Subscribe to public trades (stream only)
+        
+        Args:
+            symbol: Trading symbol (e.g., "BTCUSDT")
+            
+        Returns:
+            True if subscription was successful, False otherwise
+        """
+        self.logger.debug(f"ENTER subscribe_trades(symbol={symbol})")
+        
+        try:
+            # Initialize trade tape and per-bar volume delta if needed
+            if symbol not in self.recent_trades:
+                self.recent_trades[symbol] = TradeTape(self.trade_buffer_size)
+            for subscribed, timeframe in self.kline_subscriptions:
+                if subscribed == symbol:
+                    self._trade_bars(symbol, timeframe)
+                
+            self._add_ws_topic(PublicWebSocket.trade_topic(symbol), ('trade', symbol, None))
+            
+            self.logger.info(f"Subscribed to {symbol} trades")
+            self.logger.debug(f"EXIT subscribe_trades returned True")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error subscribing to trades: {str(e)}")
+            self.logger.debug(f"EXIT subscribe_trades returned False (error)")
+            return False
+    
     async def load_initial_data(self) -> bool:
         """
         Load initial historical data for all subscriptions
@@ -172,35 +328,69 @@ class DataManager:
         self.logger.debug(f"ENTER load_initial_data()")
         
         try:
-            # Load klines for all subscriptions
-            for symbol, timeframe in self.kline_subscriptions:
-                self.logger.info(f"Loading initial klines for {symbol} {timeframe}")
-                
-                # Get number of bars to fetch
-                lookback = self.lookback_bars.get(timeframe, 1000)
+            if self.shared_role == 'subscriber':
+                # The publisher process loads the data
+                success = await self._attach_shared_memory(self.shared_attach_timeout)
+                self.logger.debug(f"EXIT load_initial_data returned {success} (shared memory)")
+                return success
                 
-                # Fetch historical klines
-                success = await self._fetch_historical_klines(symbol, timeframe, lookback)
-                if not success:
-                    self.logger.warning(f"Failed to load initial klines for {symbol} {timeframe}")
+            # Load klines and orderbooks for all subscriptions concurrently
+            semaphore = asyncio.Semaphore(max(1, self.warmup_concurrency))
             
-            # Load tickers for all subscriptions
-            for symbol in self.ticker_subscriptions:
-                self.logger.info(f"Loading initial ticker for {symbol}")
-                
-                # Fetch latest ticker
-                success = await self._fetch_ticker(symbol)
-                if not success:
-                    self.logger.warning(f"Failed to load initial ticker for {symbol}")
+            async def load_klines(symbol: str, timeframe: str) -> None:
+                async with semaphore:
+                    self.logger.info(f"Loading initial klines for {symbol} {timeframe}")
+                    
+                    # Get number of bars to fetch
+                    lookback = self.lookback_bars.get(timeframe, 1000)
+                    
+                    if self._load_cached_klines(symbol, timeframe):
+                        # Only fetch the bars since the last cached one
+                        success = await self._backfill_klines(symbol, timeframe)
+                    else:
+                        # Fetch historical klines
+                        success = await self._fetch_historical_klines(symbol, timeframe, lookback)
+                        
+                    if success:
+                        self._persist_klines(symbol, timeframe)
+                        
+                        # Bars closed before startup are history, not bar_closed events
+                        interval_ms = interval_to_ms(timeframe)
+                        now = int(time.time() * 1000)
+                        self._closed_bars[(symbol, timeframe)] = now - now % interval_ms - interval_ms
+                    else:
+                        self.logger.warning(f"Failed to load initial klines for {symbol} {timeframe}")
+                        
+            async def load_orderbook(symbol: str) -> None:
+                async with semaphore:
+                    self.logger.info(f"Loading initial orderbook for {symbol}")
+                    
+                    # Fetch latest orderbook
+                    success = await self._fetch_orderbook(symbol)
+                    if not success:
+                        self.logger.warning(f"Failed to load initial orderbook for {symbol}")
+                        
+            started = time.monotonic()
+            await asyncio.gather(
+                *[load_klines(symbol, timeframe) for symbol, timeframe in sorted(self.kline_subscriptions)],
+                *[load_orderbook(symbol) for symbol in sorted(self.orderbook_subscriptions)]
+            )
+            self.logger.info(f"Loaded {len(self.kline_subscriptions)} kline series and "
+                             f"{len(self.orderbook_subscriptions)} orderbooks in {time.monotonic() - started:.1f}s")
             
-            # Load orderbooks for all subscriptions
-            for symbol in self.orderbook_subscriptions:
-                self.logger.info(f"Loading initial orderbook for {symbol}")
-                
-                # Fetch latest orderbook
-                success = await self._fetch_orderbook(symbol)
-                if not success:
-                    self.logger.warning(f"Failed to load initial orderbook for {symbol}")
+            # Load tickers for all subscriptions
+            if self._use_bulk_tickers():
+                self.logger.info(f"Loading initial tickers for {len(self.ticker_subscriptions)} symbols")
+                if not await self._fetch_tickers():
+                    self.logger.warning("Failed to load some initial tickers")
+            else:
+                for symbol in self.ticker_subscriptions:
+                    self.logger.info(f"Loading initial ticker for {symbol}")
+                    
+                    # Fetch latest ticker
+                    success = await self._fetch_ticker(symbol)
+                    if not success:
+                        self.logger.warning(f"Failed to load initial ticker for {symbol}")
             
             self.logger.info("Initial data loading completed")
             self.logger.debug(f"EXIT load_initial_data returned True")
@@ -215,40 +405,134 @@ class DataManager:
         """
         Update all subscribed market data
         
+        Subscriptions are refreshed concurrently; one failing or slow
+        subscription does not hold up the others.
+        
         Returns:
-            True if update was successful, False otherwise
+            True if every subscription was refreshed in time, False otherwise
         """
         self.logger.debug(f"ENTER update_market_data()")
         
         try:
+            # The stream keeps the caches current while it is connected
+            if self.ws_connected:
+                self.logger.debug(f"EXIT update_market_data returned True (streaming)")
+                return True
+            if self.shared_role == 'subscriber':
+                self.logger.debug(f"EXIT update_market_data returned True (shared memory)")
+                return True
+                
+            refreshes = {}  # Format: {label: function returning an awaitable bool}
+            
             # Update tickers
-            for symbol in self.ticker_subscriptions:
-                await self._fetch_ticker(symbol)
+            if self._use_bulk_tickers():
+                refreshes["tickers"] = self._fetch_tickers
+            else:
+                for symbol in self.ticker_subscriptions:
+                    refreshes[f"ticker {symbol}"] = partial(self._fetch_ticker, symbol)
             
             # Update klines that need updating
             current_time = datetime.now().timestamp()
             for symbol, timeframe in self.kline_subscriptions:
+                if not self._needs_rest_update(symbol, timeframe):
+                    continue
+                    
                 # Check if we need to update
                 last_update = self._get_last_kline_timestamp(symbol, timeframe)
                 if current_time - last_update > self._get_timeframe_seconds(timeframe):
-                    await self._fetch_recent_klines(symbol, timeframe, 2)
+                    refreshes[f"klines {symbol} {timeframe}"] = partial(self._backfill_klines, symbol, timeframe)
             
             # Update orderbooks if needed
             for symbol in self.orderbook_subscriptions:
-                await self._fetch_orderbook(symbol)
+                refreshes[f"orderbook {symbol}"] = partial(self._fetch_orderbook, symbol)
             
-            self.logger.debug(f"EXIT update_market_data returned True")
-            return True
+            results = await self._run_refreshes(refreshes)
+            failed = [label for label, result in results.items() if result is False]
+            skipped = [label for label, result in results.items() if result is None]
+            
+            if failed:
+                self.logger.warning(f"Market data refresh failed for: {', '.join(sorted(failed))}")
+            if skipped:
+                self.logger.warning(f"Market data refresh skipped after {self.refresh_deadline}s: {', '.join(sorted(skipped))}")
+                
+            success = not failed and not skipped
+            self.logger.debug(f"EXIT update_market_data returned {success}")
+            return success
             
         except Exception as e:
             self.logger.error(f"Error updating market data: {str(e)}")
             self.logger.debug(f"EXIT update_market_data returned False (error)")
             return False
     
+    def _refresh_limit(self) -> int:
+        """
+        Requests a REST pass may have in flight
+        
+        Limited to the market data tokens the client's rate limiter has
+        available, so a pass does not queue more requests than it can send.
+        
+        Returns:
+            Concurrency limit (at least 1)
+        """
+        limit = self.refresh_concurrency
+        limiter = getattr(self.client, 'rate_limiter', None)
+        if limiter is not None:
+            bucket = limiter.buckets.get(limiter.get_group('/v5/market/'))
+            if bucket is not None:
+                limit = min(limit, int(bucket.available()))
+        return max(1, limit)
+    
+    async def _run_refreshes(self, refreshes: Dict[str, Callable[[], Awaitable[bool]]]) -> Dict[str, Optional[bool]]:
+        """
+        Run refresh functions concurrently until the pass deadline
+        
+        Args:
+            refreshes: Functions returning True on success, by label
+            
+        Returns:
+            Result per label: True, False (failed) or None (cancelled at the deadline)
+        """
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self._refresh_limit())
+        
+        async def run(refresh: Callable[[], Awaitable[bool]]) -> bool:
+            async with semaphore:
+                return await refresh()
+                
+        tasks = {asyncio.ensure_future(run(refresh)): label for label, refresh in refreshes.items()}
+        results = {}
+        
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=self.refresh_deadline)
+            
+            # Results arriving after the deadline would be stale
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
+            for task, label in tasks.items():
+                if task in pending:
+                    results[label] = None
+                elif task.exception() is not None:
+                    self.logger.error(f"Error refreshing {label}: {str(task.exception())}")
+                    results[label] = False
+                else:
+                    results[label] = bool(task.result())
+                    
+        self.refresh_stats["passes"] += 1
+        self.refresh_stats["failed"] += sum(1 for result in results.values() if result is False)
+        self.refresh_stats["skipped"] += sum(1 for result in results.values() if result is None)
+        self.refresh_stats["last_duration"] = time.monotonic() - started
+        return results
+    
     async def _fetch_historical_klines(self, symbol: str, timeframe: str, limit: int = 1000) -> bool:
         """
         Fetch historical klines for a symbol and timeframe
         
+        Pages back from the current bar until `limit` bars are covered;
+        pages beyond the API's 1000-bar cap are fetched concurrently
+        (`backfill_concurrency` at a time) under the client's rate limiter.
+        
         Args:
             symbol: Trading symbol
             timeframe: Timeframe interval
@@ -260,122 +544,431 @@ class DataManager:
         self.logger.debug(f"ENTER _fetch_historical_klines(symbol={symbol}, timeframe={timeframe}, limit={limit})")
         
         try:
-            # Prepare parameters
-            params = {
-                "category": "linear",
-                "symbol": symbol,
-                "interval": timeframe,
-                "limit": min(limit, 1000)  # API limit is 1000
-            }
+            interval_ms = interval_to_ms(timeframe)
+            now = int(time.time() * 1000)
+            start = now - now % interval_ms - (limit - 1) * interval_ms
             
-            # Make request
-            response = await self.client.get_klines(params)
+            # Fetch the range in concurrent pages
+            pages = [
+                page async for page in self.client.iter_klines(
+                    "linear", symbol, timeframe, start, now, concurrency=self.backfill_concurrency
+                )
+            ]
             
-            # Process response
-            if response and response.get("retCode") == 0:
-                klines_data = response.get("result", {}).get("list", [])
-                
-                if not klines_data:
-                    self.logger.warning(f"No klines data returned for {symbol} {timeframe}")
-                    self.logger.debug(f"EXIT _fetch_historical_klines returned False (no data)")
-                    return False
-                
-                # Convert to DataFrame
-                df = self._convert_klines_to_dataframe(klines_data)
-                
-                # Store in cache
-                self.klines[symbol][timeframe] = df
-                
-                self.logger.info(f"Fetched {len(df)} historical klines for {symbol} {timeframe}")
-                self.logger.debug(f"EXIT _fetch_historical_klines returned True")
-                return True
-            else:
-                error_msg = response.get("retMsg", "Unknown error") if response else "No response"
-                self.logger.error(f"Error fetching historical klines: {error_msg}")
-                self.logger.debug(f"EXIT _fetch_historical_klines returned False (API error)")
+            if not pages:
+                self.logger.warning(f"No klines data returned for {symbol} {timeframe}")
+                self.logger.debug(f"EXIT _fetch_historical_klines returned False (no data)")
                 return False
                 
+            # Replace the cached bars; pages are stitched and deduplicated by start time
+            buffer = self._kline_buffer(symbol, timeframe)
+            buffer.clear()
+            buffer.extend(np.concatenate(pages))
+            
+            self.freshness.record('kline', f"{symbol} {timeframe}")
+            
+            self.logger.info(f"Fetched {len(buffer)} historical klines for {symbol} {timeframe} in {len(pages)} pages")
+            self.logger.debug(f"EXIT _fetch_historical_klines returned True")
+            return True
+                
         except Exception as e:
             self.logger.error(f"Error fetching historical klines: {str(e)}")
             self.logger.debug(f"EXIT _fetch_historical_klines returned False (exception)")
             return False
     
-    async def _fetch_recent_klines(self, symbol: str, timeframe: str, limit: int = 2) -> bool:
+    def _kline_buffer(self, symbol: str, timeframe: str) -> KlineBuffer:
         """
-        Fetch recent klines and update the cache
+        Get the kline buffer for a subscription, creating it if needed
         
         Args:
             symbol: Trading symbol
             timeframe: Timeframe interval
-            limit: Number of recent candles to fetch
             
         Returns:
-            True if fetch was successful, False otherwise
+            Buffer holding up to the timeframe's lookback bars
+        """
+        buffers = self.klines.setdefault(symbol, {})
+        buffer = buffers.get(timeframe)
+        if buffer is None:
+            capacity = self.lookback_bars.get(timeframe, 1000)
+            if self.shared_role == 'publisher':
+                buffer = SharedKlineBuffer.create(segment_name(self.shared_name, symbol, timeframe), capacity)
+            else:
+                # A subscriber replaces it with the publisher's ring once attached
+                buffer = KlineBuffer(capacity)
+            buffers[timeframe] = buffer
+            
+            # Over REST a series is only refreshed once per bar
+            grace = self.freshness.sla['kline']
+            self.freshness.set_sla('kline', f"{symbol} {timeframe}", interval_to_ms(timeframe) / 1000 + grace)
+        return buffer
+    
+    def _trade_bars(self, symbol: str, timeframe: str) -> VolumeDeltaBars:
         """
-        self.logger.debug(f"ENTER _fetch_recent_klines(symbol={symbol}, timeframe={timeframe}, limit={limit})")
+        Get the volume delta bars of a symbol and timeframe, creating them if needed
         
-        try:
-            # Prepare parameters
-            params = {
-                "category": "linear",
-                "symbol": symbol,
-                "interval": timeframe,
-                "limit": limit
-            }
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
             
-            # Make request
-            response = await self.client.get_klines(params)
+        Returns:
+            Bars holding up to the timeframe's lookback
+        """
+        bars = self.trade_bars.setdefault(symbol, {})
+        if timeframe not in bars:
+            bars[timeframe] = VolumeDeltaBars(interval_to_ms(timeframe), self.lookback_bars.get(timeframe, 1000))
+        return bars[timeframe]
+    
+    def _is_derived(self, symbol: str, timeframe: str) -> bool:
+        """
+        Whether a kline series is built from the symbol's base timeframe
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
             
-            # Process response
-            if response and response.get("retCode") == 0:
-                klines_data = response.get("result", {}).get("list", [])
+        Returns:
+            True if the base timeframe is subscribed and can be aggregated into timeframe
+        """
+        return (
+            self.derive_timeframes
+            and (symbol, self.base_timeframe) in self.kline_subscriptions
+            and can_aggregate(self.base_timeframe, timeframe)
+        )
+    
+    def _derived_timeframes(self, symbol: str) -> List[str]:
+        """
+        Subscribed timeframes of a symbol built from its base timeframe
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            List of timeframes
+        """
+        return [tf for s, tf in self.kline_subscriptions if s == symbol and self._is_derived(s, tf)]
+    
+    def _needs_rest_update(self, symbol: str, timeframe: str) -> bool:
+        """
+        Whether a kline series has to be updated over REST
+        
+        Derived series only need REST when the base bars no longer cover
+        the gap since their last bar.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            True if the series should be fetched
+        """
+        if not self._is_derived(symbol, timeframe):
+            return True
+            
+        last = self._kline_buffer(symbol, timeframe).last_timestamp
+        first_base = self._kline_buffer(symbol, self.base_timeframe).first_timestamp
+        return last is None or first_base is None or last < first_base
+    
+    def _update_derived(self, symbol: str, since: int, closed_through: Optional[int] = None) -> None:
+        """
+        Rebuild derived bars from the base bars starting at `since`
+        
+        Only windows the base buffer fully covers are rebuilt, so a
+        partially covered window keeps its REST values.
+        
+        Args:
+            symbol: Trading symbol
+            since: Start of the oldest base bar that changed, in milliseconds
+            closed_through: End of the newest closed base bar in milliseconds,
+                or None if no bar closed (derived closed bars are persisted)
+        """
+        base = self._kline_buffer(symbol, self.base_timeframe)
+        if base.empty:
+            return
+            
+        timestamps = base.column('timestamp')
+        first_base = int(timestamps[0])
+        
+        for timeframe in self._derived_timeframes(symbol):
+            interval_ms = interval_to_ms(timeframe)
+            window_start = since - since % interval_ms
+            if window_start < first_base:
+                window_start = first_base + (-first_base % interval_ms)
                 
-                if not klines_data:
-                    self.logger.warning(f"No recent klines data returned for {symbol} {timeframe}")
-                    self.logger.debug(f"EXIT _fetch_recent_klines returned False (no data)")
-                    return False
+            i = int(np.searchsorted(timestamps, window_start))
+            if i == len(timestamps):
+                continue
+                
+            self._kline_buffer(symbol, timeframe).extend(aggregate_klines(base.view()[:, i:].T, interval_ms))
+            self.freshness.record('kline', f"{symbol} {timeframe}")
+            if closed_through is not None:
+                self._persist_klines(symbol, timeframe)
+            self._publish_bars(symbol, timeframe, closed_through)
+    
+    def _load_cached_klines(self, symbol: str, timeframe: str) -> bool:
+        """
+        Load bars from the on-disk cache into an empty buffer
+        
+        Cached bars older than the lookback window are not used.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            True if cached bars were loaded
+        """
+        if self.kline_cache is None:
+            return False
+            
+        try:
+            buffer = self._kline_buffer(symbol, timeframe)
+            rows = self.kline_cache.load(symbol, timeframe, max_bars=buffer.capacity)
+            
+            interval_ms = interval_to_ms(timeframe)
+            now = int(time.time() * 1000)
+            window_start = now - now % interval_ms - (buffer.capacity - 1) * interval_ms
+            if len(rows) == 0 or rows[-1, 0] < window_start:
+                return False
                 
-                # Convert to DataFrame
-                new_df = self._convert_klines_to_dataframe(klines_data)
+            buffer.clear()
+            buffer.extend(rows)
+            self.logger.info(f"Loaded {len(rows)} cached klines for {symbol} {timeframe}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error loading cached klines for {symbol} {timeframe}: {str(e)}")
+            return False
+    
+    def _persist_klines(self, symbol: str, timeframe: str) -> None:
+        """
+        Append closed bars not yet on disk to the kline cache
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+        """
+        if self.kline_cache is None:
+            return
+            
+        try:
+            buffer = self._kline_buffer(symbol, timeframe)
+            rows = buffer.view().T
+            
+            # The forming bar is persisted once it has closed
+            now = int(time.time() * 1000)
+            closed = rows[rows[:, 0] + interval_to_ms(timeframe) <= now]
+            self.kline_cache.append(symbol, timeframe, closed, max_bars=buffer.capacity)
+            
+        except Exception as e:
+            self.logger.error(f"Error persisting klines for {symbol} {timeframe}: {str(e)}")
+    
+    async def _backfill_klines(self, symbol: str, timeframe: str) -> bool:
+        """
+        Fetch every bar from the last cached one up to now
+        
+        The last cached bar is fetched again because it may have been
+        incomplete. Gaps longer than the lookback are limited to it.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            True if the series is complete up to now, False otherwise
+        """
+        self.logger.debug(f"ENTER _backfill_klines(symbol={symbol}, timeframe={timeframe})")
+        
+        key = (symbol, timeframe)
+        last_start = None
+        
+        try:
+            buffer = self._kline_buffer(symbol, timeframe)
+            lookback = buffer.capacity
+            
+            if buffer.empty:
+                # Nothing to extend, load the full history instead
+                success = await self._fetch_historical_klines(symbol, timeframe, lookback)
+                self.logger.debug(f"EXIT _backfill_klines returned {success} (full load)")
+                return success
                 
-                # Get existing data
-                existing_df = self.klines.get(symbol, {}).get(timeframe, pd.DataFrame())
+            interval_ms = interval_to_ms(timeframe)
+            now = int(time.time() * 1000)
+            current_start = now - now % interval_ms
+            last_start = buffer.last_timestamp
+            start = max(last_start, current_start - (lookback - 1) * interval_ms)
+            
+            # Fetch the range in concurrent pages
+            pages = [
+                page async for page in self.client.iter_klines(
+                    "linear", symbol, timeframe, start, now, concurrency=self.backfill_concurrency
+                )
+            ]
+            if not pages:
+                raise ValueError("no klines returned")
                 
-                if existing_df.empty:
-                    # No existing data, just use the new data
-                    self.klines[symbol][timeframe] = new_df
-                else:
-                    # Update existing data with new data
-                    # First remove any overlapping timestamps
-                    if not new_df.empty and not existing_df.empty:
-                        existing_df = existing_df[~existing_df.index.isin(new_df.index)]
-                        
-                        # Concatenate and sort
-                        combined_df = pd.concat([existing_df, new_df])
-                        combined_df = combined_df.sort_index()
-                        
-                        # Limit to lookback bars
-                        lookback = self.lookback_bars.get(timeframe, 1000)
-                        if len(combined_df) > lookback:
-                            combined_df = combined_df.iloc[-lookback:]
-                            
-                        # Store updated DataFrame
-                        self.klines[symbol][timeframe] = combined_df
-                
-                self.logger.info(f"Updated klines for {symbol} {timeframe}")
-                self.logger.debug(f"EXIT _fetch_recent_klines returned True")
-                return True
-            else:
-                error_msg = response.get("retMsg", "Unknown error") if response else "No response"
-                self.logger.error(f"Error fetching recent klines: {error_msg}")
-                self.logger.debug(f"EXIT _fetch_recent_klines returned False (API error)")
-                return False
+            buffer.extend(np.concatenate(pages))
+            self.kline_gaps.pop(key, None)
+            self.freshness.record('kline', f"{symbol} {timeframe}")
+            self._persist_klines(symbol, timeframe)
+            
+            # Every bar before the current one has closed
+            self._publish_bars(symbol, timeframe, current_start)
+            if timeframe == self.base_timeframe:
+                self._update_derived(symbol, start, current_start)
+            
+            missing = (current_start - last_start) // interval_ms
+            if missing > 0:
+                self.logger.info(f"Backfilled {missing} {timeframe} bars for {symbol}")
+                await self._emit(
+                    "data_repaired",
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    start=last_start + interval_ms,
+                    end=current_start,
+                    bars=missing
+                )
                 
+            self.logger.debug(f"EXIT _backfill_klines returned True")
+            return True
+            
         except Exception as e:
-            self.logger.error(f"Error fetching recent klines: {str(e)}")
-            self.logger.debug(f"EXIT _fetch_recent_klines returned False (exception)")
+            if last_start is not None:
+                self.kline_gaps[key] = (last_start, int(time.time() * 1000))
+            self.logger.error(f"Error backfilling klines for {symbol} {timeframe}: {str(e)}")
+            self.logger.debug(f"EXIT _backfill_klines returned False (exception)")
             return False
     
+    async def _on_reconnect(self) -> None:
+        """
+        Repair the caches after the stream reconnected
+        
+        Trades sent while disconnected are lost, so the volume delta of
+        the bars around the gap is marked incomplete; klines are backfilled
+        in the background while the stream is read.
+        """
+        now = int(time.time() * 1000)
+        for timeframes in self.trade_bars.values():
+            for bars in timeframes.values():
+                bars.mark_gap(now)
+        self._repair_klines()
+    
+    def _repair_klines(self) -> None:
+        """
+        Start a backfill of every kline subscription (run on reconnect)
+        
+        Live bars of a series are queued until its backfill has finished,
+        so the stream (and its heartbeat) need not wait for REST.
+        """
+        self.logger.debug(f"ENTER _repair_klines()")
+        
+        # Base series first: derived ones are rebuilt from them
+        loop = asyncio.get_running_loop()
+        subscriptions = sorted(self.kline_subscriptions, key=lambda sub: self._is_derived(*sub))
+        for symbol, timeframe in subscriptions:
+            key = (symbol, timeframe)
+            task = self._backfill_tasks.get(key)
+            if (task is None or task.done()) and self._needs_rest_update(symbol, timeframe):
+                self._backfill_tasks[key] = loop.create_task(self._backfill_and_replay(symbol, timeframe))
+                
+        self.logger.debug(f"EXIT _repair_klines started {len(self._backfill_tasks)} backfills")
+    
+    def add_event_handler(self, event: str, handler: Callable) -> None:
+        """
+        Register a handler for a data event
+        
+        Events:
+            data_repaired: symbol, timeframe, start, end (ms) and number of
+                bars backfilled after a gap
+        
+        Args:
+            event: Event name
+            handler: Function or coroutine function taking keyword arguments
+        """
+        self._event_handlers.setdefault(event, []).append(handler)
+    
+    async def _emit(self, event: str, **payload) -> None:
+        """
+        Call the handlers registered for an event
+        
+        Args:
+            event: Event name
+            **payload: Event data passed to the handlers
+        """
+        for handler in self._event_handlers.get(event, []):
+            try:
+                result = handler(**payload)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"Error in {event} handler: {str(e)}")
+    
+    def _publish_bars(self, symbol: str, timeframe: str, closed_through: Optional[int] = None) -> None:
+        """
+        Publish bar_closed for a newly closed bar and bar_updated for the newest bar
+        
+        bar_closed is published once per bar, for the newest bar that
+        ended by `closed_through`; older bars closed during a gap are not
+        published separately.
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            closed_through: End of the newest closed bar in milliseconds, or
+                None if no bar closed
+        """
+        buffer = self._kline_buffer(symbol, timeframe)
+        if buffer.empty:
+            return
+            
+        key = (symbol, timeframe)
+        if closed_through is not None and self.events.has_subscribers(EventType.BAR_CLOSED):
+            interval_ms = interval_to_ms(timeframe)
+            start = closed_through - closed_through % interval_ms - interval_ms
+            timestamps = buffer.column('timestamp')
+            i = int(np.searchsorted(timestamps, start))
+            if start > self._closed_bars.get(key, -1) and i < len(timestamps) and timestamps[i] == start:
+                self._closed_bars[key] = start
+                bar = dict(zip(KLINE_COLUMNS, buffer.view()[:, i].tolist()))
+                self.events.publish(MarketEvent(EventType.BAR_CLOSED, symbol, timeframe, start, bar))
+                
+        if self.events.has_subscribers(EventType.BAR_UPDATED):
+            bar = dict(zip(KLINE_COLUMNS, buffer.view(1)[:, 0].tolist()))
+            self.events.publish(MarketEvent(EventType.BAR_UPDATED, symbol, timeframe, int(bar['timestamp']), bar))
+    
+    def _publish_ticker(self, symbol: str, ts: Optional[int] = None) -> None:
+        """
+        Publish the current ticker of a symbol
+        
+        Args:
+            symbol: Trading symbol
+            ts: Exchange time of the update in milliseconds
+        """
+        if self.events.has_subscribers(EventType.TICKER):
+            ticker = dict(self.tickers[symbol])
+            self.events.publish(MarketEvent(EventType.TICKER, symbol, None, int(ts or 0), ticker))
+    
+    def _publish_book_top(self, symbol: str, book: OrderBook) -> None:
+        """
+        Publish book_top if the best bid or ask of a synced book changed
+        
+        Args:
+            symbol: Trading symbol
+            book: The symbol's order book
+        """
+        if not book.synced or not self.events.has_subscribers(EventType.BOOK_TOP):
+            return
+            
+        top = (book.best_bid, book.best_ask, book.depth('b', 1), book.depth('a', 1))
+        if np.isnan(top[0]) or np.isnan(top[1]) or top == self._book_tops.get(symbol):
+            return
+            
+        self._book_tops[symbol] = top
+        self.events.publish(MarketEvent(
+            EventType.BOOK_TOP, symbol, None, int(book.timestamp or 0),
+            {'bid': top[0], 'ask': top[1], 'bid_size': top[2], 'ask_size': top[3]}
+        ))
+    
     async def _fetch_ticker(self, symbol: str) -> bool:
         """
         Fetch latest ticker for a symbol
@@ -389,14 +982,8 @@ class DataManager:
         self.logger.debug(f"ENTER _fetch_ticker(symbol={symbol})")
         
         try:
-            # Prepare parameters
-            params = {
-                "category": "linear",
-                "symbol": symbol
-            }
-            
             # Make request
-            response = await self.client.get_tickers(params)
+            response = await self.client.get_tickers("linear", symbol)
             
             # Process response
             if response and response.get("retCode") == 0:
@@ -409,6 +996,8 @@ class DataManager:
                 
                 # Store in cache
                 self.tickers[symbol] = ticker_data[0]
+                self.freshness.record('ticker', symbol, response.get('time'))
+                self._publish_ticker(symbol, response.get('time'))
                 
                 self.logger.debug(f"Updated ticker for {symbol}")
                 self.logger.debug(f"EXIT _fetch_ticker returned True")
@@ -424,6 +1013,59 @@ class DataManager:
             self.logger.debug(f"EXIT _fetch_ticker returned False (exception)")
             return False
     
+    def _use_bulk_tickers(self) -> bool:
+        """Whether subscribed tickers are fetched with one request for the category"""
+        return self.bulk_tickers and len(self.ticker_subscriptions) > 1
+    
+    async def _fetch_tickers(self) -> bool:
+        """
+        Fetch the tickers of all subscribed symbols in one request
+        
+        The endpoint returns every symbol of the category; only subscribed
+        ones are kept. Use _fetch_ticker() for a single symbol.
+        
+        Returns:
+            True if every subscribed symbol was updated, False otherwise
+        """
+        self.logger.debug(f"ENTER _fetch_tickers()")
+        
+        try:
+            # Make request
+            response = await self.client.get_tickers("linear")
+            
+            # Process response
+            if response and response.get("retCode") == 0:
+                wanted = self.ticker_subscriptions
+                missing = set(wanted)
+                
+                # Fan out to the subscribed symbols
+                for ticker in response.get("result", {}).get("list", []):
+                    symbol = ticker.get("symbol")
+                    if symbol in wanted:
+                        self.tickers[symbol] = ticker
+                        self.freshness.record('ticker', symbol, response.get('time'))
+                        self._publish_ticker(symbol, response.get('time'))
+                        missing.discard(symbol)
+                        
+                if missing:
+                    self.logger.warning(f"No ticker data returned for {', '.join(sorted(missing))}")
+                    self.logger.debug(f"EXIT _fetch_tickers returned False (missing symbols)")
+                    return False
+                    
+                self.logger.debug(f"Updated {len(wanted)} tickers")
+                self.logger.debug(f"EXIT _fetch_tickers returned True")
+                return True
+            else:
+                error_msg = response.get("retMsg", "Unknown error") if response else "No response"
+                self.logger.error(f"Error fetching tickers: {error_msg}")
+                self.logger.debug(f"EXIT _fetch_tickers returned False (API error)")
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"Error fetching tickers: {str(e)}")
+            self.logger.debug(f"EXIT _fetch_tickers returned False (exception)")
+            return False
+    
     async def _fetch_orderbook(self, symbol: str, limit: int = 50) -> bool:
         """
         Fetch orderbook for a symbol
@@ -438,15 +1080,8 @@ class DataManager:
         self.logger.debug(f"ENTER _fetch_orderbook(symbol={symbol}, limit={limit})")
         
         try:
-            # Prepare parameters
-            params = {
-                "category": "linear",
-                "symbol": symbol,
-                "limit": limit
-            }
-            
             # Make request
-            response = await self.client.get_orderbook(params)
+            response = await self.client.get_orderbook("linear", symbol, limit=limit)
             
             # Process response
             if response and response.get("retCode") == 0:
@@ -458,11 +1093,10 @@ class DataManager:
                     return False
                 
                 # Store in cache
-                self.orderbooks[symbol] = {
-                    'bids': orderbook_data.get('b', []),
-                    'asks': orderbook_data.get('a', []),
-                    'timestamp': orderbook_data.get('ts', int(time.time() * 1000))
-                }
+                book = self.orderbooks.setdefault(symbol, OrderBook(symbol))
+                book.apply_snapshot(orderbook_data, orderbook_data.get('ts', int(time.time() * 1000)))
+                self.freshness.record('orderbook', symbol, orderbook_data.get('ts'))
+                self._publish_book_top(symbol, book)
                 
                 self.logger.debug(f"Updated orderbook for {symbol}")
                 self.logger.debug(f"EXIT _fetch_orderbook returned True")
@@ -478,38 +1112,34 @@ class DataManager:
             self.logger.debug(f"EXIT _fetch_orderbook returned False (exception)")
             return False
     
-    def _convert_klines_to_dataframe(self, klines_data: List[List]) -> pd.DataFrame:
+    def _convert_klines_to_dataframe(self, klines_data: Union[List[List], np.ndarray]) -> pd.DataFrame:
         """
         Convert klines data from API to pandas DataFrame
         
         Args:
-            klines_data: List of klines from API
+            klines_data: List of klines from API or a float64 array from
+                BybitClient.get_klines_array()
             
         Returns:
             Pandas DataFrame with processed klines
         """
         # Check if we have data
-        if not klines_data:
+        if klines_data is None or len(klines_data) == 0:
             return pd.DataFrame()
             
-        # Create DataFrame
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']
-        df = pd.DataFrame(klines_data, columns=columns)
-        
-        # Convert types
-        df['timestamp'] = pd.to_numeric(df['timestamp'])
-        df['open'] = pd.to_numeric(df['open'])
-        df['high'] = pd.to_numeric(df['high'])
-        df['low'] = pd.to_numeric(df['low'])
-        df['close'] = pd.to_numeric(df['close'])
-        df['volume'] = pd.to_numeric(df['volume'])
-        df['turnover'] = pd.to_numeric(df['turnover'])
+        # Parse all columns in one pass (API rows are strings)
+        array = klines_to_array(klines_data)
         
-        # Set timestamp as index
-        df.set_index('timestamp', inplace=True)
+        # Create DataFrame indexed by timestamp
+        df = pd.DataFrame(
+            array[:, 1:],
+            index=pd.Index(array[:, 0].astype(np.int64), name='timestamp'),
+            columns=list(KLINE_COLUMNS[1:])
+        )
         
         # Sort by timestamp
-        df.sort_index(inplace=True)
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
         
         return df
     
@@ -525,14 +1155,14 @@ class DataManager:
             Timestamp in seconds
         """
         # Get klines for symbol and timeframe
-        klines_df = self.klines.get(symbol, {}).get(timeframe)
+        buffer = self.klines.get(symbol, {}).get(timeframe)
         
-        if klines_df is None or klines_df.empty:
+        if buffer is None or buffer.empty:
             # No data, return old timestamp to force update
             return 0
             
         # Get the latest timestamp
-        latest_ts = klines_df.index[-1]
+        latest_ts = buffer.last_timestamp
         
         # Convert from milliseconds to seconds if needed
         if latest_ts > 1e12:  # Timestamp is in milliseconds
@@ -581,10 +1211,13 @@ class DataManager:
         
         try:
             # Get klines from cache
-            df = self.klines.get(symbol, {}).get(timeframe, pd.DataFrame())
+            buffer = self.klines.get(symbol, {}).get(timeframe)
+            df = buffer.to_dataframe() if buffer is not None else pd.DataFrame()
             
             if df.empty:
                 self.logger.warning(f"No klines data found for {symbol} {timeframe}")
+            elif (symbol, timeframe) in self.kline_gaps:
+                self.logger.warning(f"Klines for {symbol} {timeframe} have an unrepaired gap")
                 
             self.logger.debug(f"EXIT get_klines returned DataFrame with {len(df)} rows")
             return df
@@ -594,12 +1227,154 @@ class DataManager:
             self.logger.debug(f"EXIT get_klines returned empty DataFrame (error)")
             return pd.DataFrame()
     
-    def get_ticker(self, symbol: str) -> Dict[str, Any]:
+    def get_trades(self, symbol: str, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get public trades of a symbol from the tape
+        
+        Args:
+            symbol: Trading symbol
+            start: First timestamp included in milliseconds (default oldest kept)
+            end: First timestamp excluded in milliseconds (default newest)
+            
+        Returns:
+            Read-only structured array with timestamp, price, size and side
+            (+1 buy, -1 sell), oldest first; empty if trades are not subscribed
+        """
+        tape = self.recent_trades.get(symbol)
+        if tape is None:
+            return np.empty(0, dtype=TRADE_DTYPE)
+        return tape.between(start if start is not None else 0, end)
+    
+    def get_volume_delta(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """
+        Get taker buy and sell volume per bar, from the trade stream
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            
+        Returns:
+            DataFrame indexed by bar start with buy_volume, sell_volume,
+            delta, buy_turnover, sell_turnover, trades and complete (False
+            for bars the stream did not fully cover), or empty DataFrame
+            if trades are not subscribed
+        """
+        self.logger.debug(f"ENTER get_volume_delta(symbol={symbol}, timeframe={timeframe})")
+        
+        try:
+            bars = self.trade_bars.get(symbol, {}).get(timeframe)
+            df = bars.to_dataframe() if bars is not None else pd.DataFrame()
+            
+            self.logger.debug(f"EXIT get_volume_delta returned {len(df)} bars")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error getting volume delta: {str(e)}")
+            self.logger.debug(f"EXIT get_volume_delta returned empty DataFrame (error)")
+            return pd.DataFrame()
+    
+    def get_footprint(self, symbol: str, timeframe: str, tick_size: float, bars: int = 1) -> pd.DataFrame:
+        """
+        Get taker buy and sell volume per price level within the latest bars
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            tick_size: Width of a price level
+            bars: Number of bars, including the forming one
+            
+        Returns:
+            DataFrame indexed by (bar start, level price) with buy_volume,
+            sell_volume, delta and volume, or empty DataFrame if no trades
+        """
+        self.logger.debug(f"ENTER get_footprint(symbol={symbol}, timeframe={timeframe}, tick_size={tick_size}, bars={bars})")
+        
+        try:
+            tape = self.recent_trades.get(symbol)
+            if tape is None or not len(tape):
+                self.logger.debug(f"EXIT get_footprint returned empty DataFrame (no trades)")
+                return pd.DataFrame()
+                
+            interval_ms = interval_to_ms(timeframe)
+            last = tape.last_timestamp
+            start = last - last % interval_ms - (bars - 1) * interval_ms
+            df = footprint(tape.between(start), interval_ms, tick_size)
+            
+            self.logger.debug(f"EXIT get_footprint returned {len(df)} cells")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error getting footprint: {str(e)}")
+            self.logger.debug(f"EXIT get_footprint returned empty DataFrame (error)")
+            return pd.DataFrame()
+    
+    def get_volume_profile(self, symbol: str, tick_size: float, start: Optional[int] = None,
+                           end: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get taker buy and sell volume per price level over a time range
+        
+        Args:
+            symbol: Trading symbol
+            tick_size: Width of a price level
+            start: First timestamp included in milliseconds (default oldest kept trade)
+            end: First timestamp excluded in milliseconds (default newest)
+            
+        Returns:
+            DataFrame indexed by level price with buy_volume, sell_volume,
+            delta and volume, or empty DataFrame if no trades
+        """
+        self.logger.debug(f"ENTER get_volume_profile(symbol={symbol}, tick_size={tick_size}, start={start}, end={end})")
+        
+        try:
+            trades = self.get_trades(symbol, start, end)
+            df = volume_profile(trades, tick_size) if len(trades) else pd.DataFrame()
+            
+            self.logger.debug(f"EXIT get_volume_profile returned {len(df)} levels")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error getting volume profile: {str(e)}")
+            self.logger.debug(f"EXIT get_volume_profile returned empty DataFrame (error)")
+            return pd.DataFrame()
+    
+    def is_stale(self, kind: str, symbol: str, timeframe: Optional[str] = None) -> bool:
+        """
+        Whether cached data is older than its freshness SLA
+        
+        Args:
+            kind: Data type ('ticker', 'orderbook', 'kline' or 'trade')
+            symbol: Trading symbol
+            timeframe: Timeframe interval (klines only)
+            
+        Returns:
+            True if the data is missing or stale; an order book that is
+            out of sync is always stale
+        """
+        if kind == 'orderbook':
+            book = self.orderbooks.get(symbol)
+            if book is None or not book.synced:
+                return True
+        return self.freshness.is_stale(kind, symbol if timeframe is None else f"{symbol} {timeframe}")
+    
+    def get_freshness_report(self) -> Dict[str, Any]:
+        """
+        Get the age, feed lag and staleness of every cached stream
+        
+        Returns:
+            Dictionary with per-type stream ages, lags and stale streams,
+            the number of stale streams and whether the stream is connected
+        """
+        report = self.freshness.report()
+        report['streaming'] = self.ws_connected
+        return report
+    
+    def get_ticker(self, symbol: str, allow_stale: bool = True) -> Dict[str, Any]:
         """
         Get ticker data for a symbol
         
         Args:
             symbol: Trading symbol
+            allow_stale: Whether to return a ticker older than its SLA
             
         Returns:
             Dictionary with ticker data or empty dict if not found
@@ -610,6 +1385,11 @@ class DataManager:
             # Get ticker from cache
             ticker = self.tickers.get(symbol, {})
             
+            if ticker and not allow_stale and self.is_stale('ticker', symbol):
+                self.logger.warning(f"Ticker for {symbol} is stale ({self.freshness.age('ticker', symbol):.1f}s old)")
+                self.logger.debug(f"EXIT get_ticker returned empty dict (stale)")
+                return {}
+                
             if not ticker:
                 self.logger.warning(f"No ticker data found for {symbol}")
                 
@@ -629,17 +1409,23 @@ class DataManager:
             symbol: Trading symbol
             
         Returns:
-            Dictionary with orderbook data or empty dict if not found
+            Dictionary with 'bids'/'asks' [price, size] float levels, best
+            first, and a 'stale' flag, or empty dict if not found
         """
         self.logger.debug(f"ENTER get_orderbook(symbol={symbol})")
         
         try:
             # Get orderbook from cache
-            orderbook = self.orderbooks.get(symbol, {})
+            book = self.orderbooks.get(symbol)
             
-            if not orderbook:
+            if not book:
                 self.logger.warning(f"No orderbook data found for {symbol}")
+                self.logger.debug(f"EXIT get_orderbook returned empty dict (no data)")
+                return {}
                 
+            orderbook = book.to_dict(self.orderbook_depth)
+            orderbook['stale'] = self.is_stale('orderbook', symbol)
+            
             self.logger.debug(f"EXIT get_orderbook returned orderbook data")
             return orderbook
             
@@ -648,12 +1434,13 @@ class DataManager:
             self.logger.debug(f"EXIT get_orderbook returned empty dict (error)")
             return {}
     
-    def get_market_price(self, symbol: str) -> float:
+    def get_market_price(self, symbol: str, allow_stale: bool = False) -> float:
         """
         Get current market price for a symbol
         
         Args:
             symbol: Trading symbol
+            allow_stale: Whether to use a ticker or book older than its SLA
             
         Returns:
             Current price or 0 if not found
@@ -662,18 +1449,18 @@ class DataManager:
         
         try:
             # Try to get price from ticker
-            ticker = self.get_ticker(symbol)
-            if ticker and 'last_price' in ticker:
-                price = float(ticker['last_price'])
+            ticker = self.get_ticker(symbol, allow_stale)
+            last_price = ticker.get('lastPrice', ticker.get('last_price')) if ticker else None
+            if last_price:
+                price = float(last_price)
                 self.logger.debug(f"EXIT get_market_price returned {price}")
                 return price
                 
             # If ticker not available, try orderbook mid price
-            orderbook = self.get_orderbook(symbol)
-            if orderbook and orderbook.get('bids') and orderbook.get('asks'):
-                best_bid = float(orderbook['bids'][0][0])
-                best_ask = float(orderbook['asks'][0][0])
-                mid_price = (best_bid + best_ask) / 2
+            book = self.orderbooks.get(symbol)
+            fresh = allow_stale or not self.is_stale('orderbook', symbol)
+            if book is not None and book.synced and book.bids.n and book.asks.n and fresh:
+                mid_price = book.mid
                 self.logger.debug(f"EXIT get_market_price returned {mid_price} (from orderbook)")
                 return mid_price
                 
@@ -703,6 +1490,13 @@ class DataManager:
                 self.logger.debug(f"EXIT start_websocket returned True (already running)")
                 return True
                 
+            if self.shared_role == 'subscriber':
+                # Updates come from the publisher's shared memory instead
+                self.ws_task = asyncio.create_task(self._shared_memory_handler())
+                self.logger.info(f"Reading market data from shared memory '{self.shared_name}'")
+                self.logger.debug(f"EXIT start_websocket returned True (shared memory)")
+                return True
+                
             # Start WebSocket task
             self.ws_task = asyncio.create_task(self._websocket_handler())
             
@@ -733,7 +1527,12 @@ class DataManager:
                 except asyncio.CancelledError:
                     pass
                     
-            self.ws_connected = False
+            # Abandon running backfills; the next update repairs the gap
+            for task in self._backfill_tasks.values():
+                task.cancel()
+            self._backfill_tasks.clear()
+            self._queued_klines.clear()
+            
             self.ws_task = None
             
             self.logger.info("WebSocket connection stopped")
@@ -748,31 +1547,350 @@ class DataManager:
     async def _websocket_handler(self) -> None:
         """
         WebSocket connection handler
+        
+        Runs the public stream until stop_websocket() is called or the
+        reconnect attempts are exhausted; REST polling takes over after that.
         """
         self.logger.debug(f"ENTER _websocket_handler()")
         
         try:
-            # Get WebSocket URL and other parameters
-            ws_url = "wss://stream-testnet.bybit.com/v5/public/linear"
+            self.ws = PublicWebSocket(
+                self._handle_ws_message,
+                testnet=self.ws_testnet,
+                url=self.ws_url,
+                ping_interval=self.ws_ping_interval,
+                max_reconnect_attempts=self.ws_reconnect_attempts,
+                on_reconnect=self._on_reconnect,
+                logger=self.logger
+            )
+            self.ws.subscribe(list(self._ws_topics))
             
             # Connect to WebSocket
-            self.logger.info(f"Connecting to WebSocket: {ws_url}")
-            
-            # Here we would connect to the WebSocket and handle messages
-            # This would involve implementing WebSocket connection to Bybit API
-            # For now, we'll just use a placeholder that sleeps
+            self.logger.info(f"Connecting to WebSocket: {self.ws.url} ({len(self._ws_topics)} topics)")
+            await self.ws.run()
+                
+        except asyncio.CancelledError:
+            self.logger.info("WebSocket task cancelled")
+        except Exception as e:
+            self.logger.error(f"WebSocket error: {str(e)}")
+        finally:
+            if self.ws is not None:
+                await self.ws.stop()
+                self.ws = None
+            self.logger.debug(f"EXIT _websocket_handler completed")
+    
+    async def _attach_shared_memory(self, timeout: float) -> bool:
+        """
+        Attach to the publisher's segments for all subscriptions
+        
+        Args:
+            timeout: Seconds to wait for segments the publisher has not created yet
             
-            self.ws_connected = True
+        Returns:
+            True if every subscription was attached
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            missing = self._attach_shared_segments()
+            if not missing:
+                self.logger.info(f"Attached to shared memory '{self.shared_name}'")
+                return True
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"Shared memory segments not found: {', '.join(missing)}")
+                return False
+            await asyncio.sleep(min(0.5, self.shared_poll_interval * 10))
+    
+    def _attach_shared_segments(self) -> List[str]:
+        """
+        Attach to segments not attached yet, or closed by a restarting publisher
+        
+        Returns:
+            Names of the segments that do not exist (yet)
+        """
+        missing = []
+        
+        for symbol, timeframe in sorted(self.kline_subscriptions):
+            buffer = self._kline_buffer(symbol, timeframe)
+            if isinstance(buffer, SharedKlineBuffer) and not buffer.closed:
+                continue
+            name = segment_name(self.shared_name, symbol, timeframe)
+            try:
+                self.klines[symbol][timeframe] = SharedKlineBuffer.attach(name)
+            except FileNotFoundError:
+                missing.append(name)
+                continue
+            if isinstance(buffer, SharedKlineBuffer):
+                buffer.close()
+                
+            # Bars closed before attaching are history, not bar_closed events
+            interval_ms = interval_to_ms(timeframe)
+            now = int(time.time() * 1000)
+            self._closed_bars.setdefault((symbol, timeframe), now - now % interval_ms - interval_ms)
             
-            # Keep connection alive
+        streams = [(symbol, 'ticker', TICKER_FIELDS) for symbol in sorted(self.ticker_subscriptions)]
+        streams += [(symbol, 'book', BOOK_TOP_FIELDS) for symbol in sorted(self.orderbook_subscriptions)]
+        for symbol, stream, fields in streams:
+            record = self._shared_records.get((symbol, stream))
+            if record is not None and not record.closed:
+                continue
+            name = segment_name(self.shared_name, symbol, stream)
+            try:
+                self._shared_records[(symbol, stream)] = SharedRecord.attach(name, fields)
+            except FileNotFoundError:
+                missing.append(name)
+                continue
+            if record is not None:
+                record.close()
+                
+        return missing
+    
+    async def _shared_memory_handler(self) -> None:
+        """
+        Poll the publisher's segments until stop_websocket() is called
+        
+        Segments missing or closed by the publisher are attached again
+        once a second.
+        """
+        self.logger.debug(f"ENTER _shared_memory_handler()")
+        
+        seen = {}  # Format: {(symbol, stream): (version or seq, last bar start)}
+        last_attach = 0.0
+        try:
             while True:
-                # Process WebSocket messages
-                await asyncio.sleep(1)
+                if time.monotonic() - last_attach >= 1.0:
+                    last_attach = time.monotonic()
+                    self._attach_shared_segments()
+                self._poll_shared_memory(seen)
+                await asyncio.sleep(self.shared_poll_interval)
                 
         except asyncio.CancelledError:
-            self.logger.info("WebSocket task cancelled")
+            self.logger.info("Shared memory task cancelled")
         except Exception as e:
-            self.logger.error(f"WebSocket error: {str(e)}")
+            self.logger.error(f"Shared memory error: {str(e)}")
         finally:
-            self.ws_connected = False
-            self.logger.debug(f"EXIT _websocket_handler completed")
\ No newline at end of file
+            self.logger.debug(f"EXIT _shared_memory_handler completed")
+    
+    def _poll_shared_memory(self, seen: Dict) -> None:
+        """
+        Pick up the publisher's writes since the last poll
+        
+        Kline rings are read in place; changed tickers and book tops are
+        copied into the caches. Freshness is recorded and events are
+        published as for the stream.
+        
+        Args:
+            seen: Last version or sequence number per stream, updated in place
+        """
+        for symbol, timeframe in self.kline_subscriptions:
+            buffer = self.klines.get(symbol, {}).get(timeframe)
+            if not isinstance(buffer, SharedKlineBuffer):
+                continue
+            key = (symbol, timeframe)
+            version = buffer.version
+            previous = seen.get(key)
+            if previous is not None and previous[0] == version:
+                continue
+                
+            last = buffer.last_timestamp
+            seen[key] = (version, last)
+            if last is None:
+                continue
+            self.freshness.record('kline', f"{symbol} {timeframe}")
+            
+            # A new bar means the previous one closed
+            closed_through = last if previous is not None and previous[1] is not None and last > previous[1] else None
+            self._publish_bars(symbol, timeframe, closed_through)
+            
+        for (symbol, stream), record in list(self._shared_records.items()):
+            seq = record.seq
+            previous = seen.get((symbol, stream))
+            if previous is not None and previous[0] == seq:
+                continue
+            seq, values = record.read()
+            if not values:
+                # Not written yet, or mid-write; the next poll retries
+                continue
+            seen[(symbol, stream)] = (seq, None)
+            ts = values.pop('ts', None)
+            ts = int(ts) if ts is not None else None
+            
+            if stream == 'ticker':
+                values['symbol'] = symbol
+                self.tickers[symbol] = values
+                self.freshness.record('ticker', symbol, ts)
+                self._publish_ticker(symbol, ts)
+            elif 'bid' in values and 'ask' in values:
+                book = self.orderbooks.get(symbol)
+                if book is None:
+                    book = self.orderbooks[symbol] = OrderBook(symbol)
+                book.apply_snapshot({
+                    'b': [[values['bid'], values.get('bid_size', 0.0)]],
+                    'a': [[values['ask'], values.get('ask_size', 0.0)]],
+                }, ts)
+                self.freshness.record('orderbook', symbol, ts)
+                self._publish_book_top(symbol, book)
+    
+    def _remove_ws_topic(self, topic: str) -> None:
+        """
+        Unregister a stream topic, unsubscribing at once if the stream is running
+        
+        Args:
+            topic: Stream topic
+        """
+        if self._ws_topics.pop(topic, None) is not None and self.ws is not None:
+            self.ws.unsubscribe([topic])
+    
+    def _add_ws_topic(self, topic: str, route: tuple) -> None:
+        """
+        Register a stream topic, subscribing at once if the stream is running
+        
+        Args:
+            topic: Stream topic
+            route: (kind, symbol, timeframe) the topic's messages update
+        """
+        self._ws_topics[topic] = route
+        if self.ws is not None:
+            self.ws.subscribe([topic])
+    
+    def _handle_ws_message(self, message: Dict) -> None:
+        """
+        Apply a stream message to the market data caches
+        
+        Args:
+            message: Decoded topic message
+        """
+        route = self._ws_topics.get(message.get('topic'))
+        if route is None:
+            return
+            
+        kind, symbol, timeframe = route
+        data = message.get('data')
+        self.freshness.record(kind, symbol if timeframe is None else f"{symbol} {timeframe}", message.get('ts'))
+        
+        if kind == 'kline':
+            self._apply_kline_message(symbol, timeframe, data)
+        elif kind == 'ticker':
+            if message.get('type') == 'snapshot' or symbol not in self.tickers:
+                self.tickers[symbol] = dict(data)
+            else:
+                self.tickers[symbol].update(data)
+            self._publish_ticker(symbol, message.get('ts'))
+        elif kind == 'orderbook':
+            self._apply_orderbook_message(message['topic'], symbol, message.get('type'), data, message.get('ts'))
+        elif kind == 'trade':
+            self._apply_trade_message(symbol, data)
+    
+    def _apply_kline_message(self, symbol: str, timeframe: str, bars: List[Dict]) -> None:
+        """
+        Upsert streamed bars into the kline cache
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+            bars: Bars from a kline topic message
+        """
+        key = (symbol, timeframe)
+        
+        # Live bars wait until a running backfill has closed the gap
+        task = self._backfill_tasks.get(key)
+        if task is not None and not task.done():
+            self._queued_klines.setdefault(key, []).append(bars)
+            return
+            
+        buffer = self._kline_buffer(symbol, timeframe)
+        first_start = min(int(bar['start']) for bar in bars)
+        last_start = buffer.last_timestamp
+        if last_start is not None:
+            if first_start > last_start + interval_to_ms(timeframe):
+                # Messages were missed; repair instead of leaving a hole
+                self.kline_gaps[key] = (last_start, first_start)
+                self._queued_klines[key] = [bars]
+                self._backfill_tasks[key] = asyncio.get_running_loop().create_task(
+                    self._backfill_and_replay(symbol, timeframe)
+                )
+                return
+                
+        for bar in sorted(bars, key=lambda bar: int(bar['start'])):
+            buffer.upsert((
+                float(bar['start']), float(bar['open']), float(bar['high']), float(bar['low']),
+                float(bar['close']), float(bar['volume']), float(bar['turnover'])
+            ))
+            
+        # A new bar means the previous one closed
+        interval_ms = interval_to_ms(timeframe)
+        closed_through = None
+        if last_start is not None and first_start > last_start:
+            closed_through = buffer.last_timestamp
+        for bar in bars:
+            if bar.get('confirm'):
+                closed_through = max(closed_through or 0, int(bar['start']) + interval_ms)
+                
+        if closed_through is not None:
+            self._persist_klines(symbol, timeframe)
+        self._publish_bars(symbol, timeframe, closed_through)
+            
+        if timeframe == self.base_timeframe:
+            self._update_derived(symbol, first_start, closed_through)
+    
+    async def _backfill_and_replay(self, symbol: str, timeframe: str) -> None:
+        """
+        Backfill a gap seen in live bars, then apply the bars queued meanwhile
+        
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe interval
+        """
+        key = (symbol, timeframe)
+        success = await self._backfill_klines(symbol, timeframe)
+        
+        self._backfill_tasks.pop(key, None)
+        queued = self._queued_klines.pop(key, [])
+        if not success:
+            # The gap stays recorded and the next update repairs it over REST
+            return
+            
+        # In arrival order, so a confirm received during the backfill is kept
+        for bars in queued:
+            self._apply_kline_message(symbol, timeframe, bars)
+    
+    def _apply_trade_message(self, symbol: str, data: List[Dict]) -> None:
+        """
+        Append streamed trades to the tape and their bars' volume delta
+        
+        Args:
+            symbol: Trading symbol
+            data: Trades from a publicTrade topic message
+        """
+        trades = trades_to_array(data)
+        tape = self.recent_trades.get(symbol)
+        if tape is None:
+            tape = self.recent_trades[symbol] = TradeTape(self.trade_buffer_size)
+        tape.extend(trades)
+        
+        for bars in self.trade_bars.get(symbol, {}).values():
+            bars.update(trades)
+    
+    def _apply_orderbook_message(self, topic: str, symbol: str, message_type: str, data: Dict, ts: Optional[int]) -> None:
+        """
+        Apply an order book snapshot or delta, resyncing if the sequence breaks
+        
+        Args:
+            topic: Orderbook topic the message arrived on
+            symbol: Trading symbol
+            message_type: 'snapshot' or 'delta'
+            data: Message data with 'b'/'a' [price, size] levels, 'u' and 'seq'
+            ts: Message timestamp in milliseconds
+        """
+        book = self.orderbooks.get(symbol)
+        if book is None:
+            book = self.orderbooks[symbol] = OrderBook(symbol)
+            
+        was_synced = book.synced
+        book.apply(message_type, data, ts)
+        self._publish_book_top(symbol, book)
+        
+        if not book.synced and (was_synced or message_type == 'snapshot'):
+            # A missed delta or crossed book; resubscribing delivers a new snapshot
+            self.logger.warning(f"Orderbook for {symbol} out of sync at u={book.update_id}, resyncing")
+            if self.ws is not None:
+                self.ws.resubscribe([topic])
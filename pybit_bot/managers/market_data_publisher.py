@@ -0,0 +1,177 @@
+"""
+Market Data Publisher - One exchange feed shared by every bot process on a host
+
+Owns a DataManager in the shared memory "publisher" role: it loads and
+streams klines, tickers and order books once, its kline buffers are
+shared memory rings, and the publisher writes each ticker and book top
+update into a shared record. Engines run their DataManager in the
+"subscriber" role with the same `data.shared_memory.name` and read
+from these segments instead of calling the exchange.
+
+While the stream is down the publisher polls REST every
+`data.shared_memory.refresh_interval` seconds, so subscribers keep
+getting data either way.
+
+Example usage:
+    publisher = MarketDataPublisher(client, config)
+    publisher.subscribe(["BTCUSDT", "ETHUSDT"], ["1m", "5m", "1h"])
+    await publisher.start()
+    ...
+    await publisher.stop()
+"""
+
+import asyncio
+import copy
+from typing import Dict, List, Optional
+
+from ..utils.logger import Logger
+from ..core.event_bus import EventType, MarketEvent, Subscription
+from ..core.shared_market_data import (
+    BOOK_TOP_FIELDS, TICKER_FIELDS, SharedKlineBuffer, SharedRecord, segment_name
+)
+from .data_manager import DataManager
+
+
+class MarketDataPublisher:
+    """
+    Writes one DataManager's market data into shared memory for subscriber processes
+    """
+    
+    def __init__(self, client, config, logger=None):
+        """
+        Initialize the publisher
+        
+        Args:
+            client: API client instance
+            config: Configuration dictionary; `general.data.shared_memory`
+                names the segments
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("MarketDataPublisher")
+        self.logger.debug(f"ENTER __init__(client={client}, config_id={id(config)}, logger={logger})")
+        
+        publisher_config = copy.deepcopy(config)
+        data_config = publisher_config.setdefault('general', {}).setdefault('data', {})
+        shared_config = data_config.setdefault('shared_memory', {})
+        shared_config['role'] = 'publisher'
+        self.refresh_interval = shared_config.get('refresh_interval', 1.0)  # Seconds between REST passes
+        
+        self.data_manager = DataManager(client, publisher_config, logger=self.logger)
+        self.name = self.data_manager.shared_name
+        
+        self.records: Dict[tuple, SharedRecord] = {}  # Format: {(symbol, 'ticker' | 'book'): SharedRecord}
+        self.stats = {"tickers": 0, "book_tops": 0}
+        self._subscription: Optional[Subscription] = None
+        self._tasks: List[asyncio.Task] = []
+        
+        self.logger.info(f"MarketDataPublisher initialized for shared memory '{self.name}'")
+        self.logger.debug(f"EXIT __init__ completed")
+        
+    def subscribe(self, symbols: List[str], timeframes: List[str]) -> None:
+        """
+        Publish klines, the ticker and the book top of symbols
+        
+        Args:
+            symbols: Trading symbols
+            timeframes: Kline timeframes published for every symbol
+        """
+        for symbol in symbols:
+            for timeframe in timeframes:
+                self.data_manager.subscribe_klines(symbol, timeframe)
+            self.data_manager.subscribe_ticker(symbol)
+            self.data_manager.subscribe_orderbook(symbol)
+            
+            for stream, fields in (('ticker', TICKER_FIELDS), ('book', BOOK_TOP_FIELDS)):
+                if (symbol, stream) not in self.records:
+                    self.records[(symbol, stream)] = SharedRecord.create(segment_name(self.name, symbol, stream), fields)
+                    
+    async def start(self) -> bool:
+        """
+        Load initial data and start streaming it into shared memory
+        
+        Returns:
+            True if the initial load succeeded
+        """
+        self.logger.debug(f"ENTER start()")
+        
+        self._subscription = self.data_manager.events.subscribe({EventType.TICKER, EventType.BOOK_TOP})
+        success = await self.data_manager.load_initial_data()
+        await self.data_manager.start_websocket()
+        
+        self._tasks = [
+            asyncio.create_task(self._publish_loop(self._subscription)),
+            asyncio.create_task(self._refresh_loop()),
+        ]
+        
+        self.logger.info(f"Publishing {len(self.records) // 2} symbols to shared memory '{self.name}'")
+        self.logger.debug(f"EXIT start returned {success}")
+        return success
+        
+    async def stop(self) -> None:
+        """Stop the feed and remove all segments"""
+        self.logger.debug(f"ENTER stop()")
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+            
+        await self.data_manager.stop_websocket()
+        
+        # Subscribers see the segments closed and attach again after a restart
+        for record in self.records.values():
+            record.close(unlink=True)
+        self.records.clear()
+        for buffers in self.data_manager.klines.values():
+            for buffer in buffers.values():
+                if isinstance(buffer, SharedKlineBuffer):
+                    buffer.close(unlink=True)
+        self.data_manager.klines.clear()
+        
+        self.logger.info(f"Stopped publishing to shared memory '{self.name}'")
+        self.logger.debug(f"EXIT stop completed")
+        
+    async def _publish_loop(self, subscription: Subscription) -> None:
+        """
+        Write ticker and book top events into their records
+        
+        Args:
+            subscription: Ticker and book top events of the DataManager
+        """
+        try:
+            async for event in subscription:
+                self.publish_event(event)
+        except asyncio.CancelledError:
+            pass
+            
+    def publish_event(self, event: MarketEvent) -> None:
+        """
+        Write one ticker or book top event into its record
+        
+        Args:
+            event: Event published by the DataManager
+        """
+        try:
+            if event.type == EventType.TICKER:
+                record = self.records.get((event.symbol, 'ticker'))
+                self.stats["tickers"] += 1
+            else:
+                record = self.records.get((event.symbol, 'book'))
+                self.stats["book_tops"] += 1
+            if record is not None:
+                record.write({**event.data, 'ts': event.timestamp or None})
+                
+        except Exception as e:
+            self.logger.error(f"Error publishing {event.type.value} for {event.symbol}: {str(e)}")
+            
+    async def _refresh_loop(self) -> None:
+        """Poll REST while the stream is down (update_market_data is a no-op while streaming)"""
+        try:
+            while True:
+                await asyncio.sleep(self.refresh_interval)
+                await self.data_manager.update_market_data()
+        except asyncio.CancelledError:
+            pass
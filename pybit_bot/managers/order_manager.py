@@ -4,15 +4,29 @@ Order Manager - Handles order placement, tracking, and management
 This module provides the high-level interface for trading operations,
 using the OrderManagerClient for API communication and adding business
 logic on top for order decision making and tracking.
+
+Order, execution, position and wallet updates are pushed by the private
+WebSocket stream once start_private_stream() is called. While it is
+connected, active_orders, order_history and the position cache are kept
+current from those events and REST is only used for a reconciliation on
+every (re)connect and every `reconcile_interval` seconds.
+
+Single orders are placed, amended and cancelled through
+OrderManagerClient.create_order/amend_order/cancel_order, which use the
+WebSocket trade API once start_trade_stream() was called and REST
+otherwise.
 """
 
 import time
+import uuid
 import asyncio
+from collections import deque
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
 from ..utils.logger import Logger
 from ..core.order_manager_client import OrderManagerClient
+from ..core.websocket_client import PrivateWebSocket
 
 
 class OrderManager:
@@ -22,6 +36,12 @@ class OrderManager:
     Uses OrderManagerClient for API communication and adds business logic
     """
     
+    # Order statuses after which an order can no longer change
+    FINAL_STATUSES = ("Filled", "Cancelled", "Rejected", "Deactivated", "PartiallyFilledCanceled")
+    
+    # Bybit v5 timeInForce values of the long names
+    TIME_IN_FORCE = {"GoodTillCancel": "GTC", "ImmediateOrCancel": "IOC", "FillOrKill": "FOK"}
+    
     def __init__(self, client, config, logger=None):
         """
         Initialize with client and configuration
@@ -54,6 +74,26 @@ class OrderManager:
         # Maximum number of orders to track in history per symbol
         self.max_orders_per_symbol = 100
         
+        # Account state pushed by the private stream
+        self.positions = {}  # Format: {symbol: position}
+        self.executions = {}  # Format: {symbol: deque of executions}
+        self.wallet = {}  # Format: {coin: balance}
+        self.max_executions_per_symbol = 1000
+        
+        # Private stream
+        system_config = self.config.get('general', {}).get('system', {})
+        self.ws_url = system_config.get('ws_private_url')  # None = Bybit private stream
+        self.ws_ping_interval = system_config.get('ws_ping_interval', 20)
+        self.ws_reconnect_attempts = system_config.get('ws_reconnect_attempts', 5)
+        self.reconcile_interval = self.config.get('execution', {}).get('reconcile_interval', 60.0)
+        self.reconcile_retry_delay = self.config.get('execution', {}).get('reconcile_retry_delay', 1.0)
+        self.reconcile_history_pages = self.config.get('execution', {}).get('reconcile_history_pages', 4)
+        self.ws = None
+        self._positions_synced = False
+        self._last_reconcile = 0.0  # Time of the last attempt
+        self._next_reconcile = 0.0  # Earliest time of the next periodic attempt
+        self._reconcile_failures = 0
+        
         self.logger.info(f"OrderManager initialized")
         self.logger.debug(f"← __init__ completed")
     
@@ -90,6 +130,9 @@ class OrderManager:
             # Format quantity based on symbol
             qty_str = str(qty)
             
+            # One client order ID for every attempt, so a retry cannot place a second order
+            order_link_id = self._new_order_link_id()
+            
             # Apply retry logic for network reliability
             for attempt in range(self.order_retry_count):
                 try:
@@ -97,21 +140,23 @@ class OrderManager:
                     
                     # Set up order parameters
                     order_params = {
+                        "category": "linear",
                         "symbol": symbol,
                         "side": side,
-                        "order_type": "Market",
+                        "orderType": "Market",
                         "qty": qty_str,
-                        "reduce_only": reduce_only
+                        "reduceOnly": reduce_only,
+                        "orderLinkId": order_link_id
                     }
                     
                     # Add TP/SL if provided
                     if tp_price is not None:
-                        order_params["take_profit"] = str(tp_price)
+                        order_params["takeProfit"] = str(tp_price)
                     if sl_price is not None:
-                        order_params["stop_loss"] = str(sl_price)
+                        order_params["stopLoss"] = str(sl_price)
                     
-                    # Place the order
-                    result = self.order_client.place_active_order(**order_params)
+                    # Place the order (trade WebSocket, or REST if it is down)
+                    result = self._order_result(await self.order_client.create_order(order_params))
                     
                     # Check for error
                     if "error" in result:
@@ -175,6 +220,9 @@ class OrderManager:
             qty_str = str(qty)
             price_str = str(price)
             
+            # One client order ID for every attempt, so a retry cannot place a second order
+            order_link_id = self._new_order_link_id()
+            
             # Apply retry logic for network reliability
             for attempt in range(self.order_retry_count):
                 try:
@@ -182,23 +230,25 @@ class OrderManager:
                     
                     # Set up order parameters
                     order_params = {
+                        "category": "linear",
                         "symbol": symbol,
                         "side": side,
-                        "order_type": "Limit",
+                        "orderType": "Limit",
                         "qty": qty_str,
                         "price": price_str,
-                        "time_in_force": time_in_force,
-                        "reduce_only": reduce_only
+                        "timeInForce": self.TIME_IN_FORCE.get(time_in_force, time_in_force),
+                        "reduceOnly": reduce_only,
+                        "orderLinkId": order_link_id
                     }
                     
                     # Add TP/SL if provided
                     if tp_price is not None:
-                        order_params["take_profit"] = str(tp_price)
+                        order_params["takeProfit"] = str(tp_price)
                     if sl_price is not None:
-                        order_params["stop_loss"] = str(sl_price)
+                        order_params["stopLoss"] = str(sl_price)
                     
-                    # Place the order
-                    result = self.order_client.place_active_order(**order_params)
+                    # Place the order (trade WebSocket, or REST if it is down)
+                    result = self._order_result(await self.order_client.create_order(order_params))
                     
                     # Check for error
                     if "error" in result:
@@ -236,6 +286,158 @@ class OrderManager:
             self.logger.debug(f"← place_limit_order returned error: {error_result}")
             return error_result
     
+    async def place_stop_order(self, symbol: str, side: str, qty: float, trigger_price: float,
+                               reduce_only: bool = True, close_on_trigger: bool = False) -> Dict:
+        """
+        Place a conditional market order that triggers at a price (e.g. a stop loss)
+        
+        Args:
+            symbol: Trading symbol
+            side: 'Buy' or 'Sell'
+            qty: Order quantity
+            trigger_price: Last price at which the order is sent
+            reduce_only: If True, order will only reduce position
+            close_on_trigger: If True, other orders are cancelled to free margin when it triggers
+            
+        Returns:
+            Dictionary with order result
+        """
+        self.logger.debug(f"→ place_stop_order(symbol={symbol}, side={side}, qty={qty}, trigger_price={trigger_price}, reduce_only={reduce_only}, close_on_trigger={close_on_trigger})")
+        
+        try:
+            qty_str = str(qty)
+            trigger_str = str(trigger_price)
+            
+            # One client order ID for every attempt, so a retry cannot place a second order
+            order_link_id = self._new_order_link_id()
+            
+            # Apply retry logic for network reliability
+            for attempt in range(self.order_retry_count):
+                try:
+                    self.logger.info(f"Placing {side} stop order for {symbol}, qty={qty_str}, trigger={trigger_str} (attempt {attempt+1}/{self.order_retry_count})")
+                    
+                    # A sell stop triggers on a falling price (2), a buy stop on a rising one (1)
+                    order_params = {
+                        "category": "linear",
+                        "symbol": symbol,
+                        "side": side,
+                        "orderType": "Market",
+                        "qty": qty_str,
+                        "triggerPrice": trigger_str,
+                        "triggerDirection": 2 if side == "Sell" else 1,
+                        "triggerBy": "LastPrice",
+                        "reduceOnly": reduce_only,
+                        "closeOnTrigger": close_on_trigger,
+                        "orderLinkId": order_link_id
+                    }
+                    
+                    # Place the order (trade WebSocket, or REST if it is down)
+                    result = self._order_result(await self.order_client.create_order(order_params))
+                    
+                    # Check for error
+                    if "error" in result:
+                        self.logger.error(f"Error placing stop order (attempt {attempt+1}): {result['error']}")
+                        if attempt < self.order_retry_count - 1:
+                            self.logger.info(f"Retrying order in {self.order_retry_delay}s...")
+                            await asyncio.sleep(self.order_retry_delay)
+                            continue
+                    else:
+                        # Order placed successfully
+                        order_id = result.get("orderId")
+                        self.logger.info(f"Stop order placed successfully: {order_id}")
+                        
+                        # Track order
+                        if order_id:
+                            self._track_order(symbol, order_id, side, qty_str, "Stop", result, trigger_str)
+                        
+                        self.logger.debug(f"← place_stop_order returned result with orderId={order_id}")
+                        return result
+                
+                except Exception as e:
+                    self.logger.error(f"Exception placing stop order (attempt {attempt+1}): {str(e)}")
+                    if attempt < self.order_retry_count - 1:
+                        await asyncio.sleep(self.order_retry_delay)
+            
+            # If we get here, all attempts failed
+            error_result = {"error": f"Failed to place stop order after {self.order_retry_count} attempts"}
+            self.logger.error(f"Failed to place stop order after {self.order_retry_count} attempts")
+            self.logger.debug(f"← place_stop_order returned error: {error_result}")
+            return error_result
+            
+        except Exception as e:
+            self.logger.error(f"Error placing stop order: {str(e)}")
+            error_result = {"error": str(e)}
+            self.logger.debug(f"← place_stop_order returned error: {error_result}")
+            return error_result
+    
+    async def amend_order(self, symbol: str, order_id: str, qty: Optional[float] = None,
+                          price: Optional[float] = None, trigger_price: Optional[float] = None) -> Dict:
+        """
+        Change the quantity, price or trigger price of an active order
+        
+        Args:
+            symbol: Trading symbol
+            order_id: Order ID to amend
+            qty: Optional new quantity
+            price: Optional new limit price
+            trigger_price: Optional new trigger price
+            
+        Returns:
+            Dictionary with amend result
+        """
+        self.logger.debug(f"→ amend_order(symbol={symbol}, order_id={order_id}, qty={qty}, price={price}, trigger_price={trigger_price})")
+        
+        try:
+            amend_params = {"category": "linear", "symbol": symbol, "orderId": order_id}
+            if qty is not None:
+                amend_params["qty"] = str(qty)
+            if price is not None:
+                amend_params["price"] = str(price)
+            if trigger_price is not None:
+                amend_params["triggerPrice"] = str(trigger_price)
+                
+            # Apply retry logic for network reliability
+            for attempt in range(self.order_retry_count):
+                try:
+                    self.logger.info(f"Amending order {order_id} for {symbol} (attempt {attempt+1}/{self.order_retry_count})")
+                    
+                    # Amend the order (trade WebSocket, or REST if it is down)
+                    result = self._order_result(await self.order_client.amend_order(amend_params))
+                    
+                    # Check for error
+                    if "error" in result:
+                        self.logger.error(f"Error amending order (attempt {attempt+1}): {result['error']}")
+                        if attempt < self.order_retry_count - 1:
+                            self.logger.info(f"Retrying amend in {self.order_retry_delay}s...")
+                            await asyncio.sleep(self.order_retry_delay)
+                            continue
+                    else:
+                        # Order amended successfully
+                        self.logger.info(f"Order {order_id} amended successfully")
+                        
+                        # Update order tracking
+                        self._apply_batch_result("amend", amend_params, result)
+                        
+                        self.logger.debug(f"← amend_order returned: {result}")
+                        return result
+                
+                except Exception as e:
+                    self.logger.error(f"Exception amending order (attempt {attempt+1}): {str(e)}")
+                    if attempt < self.order_retry_count - 1:
+                        await asyncio.sleep(self.order_retry_delay)
+            
+            # If we get here, all attempts failed
+            error_result = {"error": f"Failed to amend order after {self.order_retry_count} attempts"}
+            self.logger.error(f"Failed to amend order after {self.order_retry_count} attempts")
+            self.logger.debug(f"← amend_order returned error: {error_result}")
+            return error_result
+            
+        except Exception as e:
+            self.logger.error(f"Error amending order: {str(e)}")
+            error_result = {"error": str(e)}
+            self.logger.debug(f"← amend_order returned error: {error_result}")
+            return error_result
+    
     async def cancel_order(self, symbol: str, order_id: str) -> Dict:
         """
         Cancel an active order
@@ -255,8 +457,8 @@ class OrderManager:
                 try:
                     self.logger.info(f"Cancelling order {order_id} for {symbol} (attempt {attempt+1}/{self.order_retry_count})")
                     
-                    # Cancel the order
-                    result = self.order_client.cancel_order(symbol, order_id)
+                    # Cancel the order (trade WebSocket, or REST if it is down)
+                    result = self._order_result(await self.order_client.cancel_order(symbol, order_id=order_id))
                     
                     # Check for error
                     if "error" in result:
@@ -294,6 +496,159 @@ class OrderManager:
             self.logger.debug(f"← cancel_order returned error: {error_result}")
             return error_result
     
+    async def submit_batch(self, orders: List[Dict], action: str = "create", 
+                           category: str = "linear") -> Dict[str, Dict]:
+        """
+        Submit many orders through the batch endpoints
+        
+        Orders are chunked to the exchange's per-request limit and the
+        chunks are sent concurrently, so a ladder or a multi-symbol flatten
+        costs one or two round trips instead of one per order.
+        
+        Args:
+            orders: Bybit order dictionaries (symbol, side, orderType, qty, price, ...).
+                For "create" an orderLinkId is generated when missing; for
+                "amend" and "cancel" each needs orderId or orderLinkId
+            action: "create", "amend" or "cancel"
+            category: Product category
+            
+        Returns:
+            Dictionary mapping orderLinkId (or orderId if no link ID was given)
+            to the per-order result with orderId, success, code and msg
+        """
+        self.logger.debug(f"→ submit_batch(count={len(orders)}, action={action}, category={category})")
+        
+        batch_methods = {
+            "create": self.order_client.place_batch_orders,
+            "amend": self.order_client.amend_batch_orders,
+            "cancel": self.order_client.cancel_batch_orders
+        }
+        
+        if action not in batch_methods:
+            error_result = {"error": f"Unsupported batch action: {action}"}
+            self.logger.debug(f"← submit_batch returned error: {error_result}")
+            return error_result
+        
+        # Copy so callers' dictionaries are not modified
+        prepared = [dict(order) for order in orders]
+        if action == "create":
+            for order in prepared:
+                order.setdefault("orderLinkId", self._new_order_link_id())
+        
+        limit = OrderManagerClient.BATCH_ORDER_LIMITS.get(category, 10)
+        chunks = [prepared[i:i + limit] for i in range(0, len(prepared), limit)]
+        
+        self.logger.info(f"Submitting batch {action} of {len(prepared)} orders in {len(chunks)} request(s)")
+        
+        chunk_results = await asyncio.gather(
+            *[batch_methods[action](chunk, category) for chunk in chunks],
+            return_exceptions=True
+        )
+        
+        results = {}
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                self.logger.error(f"Batch {action} request failed: {str(chunk_result)}")
+                chunk_result = [
+                    {
+                        "orderId": order.get("orderId", ""),
+                        "orderLinkId": order.get("orderLinkId", ""),
+                        "symbol": order.get("symbol", ""),
+                        "success": False,
+                        "code": -1,
+                        "msg": str(chunk_result)
+                    }
+                    for order in chunk
+                ]
+            
+            for order, result in zip(chunk, chunk_result):
+                key = result.get("orderLinkId") or result.get("orderId")
+                results[key] = result
+                
+                if result.get("success"):
+                    self._apply_batch_result(action, order, result)
+        
+        succeeded = sum(1 for result in results.values() if result.get("success"))
+        self.logger.info(f"Batch {action}: {succeeded}/{len(results)} orders succeeded")
+        self.logger.debug(f"← submit_batch returned {len(results)} results")
+        return results
+    
+    def _apply_batch_result(self, action: str, order: Dict, result: Dict) -> None:
+        """
+        Update order tracking for a successful batch item
+        
+        Args:
+            action: "create", "amend" or "cancel"
+            order: Order dictionary that was sent
+            result: Parsed per-order result
+        """
+        symbol = result.get("symbol") or order.get("symbol")
+        order_id = result.get("orderId") or self._find_order_id(symbol, result.get("orderLinkId"))
+        
+        if not order_id:
+            return
+        
+        if action == "create":
+            self._track_order(symbol, order_id, order.get("side"), str(order.get("qty")),
+                              order.get("orderType", "Limit"), dict(order, **result),
+                              str(order["price"]) if order.get("price") is not None else None)
+        elif action == "cancel":
+            self._move_to_history(symbol, order_id, "Cancelled")
+        elif action == "amend":
+            entry = self.active_orders.get(symbol, {}).get(order_id)
+            if entry is not None:
+                for field in ("qty", "price"):
+                    if order.get(field) is not None:
+                        entry[field] = str(order[field])
+                entry["timestamp"] = time.time()
+    
+    def _find_order_id(self, symbol: str, order_link_id: Optional[str]) -> Optional[str]:
+        """
+        Look up a tracked order's ID by its client order ID
+        
+        Args:
+            symbol: Trading symbol
+            order_link_id: Client order ID
+            
+        Returns:
+            Order ID or None if not tracked
+        """
+        if not order_link_id:
+            return None
+            
+        for order_id, entry in self.active_orders.get(symbol, {}).items():
+            order_data = entry.get("order_data") or entry.get("order") or {}
+            if order_data.get("orderLinkId") == order_link_id:
+                return order_id
+                
+        return None
+    
+    def _order_result(self, response: Dict) -> Dict:
+        """
+        Reduce an OrderManagerClient create/amend/cancel response to its result
+        
+        Args:
+            response: REST-style response with retCode, retMsg and result
+            
+        Returns:
+            Result dictionary (orderId, orderLinkId) or {"error": message}
+        """
+        if not response or response.get("retCode") != 0:
+            code = response.get("retCode", -1) if response else -1
+            msg = response.get("retMsg", "No response") if response else "No response"
+            return {"error": f"{msg} (retCode {code})"}
+        return response.get("result") or {}
+    
+    @staticmethod
+    def _new_order_link_id() -> str:
+        """
+        Generate a unique client order ID (max 36 characters on Bybit)
+        
+        Returns:
+            Client order ID
+        """
+        return f"pb-{uuid.uuid4().hex[:30]}"
+    
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         """
         Get all open orders
@@ -358,8 +713,8 @@ class OrderManager:
                 cache_entry = self.order_cache[symbol][order_id]
                 cache_age = time.time() - cache_entry.get("timestamp", 0)
                 
-                # Use cache if recent enough
-                if cache_age < 5.0:  # 5 second cache TTL
+                # Use cache if recent enough (pushed updates never go stale)
+                if cache_age < 5.0 or self.stream_connected:  # 5 second cache TTL
                     self.logger.debug(f"Using cached order status for {order_id}")
                     self.logger.debug(f"← get_order_status returned cached status")
                     return cache_entry.get("order", {})
@@ -404,6 +759,15 @@ class OrderManager:
         self.logger.debug(f"→ get_positions(symbol={symbol})")
         
         try:
+            # Pushed position updates keep the cache current
+            if self.stream_connected and self._positions_synced:
+                positions = [
+                    position for position_symbol, position in self.positions.items()
+                    if symbol is None or position_symbol == symbol
+                ]
+                self.logger.debug(f"← get_positions returned {len(positions)} cached positions")
+                return positions
+                
             # Get positions from order client
             positions = self.order_client.get_positions(symbol)
             
@@ -561,6 +925,13 @@ class OrderManager:
         """
         self.logger.debug(f"→ _track_order(symbol={symbol}, order_id={order_id}, side={side}, qty={qty}, order_type={order_type}, price={price})")
         
+        # The private stream can report an order before its placement response arrives
+        if order_id in self.active_orders.get(symbol, {}) or any(
+            entry.get("orderId") == order_id for entry in self.order_history.get(symbol, [])
+        ):
+            self.logger.debug(f"← _track_order skipped (order {order_id} already known)")
+            return
+            
         # Create order tracking entry
         order_entry = {
             "symbol": symbol,
@@ -627,6 +998,14 @@ class OrderManager:
         self.logger.debug(f"→ sync_order_status()")
         
         try:
+            # Pushed order updates keep the caches current; REST is only a
+            # periodic safety net while the stream is connected
+            if self.stream_connected:
+                if time.time() >= self._next_reconcile:
+                    await self.reconcile()
+                self.logger.debug(f"← sync_order_status completed (streaming)")
+                return
+                
             # Get all open orders
             open_orders = await self.get_open_orders()
             
@@ -733,4 +1112,271 @@ class OrderManager:
             self.logger.error(f"Error creating TP/SL orders: {str(e)}")
             error_result = {"error": str(e)}
             self.logger.debug(f"← create_tp_sl_orders returned error: {error_result}")
-            return error_result
\ No newline at end of file
+            return error_result
+    
+    def get_active_orders(self, symbol: Optional[str] = None) -> List[Dict]:
+        """
+        Get tracked active orders from the local cache (no API call)
+        
+        Args:
+            symbol: Optional symbol to filter
+            
+        Returns:
+            List of order dictionaries with at least symbol, orderId and orderStatus
+        """
+        orders = []
+        for order_symbol, symbol_orders in self.active_orders.items():
+            if symbol is not None and order_symbol != symbol:
+                continue
+            for order_id, entry in symbol_orders.items():
+                order = dict(entry.get("order_data") or entry.get("order") or {})
+                order.update(symbol=order_symbol, orderId=order_id, orderStatus=entry.get("status"))
+                orders.append(order)
+        return orders
+    
+    async def _get_order_info(self, order_id: str) -> Dict:
+        """
+        Get the latest known state of an order by ID
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            Order dictionary, or empty dict if the order is unknown
+        """
+        for symbol, symbol_orders in self.order_cache.items():
+            if order_id in symbol_orders:
+                return await self.get_order_status(symbol, order_id)
+        return {}
+    
+    @property
+    def stream_connected(self) -> bool:
+        """Whether the private stream is currently connected"""
+        return self.ws is not None and self.ws.connected
+    
+    async def start_private_stream(self) -> bool:
+        """
+        Start the private WebSocket stream for order, execution, position
+        and wallet updates
+        
+        Returns:
+            True if the stream was started, False otherwise
+        """
+        self.logger.debug(f"→ start_private_stream()")
+        
+        try:
+            if self.ws is not None:
+                self.logger.info("Private stream is already running")
+                self.logger.debug(f"← start_private_stream returned True (already running)")
+                return True
+                
+            clock = getattr(self.client, "clock", None)
+            self.ws = PrivateWebSocket(
+                self.client.api_key,
+                self.client.api_secret,
+                self._handle_private_message,
+                testnet=getattr(self.client, "testnet", True),
+                url=self.ws_url,
+                clock=clock.now_ms if clock is not None else None,
+                ping_interval=self.ws_ping_interval,
+                max_reconnect_attempts=self.ws_reconnect_attempts,
+                on_connect=self.reconcile,
+                logger=self.logger
+            )
+            self.ws.subscribe(PrivateWebSocket.ACCOUNT_TOPICS)
+            self.ws.start()
+            
+            self.logger.info(f"Private stream started: {self.ws.url}")
+            self.logger.debug(f"← start_private_stream returned True")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error starting private stream: {str(e)}")
+            self.ws = None
+            self.logger.debug(f"← start_private_stream returned False (error)")
+            return False
+    
+    async def stop_private_stream(self) -> bool:
+        """
+        Stop the private WebSocket stream
+        
+        Returns:
+            True if the stream was stopped, False otherwise
+        """
+        self.logger.debug(f"→ stop_private_stream()")
+        
+        try:
+            if self.ws is not None:
+                await self.ws.stop()
+            self.ws = None
+            self._positions_synced = False
+            
+            self.logger.info("Private stream stopped")
+            self.logger.debug(f"← stop_private_stream returned True")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error stopping private stream: {str(e)}")
+            self.logger.debug(f"← stop_private_stream returned False (error)")
+            return False
+    
+    async def reconcile(self) -> None:
+        """
+        Reconcile orders and positions with REST
+        
+        Runs on every stream (re)connect, before pushed messages are
+        processed, and then every `reconcile_interval` seconds. Tracked
+        orders that are no longer open are resolved from the order
+        history, paged only until all of them are found (at most
+        `reconcile_history_pages` pages), instead of with one request per
+        order. Orders not found there stop being tracked.
+        
+        After a failure the periodic attempt is retried after
+        `reconcile_retry_delay` seconds, doubling up to `reconcile_interval`.
+        """
+        self.logger.debug(f"→ reconcile()")
+        
+        # Recorded up front so a failing reconcile is not retried on every pass
+        self._last_reconcile = time.time()
+        self._next_reconcile = self._last_reconcile + self.reconcile_interval
+        
+        try:
+            open_orders = [order async for order in self.client.iter_open_orders("linear", settle_coin="USDT")]
+            positions = [position async for position in self.client.iter_positions("linear")]
+            
+            for order in open_orders:
+                self._apply_order_update(order)
+                
+            # Resolve tracked orders that closed while nobody was listening
+            open_ids = {order.get("orderId") for order in open_orders}
+            missing = {
+                order_id: symbol for symbol, symbol_orders in self.active_orders.items()
+                for order_id in symbol_orders if order_id not in open_ids
+            }
+            if missing:
+                # Newest first, so recently closed orders are on the first pages
+                scanned = 0
+                async for order in self.client.iter_order_history("linear", limit=50):
+                    if missing.pop(order.get("orderId"), None) is not None:
+                        self._apply_order_update(order)
+                    scanned += 1
+                    if not missing or scanned >= self.reconcile_history_pages * 50:
+                        break
+                        
+                # Not searched for again on every reconcile
+                for order_id, symbol in missing.items():
+                    self.logger.warning(f"Order {order_id} ({symbol}) not found in recent order history; no longer tracked")
+                    self._move_to_history(symbol, order_id, "Unknown")
+                        
+            for position in positions:
+                self._apply_position_update(position)
+                
+            self._positions_synced = True
+            self._reconcile_failures = 0
+            
+            self.logger.debug(f"← reconcile completed ({len(open_orders)} open orders, {len(positions)} positions)")
+            
+        except Exception as e:
+            self._reconcile_failures += 1
+            delay = min(self.reconcile_interval, self.reconcile_retry_delay * 2 ** (self._reconcile_failures - 1))
+            self._next_reconcile = self._last_reconcile + delay
+            self.logger.error(f"Error reconciling orders and positions (retrying in {delay:.1f}s): {str(e)}")
+            self.logger.debug(f"← reconcile exited with error")
+    
+    def _handle_private_message(self, message: Dict) -> None:
+        """
+        Apply a private stream message to the order and position caches
+        
+        Args:
+            message: Decoded topic message
+        """
+        topic = message.get("topic", "")
+        data = message.get("data") or []
+        
+        if topic == "order":
+            for order in data:
+                self._apply_order_update(order)
+        elif topic == "execution":
+            for execution in data:
+                symbol = execution.get("symbol")
+                if symbol not in self.executions:
+                    self.executions[symbol] = deque(maxlen=self.max_executions_per_symbol)
+                self.executions[symbol].append(execution)
+        elif topic == "position":
+            for position in data:
+                self._apply_position_update(position)
+        elif topic == "wallet":
+            for account in data:
+                for coin in account.get("coin", []):
+                    self.wallet[coin.get("coin")] = coin
+    
+    @staticmethod
+    def _is_stale(update: Dict, current: Optional[Dict]) -> bool:
+        """
+        Whether an update is older than the state already cached
+        
+        Args:
+            update: Order or position update
+            current: Cached order or position
+            
+        Returns:
+            True if the update should be ignored
+        """
+        if not current:
+            return False
+        try:
+            return int(update.get("updatedTime") or 0) < int(current.get("updatedTime") or 0)
+        except (TypeError, ValueError):
+            return False
+    
+    def _apply_order_update(self, order: Dict) -> None:
+        """
+        Update active orders, history and the order cache from an order update
+        
+        Args:
+            order: Order dictionary (stream or REST format)
+        """
+        symbol = order.get("symbol")
+        order_id = order.get("orderId")
+        if not symbol or not order_id:
+            return
+            
+        cached = self.order_cache.get(symbol, {}).get(order_id)
+        if cached and self._is_stale(order, cached.get("order")):
+            return
+            
+        if symbol not in self.order_cache:
+            self.order_cache[symbol] = {}
+        self.order_cache[symbol][order_id] = {
+            "order": order,
+            "timestamp": time.time()
+        }
+        
+        status = order.get("orderStatus")
+        if order_id not in self.active_orders.get(symbol, {}):
+            if status in self.FINAL_STATUSES and cached:
+                # Already moved to history
+                return
+            self._track_order(symbol, order_id, order.get("side"), order.get("qty"),
+                              order.get("orderType"), order, order.get("price"))
+            if order_id not in self.active_orders.get(symbol, {}):
+                return
+            
+        entry = self.active_orders[symbol][order_id]
+        entry["status"] = status
+        entry["order_data"] = order
+        
+        if status in self.FINAL_STATUSES:
+            self._move_to_history(symbol, order_id, status)
+    
+    def _apply_position_update(self, position: Dict) -> None:
+        """
+        Update the position cache from a position update
+        
+        Args:
+            position: Position dictionary (stream or REST format)
+        """
+        symbol = position.get("symbol")
+        if not symbol or self._is_stale(position, self.positions.get(symbol)):
+            return
+        self.positions[symbol] = position
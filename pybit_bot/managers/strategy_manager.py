@@ -3,17 +3,26 @@ Strategy Manager - Coordinates strategy execution and signal generation
 
 This module manages the loading, initialization and execution of trading strategies.
 It processes market data through strategies and collects generated signals.
+
+Each strategy declares the market data events it runs on
+(get_event_subscriptions); strategies_for_event() maps a published
+event to the strategies that should be evaluated for it.
+
+For symbols with a trade stream, the kline DataFrames passed to
+strategies also carry the measured buy_volume, sell_volume and complete
+columns (see indicators.order_flow).
 """
 
 import os
 import importlib
 import inspect
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 import pandas as pd
 
 from ..utils.logger import Logger
 from ..strategies.base_strategy import BaseStrategy, TradeSignal, SignalType
+from ..core.event_bus import EventType, MarketEvent
 
 # Rename/alias TradeSignal as Signal for compatibility
 Signal = TradeSignal
@@ -45,8 +54,12 @@ class StrategyManager:
         # Map of active strategies by symbol
         self.strategies = {}
         
+        # Strategies by trigger, format: {(event_type, symbol, timeframe): [strategy]}
+        self._event_triggers = {}
+        
         # Load strategies
         self._load_strategies()
+        self._index_event_subscriptions()
         
         self.logger.debug(f"EXIT __init__ completed")
     
@@ -117,6 +130,46 @@ class StrategyManager:
         
         self.logger.debug(f"EXIT _load_strategies completed")
     
+    def _index_event_subscriptions(self) -> None:
+        """
+        Index the loaded strategies by the events they run on
+        """
+        self._event_triggers = {}
+        
+        for symbol, symbol_strategies in self.strategies.items():
+            for strategy in symbol_strategies:
+                try:
+                    subscriptions = strategy.get_event_subscriptions()
+                except Exception as e:
+                    self.logger.error(f"Error getting event subscriptions for {strategy.__class__.__name__}: {str(e)}")
+                    continue
+                    
+                for event_type, timeframe in subscriptions:
+                    key = (EventType(event_type), symbol, timeframe)
+                    self._event_triggers.setdefault(key, []).append(strategy)
+                    self.logger.info(f"{strategy.__class__.__name__} for {symbol} runs on {key[0].value} {timeframe or ''}")
+    
+    def get_event_subscriptions(self) -> Set[Tuple[EventType, str, Optional[str]]]:
+        """
+        Events that trigger at least one strategy
+        
+        Returns:
+            Set of (event type, symbol, timeframe)
+        """
+        return set(self._event_triggers)
+    
+    def strategies_for_event(self, event: MarketEvent) -> List[BaseStrategy]:
+        """
+        Strategies that run on an event
+        
+        Args:
+            event: Published market data event
+            
+        Returns:
+            Strategies subscribed to the event's type, symbol and timeframe
+        """
+        return self._event_triggers.get((event.type, event.symbol, event.timeframe), [])
+    
     def _get_strategy_class_name(self, strategy_id: str) -> str:
         """
         Convert strategy ID to class name
@@ -132,13 +185,19 @@ class StrategyManager:
         class_name = ''.join(part.capitalize() for part in parts)
         return class_name
     
-    async def evaluate(self, symbol: str, market_data: Optional[Dict[str, pd.DataFrame]] = None) -> List[Signal]:
+    async def evaluate(
+        self,
+        symbol: str,
+        market_data: Optional[Dict[str, pd.DataFrame]] = None,
+        strategies: Optional[List[BaseStrategy]] = None
+    ) -> List[Signal]:
         """
         Evaluate strategies for a specific symbol with the latest market data
         
         Args:
             symbol: Trading symbol
             market_data: Optional market data dictionary (if None, fetched from data manager)
+            strategies: Strategies to run (default all strategies for the symbol)
             
         Returns:
             List of signals generated by all strategies
@@ -163,10 +222,14 @@ class StrategyManager:
             for timeframe in timeframes:
                 df = self.data_manager.get_klines(symbol, timeframe)
                 if df is not None and not df.empty:
+                    # Measured taker buy/sell volume, where the trade stream is subscribed
+                    delta = self.data_manager.get_volume_delta(symbol, timeframe)
+                    if not delta.empty:
+                        df = df.join(delta[['buy_volume', 'sell_volume', 'complete']])
                     market_data[timeframe] = df
         
         # Run each strategy
-        for strategy in self.strategies[symbol]:
+        for strategy in strategies if strategies is not None else self.strategies[symbol]:
             try:
                 # Process market data with strategy
                 signals = await strategy.process_data(symbol, market_data)
@@ -157,8 +157,8 @@ class TPSLManager:
         self.logger.debug(f"ENTER _process_tpsl_orders()")
         
         try:
-            # Get all active orders to check status
-            active_orders = await self.order_manager.get_active_orders()
+            # Get all active orders to check status (local cache, no API call)
+            active_orders = self.order_manager.get_active_orders()
             active_order_ids = {order.get('orderId') for order in active_orders}
             
             # Check each TP/SL order
@@ -7,6 +7,8 @@ from enum import Enum
 from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
 
+from ..core.event_bus import EventType
+
 
 class SignalType(Enum):
     """Signal types for trade signals"""
@@ -82,6 +84,20 @@ class BaseStrategy(ABC):
         self.config = config
         self.symbol = symbol
     
+    def get_event_subscriptions(self) -> List[Tuple[EventType, Optional[str]]]:
+        """
+        Market data events that trigger process_data()
+        
+        Override to run on other events, e.g. (EventType.BOOK_TOP, None).
+        
+        Returns:
+            List of (event type, timeframe) pairs; timeframe is None for
+            events without one. Default: each closed bar of the default
+            timeframe.
+        """
+        timeframe = self.config.get('general', {}).get('trading', {}).get('default_timeframe') or '1m'
+        return [(EventType.BAR_CLOSED, timeframe)]
+    
     @abstractmethod
     async def process_data(self, symbol: str, data_dict: Dict[str, pd.DataFrame]) -> List[TradeSignal]:
         """
@@ -14,6 +14,7 @@ import pandas as pd
 import numpy as np
 
 from pybit_bot.strategies.base_strategy import BaseStrategy, TradeSignal, SignalType, OrderType
+from pybit_bot.core.event_bus import EventType
 
 
 class StrategyA(BaseStrategy):
@@ -31,6 +32,10 @@ class StrategyA(BaseStrategy):
         self.active_long_trades = 0
         self.active_short_trades = 0
     
+    def get_event_subscriptions(self) -> List[Tuple[EventType, Optional[str]]]:
+        """Run once per closed bar of the default timeframe."""
+        return [(EventType.BAR_CLOSED, self.timeframe_config.get('default', '1m'))]
+    
     def get_required_timeframes(self) -> List[str]:
         """
         Get the list of timeframes required by this strategy.
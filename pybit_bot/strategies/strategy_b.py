@@ -11,6 +11,7 @@ import numpy as np
 from datetime import datetime
 
 from pybit_bot.strategies.base_strategy import BaseStrategy, TradeSignal, SignalType, OrderType
+from pybit_bot.core.event_bus import EventType
 from pybit_bot.utils.logger import Logger
 
 
@@ -46,7 +47,6 @@ class StrategyB(BaseStrategy):
         self.atr_timeframe = self.strategy_config.get('atr_timeframe', '1m')
         
         # Enhanced state tracking
-        self.last_signal_minute = -1
         self.last_signal_type = None
         self.force_alternating = self.strategy_config.get('force_alternating', True)  # Force alternating signals
         
@@ -60,6 +60,15 @@ class StrategyB(BaseStrategy):
         self.logger.info(f"- Trade Rule: LONG on even minutes, SHORT on odd minutes")
         self.logger.info(f"- Force Alternating Signals: {self.force_alternating}")
     
+    def get_event_subscriptions(self) -> List[Tuple[EventType, Optional[str]]]:
+        """
+        Run once per closed bar of the primary timeframe.
+        
+        Returns:
+            List of (event type, timeframe) pairs
+        """
+        return [(EventType.BAR_CLOSED, self.primary_timeframe)]
+    
     async def process_data(self, symbol: str, data_dict: Dict[str, pd.DataFrame]) -> List[TradeSignal]:
         """
         Process market data and generate signals.
@@ -131,7 +140,7 @@ class StrategyB(BaseStrategy):
             # Log details about the latest candle
             if len(df) > 0:
                 last_candle = df.iloc[-1]
-                timestamp_ms = last_candle['timestamp']
+                timestamp_ms = int(df.index[-1])
                 candle_time = datetime.fromtimestamp(timestamp_ms / 1000)
                 minute = candle_time.minute
                 
@@ -206,17 +215,12 @@ class StrategyB(BaseStrategy):
         # Get the dataframe with latest data
         df = data_dict[self.primary_timeframe]
         
-        # Get latest candle
+        # Get latest candle (runs once per closed bar, see get_event_subscriptions)
         latest_candle = df.iloc[-1]
-        timestamp_ms = latest_candle['timestamp']
+        timestamp_ms = int(df.index[-1])
         candle_time = datetime.fromtimestamp(timestamp_ms / 1000)
         minute = candle_time.minute
         
-        # Check if we already generated a signal for this minute
-        if minute == self.last_signal_minute:
-            self.logger.info(f"Already generated signal for minute {minute}, skipping")
-            return signals
-        
         # Get ATR value
         atr_value = None
         if self.primary_timeframe == self.atr_timeframe:
@@ -307,8 +311,7 @@ class StrategyB(BaseStrategy):
         
         signals.append(signal)
         
-        # Update last signal minute and type
-        self.last_signal_minute = minute
+        # Update last signal type
         self.last_signal_type = signal_type
         
         return signals
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+Testing utilities for pybit_bot
+
+Provides a local mock of the Bybit v5 API for offline tests and benchmarks.
+"""
+
+from .mock_exchange import MockBybitExchange
@@ -0,0 +1,166 @@
+"""
+Benchmark - Throughput and tick-to-trade latency against the mock exchange
+
+Runs BybitClient against a local MockBybitExchange, so results are
+reproducible on machines without network access.
+
+Usage:
+    python -m pybit_bot.testing.benchmark --requests 2000 --concurrency 50 --latency 0.001
+"""
+
+import time
+import asyncio
+import argparse
+from typing import Dict, List
+
+from aiohttp import ClientSession
+
+from ..core.client import BybitClient, APICredentials
+from ..core.rate_limiter import RateLimiter
+from .mock_exchange import MockBybitExchange
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarise latency samples in milliseconds
+    
+    Args:
+        samples: Latencies in seconds
+        
+    Returns:
+        Dictionary with p50/p90/p99/max in milliseconds
+    """
+    if not samples:
+        return {"p50_ms": 0.0, "p90_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    
+    def pick(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * (len(ordered) - 1)))] * 1000
+        
+    return {"p50_ms": pick(0.50), "p90_ms": pick(0.90), "p99_ms": pick(0.99), "max_ms": ordered[-1] * 1000}
+
+
+async def benchmark_throughput(client: BybitClient, requests: int, concurrency: int) -> Dict:
+    """
+    Measure market-data request throughput and latency
+    
+    Args:
+        client: Client pointed at the mock exchange
+        requests: Total number of requests
+        concurrency: Concurrent workers
+        
+    Returns:
+        Benchmark results
+    """
+    latencies: List[float] = []
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    counter = iter(range(requests))
+    
+    async def worker() -> None:
+        for i in counter:
+            started = time.perf_counter()
+            await client.get_orderbook("linear", symbols[i % len(symbols)], limit=i % 50 + 1)
+            latencies.append(time.perf_counter() - started)
+            
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    
+    return dict(_percentiles(latencies), requests=len(latencies), rps=len(latencies) / elapsed)
+
+
+async def benchmark_tick_to_trade(client: BybitClient, exchange: MockBybitExchange, ticks: int) -> Dict:
+    """
+    Measure the time from a price tick to the order acknowledgement
+    
+    Each tick is pushed on the public ticker stream; when the client sees
+    it, it places an order over REST.
+    
+    Args:
+        client: Client pointed at the mock exchange
+        exchange: Running mock exchange
+        ticks: Number of ticks to trade on
+        
+    Returns:
+        Benchmark results
+    """
+    latencies: List[float] = []
+    
+    async with ClientSession() as session:
+        async with session.ws_connect(exchange.public_ws_url) as ws:
+            await ws.send_json({"op": "subscribe", "args": ["tickers.BTCUSDT"]})
+            await ws.receive_json()
+            
+            for i in range(ticks):
+                tick_time = time.perf_counter()
+                await exchange.set_price("BTCUSDT", 50000.0 + (i % 20))
+                
+                while True:
+                    message = await ws.receive_json()
+                    if message.get("topic") == "tickers.BTCUSDT":
+                        break
+                        
+                await client.place_order({
+                    "category": "linear",
+                    "symbol": "BTCUSDT",
+                    "side": "Buy" if i % 2 == 0 else "Sell",
+                    "orderType": "Market",
+                    "qty": "0.001",
+                    "orderLinkId": f"bench-{i}",
+                })
+                latencies.append(time.perf_counter() - tick_time)
+                
+    return dict(_percentiles(latencies), ticks=len(latencies))
+
+
+async def run(requests: int, concurrency: int, ticks: int, latency: float, jitter: float) -> Dict:
+    """
+    Run all benchmarks
+    
+    Args:
+        requests: Market-data requests for the throughput benchmark
+        concurrency: Concurrent workers for the throughput benchmark
+        ticks: Ticks for the tick-to-trade benchmark
+        latency: Simulated exchange latency in seconds
+        jitter: Simulated latency jitter in seconds
+        
+    Returns:
+        Results keyed by benchmark name
+    """
+    # Rate limits are lifted on both sides so the transport itself is measured
+    async with MockBybitExchange(latency=latency, latency_jitter=jitter, seed=1,
+                                 rate_limits={group: None for group in MockBybitExchange.DEFAULT_RATE_LIMITS}) as exchange:
+        unlimited = (1e9, 1e9)
+        rate_limiter = RateLimiter(limits={group: unlimited for group in RateLimiter.DEFAULT_LIMITS},
+                                   ip_limit=unlimited)
+        client = BybitClient(APICredentials(api_key="bench", api_secret="bench", testnet=True),
+                             rate_limiter=rate_limiter, base_url=exchange.base_url)
+        try:
+            return {
+                "throughput": await benchmark_throughput(client, requests, concurrency),
+                "tick_to_trade": await benchmark_tick_to_trade(client, exchange, ticks),
+                "transport": client.get_transport_metrics()["scheduler"],
+            }
+        finally:
+            await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BybitClient against the local mock exchange")
+    parser.add_argument("--requests", type=int, default=2000, help="Market-data requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent workers")
+    parser.add_argument("--ticks", type=int, default=200, help="Ticks for tick-to-trade")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Simulated latency jitter (seconds)")
+    args = parser.parse_args()
+    
+    results = asyncio.run(run(args.requests, args.concurrency, args.ticks, args.latency, args.jitter))
+    
+    for name in ("throughput", "tick_to_trade"):
+        print(f"{name}:")
+        for key, value in results[name].items():
+            print(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1271 @@
+"""
+Mock Exchange - Local stand-in for the Bybit v5 REST and WebSocket API
+
+Serves the endpoints the bot uses (market data, order entry and queries,
+positions, trading stops, wallet balance, public and private streams,
+WebSocket trade API)
+from an in-process aiohttp server, so BybitClient, OrderManager and
+TradingEngine can be load-tested and benchmarked without network access.
+
+Features:
+- Configurable latency (fixed + uniform jitter) per request
+- Error injection: random 5xx rate and one-shot errors per path
+- Per-endpoint-group rate limits with X-Bapi-Limit-* headers
+- A simple one-way-mode matching engine: market orders fill at the
+  touch, limit orders rest until the price crosses, positions track
+  average price and realised PnL, TP/SL from trading-stop trigger
+- Deterministic synthetic klines (seeded by symbol and bar time)
+
+Signatures are not verified; the server only checks that signed
+requests carry an api_key.
+
+Example usage:
+    async with MockBybitExchange(latency=0.002) as exchange:
+        client = BybitClient(credentials, base_url=exchange.base_url)
+        await client.place_order({...})
+        await exchange.set_price("BTCUSDT", 50500.0)
+"""
+
+import time
+import json
+import uuid
+import zlib
+import random
+import asyncio
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web, WSMsgType
+
+from ..core.rate_limiter import RateLimiter
+from ..core.pagination import KLINE_INTERVALS
+from ..utils.logger import Logger
+
+
+# Request storage key for parsed query/body parameters
+PARAMS = web.RequestKey("params", dict) if hasattr(web, "RequestKey") else "params"
+
+
+class MockBybitExchange:
+    """
+    In-process Bybit v5 exchange simulator
+    """
+    
+    # Default symbols and their starting prices
+    DEFAULT_SYMBOLS = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "SOLUSDT": 100.0}
+    
+    # Requests per second per endpoint group (None = unlimited)
+    DEFAULT_RATE_LIMITS = {
+        "market": None,
+        "order": 10,
+        "order_query": 50,
+        "position": 50,
+        "account": 50,
+        "default": 20,
+    }
+    
+    # Levels per side of the synthetic order book
+    BOOK_DEPTH = 50
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503,
+                 rate_limits: Optional[Dict[str, Optional[int]]] = None,
+                 symbols: Optional[Dict[str, float]] = None,
+                 tick_size: float = 0.1, spread_ticks: int = 1,
+                 wallet_balance: float = 100000.0, seed: Optional[int] = None,
+                 logger: Optional[Logger] = None):
+        """
+        Initialize the exchange (call start() to serve)
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Fixed delay added to every request, in seconds
+            latency_jitter: Additional uniform random delay, in seconds
+            error_rate: Probability that a request fails with error_status
+            error_status: HTTP status of randomly injected errors
+            rate_limits: Optional overrides of per-group requests per second
+            symbols: Optional {symbol: starting price}
+            tick_size: Price tick for all symbols
+            spread_ticks: Bid/ask spread in ticks
+            wallet_balance: Starting USDT balance
+            seed: Random seed for latency jitter and error injection
+            logger: Optional logger instance
+        """
+        self.logger = logger or Logger("MockBybitExchange")
+        
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.tick_size = tick_size
+        self.spread_ticks = spread_ticks
+        self.random = random.Random(seed)
+        
+        self.rate_limits = dict(self.DEFAULT_RATE_LIMITS)
+        if rate_limits:
+            self.rate_limits.update(rate_limits)
+        self._groups = RateLimiter(logger=self.logger)  # only used for path -> group mapping
+        self._rate_windows: Dict[str, Tuple[int, int]] = {}  # group -> (window second, count)
+        
+        # Market state
+        self.prices: Dict[str, float] = dict(symbols or self.DEFAULT_SYMBOLS)
+        self.books: Dict[str, Dict[str, Dict[float, float]]] = {}
+        self.book_update_id: Dict[str, int] = defaultdict(int)
+        self.trade_seq = 0
+        for symbol in self.prices:
+            self.books[symbol] = self._build_book(symbol)
+            
+        # Account state
+        self.wallet_balance = wallet_balance
+        self.orders: Dict[str, Dict] = {}  # orderId -> order (all states)
+        self.open_order_ids: Dict[str, Set[str]] = defaultdict(set)  # symbol -> orderIds
+        self.link_ids: Dict[str, str] = {}  # orderLinkId -> orderId
+        self.positions: Dict[str, Dict] = {}
+        self.executions: List[Dict] = []
+        self.leverage: Dict[str, str] = defaultdict(lambda: "10")
+        
+        # Fault injection: path -> queue of (status, retCode)
+        self._injected_errors: Dict[str, Deque[Tuple[int, Optional[int]]]] = defaultdict(deque)
+        
+        # WebSocket subscribers
+        self._public_clients: Dict[web.WebSocketResponse, Set[str]] = {}
+        self._private_clients: Dict[web.WebSocketResponse, Set[str]] = {}
+        self._authed: Set[web.WebSocketResponse] = set()
+        self._trade_clients: Set[web.WebSocketResponse] = set()
+        
+        # Statistics
+        self.stats = {"requests": defaultdict(int), "errors_injected": 0, "rate_limited": 0, "fills": 0}
+        
+        self.app = self._build_app()
+        self._runner: Optional[web.AppRunner] = None
+        self._site: Optional[web.TCPSite] = None
+        
+    # Lifecycle
+    
+    async def start(self) -> str:
+        """
+        Start serving
+        
+        Returns:
+            REST base URL
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self.host, self.port)
+        await self._site.start()
+        
+        # Resolve the actual port when 0 was requested
+        if self._runner.addresses:
+            self.port = self._runner.addresses[0][1]
+            
+        self.logger.info(f"Mock exchange listening on {self.base_url}")
+        return self.base_url
+        
+    async def stop(self) -> None:
+        """Close WebSocket connections and stop serving"""
+        for ws in list(self._public_clients) + list(self._private_clients):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            
+    async def __aenter__(self) -> "MockBybitExchange":
+        await self.start()
+        return self
+        
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+        
+    @property
+    def base_url(self) -> str:
+        """REST base URL"""
+        return f"http://{self.host}:{self.port}"
+        
+    @property
+    def public_ws_url(self) -> str:
+        """Public linear stream URL"""
+        return f"ws://{self.host}:{self.port}/v5/public/linear"
+        
+    @property
+    def private_ws_url(self) -> str:
+        """Private stream URL"""
+        return f"ws://{self.host}:{self.port}/v5/private"
+        
+    @property
+    def trade_ws_url(self) -> str:
+        """WebSocket trade API URL"""
+        return f"ws://{self.host}:{self.port}/v5/trade"
+        
+    # Test controls
+    
+    def inject_error(self, path: str, status: int = 503, ret_code: Optional[int] = None,
+                     times: int = 1) -> None:
+        """
+        Make the next requests to `path` fail
+        
+        Args:
+            path: Endpoint path
+            status: HTTP status to return
+            ret_code: If set, return HTTP 200 with this retCode instead
+            times: Number of requests to fail
+        """
+        for _ in range(times):
+            self._injected_errors[path].append((status, ret_code))
+            
+    async def set_price(self, symbol: str, price: float) -> None:
+        """
+        Move the market, fill crossing orders, trigger TP/SL and push updates
+        
+        Args:
+            symbol: Trading symbol
+            price: New last traded price
+        """
+        old_book = self.books.get(symbol)
+        self.prices[symbol] = price
+        self.books[symbol] = self._build_book(symbol)
+        
+        await self._match_resting_orders(symbol)
+        await self._check_trading_stops(symbol)
+        
+        await self._publish_book_delta(symbol, old_book)
+        await self.publish_trade(symbol, price, 0.001, "Buy")
+        await self._publish_public(f"tickers.{symbol}", self._ticker(symbol), "snapshot")
+        await self._publish_klines(symbol)
+        
+    async def publish_trade(self, symbol: str, price: float, qty: float, side: str) -> None:
+        """
+        Push a public trade
+        
+        Args:
+            symbol: Trading symbol
+            price: Trade price
+            qty: Trade quantity
+            side: Taker side ('Buy' or 'Sell')
+        """
+        self.trade_seq += 1
+        trade = {
+            "T": self._now_ms(),
+            "s": symbol,
+            "S": side,
+            "v": self._fmt(qty),
+            "p": self._fmt(price),
+            "i": str(uuid.uuid4()),
+            "BT": False,
+            "seq": self.trade_seq,
+        }
+        await self._publish_public(f"publicTrade.{symbol}", [trade], "snapshot")
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request and fault statistics
+        
+        Returns:
+            Dictionary of statistics
+        """
+        return dict(self.stats, requests=dict(self.stats["requests"]))
+        
+    # HTTP plumbing
+    
+    def _build_app(self) -> web.Application:
+        """Create the aiohttp application with all routes"""
+        app = web.Application(middlewares=[self._middleware])
+        
+        routes = [
+            ("GET", "/v5/server/time", self._server_time),
+            ("GET", "/v5/market/kline", self._kline),
+            ("GET", "/v5/market/tickers", self._tickers),
+            ("GET", "/v5/market/orderbook", self._orderbook),
+            ("GET", "/v5/market/instruments-info", self._instruments_info),
+            ("POST", "/v5/order/create", self._order_create),
+            ("POST", "/v5/order/amend", self._order_amend),
+            ("POST", "/v5/order/cancel", self._order_cancel),
+            ("POST", "/v5/order/cancel-all", self._order_cancel_all),
+            ("POST", "/v5/order/create-batch", self._order_create_batch),
+            ("POST", "/v5/order/amend-batch", self._order_amend_batch),
+            ("POST", "/v5/order/cancel-batch", self._order_cancel_batch),
+            ("GET", "/v5/order/realtime", self._order_realtime),
+            ("GET", "/v5/order/history", self._order_history),
+            ("GET", "/v5/execution/list", self._execution_list),
+            ("GET", "/v5/position/list", self._position_list),
+            ("POST", "/v5/position/trading-stop", self._trading_stop),
+            ("POST", "/v5/position/set-leverage", self._set_leverage),
+            ("GET", "/v5/account/wallet-balance", self._wallet_balance),
+            ("GET", "/v5/public/linear", self._public_ws),
+            ("GET", "/v5/private", self._private_ws),
+            ("GET", "/v5/trade", self._trade_ws),
+        ]
+        for method, path, handler in routes:
+            app.router.add_route(method, path, handler)
+            
+        return app
+        
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, fault injection and rate limits"""
+        path = request.path
+        if path in ("/v5/public/linear", "/v5/private", "/v5/trade"):
+            return await handler(request)
+            
+        self.stats["requests"][path] += 1
+        
+        delay = self.latency + (self.random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+            
+        injected = self._injected_errors.get(path)
+        if injected:
+            status, ret_code = injected.popleft()
+            self.stats["errors_injected"] += 1
+            if ret_code is not None:
+                return web.json_response(self._error(ret_code, "injected error"))
+            return web.Response(status=status, text="injected error")
+            
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats["errors_injected"] += 1
+            return web.Response(status=self.error_status, text="injected error")
+            
+        group = self._groups.get_group(path)
+        limit = self.rate_limits.get(group, self.rate_limits.get("default"))
+        headers = {}
+        if limit:
+            now = time.time()
+            window = int(now)
+            start, count = self._rate_windows.get(group, (window, 0))
+            if start != window:
+                start, count = window, 0
+            count += 1
+            self._rate_windows[group] = (start, count)
+            
+            headers = {
+                "X-Bapi-Limit": str(limit),
+                "X-Bapi-Limit-Status": str(max(0, limit - count)),
+                "X-Bapi-Limit-Reset-Timestamp": str((window + 1) * 1000),
+            }
+            if count > limit:
+                self.stats["rate_limited"] += 1
+                return web.json_response(self._error(10006, "Too many visits!"), headers=headers)
+                
+        if request.method == "POST":
+            try:
+                request[PARAMS] = await request.json()
+            except ValueError:
+                return web.json_response(self._error(10001, "invalid json"))
+        else:
+            request[PARAMS] = dict(request.query)
+            
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+        
+    @staticmethod
+    def _ok(result: Any) -> web.Response:
+        """Successful v5 envelope"""
+        return web.json_response({
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": result,
+            "retExtInfo": {},
+            "time": int(time.time() * 1000),
+        })
+        
+    @staticmethod
+    def _error(code: int, message: str) -> Dict:
+        """Error v5 envelope"""
+        return {"retCode": code, "retMsg": message, "result": {}, "retExtInfo": {}, "time": int(time.time() * 1000)}
+        
+    def _reject(self, code: int, message: str) -> web.Response:
+        """Error response"""
+        return web.json_response(self._error(code, message))
+        
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+        
+    @staticmethod
+    def _fmt(value: float) -> str:
+        """Format a number the way Bybit does (string, no exponent)"""
+        return f"{value:.8f}".rstrip("0").rstrip(".") or "0"
+        
+    # Market data
+    
+    async def _server_time(self, request: web.Request) -> web.Response:
+        now_ns = time.time_ns()
+        return self._ok({"timeSecond": str(now_ns // 1_000_000_000), "timeNano": str(now_ns)})
+        
+    def _synthetic_bar(self, symbol: str, interval_ms: int, open_time: int) -> List[str]:
+        """
+        Deterministic OHLCV bar for a symbol and bar open time
+        
+        Args:
+            symbol: Trading symbol
+            interval_ms: Bar length in milliseconds
+            open_time: Bar open time in milliseconds
+            
+        Returns:
+            Bybit kline row
+        """
+        base = self.prices.get(symbol, 100.0)
+        rng = random.Random(zlib.crc32(f"{symbol}:{interval_ms}:{open_time}".encode()))
+        open_price = base * (1 + rng.uniform(-0.01, 0.01))
+        close_price = open_price * (1 + rng.uniform(-0.002, 0.002))
+        high = max(open_price, close_price) * (1 + rng.uniform(0, 0.001))
+        low = min(open_price, close_price) * (1 - rng.uniform(0, 0.001))
+        volume = rng.uniform(1, 100)
+        return [
+            str(open_time),
+            self._fmt(round(open_price, 2)),
+            self._fmt(round(high, 2)),
+            self._fmt(round(low, 2)),
+            self._fmt(round(close_price, 2)),
+            self._fmt(round(volume, 3)),
+            self._fmt(round(volume * close_price, 2)),
+        ]
+        
+    async def _kline(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        symbol = params.get("symbol", "")
+        if symbol not in self.prices:
+            return self._reject(10001, "Not supported symbols")
+            
+        entry = KLINE_INTERVALS.get(params.get("interval", ""))
+        if entry is None:
+            return self._reject(10001, "Invalid period!")
+        interval_ms = entry[1]
+        
+        limit = min(int(params.get("limit", 200)), 1000)
+        now = self._now_ms()
+        end = min(int(params.get("end", now)), now)
+        last_open = end - end % interval_ms
+        
+        if "start" in params:
+            start = int(params["start"])
+            first_open = start + (-start % interval_ms)
+            opens = list(range(first_open, last_open + 1, interval_ms))[:limit]
+        else:
+            opens = [last_open - i * interval_ms for i in range(limit)][::-1]
+            
+        rows = [self._synthetic_bar(symbol, interval_ms, t) for t in reversed(opens)]
+        return self._ok({"symbol": symbol, "category": params.get("category", "linear"), "list": rows})
+        
+    def _ticker(self, symbol: str) -> Dict:
+        """Ticker snapshot for a symbol"""
+        price = self.prices[symbol]
+        book = self.books[symbol]
+        return {
+            "symbol": symbol,
+            "lastPrice": self._fmt(price),
+            "markPrice": self._fmt(price),
+            "indexPrice": self._fmt(price),
+            "bid1Price": self._fmt(max(book["b"])),
+            "bid1Size": self._fmt(book["b"][max(book["b"])]),
+            "ask1Price": self._fmt(min(book["a"])),
+            "ask1Size": self._fmt(book["a"][min(book["a"])]),
+            "volume24h": "1000",
+            "turnover24h": self._fmt(1000 * price),
+            "fundingRate": "0.0001",
+        }
+        
+    async def _tickers(self, request: web.Request) -> web.Response:
+        symbol = request[PARAMS].get("symbol")
+        if symbol and symbol not in self.prices:
+            return self._reject(10001, "Not supported symbols")
+        symbols = [symbol] if symbol else list(self.prices)
+        return self._ok({"category": "linear", "list": [self._ticker(s) for s in symbols]})
+        
+    def _build_book(self, symbol: str) -> Dict[str, Dict[float, float]]:
+        """
+        Synthetic book centred on the last price
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            {"b": {price: size}, "a": {price: size}}
+        """
+        tick = self.tick_size
+        spread = max(1, self.spread_ticks)
+        bid_ticks = round(self.prices[symbol] / tick) - spread // 2
+        ask_ticks = bid_ticks + spread
+        
+        bids, asks = {}, {}
+        for level in range(self.BOOK_DEPTH):
+            size = round(1.0 + (zlib.crc32(f"{symbol}:{level}".encode()) % 1000) / 100, 3)
+            bids[round((bid_ticks - level) * tick, 8)] = size
+            asks[round((ask_ticks + level) * tick, 8)] = size
+        return {"b": bids, "a": asks}
+        
+    def _book_levels(self, symbol: str, limit: int) -> Dict[str, List[List[str]]]:
+        """Top `limit` levels per side as Bybit string pairs"""
+        book = self.books[symbol]
+        bids = sorted(book["b"].items(), reverse=True)[:limit]
+        asks = sorted(book["a"].items())[:limit]
+        return {
+            "b": [[self._fmt(p), self._fmt(q)] for p, q in bids],
+            "a": [[self._fmt(p), self._fmt(q)] for p, q in asks],
+        }
+        
+    async def _orderbook(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        symbol = params.get("symbol", "")
+        if symbol not in self.prices:
+            return self._reject(10001, "Not supported symbols")
+        limit = min(int(params.get("limit", 25)), self.BOOK_DEPTH)
+        return self._ok(dict(
+            self._book_levels(symbol, limit),
+            s=symbol,
+            ts=self._now_ms(),
+            u=self.book_update_id[symbol],
+            seq=self.book_update_id[symbol],
+        ))
+        
+    async def _instruments_info(self, request: web.Request) -> web.Response:
+        symbol = request[PARAMS].get("symbol")
+        symbols = [symbol] if symbol else list(self.prices)
+        instruments = [{
+            "symbol": s,
+            "status": "Trading",
+            "contractType": "LinearPerpetual",
+            "baseCoin": s.replace("USDT", ""),
+            "quoteCoin": "USDT",
+            "priceFilter": {"tickSize": self._fmt(self.tick_size), "minPrice": "0.1", "maxPrice": "1999999"},
+            "lotSizeFilter": {"qtyStep": "0.001", "minOrderQty": "0.001", "maxOrderQty": "1000"},
+            "leverageFilter": {"minLeverage": "1", "maxLeverage": "100", "leverageStep": "0.01"},
+        } for s in symbols if s in self.prices]
+        return self._ok({"category": "linear", "list": instruments, "nextPageCursor": ""})
+        
+    # Matching engine
+    
+    def _best(self, symbol: str, side: str) -> float:
+        """Price a taker order on `side` trades at"""
+        book = self.books[symbol]
+        return min(book["a"]) if side == "Buy" else max(book["b"])
+        
+    def _new_order(self, params: Dict) -> Tuple[Optional[Dict], Optional[Tuple[int, str]]]:
+        """
+        Validate order parameters and build the order record
+        
+        Args:
+            params: Create-order parameters
+            
+        Returns:
+            (order, None) or (None, (retCode, retMsg))
+        """
+        symbol = params.get("symbol")
+        if symbol not in self.prices:
+            return None, (10001, "params error: symbol invalid")
+        side = params.get("side")
+        if side not in ("Buy", "Sell"):
+            return None, (10001, "params error: side invalid")
+        order_type = params.get("orderType", "Market")
+        try:
+            qty = float(params.get("qty", 0))
+        except (TypeError, ValueError):
+            qty = 0
+        if qty <= 0:
+            return None, (10001, "params error: qty invalid")
+        if order_type == "Limit" and not params.get("price"):
+            return None, (10001, "params error: price required")
+            
+        link_id = params.get("orderLinkId") or ""
+        if link_id and link_id in self.link_ids:
+            return None, (110072, "OrderLinkedID is duplicate")
+            
+        now = str(self._now_ms())
+        order = {
+            "orderId": str(uuid.uuid4()),
+            "orderLinkId": link_id,
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "price": self._fmt(float(params["price"])) if params.get("price") else "0",
+            "qty": self._fmt(qty),
+            "cumExecQty": "0",
+            "cumExecValue": "0",
+            "avgPrice": "",
+            "leavesQty": self._fmt(qty),
+            "orderStatus": "New",
+            "timeInForce": params.get("timeInForce", "GTC" if order_type == "Limit" else "IOC"),
+            "reduceOnly": bool(params.get("reduceOnly", False)),
+            "takeProfit": str(params.get("takeProfit", "")),
+            "stopLoss": str(params.get("stopLoss", "")),
+            "createdTime": now,
+            "updatedTime": now,
+            "category": params.get("category", "linear"),
+        }
+        return order, None
+        
+    async def _submit(self, params: Dict) -> Tuple[Optional[Dict], Optional[Tuple[int, str]]]:
+        """
+        Accept an order and match it
+        
+        Args:
+            params: Create-order parameters
+            
+        Returns:
+            (order, None) or (None, (retCode, retMsg))
+        """
+        order, error = self._new_order(params)
+        if error:
+            return None, error
+            
+        self.orders[order["orderId"]] = order
+        if order["orderLinkId"]:
+            self.link_ids[order["orderLinkId"]] = order["orderId"]
+            
+        symbol, side = order["symbol"], order["side"]
+        touch = self._best(symbol, side)
+        
+        if order["orderType"] == "Market":
+            await self._fill(order, touch)
+        else:
+            limit_price = float(order["price"])
+            crosses = limit_price >= touch if side == "Buy" else limit_price <= touch
+            if crosses and order["timeInForce"] != "PostOnly":
+                await self._fill(order, touch)
+            elif crosses:
+                order["orderStatus"] = "Cancelled"
+                await self._publish_order(order)
+            else:
+                self.open_order_ids[symbol].add(order["orderId"])
+                await self._publish_order(order)
+                
+        return order, None
+        
+    async def _fill(self, order: Dict, price: float) -> None:
+        """
+        Fill an order completely at `price` and update the position
+        
+        Args:
+            order: Order record
+            price: Execution price
+        """
+        symbol, side = order["symbol"], order["side"]
+        qty = float(order["leavesQty"])
+        
+        position = self.positions.setdefault(symbol, self._empty_position(symbol))
+        size = float(position["size"])
+        signed = size if position["side"] == "Buy" else -size
+        delta = qty if side == "Buy" else -qty
+        
+        if order["reduceOnly"]:
+            # Never flip or grow a position with a reduce-only order
+            if signed == 0 or (signed > 0) == (delta > 0):
+                order["orderStatus"] = "Cancelled"
+                self.open_order_ids[symbol].discard(order["orderId"])
+                await self._publish_order(order)
+                return
+            delta = max(-abs(signed), min(abs(signed), delta)) if delta else 0
+            qty = abs(delta)
+            
+        new_signed = signed + delta
+        avg_price = float(position["avgPrice"] or 0)
+        realised = float(position["cumRealisedPnl"])
+        
+        if signed == 0 or (signed > 0) == (delta > 0):
+            # Opening or adding
+            avg_price = (abs(signed) * avg_price + qty * price) / (abs(signed) + qty)
+        else:
+            closed = min(abs(signed), qty)
+            direction = 1 if signed > 0 else -1
+            realised += direction * closed * (price - avg_price)
+            if abs(delta) > abs(signed):
+                avg_price = price  # Flipped
+                
+        if abs(new_signed) < 1e-12:
+            new_signed = 0.0
+            avg_price = 0.0
+            
+        position.update({
+            "side": "Buy" if new_signed > 0 else ("Sell" if new_signed < 0 else ""),
+            "size": self._fmt(abs(new_signed)),
+            "avgPrice": self._fmt(avg_price),
+            "positionValue": self._fmt(abs(new_signed) * avg_price),
+            "markPrice": self._fmt(self.prices[symbol]),
+            "cumRealisedPnl": self._fmt(realised),
+            "updatedTime": str(self._now_ms()),
+        })
+        if new_signed == 0:
+            position["takeProfit"] = ""
+            position["stopLoss"] = ""
+        elif order.get("takeProfit") or order.get("stopLoss"):
+            position["takeProfit"] = order.get("takeProfit") or position["takeProfit"]
+            position["stopLoss"] = order.get("stopLoss") or position["stopLoss"]
+            
+        order.update({
+            "orderStatus": "Filled",
+            "cumExecQty": self._fmt(float(order["cumExecQty"]) + qty),
+            "cumExecValue": self._fmt(float(order["cumExecValue"]) + qty * price),
+            "avgPrice": self._fmt(price),
+            "leavesQty": "0",
+            "updatedTime": str(self._now_ms()),
+        })
+        self.open_order_ids[symbol].discard(order["orderId"])
+        
+        execution = {
+            "symbol": symbol,
+            "orderId": order["orderId"],
+            "orderLinkId": order["orderLinkId"],
+            "side": side,
+            "orderType": order["orderType"],
+            "execId": str(uuid.uuid4()),
+            "execPrice": self._fmt(price),
+            "execQty": self._fmt(qty),
+            "execValue": self._fmt(qty * price),
+            "execFee": self._fmt(qty * price * 0.00055),
+            "execType": "Trade",
+            "execTime": str(self._now_ms()),
+            "isMaker": order["orderType"] == "Limit",
+            "category": order["category"],
+        }
+        self.executions.append(execution)
+        self.stats["fills"] += 1
+        
+        await self._publish_order(order)
+        await self._publish_private("execution", [execution])
+        await self._publish_private("position", [dict(position)])
+        
+    async def _match_resting_orders(self, symbol: str) -> None:
+        """Fill resting limit orders the new price crosses"""
+        price = self.prices[symbol]
+        for order_id in sorted(self.open_order_ids[symbol], key=lambda oid: self.orders[oid]["createdTime"]):
+            order = self.orders[order_id]
+            limit_price = float(order["price"])
+            if (order["side"] == "Buy" and price <= limit_price) or (order["side"] == "Sell" and price >= limit_price):
+                await self._fill(order, limit_price)
+                
+    async def _check_trading_stops(self, symbol: str) -> None:
+        """Close positions whose TP or SL the new price reached"""
+        position = self.positions.get(symbol)
+        if not position or float(position["size"]) == 0:
+            return
+            
+        price = self.prices[symbol]
+        is_long = position["side"] == "Buy"
+        take_profit = float(position["takeProfit"] or 0)
+        stop_loss = float(position["stopLoss"] or 0)
+        
+        hit = False
+        if take_profit:
+            hit = price >= take_profit if is_long else price <= take_profit
+        if stop_loss and not hit:
+            hit = price <= stop_loss if is_long else price >= stop_loss
+            
+        if hit:
+            close, _ = self._new_order({
+                "symbol": symbol,
+                "side": "Sell" if is_long else "Buy",
+                "orderType": "Market",
+                "qty": position["size"],
+                "reduceOnly": True,
+                "category": "linear",
+            })
+            self.orders[close["orderId"]] = close
+            await self._fill(close, price)
+            
+    def _empty_position(self, symbol: str) -> Dict:
+        """Flat position record"""
+        return {
+            "symbol": symbol,
+            "side": "",
+            "size": "0",
+            "avgPrice": "0",
+            "positionValue": "0",
+            "markPrice": self._fmt(self.prices[symbol]),
+            "leverage": self.leverage[symbol],
+            "takeProfit": "",
+            "stopLoss": "",
+            "unrealisedPnl": "0",
+            "cumRealisedPnl": "0",
+            "positionIdx": 0,
+            "updatedTime": str(self._now_ms()),
+        }
+        
+    def _find_order(self, params: Dict) -> Optional[Dict]:
+        """Look up an order by orderId or orderLinkId"""
+        order_id = params.get("orderId") or self.link_ids.get(params.get("orderLinkId") or "")
+        return self.orders.get(order_id) if order_id else None
+        
+    @staticmethod
+    def _order_ack(order: Dict) -> Dict:
+        return {"orderId": order["orderId"], "orderLinkId": order["orderLinkId"]}
+        
+    # Trading endpoints
+    
+    def _check_auth(self, params: Dict) -> Optional[web.Response]:
+        """Reject unsigned private requests"""
+        if not params.get("api_key") or not params.get("sign"):
+            return self._reject(10003, "API key is invalid.")
+        return None
+        
+    async def _order_create(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        order, error = await self._submit(params)
+        if error:
+            return self._reject(*error)
+        return self._ok(self._order_ack(order))
+        
+    async def _amend(self, params: Dict) -> Tuple[Optional[Dict], Optional[Tuple[int, str]]]:
+        order = self._find_order(params)
+        if order is None or order["orderId"] not in self.open_order_ids[order["symbol"]]:
+            return None, (110001, "order not exists or too late to replace")
+        if params.get("qty"):
+            order["qty"] = self._fmt(float(params["qty"]))
+            order["leavesQty"] = order["qty"]
+        if params.get("price"):
+            order["price"] = self._fmt(float(params["price"]))
+        order["updatedTime"] = str(self._now_ms())
+        await self._publish_order(order)
+        await self._match_resting_orders(order["symbol"])
+        return order, None
+        
+    async def _order_amend(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        order, error = await self._amend(params)
+        if error:
+            return self._reject(*error)
+        return self._ok(self._order_ack(order))
+        
+    async def _cancel(self, params: Dict) -> Tuple[Optional[Dict], Optional[Tuple[int, str]]]:
+        order = self._find_order(params)
+        if order is None or order["orderId"] not in self.open_order_ids[order["symbol"]]:
+            return None, (110001, "order not exists or too late to cancel")
+        order["orderStatus"] = "Cancelled"
+        order["updatedTime"] = str(self._now_ms())
+        self.open_order_ids[order["symbol"]].discard(order["orderId"])
+        await self._publish_order(order)
+        return order, None
+        
+    async def _order_cancel(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        order, error = await self._cancel(params)
+        if error:
+            return self._reject(*error)
+        return self._ok(self._order_ack(order))
+        
+    async def _order_cancel_all(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        symbols = [params["symbol"]] if params.get("symbol") else list(self.open_order_ids)
+        cancelled = []
+        for symbol in symbols:
+            for order_id in list(self.open_order_ids[symbol]):
+                order, _ = await self._cancel({"orderId": order_id})
+                cancelled.append(self._order_ack(order))
+        return self._ok({"list": cancelled, "success": "1"})
+        
+    async def _batch(self, request: web.Request, operation) -> web.Response:
+        """Run a batch operation, reporting per-item results in retExtInfo"""
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        items = params.get("request") or []
+        if len(items) > 20:
+            return self._reject(10001, "batch size exceeds limit")
+            
+        results, infos = [], []
+        for item in items:
+            item = dict(item, category=params.get("category", "linear"))
+            order, error = await operation(item)
+            if error:
+                results.append({"orderId": "", "orderLinkId": item.get("orderLinkId", ""), "symbol": item.get("symbol", "")})
+                infos.append({"code": error[0], "msg": error[1]})
+            else:
+                results.append(dict(self._order_ack(order), symbol=order["symbol"]))
+                infos.append({"code": 0, "msg": "OK"})
+                
+        return web.json_response({
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {"list": results},
+            "retExtInfo": {"list": infos},
+            "time": self._now_ms(),
+        })
+        
+    async def _order_create_batch(self, request: web.Request) -> web.Response:
+        return await self._batch(request, self._submit)
+        
+    async def _order_amend_batch(self, request: web.Request) -> web.Response:
+        return await self._batch(request, self._amend)
+        
+    async def _order_cancel_batch(self, request: web.Request) -> web.Response:
+        return await self._batch(request, self._cancel)
+        
+    def _paginate(self, items: List[Dict], params: Dict, default_limit: int) -> Dict:
+        """Slice `items` with Bybit-style cursor pagination"""
+        limit = int(params.get("limit", default_limit))
+        offset = int(params.get("cursor") or 0)
+        page = items[offset:offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(items) else ""
+        return {"category": params.get("category", "linear"), "list": page, "nextPageCursor": next_cursor}
+        
+    @staticmethod
+    def _symbols_in_scope(params: Dict, symbols: List[str]) -> Optional[List[str]]:
+        """
+        Symbols a linear/inverse account query covers
+        
+        Like Bybit, such queries need a symbol, baseCoin or settleCoin.
+        
+        Args:
+            params: Query parameters
+            symbols: Candidate symbols
+            
+        Returns:
+            Matching symbols, or None if the query has no scope
+        """
+        if params.get("symbol"):
+            return [params["symbol"]]
+        if params.get("category", "linear") in ("linear", "inverse") \
+                and not params.get("baseCoin") and not params.get("settleCoin"):
+            return None
+        return [
+            symbol for symbol in symbols
+            if symbol.startswith(params.get("baseCoin") or "") and symbol.endswith(params.get("settleCoin") or "")
+        ]
+        
+    async def _order_realtime(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        if params.get("orderId") or params.get("orderLinkId"):
+            # Bybit also returns recently closed orders when queried by ID
+            found = self._find_order(params)
+            orders = [found] if found else []
+        else:
+            symbols = self._symbols_in_scope(params, list(self.open_order_ids))
+            if symbols is None:
+                return self._reject(10001, "Missing some parameters that must be filled in, symbol or settleCoin or baseCoin")
+            orders = [self.orders[oid] for s in symbols for oid in self.open_order_ids[s]]
+        orders.sort(key=lambda o: o["createdTime"], reverse=True)
+        return self._ok(self._paginate(orders, params, 20))
+        
+    async def _order_history(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        orders = [
+            o for o in self.orders.values()
+            if (not params.get("symbol") or o["symbol"] == params["symbol"])
+            and (not params.get("orderId") or o["orderId"] == params["orderId"])
+        ]
+        orders.sort(key=lambda o: o["createdTime"], reverse=True)
+        return self._ok(self._paginate(orders, params, 20))
+        
+    async def _execution_list(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        executions = [
+            e for e in reversed(self.executions)
+            if (not params.get("symbol") or e["symbol"] == params["symbol"])
+            and int(e["execTime"]) >= int(params.get("startTime", 0))
+            and int(e["execTime"]) <= int(params.get("endTime", 1 << 62))
+        ]
+        return self._ok(self._paginate(executions, params, 50))
+        
+    async def _position_list(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        symbols = self._symbols_in_scope(params, sorted(self.positions))
+        if symbols is None:
+            return self._reject(10001, "Missing some parameters that must be filled in, symbol or settleCoin")
+        positions = []
+        for symbol in symbols:
+            if symbol not in self.prices:
+                continue
+            position = self.positions.get(symbol) or self._empty_position(symbol)
+            size = float(position["size"])
+            direction = 1 if position["side"] == "Buy" else -1
+            unrealised = direction * size * (self.prices[symbol] - float(position["avgPrice"] or 0)) if size else 0.0
+            positions.append(dict(position, markPrice=self._fmt(self.prices[symbol]),
+                                  unrealisedPnl=self._fmt(unrealised), leverage=self.leverage[symbol]))
+        return self._ok(self._paginate(positions, params, 20))
+        
+    async def _trading_stop(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        symbol = params.get("symbol")
+        position = self.positions.get(symbol)
+        if not position or float(position["size"]) == 0:
+            return self._reject(10001, "can not set tp/sl/ts for zero position")
+        if "takeProfit" in params:
+            position["takeProfit"] = "" if str(params["takeProfit"]) in ("", "0") else str(params["takeProfit"])
+        if "stopLoss" in params:
+            position["stopLoss"] = "" if str(params["stopLoss"]) in ("", "0") else str(params["stopLoss"])
+        position["updatedTime"] = str(self._now_ms())
+        await self._publish_private("position", [dict(position)])
+        return self._ok({})
+        
+    async def _set_leverage(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        symbol = params.get("symbol")
+        if symbol not in self.prices:
+            return self._reject(10001, "params error: symbol invalid")
+        leverage = str(params.get("buyLeverage", "10"))
+        if self.leverage[symbol] == leverage:
+            return self._reject(110043, "leverage not modified")
+        self.leverage[symbol] = leverage
+        return self._ok({})
+        
+    async def _wallet_balance(self, request: web.Request) -> web.Response:
+        params = request[PARAMS]
+        denied = self._check_auth(params)
+        if denied:
+            return denied
+        realised = sum(float(p["cumRealisedPnl"]) for p in self.positions.values())
+        equity = self.wallet_balance + realised
+        coin = {"coin": "USDT", "walletBalance": self._fmt(equity), "equity": self._fmt(equity),
+                "availableToWithdraw": self._fmt(equity), "usdValue": self._fmt(equity)}
+        return self._ok({"list": [{
+            "accountType": params.get("accountType", "UNIFIED"),
+            "totalEquity": self._fmt(equity),
+            "totalWalletBalance": self._fmt(equity),
+            "totalAvailableBalance": self._fmt(equity),
+            "coin": [coin],
+        }]})
+        
+    # WebSocket streams
+    
+    async def _public_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._public_clients[ws] = set()
+        
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                op = message.get("op")
+                
+                if op == "ping":
+                    await ws.send_json({"success": True, "ret_msg": "pong", "op": "ping",
+                                        "req_id": message.get("req_id", ""), "conn_id": str(id(ws))})
+                elif op in ("subscribe", "unsubscribe"):
+                    args = message.get("args") or []
+                    if len(args) > 10:
+                        await ws.send_json({"success": False, "ret_msg": "args size >10", "op": op,
+                                            "req_id": message.get("req_id", ""), "conn_id": str(id(ws))})
+                        continue
+                    if op == "subscribe":
+                        self._public_clients[ws].update(args)
+                    else:
+                        self._public_clients[ws].difference_update(args)
+                    await ws.send_json({"success": True, "ret_msg": "", "op": op,
+                                        "req_id": message.get("req_id", ""), "conn_id": str(id(ws))})
+                    if op == "subscribe":
+                        for topic in args:
+                            await self._send_initial_snapshot(ws, topic)
+        finally:
+            self._public_clients.pop(ws, None)
+            
+        return ws
+        
+    async def _send_initial_snapshot(self, ws: web.WebSocketResponse, topic: str) -> None:
+        """Send the snapshot a fresh order book subscription starts with"""
+        parts = topic.split(".")
+        if parts[0] == "orderbook" and len(parts) == 3 and parts[2] in self.prices:
+            symbol = parts[2]
+            depth = int(parts[1])
+            await ws.send_json(self._book_message(topic, symbol, "snapshot", self._book_levels(symbol, depth)))
+            
+    async def _private_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._private_clients[ws] = set()
+        
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                op = message.get("op")
+                response = {"op": op, "req_id": message.get("req_id", ""), "conn_id": str(id(ws))}
+                
+                if op == "ping":
+                    await ws.send_json(dict(response, success=True, ret_msg="pong"))
+                elif op == "auth":
+                    args = message.get("args") or []
+                    expires = int(args[1]) if len(args) == 3 else 0
+                    if len(args) == 3 and args[0] and expires > self._now_ms():
+                        self._authed.add(ws)
+                        await ws.send_json(dict(response, success=True, ret_msg=""))
+                    else:
+                        await ws.send_json(dict(response, success=False, ret_msg="Request not authorized"))
+                elif op == "subscribe":
+                    if ws not in self._authed:
+                        await ws.send_json(dict(response, success=False, ret_msg="Request not authorized"))
+                        continue
+                    self._private_clients[ws].update(message.get("args") or [])
+                    await ws.send_json(dict(response, success=True, ret_msg=""))
+        finally:
+            self._private_clients.pop(ws, None)
+            self._authed.discard(ws)
+            
+        return ws
+        
+    async def _trade_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._trade_clients.add(ws)
+        authed = False
+        operations = {"order.create": self._submit, "order.amend": self._amend, "order.cancel": self._cancel}
+        
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                op = message.get("op")
+                
+                if op == "ping":
+                    await ws.send_json({"op": "pong", "args": [str(self._now_ms())], "conn_id": str(id(ws))})
+                elif op == "auth":
+                    args = message.get("args") or []
+                    expires = int(args[1]) if len(args) == 3 else 0
+                    authed = len(args) == 3 and bool(args[0]) and expires > self._now_ms()
+                    await ws.send_json({"retCode": 0 if authed else 10004,
+                                        "retMsg": "OK" if authed else "Invalid sign",
+                                        "op": "auth", "connId": str(id(ws))})
+                elif op in operations:
+                    self.stats["requests"][f"ws:{op}"] += 1
+                    delay = self.latency + (self.random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                        
+                    reply = {"reqId": message.get("reqId", ""), "op": op, "retExtInfo": {}, "data": {},
+                             "header": {"Timenow": str(self._now_ms())}, "connId": str(id(ws))}
+                    args = message.get("args") or []
+                    if not authed:
+                        reply.update(retCode=10003, retMsg="Request not authorized")
+                    elif len(args) != 1:
+                        reply.update(retCode=10001, retMsg="args must contain exactly one request")
+                    else:
+                        order, error = await operations[op](dict(args[0]))
+                        if error:
+                            reply.update(retCode=error[0], retMsg=error[1])
+                        else:
+                            reply.update(retCode=0, retMsg="OK", data=self._order_ack(order))
+                    await ws.send_json(reply)
+        finally:
+            self._trade_clients.discard(ws)
+            
+        return ws
+        
+    async def _send(self, clients: Dict[web.WebSocketResponse, Set[str]], topic: str, message: Dict) -> None:
+        """Send a message to every client subscribed to `topic`"""
+        for ws, topics in list(clients.items()):
+            if topic in topics and not ws.closed:
+                try:
+                    await ws.send_json(message)
+                except (ConnectionResetError, RuntimeError):
+                    clients.pop(ws, None)
+                    
+    async def _publish_public(self, topic: str, data: Any, message_type: str) -> None:
+        """Push a public topic message"""
+        if not any(topic in topics for topics in self._public_clients.values()):
+            return
+        await self._send(self._public_clients, topic, {
+            "topic": topic, "type": message_type, "ts": self._now_ms(), "data": data
+        })
+        
+    async def _publish_private(self, topic: str, data: List[Dict]) -> None:
+        """Push a private topic message"""
+        if not any(topic in topics for topics in self._private_clients.values()):
+            return
+        await self._send(self._private_clients, topic, {
+            "id": str(uuid.uuid4()), "topic": topic, "creationTime": self._now_ms(), "data": data
+        })
+        
+    async def _publish_order(self, order: Dict) -> None:
+        await self._publish_private("order", [dict(order)])
+        
+    def _book_message(self, topic: str, symbol: str, message_type: str, levels: Dict) -> Dict:
+        update_id = self.book_update_id[symbol]
+        return {
+            "topic": topic,
+            "type": message_type,
+            "ts": self._now_ms(),
+            "data": dict(levels, s=symbol, u=update_id, seq=update_id),
+            "cts": self._now_ms(),
+        }
+        
+    async def _publish_book_delta(self, symbol: str, old_book: Optional[Dict]) -> None:
+        """Push the difference between the old and new synthetic book"""
+        topics = {t for topics in self._public_clients.values() for t in topics
+                  if t.startswith("orderbook.") and t.endswith(f".{symbol}")}
+        if not topics:
+            return
+            
+        self.book_update_id[symbol] += 1
+        new_book = self.books[symbol]
+        for topic in topics:
+            depth = int(topic.split(".")[1])
+            old_levels = self._top_levels(old_book or {"b": {}, "a": {}}, depth)
+            new_levels = self._top_levels(new_book, depth)
+            delta = {}
+            for side in ("b", "a"):
+                changes = [[self._fmt(p), self._fmt(q)] for p, q in new_levels[side].items()
+                           if old_levels[side].get(p) != q]
+                changes += [[self._fmt(p), "0"] for p in old_levels[side] if p not in new_levels[side]]
+                delta[side] = changes
+            await self._send(self._public_clients, topic, self._book_message(topic, symbol, "delta", delta))
+            
+    @staticmethod
+    def _top_levels(book: Dict, depth: int) -> Dict[str, Dict[float, float]]:
+        return {
+            "b": dict(sorted(book["b"].items(), reverse=True)[:depth]),
+            "a": dict(sorted(book["a"].items())[:depth]),
+        }
+        
+    async def _publish_klines(self, symbol: str) -> None:
+        """Push the current (unconfirmed) bar for each subscribed interval"""
+        topics = {t for topics in self._public_clients.values() for t in topics
+                  if t.startswith("kline.") and t.endswith(f".{symbol}")}
+        now = self._now_ms()
+        price = self._fmt(self.prices[symbol])
+        for topic in topics:
+            entry = KLINE_INTERVALS.get(topic.split(".")[1])
+            if entry is None:
+                continue
+            interval_ms = entry[1]
+            start = now - now % interval_ms
+            row = self._synthetic_bar(symbol, interval_ms, start)
+            await self._publish_public(topic, [{
+                "start": start,
+                "end": start + interval_ms - 1,
+                "interval": entry[0],
+                "open": row[1],
+                "close": price,
+                "high": max(row[2], price, key=float),
+                "low": min(row[3], price, key=float),
+                "volume": row[5],
+                "turnover": row[6],
+                "confirm": False,
+                "timestamp": now,
+            }], "snapshot")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline tests for the BybitClient async transport
+
+Runs the client against a local aiohttp server, so no network access
+or API credentials are needed.
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+
+
+def make_client(server: TestServer) -> BybitClient:
+    """Create a client pointed at the local test server"""
+    client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True))
+    client.base_url = str(server.make_url("")).rstrip("/")
+    client.retry_policy.base_delay = 0.01
+    return client
+
+
+class TransportTestCase(unittest.TestCase):
+    """Base class serving a small v5 stand-in app for each test"""
+
+    def setUp(self):
+        self.requests = []
+
+        async def tickers(request):
+            self.requests.append(dict(request.query))
+            return web.json_response({
+                "retCode": 0,
+                "retMsg": "OK",
+                "result": {"list": [{"symbol": request.query.get("symbol"), "lastPrice": "100"}]}
+            })
+
+        async def create(request):
+            body = await request.json()
+            self.requests.append(body)
+            return web.json_response({"retCode": 0, "retMsg": "OK", "result": {"orderId": "1"}})
+
+        async def positions(request):
+            self.requests.append(dict(request.query))
+            await asyncio.sleep(0.02)
+            return web.json_response({"retCode": 0, "retMsg": "OK", "result": {"list": []}})
+
+        async def broken(request):
+            self.requests.append({})
+            return web.Response(status=502, text="bad gateway")
+
+        self.app = web.Application()
+        self.app.router.add_get("/v5/market/tickers", tickers)
+        self.app.router.add_post("/v5/order/create", create)
+        self.app.router.add_get("/v5/broken", broken)
+        self.app.router.add_get("/v5/position/list", positions)
+
+    def run_with_server(self, scenario):
+        async def runner():
+            server = TestServer(self.app)
+            await server.start_server()
+            client = make_client(server)
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+                await server.close()
+        return asyncio.run(runner())
+
+
+class TestAsyncTransport(TransportTestCase):
+    """Tests for the pooled aiohttp transport"""
+
+    def test_concurrent_requests_share_one_session(self):
+        async def scenario(client):
+            results = await asyncio.gather(*[
+                client.get_tickers("linear", f"SYM{i}USDT") for i in range(10)
+            ])
+            return results, client._async_session
+
+        results, session = self.run_with_server(scenario)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r["retCode"] == 0 for r in results))
+        self.assertEqual(len(self.requests), 10)
+        self.assertIsNotNone(session)
+
+    def test_signed_post_sends_json_body(self):
+        async def scenario(client):
+            return await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+
+        result = self.run_with_server(scenario)
+        self.assertEqual(result["result"]["orderId"], "1")
+        body = self.requests[0]
+        self.assertEqual(body["symbol"], "BTCUSDT")
+        self.assertIn("sign", body)
+        self.assertIn("timestamp", body)
+
+    def test_http_errors_are_retried_then_raised(self):
+        async def scenario(client):
+            with self.assertRaises(Exception) as ctx:
+                await client.raw_request("GET", "/v5/broken", {}, auth_required=False)
+            return ctx.exception
+
+        error = self.run_with_server(scenario)
+        self.assertIn("Failed to connect", str(error))
+        self.assertEqual(len(self.requests), 3)
+
+    def test_close_releases_session(self):
+        async def scenario(client):
+            await client.get_tickers("linear", "BTCUSDT")
+            await client.close()
+            return client._async_session
+
+        self.assertIsNone(self.run_with_server(scenario))
+
+
+class TestRequestCoalescing(TransportTestCase):
+    """Tests for single-flight GET coalescing"""
+
+    def test_concurrent_identical_gets_share_one_round_trip(self):
+        async def scenario(client):
+            results = await asyncio.gather(*[client.get_positions() for _ in range(5)])
+            return results, client.coalescer.stats
+
+        results, stats = self.run_with_server(scenario)
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(stats["shared"], 4)
+
+    def test_ttl_reuses_result_until_write(self):
+        async def scenario(client):
+            await client.get_positions()
+            await client.get_positions()
+            await client.place_order({"category": "linear", "symbol": "BTCUSDT", "orderLinkId": "a"})
+            await client.get_positions()
+
+        self.run_with_server(scenario)
+        position_requests = [r for r in self.requests if "settleCoin" in r]
+        self.assertEqual(len(position_requests), 2)
+
+    def test_different_params_are_not_coalesced(self):
+        async def scenario(client):
+            await asyncio.gather(client.get_positions(symbol="BTCUSDT"), client.get_positions(symbol="ETHUSDT"))
+
+        self.run_with_server(scenario)
+        self.assertEqual(len(self.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
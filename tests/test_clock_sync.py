@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline tests for server clock-offset tracking
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.clock_sync import ClockSync
+
+
+def server_time_response(server_ms: float) -> dict:
+    """Build a /v5/server/time response"""
+    return {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": {"timeSecond": str(int(server_ms // 1000)), "timeNano": str(int(server_ms * 1e6))},
+    }
+
+
+class TestClockSync(unittest.TestCase):
+    """Tests for offset estimation"""
+
+    def test_offset_tracks_skewed_server_clock(self):
+        async def fetch():
+            await asyncio.sleep(0.005)
+            return server_time_response(time.time() * 1000 + 3000)
+
+        async def scenario():
+            clock = ClockSync(fetch, samples=3)
+            self.assertTrue(await clock.sync())
+            return clock
+
+        clock = asyncio.run(scenario())
+        self.assertAlmostEqual(clock.now_ms() - time.time() * 1000, 3000, delta=50)
+        stats = clock.get_stats()
+        self.assertAlmostEqual(stats["skew_ms"], 3000, delta=50)
+        self.assertGreater(stats["rtt_ms"], 0)
+        self.assertEqual(stats["syncs"], 1)
+
+    def test_failed_sync_keeps_previous_estimate(self):
+        async def fetch():
+            raise RuntimeError("down")
+
+        async def scenario():
+            clock = ClockSync(fetch, samples=2)
+            before = clock.now_ms()
+            self.assertFalse(await clock.sync())
+            return clock, before
+
+        clock, before = asyncio.run(scenario())
+        self.assertFalse(clock.synced)
+        self.assertEqual(clock.stats["failures"], 1)
+        self.assertAlmostEqual(clock.now_ms(), before, delta=50)
+
+    def test_background_task_resyncs(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return server_time_response(time.time() * 1000)
+
+        async def scenario(interval):
+            clock = ClockSync(fetch, interval=interval, samples=1)
+            clock.start()
+            await asyncio.sleep(0.05)
+            await clock.stop()
+
+        # The first background sync waits one interval
+        asyncio.run(scenario(1.0))
+        self.assertEqual(calls, [])
+
+        asyncio.run(scenario(0.01))
+        self.assertGreater(len(calls), 1)
+
+
+class TestClientTimestamps(unittest.TestCase):
+    """Tests for signing with the corrected clock"""
+
+    def setUp(self):
+        self.skew_ms = 10000
+        self.orders = []
+
+        async def server_time(request):
+            return web.json_response(server_time_response(time.time() * 1000 + self.skew_ms))
+
+        async def create(request):
+            body = await request.json()
+            self.orders.append(body)
+            server_ms = time.time() * 1000 + self.skew_ms
+            if abs(int(body["timestamp"]) - server_ms) > int(body["recv_window"]):
+                return web.json_response({"retCode": 10002, "retMsg": "invalid request, please check your server timestamp"})
+            return web.json_response({"retCode": 0, "retMsg": "OK", "result": {"orderId": "1"}})
+
+        self.app = web.Application()
+        self.app.router.add_get("/v5/server/time", server_time)
+        self.app.router.add_post("/v5/order/create", create)
+
+    def run_with_server(self, scenario):
+        async def runner():
+            server = TestServer(self.app)
+            await server.start_server()
+            client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                 recv_window=2000)
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+                await server.close()
+        return asyncio.run(runner())
+
+    def test_timestamp_reject_resyncs_and_retries_once(self):
+        async def scenario(client):
+            return await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+
+        result = self.run_with_server(scenario)
+        self.assertEqual(result["retCode"], 0)
+        self.assertEqual(len(self.orders), 2)
+        self.assertEqual(self.orders[1]["recv_window"], "2000")
+
+    def test_synced_client_signs_with_server_time(self):
+        async def scenario(client):
+            await client.start_clock_sync()
+            result = await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+            return result, client.get_transport_metrics()["clock"]
+
+        result, clock_stats = self.run_with_server(scenario)
+        self.assertEqual(result["retCode"], 0)
+        self.assertEqual(len(self.orders), 1)
+        self.assertAlmostEqual(clock_stats["skew_ms"], self.skew_ms, delta=100)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
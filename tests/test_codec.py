@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline tests for the JSON codec and signing helpers
+"""
+
+import os
+import sys
+import hmac
+import json
+import asyncio
+import hashlib
+import unittest
+from unittest import mock
+
+import numpy as np
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core import codec
+from pybit_bot.core.client import BybitClient, APICredentials
+
+
+KLINE_PAGE = {
+    "retCode": 0,
+    "retMsg": "OK",
+    "result": {
+        "symbol": "BTCUSDT",
+        "category": "linear",
+        "list": [
+            ["1700000120000", "101", "103", "100", "102", "5", "510"],
+            ["1700000060000", "100", "102", "99", "101", "4", "404"],
+            ["1700000000000", "99", "101", "98", "100", "3", "300"],
+        ],
+    },
+    "time": 1700000130000,
+}
+
+
+class TestCodec(unittest.TestCase):
+    """Tests for encoding, decoding and signing"""
+
+    def test_param_string_is_sorted_and_joined(self):
+        params = {"symbol": "BTCUSDT", "category": "linear", "limit": 5}
+        self.assertEqual(codec.build_param_string(params), "category=linear&limit=5&symbol=BTCUSDT")
+        self.assertEqual(codec.build_param_string({}), "")
+
+    def test_signer_matches_plain_hmac(self):
+        signer = codec.HmacSigner("secret")
+        for payload in ("a=1", "category=linear&symbol=BTCUSDT", ""):
+            expected = hmac.new(b"secret", payload.encode(), hashlib.sha256).hexdigest()
+            self.assertEqual(signer.sign(payload), expected)
+
+    def test_round_trip_from_bytes(self):
+        obj = {"category": "linear", "qty": "0.01", "request": [{"orderLinkId": "a"}]}
+        encoded = codec.dumps(obj)
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(codec.loads(encoded.encode()), obj)
+
+    def test_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html>bad gateway</html>")
+
+    def test_stdlib_fallback(self):
+        with mock.patch.object(codec, "orjson", None), mock.patch.object(codec, "msgspec", None):
+            self.assertEqual(codec.loads(codec.dumps({"a": 1})), {"a": 1})
+            response = codec.decode_klines_response(json.dumps(KLINE_PAGE).encode())
+        self.assertEqual(response["result"]["list"].shape, (3, 7))
+
+    def test_kline_page_decodes_to_ascending_array(self):
+        response = codec.decode_klines_response(json.dumps(KLINE_PAGE).encode())
+        array = response["result"]["list"]
+        self.assertEqual(array.dtype, np.float64)
+        self.assertEqual(array.shape, (3, 7))
+        self.assertTrue(np.all(np.diff(array[:, 0]) > 0))
+        self.assertEqual(array[-1, 4], 102.0)
+
+    def test_empty_kline_page(self):
+        array = codec.klines_to_array([])
+        self.assertEqual(array.shape, (0, len(codec.KLINE_COLUMNS)))
+
+
+class TestKlineArrayRequest(unittest.TestCase):
+    """Tests for BybitClient.get_klines_array"""
+
+    def test_get_klines_array(self):
+        async def kline(request):
+            self.assertEqual(request.query["interval"], "1")
+            return web.json_response(KLINE_PAGE)
+
+        app = web.Application()
+        app.router.add_get("/v5/market/kline", kline)
+
+        async def runner():
+            server = TestServer(app)
+            await server.start_server()
+            client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True))
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                array = await client.get_klines_array("linear", "BTCUSDT", "1", limit=3)
+                response = await client.get_klines("linear", "BTCUSDT", "1", limit=3)
+                return array, response
+            finally:
+                await client.close()
+                await server.close()
+
+        array, response = asyncio.run(runner())
+        self.assertEqual(array.shape, (3, 7))
+        self.assertEqual(array[0, 0], 1700000000000.0)
+        # Plain requests are not affected by the array decoder
+        self.assertIsInstance(response["result"]["list"], list)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for market data events and event-driven strategy evaluation
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.event_bus import EventBus, EventType, MarketEvent
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.managers.strategy_manager import StrategyManager
+from pybit_bot.testing import MockBybitExchange
+
+
+def drain(subscription):
+    """All queued events"""
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def kline_message(start, close, confirm=False):
+    """A 1m kline topic message for one bar"""
+    bar = {"start": start, "end": start + 59_999, "interval": "1", "open": "100", "high": str(max(close, 100.0)),
+           "low": str(min(close, 100.0)), "close": str(close), "volume": "1", "turnover": "100",
+           "confirm": confirm}
+    return {"topic": "kline.1.BTCUSDT", "type": "snapshot", "data": [bar]}
+
+
+class TestEventBus(unittest.TestCase):
+    """Tests for EventBus"""
+
+    def test_filters_and_drops_oldest(self):
+        bus = EventBus()
+        closed = bus.subscribe({EventType.BAR_CLOSED}, symbols={"BTCUSDT"}, maxsize=2)
+        everything = bus.subscribe(EventType)
+
+        for i in range(3):
+            bus.publish(MarketEvent(EventType.BAR_CLOSED, "BTCUSDT", "1m", i * 60_000))
+        bus.publish(MarketEvent(EventType.BAR_CLOSED, "ETHUSDT", "1m", 0))
+        bus.publish(MarketEvent(EventType.TICKER, "BTCUSDT"))
+
+        self.assertEqual([event.timestamp for event in drain(closed)], [60_000, 120_000])
+        self.assertEqual(closed.dropped, 1)
+        self.assertEqual(len(drain(everything)), 5)
+
+        closed.close()
+        self.assertEqual(bus.publish(MarketEvent(EventType.BAR_CLOSED, "BTCUSDT", "1m", 0)), 1)
+        everything.close()
+        self.assertFalse(bus.has_subscribers(EventType.BAR_CLOSED))
+
+
+class TestMarketEvents(unittest.TestCase):
+    """Tests for events published by DataManager"""
+
+    def test_bar_closed_once_per_bar(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {
+                    "general": {"data": {"lookback_bars": {"1m": 300, "5m": 50}}},
+                    "strategy": {"enabled_strategies": ["strategy_b"],
+                                 "strategies": {"strategy_b": {"sma_timeframe": "1m"}}}
+                }
+                config["general"]["trading"] = {"symbols": ["BTCUSDT"], "timeframes": ["1m", "5m"]}
+                try:
+                    manager = DataManager(client=client, config=config)
+                    manager.subscribe_klines("BTCUSDT", "1m")
+                    manager.subscribe_klines("BTCUSDT", "5m")
+                    await manager.load_initial_data()
+                    strategies = StrategyManager(manager, config)
+
+                    bars = manager.events.subscribe({EventType.BAR_CLOSED, EventType.BAR_UPDATED})
+                    current = manager.klines["BTCUSDT"]["1m"].last_timestamp
+
+                    # Updates to the forming bar do not close it
+                    manager._handle_ws_message(kline_message(current, 101.0))
+                    updates = drain(bars)
+
+                    # Four new bars, the last one confirmed, then one more
+                    for i in range(1, 5):
+                        manager._handle_ws_message(kline_message(current + i * 60_000, 101.0 + i))
+                    manager._handle_ws_message(kline_message(current + 4 * 60_000, 105.0, confirm=True))
+                    manager._handle_ws_message(kline_message(current + 5 * 60_000, 106.0))
+                    closes = [event for event in drain(bars) if event.type == EventType.BAR_CLOSED]
+
+                    evaluated = []
+                    for event in closes:
+                        for strategy in strategies.strategies_for_event(event):
+                            evaluated.append((event.timeframe, strategy.__class__.__name__))
+                    signals = [await strategies.evaluate("BTCUSDT", strategies=strategies.strategies["BTCUSDT"])
+                               for _ in range(2)]
+                    return current, updates, closes, evaluated, signals
+                finally:
+                    await client.close()
+
+        current, updates, closes, evaluated, signals = asyncio.run(scenario())
+        self.assertEqual([(event.type, event.timeframe) for event in updates],
+                         [(EventType.BAR_UPDATED, "1m"), (EventType.BAR_UPDATED, "5m")])
+        self.assertEqual(updates[0].data["close"], 101.0)
+
+        one_minute = [event for event in closes if event.timeframe == "1m"]
+        self.assertEqual([event.timestamp for event in one_minute], [current + i * 60_000 for i in range(5)])
+        self.assertEqual(one_minute[-1].data["close"], 105.0)
+        # Exactly one 5m window ended within the five minutes
+        five_minute = [event for event in closes if event.timeframe == "5m"]
+        self.assertEqual(len(five_minute), 1)
+        self.assertEqual(five_minute[0].timestamp % 300_000, 0)
+
+        # StrategyB only runs on closed 1m bars and no longer dedupes by minute
+        self.assertEqual(evaluated, [("1m", "StrategyB")] * 5)
+        self.assertEqual([len(batch) for batch in signals], [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
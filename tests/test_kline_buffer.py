@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the columnar kline ring buffer
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.kline_buffer import KlineBuffer
+
+
+def bars(start, count, close=100.0):
+    """Rows of 1m bars starting at bar `start`"""
+    rows = np.zeros((count, 7))
+    rows[:, 0] = (start + np.arange(count)) * 60_000
+    rows[:, 1:5] = close + np.arange(count)[:, None]
+    rows[:, 5] = 1.0
+    return rows
+
+
+class TestKlineBuffer(unittest.TestCase):
+    """Tests for KlineBuffer"""
+
+    def test_wraps_with_contiguous_views(self):
+        buffer = KlineBuffer(capacity=5)
+        buffer.extend(bars(0, 3))
+        for i in range(3, 12):
+            buffer.upsert(bars(i, 1, close=100.0 + i)[0])
+
+        self.assertEqual(len(buffer), 5)
+        closes = buffer.column("close")
+        self.assertTrue(closes.flags.c_contiguous)
+        self.assertFalse(closes.flags.writeable)
+        self.assertEqual(closes.tolist(), [107.0, 108.0, 109.0, 110.0, 111.0])
+        self.assertEqual(buffer.last_timestamp, 11 * 60_000)
+        self.assertEqual(buffer.column("timestamp", 2).tolist(), [600_000.0, 660_000.0])
+        # Views share memory with the buffer
+        self.assertTrue(np.shares_memory(closes, buffer._data))
+
+    def test_updates_forming_bar_in_place(self):
+        buffer = KlineBuffer(capacity=4)
+        buffer.extend(bars(0, 4))
+        forming = bars(3, 1, close=200.0)[0]
+        buffer.upsert(forming)
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.column("close")[-1], 200.0)
+
+        # Overlapping page: last cached bar is replaced, newer ones appended
+        buffer.extend(bars(3, 3, close=300.0))
+        self.assertEqual(buffer.column("timestamp").tolist(), [i * 60_000.0 for i in range(2, 6)])
+        self.assertEqual(buffer.column("close").tolist(), [102.0, 300.0, 301.0, 302.0])
+
+    def test_merges_older_bars(self):
+        buffer = KlineBuffer(capacity=6)
+        buffer.extend(bars(4, 3))
+        buffer.extend(bars(1, 4, close=50.0))
+
+        self.assertEqual(buffer.column("timestamp").tolist(), [i * 60_000.0 for i in range(1, 7)])
+        # Newer data wins on overlap
+        self.assertEqual(buffer.column("close").tolist(), [50.0, 51.0, 52.0, 53.0, 101.0, 102.0])
+
+    def test_dataframe_is_cached_until_write(self):
+        buffer = KlineBuffer(capacity=3)
+        buffer.extend(bars(0, 5))
+        df = buffer.to_dataframe()
+
+        self.assertIs(buffer.to_dataframe(), df)
+        self.assertEqual(df.index.tolist(), [120_000, 180_000, 240_000])
+        self.assertEqual(list(df.columns), ["open", "high", "low", "close", "volume", "turnover"])
+
+        buffer.upsert(bars(5, 1)[0])
+        self.assertIsNot(buffer.to_dataframe(), df)
+        # The old frame is a copy, not a view of the ring
+        self.assertEqual(df["close"].tolist(), [102.0, 103.0, 104.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
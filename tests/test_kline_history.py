@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for DataManager's historical kline loading
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.kline_cache import KlineCache
+from pybit_bot.core.kline_aggregator import aggregate_klines, can_aggregate
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+
+class TestKlineWarmup(unittest.TestCase):
+    """Tests for the initial deep kline load"""
+
+    def run_manager(self, scenario, config=None, latency=0.0):
+        async def runner():
+            async with MockBybitExchange(seed=1, latency=latency) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                manager = DataManager(client=client, config=config or {})
+                try:
+                    return await scenario(manager, exchange)
+                finally:
+                    await client.close()
+        return asyncio.run(runner())
+
+    def test_loads_lookback_beyond_api_cap(self):
+        config = {"general": {"data": {"lookback_bars": {"1m": 2500, "5m": 300}}}}
+
+        async def scenario(manager, exchange):
+            for symbol in ("BTCUSDT", "ETHUSDT"):
+                manager.subscribe_klines(symbol, "1m")
+                manager.subscribe_klines(symbol, "5m")
+            self.assertTrue(await manager.load_initial_data())
+            return manager, exchange._now_ms(), exchange.get_stats()["requests"]["/v5/market/kline"]
+
+        manager, now, kline_requests = self.run_manager(scenario, config)
+        for symbol in ("BTCUSDT", "ETHUSDT"):
+            buffer = manager.klines[symbol]["1m"]
+            self.assertEqual(len(buffer), 2500)
+            self.assertTrue(np.all(np.diff(buffer.column("timestamp")) == 60_000))
+            self.assertEqual(buffer.last_timestamp, now - now % 60_000)
+            self.assertEqual(len(manager.get_klines(symbol, "5m")), 300)
+        # Three pages per 1m series, one per 5m series
+        self.assertEqual(kline_requests, 2 * 3 + 2 * 1)
+
+    def test_series_load_concurrently(self):
+        config = {"general": {"data": {"lookback_bars": {"1m": 3000}}}}
+
+        async def scenario(manager, exchange):
+            for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+                manager.subscribe_klines(symbol, "1m")
+                manager.subscribe_orderbook(symbol)
+            started = time.monotonic()
+            await manager.load_initial_data()
+            return manager, time.monotonic() - started
+
+        # Nine pages and three orderbooks of 100 ms each; sequential loading would take 1.2 s
+        manager, elapsed = self.run_manager(scenario, config, latency=0.1)
+        self.assertLess(elapsed, 0.6)
+        self.assertTrue(all(manager.orderbooks[symbol].best_bid for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT")))
+
+
+def bars(start, count):
+    """Rows of 1m bars starting at bar `start`"""
+    rows = np.zeros((count, 7))
+    rows[:, 0] = (start + np.arange(count)) * 60_000
+    rows[:, 1:] = 100.0 + np.arange(count)[:, None]
+    return rows
+
+
+class TestKlineCache(unittest.TestCase):
+    """Tests for the on-disk kline cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_appends_and_reloads(self):
+        cache = KlineCache(self.tmp.name)
+        self.assertEqual(cache.append("BTCUSDT", "1m", bars(0, 5), max_bars=10), 5)
+        # Only bars after the last cached one are written
+        self.assertEqual(cache.append("BTCUSDT", "1m", bars(3, 4), max_bars=10), 2)
+
+        rows = KlineCache(self.tmp.name).load("BTCUSDT", "1m")
+        self.assertEqual(rows[:, 0].tolist(), [i * 60_000.0 for i in range(7)])
+        self.assertEqual(KlineCache(self.tmp.name).load("BTCUSDT", "1m", max_bars=3)[0, 0], 4 * 60_000.0)
+
+    def test_drops_partial_and_invalid_rows(self):
+        cache = KlineCache(self.tmp.name)
+        cache.append("BTCUSDT", "1m", bars(0, 6), max_bars=10)
+        path = cache.path("BTCUSDT", "1m")
+
+        # Corrupt the fifth row's timestamp and leave half a row at the end
+        with open(path, "r+b") as f:
+            f.seek(16 + 4 * 56)
+            f.write(np.float64(123.0).tobytes())
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 20)
+
+        cache = KlineCache(self.tmp.name)
+        rows = cache.load("BTCUSDT", "1m")
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(cache.stats["repaired"], 2)
+        self.assertEqual(os.path.getsize(path), 16 + 4 * 56)
+        # Appending continues from the repaired tail
+        self.assertEqual(cache.append("BTCUSDT", "1m", bars(4, 2), max_bars=10), 2)
+        self.assertEqual(len(KlineCache(self.tmp.name).load("BTCUSDT", "1m")), 6)
+
+    def test_compacts_to_max_bars(self):
+        cache = KlineCache(self.tmp.name, compact_factor=2.0)
+        for start in range(0, 25, 5):
+            cache.append("BTCUSDT", "1m", bars(start, 5), max_bars=10)
+
+        self.assertGreaterEqual(cache.stats["compactions"], 1)
+        rows = KlineCache(self.tmp.name).load("BTCUSDT", "1m")
+        self.assertLessEqual(len(rows), 20)
+        self.assertEqual(rows[-1, 0], 24 * 60_000.0)
+        self.assertTrue(np.all(np.diff(rows[:, 0]) == 60_000))
+
+    def test_compaction_after_file_removed(self):
+        cache = KlineCache(self.tmp.name, compact_factor=2.0)
+        cache.append("BTCUSDT", "1m", bars(0, 15), max_bars=10)
+        os.remove(cache.path("BTCUSDT", "1m"))
+
+        # Would compact, but there is no file left to merge with
+        self.assertEqual(cache.append("BTCUSDT", "1m", bars(15, 12), max_bars=10), 12)
+        rows = KlineCache(self.tmp.name).load("BTCUSDT", "1m")
+        self.assertEqual(rows[:, 0].tolist(), [i * 60_000.0 for i in range(17, 27)])
+        self.assertEqual(cache.last_timestamp("BTCUSDT", "1m"), 26 * 60_000)
+        self.assertEqual(cache.stats["compactions"], 0)
+
+    def test_restart_fetches_only_the_delta(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {"general": {"data": {"lookback_bars": {"1m": 2500}, "kline_cache_dir": self.tmp.name}}}
+                try:
+                    first = DataManager(client=client, config=config)
+                    first.subscribe_klines("BTCUSDT", "1m")
+                    await first.load_initial_data()
+                    cold = exchange.get_stats()["requests"]["/v5/market/kline"]
+
+                    second = DataManager(client=client, config=config)
+                    second.subscribe_klines("BTCUSDT", "1m")
+                    await second.load_initial_data()
+                    warm = exchange.get_stats()["requests"]["/v5/market/kline"] - cold
+                    return first, second, cold, warm
+                finally:
+                    await client.close()
+
+        first, second, cold, warm = asyncio.run(scenario())
+        self.assertEqual(cold, 3)
+        self.assertEqual(warm, 1)
+        # Closed bars match the cold load
+        cold_df = first.get_klines("BTCUSDT", "1m").iloc[:-1]
+        warm_df = second.get_klines("BTCUSDT", "1m")
+        self.assertEqual(len(warm_df), 2500)
+        np.testing.assert_array_equal(warm_df.loc[cold_df.index].values, cold_df.values)
+
+
+class TestTimeframeAggregation(unittest.TestCase):
+    """Tests for higher timeframes built from the base stream"""
+
+    def test_aggregate_klines(self):
+        rows = bars(3, 9)
+        rows[:, 2] += np.array([0, 5, 0, 0, 0, 0, 0, 9, 0])
+        rows[:, 3] -= 1.0
+        five_minute = aggregate_klines(rows, 5 * 60_000)
+
+        self.assertEqual(five_minute[:, 0].tolist(), [0.0, 300_000.0, 600_000.0])
+        # Bars 3-4, 5-9 and 10-11
+        self.assertEqual(five_minute[:, 1].tolist(), [100.0, 102.0, 107.0])
+        self.assertEqual(five_minute[:, 2].tolist(), [106.0, 106.0, 116.0])
+        self.assertEqual(five_minute[:, 3].tolist(), [99.0, 101.0, 106.0])
+        self.assertEqual(five_minute[:, 4].tolist(), [101.0, 106.0, 108.0])
+        self.assertEqual(five_minute[:, 5].tolist(), [201.0, 520.0, 215.0])
+        self.assertTrue(can_aggregate("1m", "4h"))
+        self.assertFalse(can_aggregate("5m", "1m"))
+        self.assertFalse(can_aggregate("1m", "1w"))
+
+    def test_streams_only_the_base_timeframe(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {"general": {"system": {"ws_public_url": exchange.public_ws_url},
+                                      "data": {"lookback_bars": {"1m": 300, "5m": 50, "1h": 10}}}}
+                manager = DataManager(client=client, config=config)
+                for timeframe in ("5m", "1m", "1h"):
+                    manager.subscribe_klines("BTCUSDT", timeframe)
+                await manager.load_initial_data()
+                await manager.start_websocket()
+                try:
+                    await wait_for(lambda: any("kline.1.BTCUSDT" in topics for topics in exchange._public_clients.values()))
+                    await exchange.set_price("BTCUSDT", 70000.0)
+                    await wait_for(lambda: manager.klines["BTCUSDT"]["5m"].column("close")[-1] == 70000.0)
+                    return manager, sorted(manager._ws_topics)
+                finally:
+                    await manager.stop_websocket()
+                    await client.close()
+
+        manager, topics = asyncio.run(scenario())
+        self.assertEqual(topics, ["kline.1.BTCUSDT"])
+        base = manager.klines["BTCUSDT"]["1m"]
+        for timeframe, interval_ms in (("5m", 300_000), ("1h", 3_600_000)):
+            derived = manager.klines["BTCUSDT"][timeframe]
+            self.assertEqual(derived.last_timestamp, base.last_timestamp - base.last_timestamp % interval_ms)
+            self.assertEqual(derived.column("close")[-1], 70000.0)
+            self.assertGreaterEqual(derived.column("high")[-1], 70000.0)
+        # The forming 5m bar is the aggregate of its 1m bars
+        last_window = base.view()[:, base.column("timestamp") >= manager.klines["BTCUSDT"]["5m"].last_timestamp].T
+        np.testing.assert_array_equal(manager.klines["BTCUSDT"]["5m"].view(1)[:, 0],
+                                      aggregate_klines(last_window, 300_000)[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for DataManager's REST market data refresh
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.freshness import FreshnessTracker
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.testing import MockBybitExchange
+
+PRICES = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "SOLUSDT": 100.0, "XRPUSDT": 0.5, "DOGEUSDT": 0.1}
+SYMBOLS = sorted(PRICES)
+
+
+def run_manager(scenario, config=None, latency=0.0):
+    """Run scenario(manager, exchange) with tickers and books subscribed for SYMBOLS"""
+    async def runner():
+        async with MockBybitExchange(seed=1, latency=latency, symbols=PRICES) as exchange:
+            client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                 base_url=exchange.base_url)
+            manager = DataManager(client=client, config=config or {})
+            for symbol in SYMBOLS:
+                manager.subscribe_ticker(symbol)
+                manager.subscribe_orderbook(symbol)
+            try:
+                return await scenario(manager, exchange)
+            finally:
+                await client.close()
+    return asyncio.run(runner())
+
+
+class TestMarketDataRefresh(unittest.TestCase):
+    """Tests for update_market_data() without a stream"""
+
+    def test_refreshes_symbols_concurrently(self):
+        async def scenario(manager, exchange):
+            started = time.monotonic()
+            success = await manager.update_market_data()
+            return success, time.monotonic() - started, manager
+
+        # Ten requests of 100 ms each; one after another would take 1 s
+        success, elapsed, manager = run_manager(scenario, latency=0.1)
+        self.assertTrue(success)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(sorted(manager.tickers), sorted(SYMBOLS))
+        self.assertTrue(all(manager.orderbooks[symbol].synced for symbol in SYMBOLS))
+
+    def test_failures_are_isolated(self):
+        async def scenario(manager, exchange):
+            exchange.inject_error("/v5/market/orderbook", ret_code=10001)
+            success = await manager.update_market_data()
+            return success, manager
+
+        success, manager = run_manager(scenario)
+        self.assertFalse(success)
+        self.assertEqual(manager.refresh_stats["failed"], 1)
+        self.assertEqual(sorted(manager.tickers), sorted(SYMBOLS))
+        self.assertEqual(sum(1 for book in manager.orderbooks.values() if book.synced), len(SYMBOLS) - 1)
+
+    def test_skips_results_after_deadline(self):
+        config = {"general": {"data": {"refresh_deadline": 0.1}}}
+
+        async def scenario(manager, exchange):
+            started = time.monotonic()
+            success = await manager.update_market_data()
+            elapsed = time.monotonic() - started
+            # Let the abandoned requests finish before the client closes
+            await asyncio.sleep(0.5)
+            return success, elapsed, manager
+
+        success, elapsed, manager = run_manager(scenario, config, latency=0.5)
+        self.assertFalse(success)
+        self.assertLess(elapsed, 0.4)
+        # One bulk ticker request and one order book request per symbol
+        self.assertEqual(manager.refresh_stats["skipped"], 1 + len(SYMBOLS))
+        self.assertFalse(any(manager.tickers.values()))
+
+    def test_bulk_ticker_request(self):
+        async def scenario(manager, exchange):
+            await manager.update_market_data()
+            bulk = exchange.get_stats()["requests"]["/v5/market/tickers"]
+            manager.bulk_tickers = False
+            await manager.update_market_data()
+            return manager, bulk, exchange.get_stats()["requests"]["/v5/market/tickers"] - bulk
+
+        manager, bulk, per_symbol = run_manager(scenario)
+        self.assertEqual(bulk, 1)
+        self.assertEqual(per_symbol, len(SYMBOLS))
+        for symbol in SYMBOLS:
+            self.assertEqual(manager.tickers[symbol]["symbol"], symbol)
+            self.assertEqual(float(manager.tickers[symbol]["lastPrice"]), PRICES[symbol])
+
+
+class TestFreshness(unittest.TestCase):
+    """Tests for staleness tracking"""
+
+    def test_tracker_ages_and_lag(self):
+        tracker = FreshnessTracker(sla={"ticker": 0.05}, clock=lambda: 10_250)
+        tracker.record("ticker", "BTCUSDT", 10_000)
+        tracker.set_sla("kline", "BTCUSDT 1m", 0.5)
+        tracker.record("kline", "BTCUSDT 1m")
+
+        self.assertFalse(tracker.is_stale("ticker", "BTCUSDT"))
+        self.assertTrue(tracker.is_stale("ticker", "ETHUSDT"))
+        time.sleep(0.1)
+        self.assertTrue(tracker.is_stale("ticker", "BTCUSDT"))
+        self.assertFalse(tracker.is_stale("kline", "BTCUSDT 1m"))
+
+        report = tracker.report()
+        self.assertEqual(report["stale"], 1)
+        self.assertEqual(report["types"]["ticker"]["stale"], ["BTCUSDT"])
+        self.assertEqual(report["types"]["ticker"]["streams"]["BTCUSDT"]["lag_ms"], 250)
+        self.assertEqual(report["types"]["ticker"]["lag"]["max_ms"], 250)
+        self.assertIsNone(report["types"]["kline"]["streams"]["BTCUSDT 1m"]["lag_ms"])
+
+    def test_stale_prices_are_not_used(self):
+        config = {"general": {"data": {"freshness_sla": {"ticker": 0.2, "orderbook": 0.2}}}}
+
+        async def scenario(manager, exchange):
+            await manager.update_market_data()
+            fresh = (manager.get_market_price("BTCUSDT"), manager.get_orderbook("BTCUSDT")["stale"])
+            await asyncio.sleep(0.3)
+            stale = (manager.get_market_price("BTCUSDT"), manager.get_orderbook("BTCUSDT")["stale"],
+                     manager.get_ticker("BTCUSDT", allow_stale=False))
+            return manager, fresh, stale
+
+        manager, fresh, stale = run_manager(scenario, config)
+        self.assertEqual(fresh, (50000.0, False))
+        self.assertEqual(stale, (0, True, {}))
+        self.assertEqual(manager.get_market_price("BTCUSDT", allow_stale=True), 50000.0)
+        self.assertTrue(manager.is_stale("ticker", "BTCUSDT"))
+        self.assertEqual(manager.get_freshness_report()["stale"], 2 * len(SYMBOLS))
+
+
+if __name__ == '__main__':
+    unittest.main()
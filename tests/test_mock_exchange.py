@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the local mock Bybit exchange, driven through BybitClient
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import aiohttp
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.retry_policy import RetryPolicy
+from pybit_bot.testing import MockBybitExchange
+
+
+class MockExchangeTestCase(unittest.TestCase):
+    """Runs each scenario against a fresh exchange and client"""
+
+    exchange_options = {}
+
+    def run_scenario(self, scenario):
+        async def runner():
+            async with MockBybitExchange(seed=1, **self.exchange_options) as exchange:
+                client = BybitClient(
+                    APICredentials(api_key="key", api_secret="secret", testnet=True),
+                    retry_policy=RetryPolicy(base_delay=0.01),
+                    base_url=exchange.base_url
+                )
+                try:
+                    return await scenario(client, exchange)
+                finally:
+                    await client.close()
+        return asyncio.run(runner())
+
+
+class TestMarketData(MockExchangeTestCase):
+    """Tests for market data endpoints"""
+
+    def test_tickers_and_orderbook(self):
+        async def scenario(client, exchange):
+            ticker = await client.get_tickers("linear", "BTCUSDT")
+            book = await client.get_orderbook("linear", "BTCUSDT", limit=5)
+            return ticker, book
+
+        ticker, book = self.run_scenario(scenario)
+        self.assertEqual(ticker["result"]["list"][0]["lastPrice"], "50000")
+        self.assertEqual(len(book["result"]["b"]), 5)
+        self.assertLess(float(book["result"]["b"][0][0]), float(book["result"]["a"][0][0]))
+
+    def test_klines_are_deterministic(self):
+        async def scenario(client, exchange):
+            end = 1_700_000_000_000
+            first = await client.get_klines_array("linear", "BTCUSDT", "1m", limit=10, end=end)
+            second = await client.get_klines_array("linear", "BTCUSDT", "1m", limit=10, end=end)
+            return first, second
+
+        first, second = self.run_scenario(scenario)
+        self.assertEqual(first.shape, (10, 7))
+        self.assertTrue((first == second).all())
+
+    def test_unknown_symbol_is_rejected(self):
+        async def scenario(client, exchange):
+            return await client.get_tickers("linear", "NOPEUSDT")
+
+        self.assertEqual(self.run_scenario(scenario)["retCode"], 10001)
+
+
+class TestMatchingEngine(MockExchangeTestCase):
+    """Tests for order entry and the matching engine"""
+
+    def test_market_order_opens_position(self):
+        async def scenario(client, exchange):
+            await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                      "orderType": "Market", "qty": "0.01"})
+            return await client.get_positions(symbol="BTCUSDT")
+
+        position = self.run_scenario(scenario)["result"]["list"][0]
+        self.assertEqual(position["side"], "Buy")
+        self.assertEqual(position["size"], "0.01")
+
+    def test_limit_order_rests_until_price_crosses(self):
+        async def scenario(client, exchange):
+            ack = await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                            "orderType": "Limit", "qty": "0.01", "price": "49900"})
+            resting = await client.get_open_orders(symbol="BTCUSDT")
+            by_coin = await client.get_open_orders(settle_coin="USDT")
+            unscoped = await client.get_open_orders()
+            await exchange.set_price("BTCUSDT", 49850.0)
+            history = await client.get_order_history(symbol="BTCUSDT", order_id=ack["result"]["orderId"])
+            return resting, by_coin, unscoped, history
+
+        resting, by_coin, unscoped, history = self.run_scenario(scenario)
+        self.assertEqual(len(resting["result"]["list"]), 1)
+        self.assertEqual(by_coin["result"]["list"], resting["result"]["list"])
+        # Linear queries need a symbol or coin, as on Bybit
+        self.assertEqual(unscoped["retCode"], 10001)
+        order = history["result"]["list"][0]
+        self.assertEqual(order["orderStatus"], "Filled")
+        self.assertEqual(order["avgPrice"], "49900")
+
+    def test_duplicate_order_link_id_is_rejected(self):
+        async def scenario(client, exchange):
+            params = {"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                      "orderType": "Market", "qty": "0.01", "orderLinkId": "dup"}
+            await client.place_order(dict(params))
+            return await client.place_order(dict(params))
+
+        self.assertEqual(self.run_scenario(scenario)["retCode"], 110072)
+
+    def test_stop_loss_closes_position(self):
+        async def scenario(client, exchange):
+            await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                      "orderType": "Market", "qty": "0.01"})
+            await client.set_trading_stop({"category": "linear", "symbol": "BTCUSDT", "stopLoss": "49000"})
+            await exchange.set_price("BTCUSDT", 48900.0)
+            positions = await client.get_positions(symbol="BTCUSDT")
+            executions = [e async for e in client.iter_executions(symbol="BTCUSDT")]
+            return positions, executions
+
+        positions, executions = self.run_scenario(scenario)
+        self.assertEqual(positions["result"]["list"][0]["size"], "0")
+        self.assertEqual(len(executions), 2)
+
+    def test_batch_create_reports_per_item_results(self):
+        async def scenario(client, exchange):
+            return await client.place_batch_order("linear", [
+                {"symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "qty": "0.01", "price": "45000", "orderLinkId": "a"},
+                {"symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "qty": "0", "price": "45000", "orderLinkId": "b"},
+            ])
+
+        response = self.run_scenario(scenario)
+        codes = [info["code"] for info in response["retExtInfo"]["list"]]
+        self.assertEqual(codes, [0, 10001])
+
+
+class TestFaultInjection(MockExchangeTestCase):
+    """Tests for latency, injected errors and rate limits"""
+
+    exchange_options = {"rate_limits": {"order": 2}}
+
+    def test_injected_error_is_retried(self):
+        async def scenario(client, exchange):
+            exchange.inject_error("/v5/market/tickers", status=502)
+            result = await client.get_tickers("linear", "BTCUSDT")
+            return result, exchange.get_stats()
+
+        result, stats = self.run_scenario(scenario)
+        self.assertEqual(result["retCode"], 0)
+        self.assertEqual(stats["errors_injected"], 1)
+        self.assertEqual(stats["requests"]["/v5/market/tickers"], 2)
+
+    def test_rate_limit_headers_and_rejection(self):
+        async def scenario(client, exchange):
+            async with aiohttp.ClientSession() as session:
+                statuses = []
+                for i in range(3):
+                    params = {"api_key": "key", "sign": "x", "symbol": "BTCUSDT", "side": "Buy",
+                              "orderType": "Market", "qty": "0.01", "orderLinkId": f"rl-{i}"}
+                    async with session.post(f"{exchange.base_url}/v5/order/create", json=params) as response:
+                        body = await response.json()
+                        statuses.append((body["retCode"], response.headers.get("X-Bapi-Limit-Status")))
+                return statuses
+
+        statuses = self.run_scenario(scenario)
+        self.assertEqual(statuses[0], (0, "1"))
+        self.assertEqual(statuses[-1][0], 10006)
+
+
+class TestStreams(MockExchangeTestCase):
+    """Tests for the public and private WebSocket streams"""
+
+    def test_public_stream_pushes_ticker_and_book(self):
+        async def scenario(client, exchange):
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(exchange.public_ws_url) as ws:
+                    await ws.send_json({"op": "subscribe", "args": ["tickers.BTCUSDT", "orderbook.50.BTCUSDT"]})
+                    ack = await ws.receive_json()
+                    snapshot = await ws.receive_json()
+                    await exchange.set_price("BTCUSDT", 50010.0)
+                    messages = [await ws.receive_json() for _ in range(2)]
+                    return ack, snapshot, messages
+
+        ack, snapshot, messages = self.run_scenario(scenario)
+        self.assertTrue(ack["success"])
+        self.assertEqual(snapshot["type"], "snapshot")
+        delta = next(m for m in messages if m["topic"].startswith("orderbook"))
+        ticker = next(m for m in messages if m["topic"].startswith("tickers"))
+        self.assertEqual(delta["type"], "delta")
+        self.assertEqual(delta["data"]["u"], snapshot["data"]["u"] + 1)
+        self.assertEqual(ticker["data"]["lastPrice"], "50010")
+
+    def test_private_stream_requires_auth(self):
+        async def scenario(client, exchange):
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(exchange.private_ws_url) as ws:
+                    await ws.send_json({"op": "subscribe", "args": ["order"]})
+                    denied = await ws.receive_json()
+                    await ws.send_json({"op": "auth", "args": ["key", str(2 ** 62), "sig"]})
+                    authed = await ws.receive_json()
+                    await ws.send_json({"op": "subscribe", "args": ["order"]})
+                    await ws.receive_json()
+                    await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                              "orderType": "Limit", "qty": "0.01", "price": "40000"})
+                    update = await ws.receive_json()
+                    return denied, authed, update
+
+        denied, authed, update = self.run_scenario(scenario)
+        self.assertFalse(denied["success"])
+        self.assertTrue(authed["success"])
+        self.assertEqual(update["topic"], "order")
+        self.assertEqual(update["data"][0]["orderStatus"], "New")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
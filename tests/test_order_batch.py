@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for batch order submission through OrderManager
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.managers.order_manager import OrderManager
+
+
+class FakeTransport:
+    """Records batch calls and answers like Bybit's batch endpoints"""
+
+    def __init__(self, reject_link_ids=()):
+        self.calls = []
+        self.reject_link_ids = set(reject_link_ids)
+        self.order_ids = {}
+
+    async def _batch(self, endpoint, category, requests):
+        self.calls.append((endpoint, category, list(requests)))
+        items, statuses = [], []
+        for index, request in enumerate(requests):
+            link_id = request.get("orderLinkId", "")
+            order_id = request.get("orderId") or self.order_ids.setdefault(link_id, f"oid-{len(self.calls)}-{index}")
+            items.append({
+                "category": category,
+                "symbol": request["symbol"],
+                "orderId": order_id,
+                "orderLinkId": link_id,
+            })
+            if link_id in self.reject_link_ids:
+                statuses.append({"code": 110007, "msg": "Insufficient balance"})
+            else:
+                statuses.append({"code": 0, "msg": "OK"})
+        return {"retCode": 0, "retMsg": "OK", "result": {"list": items}, "retExtInfo": {"list": statuses}}
+
+    async def place_batch_order(self, category, requests):
+        return await self._batch("create", category, requests)
+
+    async def amend_batch_order(self, category, requests):
+        return await self._batch("amend", category, requests)
+
+    async def cancel_batch_order(self, category, requests):
+        return await self._batch("cancel", category, requests)
+
+
+class TestSubmitBatch(unittest.TestCase):
+    """Tests for OrderManager.submit_batch"""
+
+    def setUp(self):
+        self.transport = FakeTransport(reject_link_ids={"ladder-3"})
+        self.manager = OrderManager(self.transport, {}, logger=MagicMock())
+
+    def test_create_is_chunked_and_mapped_by_link_id(self):
+        orders = [
+            {"symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "qty": "0.001",
+             "price": str(60000 - i), "orderLinkId": f"ladder-{i}"}
+            for i in range(25)
+        ]
+
+        results = asyncio.run(self.manager.submit_batch(orders))
+
+        self.assertEqual([len(call[2]) for call in self.transport.calls], [20, 5])
+        self.assertEqual(len(results), 25)
+        self.assertFalse(results["ladder-3"]["success"])
+        self.assertEqual(results["ladder-3"]["code"], 110007)
+        self.assertTrue(results["ladder-4"]["success"])
+        self.assertEqual(self.manager.get_active_orders_count("BTCUSDT"), 24)
+
+    def test_create_generates_missing_link_ids(self):
+        orders = [{"symbol": "ETHUSDT", "side": "Sell", "orderType": "Market", "qty": "0.1"}]
+
+        results = asyncio.run(self.manager.submit_batch(orders))
+
+        link_id = next(iter(results))
+        self.assertTrue(link_id.startswith("pb-"))
+        self.assertLessEqual(len(link_id), 36)
+        self.assertNotIn("orderLinkId", orders[0])
+
+    def test_cancel_moves_orders_to_history(self):
+        created = asyncio.run(self.manager.submit_batch([
+            {"symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit", "qty": "0.001",
+             "price": "50000", "orderLinkId": "to-cancel"}
+        ]))
+        self.assertTrue(created["to-cancel"]["success"])
+
+        results = asyncio.run(self.manager.submit_batch(
+            [{"symbol": "BTCUSDT", "orderLinkId": "to-cancel"}], action="cancel"
+        ))
+
+        self.assertTrue(results["to-cancel"]["success"])
+        self.assertEqual(self.manager.get_active_orders_count("BTCUSDT"), 0)
+        self.assertEqual(self.manager.order_history["BTCUSDT"][-1]["status"], "Cancelled")
+
+    def test_unsupported_action(self):
+        results = asyncio.run(self.manager.submit_batch([], action="replace"))
+        self.assertIn("error", results)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the incremental L2 order book
+"""
+
+import os
+import sys
+import math
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.orderbook import OrderBook
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+
+def snapshot(u=10, seq=100):
+    return {"s": "BTCUSDT", "u": u, "seq": seq,
+            "b": [["100.0", "1"], ["99.5", "2"], ["99.0", "3"]],
+            "a": [["100.5", "1.5"], ["101.0", "2.5"]]}
+
+
+class TestOrderBook(unittest.TestCase):
+    """Tests for OrderBook"""
+
+    def test_snapshot_and_queries(self):
+        book = OrderBook("BTCUSDT")
+        self.assertTrue(math.isnan(book.best_bid))
+        self.assertTrue(book.apply("snapshot", snapshot(), 1000))
+
+        self.assertEqual(book.best_bid, 100.0)
+        self.assertEqual(book.best_ask, 100.5)
+        self.assertEqual(book.mid, 100.25)
+        self.assertEqual(book.spread, 0.5)
+        self.assertEqual(book.depth("b", 2), 3.0)
+        self.assertEqual(book.depth("b", 10), 6.0)
+        self.assertEqual(book.depth("a", 1), 1.5)
+        self.assertEqual(book.to_dict(2)["bids"], [[100.0, 1.0], [99.5, 2.0]])
+        self.assertEqual(len(book), 5)
+
+    def test_deltas_insert_update_and_remove(self):
+        book = OrderBook("BTCUSDT", capacity=2)
+        book.apply("snapshot", snapshot())
+        self.assertTrue(book.apply("delta", {"u": 11, "seq": 101,
+                                             "b": [["100.0", "0"], ["99.75", "4"], ["99.0", "5"]],
+                                             "a": [["100.25", "1"]]}))
+
+        self.assertEqual(book.levels("b", 10).tolist(), [[99.75, 4.0], [99.5, 2.0], [99.0, 5.0]])
+        self.assertEqual(book.levels("a", 10).tolist(), [[100.25, 1.0], [100.5, 1.5], [101.0, 2.5]])
+        self.assertEqual(book.depth("b", 3), 11.0)
+        self.assertEqual(book.update_id, 11)
+
+    def test_gap_marks_out_of_sync_until_snapshot(self):
+        book = OrderBook("BTCUSDT")
+        book.apply("snapshot", snapshot())
+        # Duplicate is ignored without losing sync
+        self.assertFalse(book.apply("delta", {"u": 10, "seq": 100, "b": [["100.0", "9"]]}))
+        self.assertTrue(book.synced)
+
+        self.assertFalse(book.apply("delta", {"u": 12, "seq": 102, "b": [["100.0", "9"]]}))
+        self.assertFalse(book.synced)
+        self.assertFalse(book.apply("delta", {"u": 13, "seq": 103, "b": [["100.0", "9"]]}))
+        self.assertEqual(book.best_bid, 100.0)
+        self.assertEqual(book.depth("b", 1), 1.0)
+
+        self.assertTrue(book.apply("snapshot", snapshot(u=20, seq=200)))
+        self.assertTrue(book.apply("delta", {"u": 21, "seq": 201, "a": [["100.5", "0"]]}))
+        self.assertEqual(book.best_ask, 101.0)
+        self.assertEqual(book.stats["gaps"], 1)
+        self.assertEqual(book.stats["stale"], 1)
+
+    def test_crossed_book_marks_out_of_sync(self):
+        book = OrderBook("BTCUSDT")
+        book.apply("snapshot", snapshot())
+        self.assertFalse(book.apply("delta", {"u": 11, "seq": 101, "b": [["100.5", "1"]]}))
+        self.assertFalse(book.synced)
+        self.assertEqual(book.stats["crossed"], 1)
+
+
+class TestDataManagerOrderBook(unittest.TestCase):
+    """Tests for DataManager's streamed order books"""
+
+    def test_resyncs_after_missed_delta(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                config = {"general": {"system": {"ws_public_url": exchange.public_ws_url}}}
+                manager = DataManager(client=None, config=config)
+                manager.subscribe_orderbook("BTCUSDT")
+                await manager.start_websocket()
+                try:
+                    book = manager.orderbooks["BTCUSDT"]
+                    await wait_for(lambda: book.synced)
+
+                    # Simulate a lost delta
+                    manager._handle_ws_message({"topic": "orderbook.50.BTCUSDT", "type": "delta", "ts": 1,
+                                                "data": {"s": "BTCUSDT", "u": book.update_id + 2,
+                                                         "seq": book.seq + 2, "b": [], "a": []}})
+                    self.assertFalse(book.synced)
+                    await wait_for(lambda: book.synced)
+
+                    await exchange.set_price("BTCUSDT", 50500.0)
+                    await wait_for(lambda: book.best_bid == 50500.0)
+                    return book, manager.get_market_price("BTCUSDT")
+                finally:
+                    await manager.stop_websocket()
+
+        book, price = asyncio.run(scenario())
+        self.assertEqual(book.stats["snapshots"], 2)
+        self.assertEqual(book.stats["gaps"], 1)
+        self.assertEqual(price, book.mid)
+        self.assertLess(book.best_bid, book.best_ask)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline tests for cursor and time-window pagination
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import numpy as np
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.pagination import split_time_range, to_bybit_interval, interval_to_ms
+from pybit_bot.exceptions import BybitAPIError
+
+
+MINUTE = 60_000
+
+
+class TestPaginationHelpers(unittest.TestCase):
+    """Tests for interval and window helpers"""
+
+    def test_interval_mapping(self):
+        self.assertEqual(to_bybit_interval("1m"), "1")
+        self.assertEqual(to_bybit_interval("1h"), "60")
+        self.assertEqual(to_bybit_interval("60"), "60")
+        self.assertEqual(interval_to_ms("5m"), 5 * MINUTE)
+        with self.assertRaises(ValueError):
+            interval_to_ms("M")
+
+    def test_split_time_range_covers_range_without_overlap(self):
+        windows = split_time_range(0, 10 * MINUTE - 1, 4 * MINUTE)
+        self.assertEqual(windows, [(0, 4 * MINUTE - 1), (4 * MINUTE, 8 * MINUTE - 1), (8 * MINUTE, 10 * MINUTE - 1)])
+
+
+class TestClientPagination(unittest.TestCase):
+    """Tests for BybitClient iterators against a local server"""
+
+    def setUp(self):
+        self.history_requests = []
+        self.kline_in_flight = 0
+        self.kline_max_in_flight = 0
+        self.fail_cursor = None
+
+        async def history(request):
+            cursor = request.query.get("cursor", "")
+            self.history_requests.append(cursor)
+            if cursor and cursor == self.fail_cursor:
+                return web.json_response({"retCode": 10001, "retMsg": "params error"})
+            page = int(cursor or 0)
+            items = [{"orderId": f"{page}-{i}"} for i in range(2)]
+            next_cursor = str(page + 1) if page < 2 else ""
+            return web.json_response({
+                "retCode": 0,
+                "retMsg": "OK",
+                "result": {"list": items, "nextPageCursor": next_cursor}
+            })
+
+        async def kline(request):
+            self.kline_in_flight += 1
+            self.kline_max_in_flight = max(self.kline_max_in_flight, self.kline_in_flight)
+            await asyncio.sleep(0.01)
+            self.kline_in_flight -= 1
+
+            start, end = int(request.query["start"]), int(request.query["end"])
+            limit = int(request.query["limit"])
+            first = -(-start // MINUTE) * MINUTE
+            opens = list(range(first, end + 1, MINUTE))[:limit]
+            rows = [[str(t), "1", "2", "0.5", "1.5", "10", "15"] for t in reversed(opens)]
+            return web.json_response({
+                "retCode": 0,
+                "retMsg": "OK",
+                "result": {"symbol": request.query["symbol"], "category": "linear", "list": rows}
+            })
+
+        self.app = web.Application()
+        self.app.router.add_get("/v5/order/history", history)
+        self.app.router.add_get("/v5/market/kline", kline)
+
+    def run_with_server(self, scenario):
+        async def runner():
+            server = TestServer(self.app)
+            await server.start_server()
+            client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True))
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+                await server.close()
+        return asyncio.run(runner())
+
+    def test_order_history_follows_cursor(self):
+        async def scenario(client):
+            return [order["orderId"] async for order in client.iter_order_history(symbol="BTCUSDT")]
+
+        order_ids = self.run_with_server(scenario)
+        self.assertEqual(order_ids, ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"])
+        self.assertEqual(self.history_requests, ["", "1", "2"])
+
+    def test_next_page_is_prefetched(self):
+        async def scenario(client):
+            async for _ in client.iter_order_history():
+                # Give the prefetch a chance to complete while "processing"
+                await asyncio.sleep(0.05)
+                return list(self.history_requests)
+
+        requested = self.run_with_server(scenario)
+        self.assertEqual(requested, ["", "1"])
+
+    def test_page_error_raises(self):
+        self.fail_cursor = "1"
+
+        async def scenario(client):
+            seen = []
+            with self.assertRaises(BybitAPIError):
+                async for order in client.iter_order_history():
+                    seen.append(order)
+            return seen
+
+        self.assertEqual(len(self.run_with_server(scenario)), 2)
+
+    def test_klines_stream_in_order_with_bounded_concurrency(self):
+        start = 1_700_000_000_000 - 1_700_000_000_000 % MINUTE
+        end = start + 2500 * MINUTE - 1
+
+        async def scenario(client):
+            pages = []
+            async for page in client.iter_klines("linear", "BTCUSDT", "1m", start, end, concurrency=2):
+                pages.append(page)
+            return pages
+
+        pages = self.run_with_server(scenario)
+        bars = np.concatenate(pages)
+        self.assertEqual([len(p) for p in pages], [1000, 1000, 500])
+        self.assertEqual(len(bars), 2500)
+        self.assertTrue(np.all(np.diff(bars[:, 0]) == MINUTE))
+        self.assertEqual(bars[0, 0], start)
+        self.assertEqual(self.kline_max_in_flight, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
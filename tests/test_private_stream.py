@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for OrderManager's caches fed by the private WebSocket stream
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.websocket_client import PrivateWebSocket
+from pybit_bot.managers.order_manager import OrderManager
+from pybit_bot.managers.tpsl_manager import TPSLManager
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+
+class TestPrivateStream(unittest.TestCase):
+    """Tests for pushed order, execution and position updates"""
+
+    def run_scenario(self, scenario):
+        async def runner():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {"general": {"system": {"ws_private_url": exchange.private_ws_url}}}
+                manager = OrderManager(client, config)
+                try:
+                    return await scenario(manager, client, exchange)
+                finally:
+                    await manager.stop_private_stream()
+                    await client.close()
+        return asyncio.run(runner())
+
+    def test_fill_updates_caches_without_polling(self):
+        async def scenario(manager, client, exchange):
+            await manager.start_private_stream()
+            await wait_for(lambda: manager.stream_connected and manager._positions_synced)
+
+            await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                      "orderType": "Limit", "qty": "0.01", "price": "49000"})
+            await wait_for(lambda: manager.get_active_orders_count("BTCUSDT") == 1)
+            order_id = manager.get_active_orders("BTCUSDT")[0]["orderId"]
+
+            await exchange.set_price("BTCUSDT", 48900.0)
+            await wait_for(lambda: manager.get_active_orders_count("BTCUSDT") == 0)
+            await wait_for(lambda: manager.executions.get("BTCUSDT"))
+
+            requests_before = sum(exchange.get_stats()["requests"].values())
+            await manager.sync_order_status()
+            positions = await manager.get_positions("BTCUSDT")
+            info = await manager._get_order_info(order_id)
+            requests_after = sum(exchange.get_stats()["requests"].values())
+            return manager, positions, info, requests_after - requests_before
+
+        manager, positions, info, rest_calls = self.run_scenario(scenario)
+        self.assertEqual(rest_calls, 0)
+        self.assertEqual(info["orderStatus"], "Filled")
+        self.assertEqual(manager.order_history["BTCUSDT"][-1]["status"], "Filled")
+        self.assertEqual(positions[0]["size"], "0.01")
+        self.assertEqual(positions[0]["side"], "Buy")
+        self.assertEqual(manager.executions["BTCUSDT"][-1]["execPrice"], "49000")
+
+    def test_tpsl_manager_places_take_profit_after_fill(self):
+        async def scenario(manager, client, exchange):
+            await manager.start_private_stream()
+            await wait_for(lambda: manager.stream_connected and manager._positions_synced)
+
+            tpsl = TPSLManager(manager, {})
+            placed = await manager.place_market_order("BTCUSDT", "Buy", 0.01)
+            tpsl.add_tpsl_order("BTCUSDT", placed["orderId"], "Buy", 50000.0, tp_price=52000.0)
+            await wait_for(lambda: manager.positions.get("BTCUSDT", {}).get("size") == "0.01")
+
+            await tpsl.update()
+            await tpsl.update()
+            return tpsl.tpsl_orders[placed["orderId"]], exchange
+
+        order_data, exchange = self.run_scenario(scenario)
+        take_profit = exchange.orders[order_data["tp_order_id"]]
+        self.assertEqual((take_profit["side"], take_profit["price"], take_profit["orderStatus"]), ("Sell", "52000", "New"))
+        self.assertTrue(take_profit["reduceOnly"])
+
+    def test_reconcile_resolves_orders_closed_while_disconnected(self):
+        async def scenario(manager, client, exchange):
+            response = await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Sell",
+                                                 "orderType": "Limit", "qty": "0.02", "price": "51000"})
+            order_id = response["result"]["orderId"]
+            manager._track_order("BTCUSDT", order_id, "Sell", "0.02", "Limit", response["result"], "51000")
+            await client.cancel_order("linear", "BTCUSDT", order_id=order_id)
+
+            await manager.start_private_stream()
+            await wait_for(lambda: manager._positions_synced)
+            return manager
+
+        manager = self.run_scenario(scenario)
+        self.assertEqual(manager.get_active_orders_count(), 0)
+        self.assertEqual(manager.order_history["BTCUSDT"][-1]["status"], "Cancelled")
+
+    def test_reconcile_pages_history_for_older_orders(self):
+        def market_orders(count):
+            return [{"symbol": "BTCUSDT", "side": "Buy" if i % 2 else "Sell", "orderType": "Market", "qty": "0.01"}
+                    for i in range(count)]
+
+        async def scenario(manager, client, exchange):
+            await client.place_batch_order("linear", market_orders(20))
+            response = await client.place_order({"category": "linear", "symbol": "BTCUSDT", "side": "Sell",
+                                                 "orderType": "Limit", "qty": "0.02", "price": "51000"})
+            order_id = response["result"]["orderId"]
+            manager._track_order("BTCUSDT", order_id, "Sell", "0.02", "Limit", response["result"], "51000")
+            manager._track_order("BTCUSDT", "unknown-1", "Buy", "0.01", "Limit", {}, "40000")
+            await client.cancel_order("linear", "BTCUSDT", order_id=order_id)
+
+            # More orders than one history page since the tracked one closed
+            for _ in range(4):
+                await client.place_batch_order("linear", market_orders(20))
+
+            manager.reconcile_history_pages = 2
+            await manager.start_private_stream()
+            await wait_for(lambda: manager._positions_synced)
+            return manager, exchange.get_stats()["requests"]
+
+        manager, requests = self.run_scenario(scenario)
+        self.assertEqual(manager.get_active_orders_count(), 0)
+        statuses = {entry["orderId"]: entry["status"] for entry in manager.order_history["BTCUSDT"]}
+        self.assertEqual(sorted(statuses.values()), ["Cancelled", "Unknown"])
+        self.assertEqual(statuses["unknown-1"], "Unknown")
+        # Stopped after two of the three pages
+        self.assertLessEqual(requests["/v5/order/history"], 3)
+        self.assertEqual(len(manager.order_cache["BTCUSDT"]), 1)
+
+    def test_failed_reconcile_backs_off(self):
+        async def scenario(manager, client, exchange):
+            await manager.start_private_stream()
+            await wait_for(lambda: manager.stream_connected and manager._positions_synced)
+
+            manager.reconcile_retry_delay = 0.1
+            manager._next_reconcile = 0.0
+            exchange.inject_error("/v5/order/realtime", ret_code=10016, times=1000)
+            client.coalescer.clear()
+            before = exchange.get_stats()["requests"]["/v5/order/realtime"]
+            # Main loop passes for 0.35s
+            for _ in range(35):
+                await manager.sync_order_status()
+                await asyncio.sleep(0.01)
+            return manager, exchange.get_stats()["requests"]["/v5/order/realtime"] - before
+
+        manager, attempts = self.run_scenario(scenario)
+        # At 0, 0.1 and 0.3s
+        self.assertIn(attempts, (3, 4))
+        self.assertEqual(manager._reconcile_failures, attempts)
+
+    def test_rejected_auth_stops_reconnecting(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                # Signature already expired
+                ws = PrivateWebSocket("key", "secret", lambda message: None, url=exchange.private_ws_url,
+                                      auth_expiry_ms=-10000, backoff_base=0.01)
+                await asyncio.wait_for(ws.run(), 5)
+                return ws.get_stats()
+
+        stats = asyncio.run(scenario())
+        self.assertEqual(stats["failed_connects"], 1)
+        self.assertEqual(stats["connects"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the token-bucket RateLimiter
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for TokenBucket"""
+
+    def test_wait_time_after_draining(self):
+        bucket = TokenBucket(capacity=2, refill_rate=10.0)
+        now = time.monotonic()
+        self.assertEqual(bucket.wait_time(now=now), 0.0)
+        bucket.consume()
+        bucket.consume()
+        self.assertAlmostEqual(bucket.wait_time(now=now), 0.1, places=2)
+
+    def test_sync_blocks_until_reset(self):
+        bucket = TokenBucket(capacity=10, refill_rate=10.0)
+        reset_at = time.monotonic() + 5.0
+        bucket.sync(remaining=0, limit=10, reset_at=reset_at)
+        self.assertGreater(bucket.wait_time(), 4.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for RateLimiter"""
+
+    def test_endpoint_groups(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.get_group("/v5/market/tickers"), "market")
+        self.assertEqual(limiter.get_group("/v5/order/create"), "order")
+        self.assertEqual(limiter.get_group("/v5/order/cancel-batch"), "order")
+        self.assertEqual(limiter.get_group("/v5/order/realtime"), "order_query")
+        self.assertEqual(limiter.get_group("/v5/position/list"), "position")
+        self.assertEqual(limiter.get_group("/v5/account/wallet-balance"), "account")
+
+    def test_market_data_cannot_use_order_reserve(self):
+        limiter = RateLimiter(limits={"market": (1000, 1000.0)})
+        reserve = limiter.ip_bucket.capacity * limiter.MARKET_RESERVE_RATIO
+        limiter.ip_bucket.tokens = reserve
+
+        self.assertGreater(limiter._reserve("market"), 0)
+        self.assertEqual(limiter._reserve("order"), 0)
+
+    def test_groups_are_independent(self):
+        limiter = RateLimiter(limits={"market": (1, 0.001)})
+
+        async def scenario():
+            await limiter.acquire("/v5/market/tickers")
+            start = time.monotonic()
+            await limiter.acquire("/v5/order/cancel")
+            return time.monotonic() - start
+
+        self.assertLess(asyncio.run(scenario()), 0.05)
+        self.assertGreater(limiter._reserve("market"), 0)
+
+    def test_headers_update_bucket(self):
+        limiter = RateLimiter()
+        reset_ms = (time.time() + 2.0) * 1000
+        limiter.update_from_headers("/v5/order/create", {
+            "X-Bapi-Limit-Status": "0",
+            "X-Bapi-Limit": "10",
+            "X-Bapi-Limit-Reset-Timestamp": str(reset_ms),
+        })
+        self.assertGreater(limiter._reserve("order"), 1.0)
+        self.assertEqual(limiter._reserve("position"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
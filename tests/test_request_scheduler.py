@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the priority RequestScheduler
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.request_scheduler import RequestScheduler, RequestPriority
+from pybit_bot.exceptions import RequestDroppedError
+
+
+class TestRequestScheduler(unittest.TestCase):
+    """Tests for RequestScheduler"""
+
+    def test_classify(self):
+        scheduler = RequestScheduler()
+        self.assertEqual(scheduler.classify("/v5/order/create"), RequestPriority.ORDER_MUTATION)
+        self.assertEqual(scheduler.classify("/v5/order/cancel-batch"), RequestPriority.ORDER_MUTATION)
+        self.assertEqual(scheduler.classify("/v5/position/trading-stop"), RequestPriority.ORDER_MUTATION)
+        self.assertEqual(scheduler.classify("/v5/position/list"), RequestPriority.ORDER_QUERY)
+        self.assertEqual(scheduler.classify("/v5/order/realtime"), RequestPriority.ORDER_QUERY)
+        self.assertEqual(scheduler.classify("/v5/market/kline"), RequestPriority.MARKET_DATA)
+
+    def test_order_mutation_preempts_queued_market_data(self):
+        scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0)
+        order = []
+
+        async def scenario():
+            gate = asyncio.Event()
+
+            async def blocker():
+                await gate.wait()
+                order.append("blocker")
+
+            def make(name):
+                async def request():
+                    order.append(name)
+                return request
+
+            first = asyncio.create_task(scheduler.submit(blocker, RequestPriority.MARKET_DATA))
+            await asyncio.sleep(0)
+            tasks = [
+                asyncio.create_task(scheduler.submit(make(f"kline{i}"), RequestPriority.MARKET_DATA))
+                for i in range(3)
+            ]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(scheduler.submit(make("cancel"), RequestPriority.ORDER_MUTATION)))
+            await asyncio.sleep(0)
+            gate.set()
+            await asyncio.gather(first, *tasks)
+
+        asyncio.run(scenario())
+        self.assertEqual(order[:2], ["blocker", "cancel"])
+
+    def test_expired_market_data_is_dropped(self):
+        scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0)
+
+        async def scenario():
+            async def slow():
+                await asyncio.sleep(0.05)
+
+            async def fast():
+                return "sent"
+
+            first = asyncio.create_task(scheduler.submit(slow, RequestPriority.ORDER_QUERY))
+            await asyncio.sleep(0)
+            stale = asyncio.create_task(scheduler.submit(fast, RequestPriority.MARKET_DATA, deadline=0.01))
+            await first
+            with self.assertRaises(RequestDroppedError):
+                await stale
+
+        asyncio.run(scenario())
+        metrics = scheduler.get_metrics()
+        self.assertEqual(metrics["MARKET_DATA"]["dropped_expired"], 1)
+        self.assertEqual(metrics["ORDER_QUERY"]["completed"], 1)
+
+    def test_full_queue_rejects(self):
+        scheduler = RequestScheduler(max_in_flight=1, reserved_slots=0,
+                                     queue_sizes={RequestPriority.MARKET_DATA: 1})
+
+        async def scenario():
+            gate = asyncio.Event()
+
+            async def blocker():
+                await gate.wait()
+
+            async def noop():
+                return None
+
+            first = asyncio.create_task(scheduler.submit(blocker, RequestPriority.MARKET_DATA))
+            await asyncio.sleep(0)
+            queued = asyncio.create_task(scheduler.submit(noop, RequestPriority.MARKET_DATA))
+            await asyncio.sleep(0)
+            with self.assertRaises(RequestDroppedError):
+                await scheduler.submit(noop, RequestPriority.MARKET_DATA)
+            gate.set()
+            await asyncio.gather(first, queued)
+
+        asyncio.run(scenario())
+        self.assertEqual(scheduler.get_metrics()["MARKET_DATA"]["dropped_full"], 1)
+
+    def test_market_data_cannot_take_reserved_slots(self):
+        scheduler = RequestScheduler(max_in_flight=2, reserved_slots=1)
+
+        async def scenario():
+            gate = asyncio.Event()
+            started = []
+
+            async def blocker():
+                await gate.wait()
+
+            async def record():
+                started.append("order")
+
+            market = [asyncio.create_task(scheduler.submit(blocker, RequestPriority.MARKET_DATA)) for _ in range(2)]
+            await asyncio.sleep(0)
+            await scheduler.submit(record, RequestPriority.ORDER_MUTATION)
+            gate.set()
+            await asyncio.gather(*market)
+            return started
+
+        self.assertEqual(asyncio.run(scenario()), ["order"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
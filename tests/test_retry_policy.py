@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline tests for the retry policy and circuit breaker
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.retry_policy import RetryPolicy, CircuitBreaker
+from pybit_bot.exceptions import CircuitOpenError
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for idempotency rules and backoff"""
+
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3, base_delay=0.2, max_delay=1.0)
+
+    def test_reads_and_cancels_are_retryable(self):
+        self.assertTrue(self.policy.is_retryable("GET", "/v5/market/tickers", {}))
+        self.assertTrue(self.policy.is_retryable("POST", "/v5/order/cancel", {"orderId": "1"}))
+        self.assertTrue(self.policy.is_retryable("POST", "/v5/order/amend-batch", {"request": []}))
+
+    def test_create_needs_client_order_id(self):
+        self.assertFalse(self.policy.is_retryable("POST", "/v5/order/create", {"symbol": "BTCUSDT"}))
+        self.assertTrue(self.policy.is_retryable("POST", "/v5/order/create", {"orderLinkId": "a"}))
+
+    def test_batch_create_needs_client_id_on_every_order(self):
+        self.assertTrue(self.policy.is_retryable(
+            "POST", "/v5/order/create-batch", {"request": [{"orderLinkId": "a"}, {"orderLinkId": "b"}]}
+        ))
+        self.assertFalse(self.policy.is_retryable(
+            "POST", "/v5/order/create-batch", {"request": [{"orderLinkId": "a"}, {"symbol": "BTCUSDT"}]}
+        ))
+
+    def test_unknown_post_is_not_retryable(self):
+        self.assertFalse(self.policy.is_retryable("POST", "/v5/asset/transfer/inter-transfer", {}))
+
+    def test_delay_is_jittered_and_capped(self):
+        for attempt in range(1, 8):
+            ceiling = min(1.0, 0.2 * 2 ** (attempt - 1))
+            for _ in range(50):
+                delay = self.policy.compute_delay(attempt)
+                self.assertGreaterEqual(delay, 0.0)
+                self.assertLessEqual(delay, ceiling)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for breaker state transitions"""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+        for _ in range(3):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.02)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestClientRetries(unittest.TestCase):
+    """Tests for retry and breaker behaviour of the async transport"""
+
+    def setUp(self):
+        self.calls = {"create": 0, "cancel": 0}
+
+        async def create(request):
+            self.calls["create"] += 1
+            return web.Response(status=503, text="unavailable")
+
+        async def cancel(request):
+            self.calls["cancel"] += 1
+            if self.calls["cancel"] < 2:
+                return web.Response(status=502, text="bad gateway")
+            return web.json_response({"retCode": 0, "retMsg": "OK", "result": {}})
+
+        self.app = web.Application()
+        self.app.router.add_post("/v5/order/create", create)
+        self.app.router.add_post("/v5/order/cancel", cancel)
+
+    def run_with_server(self, scenario, breaker=None):
+        async def runner():
+            server = TestServer(self.app)
+            await server.start_server()
+            client = BybitClient(
+                APICredentials(api_key="key", api_secret="secret", testnet=True),
+                retry_policy=RetryPolicy(base_delay=0.01),
+                circuit_breaker=breaker
+            )
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+                await server.close()
+        return asyncio.run(runner())
+
+    def test_create_without_link_id_is_sent_once(self):
+        async def scenario(client):
+            with self.assertRaises(Exception):
+                await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+
+        self.run_with_server(scenario)
+        self.assertEqual(self.calls["create"], 1)
+
+    def test_create_with_link_id_is_retried(self):
+        async def scenario(client):
+            with self.assertRaises(Exception):
+                await client.place_order({"category": "linear", "symbol": "BTCUSDT", "orderLinkId": "a"})
+
+        self.run_with_server(scenario)
+        self.assertEqual(self.calls["create"], 3)
+
+    def test_cancel_recovers_after_transient_error(self):
+        async def scenario(client):
+            return await client.cancel_order("linear", "BTCUSDT", order_id="1")
+
+        result = self.run_with_server(scenario)
+        self.assertEqual(result["retCode"], 0)
+        self.assertEqual(self.calls["cancel"], 2)
+
+    def test_open_circuit_rejects_without_sending(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+
+        async def scenario(client):
+            with self.assertRaises(Exception):
+                await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+            with self.assertRaises(CircuitOpenError):
+                await client.place_order({"category": "linear", "symbol": "BTCUSDT"})
+            return client.get_transport_metrics()["circuit_breaker"]
+
+        stats = self.run_with_server(scenario, breaker)
+        self.assertEqual(self.calls["create"], 1)
+        self.assertEqual(stats["state"], CircuitBreaker.OPEN)
+        self.assertEqual(stats["rejected"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared-memory market data bus
+"""
+
+import os
+import sys
+import json
+import asyncio
+import unittest
+import subprocess
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.event_bus import EventType
+from pybit_bot.core.shared_market_data import (
+    BOOK_TOP_FIELDS, TICKER_FIELDS, SharedKlineBuffer, SharedRecord, segment_name
+)
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.managers.market_data_publisher import MarketDataPublisher
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+PREFIX = f"pybit_test_{os.getpid()}"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Reads segments in a separate interpreter, as a bot process would
+READER = """
+import json, sys
+from pybit_bot.core.shared_market_data import SharedKlineBuffer, SharedRecord, TICKER_FIELDS
+buffer = SharedKlineBuffer.attach(sys.argv[1])
+seq, ticker = SharedRecord.attach(sys.argv[2], TICKER_FIELDS).read()
+print(json.dumps([len(buffer), buffer.last_timestamp, buffer.column("close")[-1], ticker]))
+"""
+
+
+class TestSharedSegments(unittest.TestCase):
+    """Tests for SharedKlineBuffer and SharedRecord"""
+
+    def test_reader_sees_writer_without_copy(self):
+        writer = SharedKlineBuffer.create(segment_name(PREFIX, "BTCUSDT", "1m"), capacity=5)
+        reader = SharedKlineBuffer.attach(segment_name(PREFIX, "BTCUSDT", "1m"))
+        self.addCleanup(writer.close, unlink=True)
+
+        for i in range(4):
+            writer.upsert((i * 60_000.0, 100.0, 101.0, 99.0, 100.0 + i, 1.0, 100.0))
+        closes = reader.column("close", 3)
+        self.assertEqual(closes.tolist(), [101.0, 102.0, 103.0])
+        self.assertFalse(closes.flags.writeable)
+
+        # The forming bar changes in place, appends leave the view alone
+        writer.upsert((3 * 60_000.0, 100.0, 105.0, 99.0, 104.0, 2.0, 200.0))
+        writer.upsert((4 * 60_000.0, 104.0, 104.0, 104.0, 104.0, 0.0, 0.0))
+        self.assertEqual(closes.tolist(), [101.0, 102.0, 104.0])
+        self.assertEqual((len(reader), reader.last_timestamp, reader.version), (5, 240_000, writer.version))
+        self.assertEqual(reader.seq % 2, 0)
+
+        # Out-of-order bars take the merge path and still read consistently
+        writer.extend(np.array([[60_000.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]]))
+        np.testing.assert_array_equal(reader.to_dataframe().values, writer.to_dataframe().values)
+        self.assertEqual(reader.to_dataframe().loc[60_000, "close"], 1.0)
+        with self.assertRaises(ValueError):
+            reader.upsert((5 * 60_000.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0))
+
+        closes = reader.column("close")
+        writer.close(unlink=True)
+        self.assertTrue(reader.closed)
+        self.assertEqual(closes.tolist(), [100.0, 1.0, 102.0, 104.0, 104.0])
+        with self.assertRaises(FileNotFoundError):
+            SharedKlineBuffer.attach(segment_name(PREFIX, "BTCUSDT", "1m"))
+
+    def test_seqlock_and_other_process(self):
+        kline_name = segment_name(PREFIX, "ETHUSDT", "1m")
+        ticker_name = segment_name(PREFIX, "ETHUSDT", "ticker")
+        buffer = SharedKlineBuffer.create(kline_name, capacity=100)
+        record = SharedRecord.create(ticker_name, TICKER_FIELDS)
+        self.addCleanup(buffer.close, unlink=True)
+        self.addCleanup(record.close, unlink=True)
+        self.assertEqual(record.read(), (0, {}))
+
+        # A write in progress is never read
+        record._header[0] += 1
+        self.assertEqual(SharedRecord.attach(ticker_name, TICKER_FIELDS).read(), (1, None))
+        record._header[0] -= 1
+
+        buffer.extend(np.array([(i * 60_000.0, 100.0, 101.0, 99.0, 100.0 + i, 1.0, 100.0) for i in range(150)]))
+        record.write({"lastPrice": "123.5", "ts": 1_000, "symbol": "ETHUSDT"})
+
+        # Nor is a kline write in progress; the last consistent frame is kept
+        reader = SharedKlineBuffer.attach(kline_name)
+        frame = reader.to_dataframe()
+        buffer._header[0] += 1
+        buffer._header[3] += 1
+        self.assertEqual(reader.snapshot(), (buffer.version, None))
+        self.assertIs(reader.to_dataframe(), frame)
+        buffer._header[0] -= 1
+        self.assertIsNot(reader.to_dataframe(), frame)
+
+        for _ in range(2):
+            output = subprocess.run([sys.executable, "-c", READER, kline_name, ticker_name], cwd=ROOT,
+                                    capture_output=True, text=True, timeout=60, check=True).stdout
+            self.assertEqual(json.loads(output), [100, 149 * 60_000, 249.0, {"ts": 1_000.0, "lastPrice": 123.5}])
+        # A reader exiting does not remove the segments
+        self.assertEqual(len(SharedKlineBuffer.attach(kline_name)), 100)
+
+
+class TestSharedMarketData(unittest.TestCase):
+    """Tests for MarketDataPublisher and the DataManager subscriber role"""
+
+    def test_subscriber_reads_publisher_feed(self):
+        shared = {"name": f"{PREFIX}_bus", "poll_interval": 0.01, "attach_timeout": 2.0}
+
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {"general": {"system": {"ws_public_url": exchange.public_ws_url},
+                                      "data": {"lookback_bars": {"1m": 300, "5m": 50}, "shared_memory": shared}}}
+                publisher = MarketDataPublisher(client, config)
+                publisher.subscribe(["BTCUSDT"], ["1m", "5m"])
+
+                subscriber_config = {"general": {"data": {"shared_memory": dict(shared, role="subscriber")}}}
+                subscriber = DataManager(client=client, config=subscriber_config)
+                subscriber.subscribe_klines("BTCUSDT", "1m")
+                subscriber.subscribe_klines("BTCUSDT", "5m")
+                subscriber.subscribe_ticker("BTCUSDT")
+                subscriber.subscribe_orderbook("BTCUSDT")
+                events = subscriber.events.subscribe(EventType)
+                try:
+                    self.assertTrue(await publisher.start())
+                    self.assertTrue(await subscriber.load_initial_data())
+                    await subscriber.start_websocket()
+                    requests = sum(exchange.get_stats()["requests"].values())
+
+                    await wait_for(lambda: any("kline.1.BTCUSDT" in topics
+                                               for topics in exchange._public_clients.values()))
+                    await exchange.set_price("BTCUSDT", 70000.0)
+                    await wait_for(lambda: subscriber.get_market_price("BTCUSDT") == 70000.0)
+                    await wait_for(lambda: subscriber.klines["BTCUSDT"]["5m"].column("close")[-1] == 70000.0)
+                    await wait_for(lambda: not subscriber.is_stale("orderbook", "BTCUSDT"))
+
+                    self.assertTrue(await subscriber.update_market_data())
+                    polled = sum(exchange.get_stats()["requests"].values()) - requests
+                    received = []
+                    while not events.queue.empty():
+                        received.append(events.queue.get_nowait().type)
+                    return publisher, subscriber, polled, received
+                finally:
+                    await subscriber.stop_websocket()
+                    await publisher.stop()
+                    await client.close()
+
+        publisher, subscriber, polled, received = asyncio.run(scenario())
+        # The subscriber never calls the exchange
+        self.assertEqual(polled, 0)
+        self.assertIsInstance(subscriber.klines["BTCUSDT"]["1m"], SharedKlineBuffer)
+        self.assertEqual(len(subscriber.get_klines("BTCUSDT", "1m")), 300)
+        self.assertEqual(subscriber.get_ticker("BTCUSDT")["lastPrice"], 70000.0)
+        book = subscriber.get_orderbook("BTCUSDT")
+        self.assertLess(book["bids"][0][0], book["asks"][0][0])
+        self.assertTrue({EventType.TICKER, EventType.BOOK_TOP, EventType.BAR_UPDATED} <= set(received))
+        self.assertGreater(publisher.stats["tickers"], 0)
+        # Stopping the publisher removes its segments
+        with self.assertRaises(FileNotFoundError):
+            SharedRecord.attach(segment_name(shared["name"], "BTCUSDT", "book"), BOOK_TOP_FIELDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
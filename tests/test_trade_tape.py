@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for trade tape ingestion and order flow aggregation
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.codec import BUY, SELL, trades_to_array
+from pybit_bot.core.trade_tape import TradeTape, VolumeDeltaBars, footprint, volume_profile
+from pybit_bot.indicators.cvd import calculate_cvd
+from pybit_bot.indicators.order_flow import calculate_cvd_from_trades, calculate_vfi_from_trades
+from pybit_bot.managers.data_manager import DataManager
+
+
+def random_trades(count, start=0, seed=1):
+    """Trades over roughly `count` seconds from `start` ms"""
+    rng = np.random.default_rng(seed)
+    return [{"T": start + int(t), "p": f"{price:.1f}", "v": f"{size:.3f}", "S": side}
+            for t, price, size, side in zip(np.sort(rng.integers(0, count * 1000, count)),
+                                             100.0 + rng.normal(size=count).cumsum(),
+                                             rng.random(count) + 0.001,
+                                             rng.choice(["Buy", "Sell"], count))]
+
+
+def trade_message(trades):
+    """A publicTrade topic message"""
+    return {"topic": "publicTrade.BTCUSDT", "type": "snapshot", "ts": trades[-1]["T"], "data": trades}
+
+
+class TestTradeTape(unittest.TestCase):
+    """Tests for trades_to_array and TradeTape"""
+
+    def test_decodes_and_wraps(self):
+        trades = trades_to_array([{"T": 2, "p": "101.5", "v": "0.2", "S": "Sell"},
+                                  {"T": 1, "p": "101", "v": "1", "S": "Buy"}])
+        self.assertEqual(trades["timestamp"].tolist(), [1, 2])
+        self.assertEqual(trades["side"].tolist(), [BUY, SELL])
+        self.assertEqual(trades.itemsize, 25)
+
+        tape = TradeTape(capacity=100)
+        batches = np.array_split(trades_to_array(random_trades(250)), 7)
+        for batch in batches:
+            tape.extend(batch)
+        everything = np.concatenate(batches)
+
+        self.assertEqual((len(tape), tape.total), (100, 250))
+        np.testing.assert_array_equal(tape.view(), everything[-100:])
+        self.assertEqual(tape.last_timestamp, everything["timestamp"][-1])
+        start, end = everything["timestamp"][180], everything["timestamp"][220]
+        expected = everything[(everything["timestamp"] >= start) & (everything["timestamp"] < end)]
+        np.testing.assert_array_equal(tape.between(start, end), expected)
+        self.assertFalse(tape.view().flags.writeable)
+
+
+class TestVolumeDelta(unittest.TestCase):
+    """Tests for VolumeDeltaBars, footprint and volume_profile"""
+
+    def test_incremental_matches_batch(self):
+        trades = trades_to_array(random_trades(600, start=30_000))
+        bars = VolumeDeltaBars(60_000, capacity=20)
+        for batch in np.array_split(trades, 37):
+            bars.update(batch)
+        df = bars.to_dataframe()
+
+        start = trades["timestamp"] - trades["timestamp"] % 60_000
+        buys = trades["side"] == BUY
+        expected_buy = pd.Series(np.where(buys, trades["size"], 0.0)).groupby(start).sum()
+        expected_sell = pd.Series(np.where(buys, 0.0, trades["size"])).groupby(start).sum()
+        np.testing.assert_allclose(df["buy_volume"].values, expected_buy.values)
+        np.testing.assert_allclose(df["delta"].values, (expected_buy - expected_sell).values)
+        self.assertEqual(df["trades"].sum(), 600)
+        # Trades started half way through the first bar
+        self.assertEqual(df["complete"].tolist(), [False] + [True] * (len(df) - 1))
+
+        # Footprint and profile add up to the bar totals
+        cells = footprint(trades, 60_000, tick_size=1.0)
+        np.testing.assert_allclose(cells.groupby(level="timestamp")["buy_volume"].sum().values, expected_buy.values)
+        profile = volume_profile(trades, tick_size=1.0)
+        self.assertAlmostEqual(profile["volume"].sum(), trades["size"].sum())
+        self.assertTrue(profile.index.is_monotonic_increasing)
+
+    def test_late_trades_and_gaps(self):
+        bars = VolumeDeltaBars(60_000, capacity=10)
+        bars.update(trades_to_array([{"T": 0, "p": "100", "v": "1", "S": "Buy"},
+                                     {"T": 61_000, "p": "100", "v": "2", "S": "Sell"}]))
+        # A late trade for the previous bar
+        bars.update(trades_to_array([{"T": 59_000, "p": "100", "v": "3", "S": "Buy"}]))
+        bars.mark_gap(150_000)
+        bars.update(trades_to_array([{"T": 170_000, "p": "100", "v": "1", "S": "Buy"},
+                                     {"T": 180_000, "p": "100", "v": "1", "S": "Buy"}]))
+
+        df = bars.to_dataframe()
+        self.assertEqual(df.index.tolist(), [0, 60_000, 120_000, 180_000])
+        self.assertEqual(df["buy_volume"].tolist(), [4.0, 0.0, 1.0, 1.0])
+        self.assertEqual(df["complete"].tolist(), [True, False, False, True])
+
+
+class TestOrderFlowIndicators(unittest.TestCase):
+    """Tests for CVD and VFI from measured volume"""
+
+    def test_measured_volume_replaces_estimate(self):
+        rng = np.random.default_rng(3)
+        opens = 100 + rng.normal(size=50).cumsum()
+        closes = opens + rng.normal(size=50)
+        df = pd.DataFrame({"open": opens, "close": closes, "high": np.maximum(opens, closes) + rng.random(50),
+                           "low": np.minimum(opens, closes) - rng.random(50), "volume": rng.random(50) * 10})
+
+        # Without trade data both match the candle-shape CVD
+        np.testing.assert_allclose(calculate_cvd_from_trades(df, 25).values, calculate_cvd(df, 25).values)
+
+        df["buy_volume"] = df["volume"]
+        df["sell_volume"] = 0.0
+        df["complete"] = True
+        self.assertEqual(calculate_vfi_from_trades(df, 10).tolist(), [1.0] * 50)
+        self.assertTrue((calculate_cvd_from_trades(df, 25) > 0).all())
+
+
+class TestTradeStream(unittest.TestCase):
+    """Tests for DataManager's trade ingestion"""
+
+    def test_stream_builds_order_flow(self):
+        async def scenario():
+            config = {"general": {"data": {"lookback_bars": {"1m": 100, "5m": 20}, "trade_buffer_size": 500}}}
+            manager = DataManager(client=None, config=config)
+            manager.subscribe_klines("BTCUSDT", "1m")
+            manager.subscribe_trades("BTCUSDT")
+            manager.subscribe_klines("BTCUSDT", "5m")
+
+            trades = random_trades(900)
+            for i in range(0, len(trades), 50):
+                manager._handle_ws_message(trade_message(trades[i:i + 50]))
+            await manager._on_reconnect()
+            return manager, trades_to_array(trades)
+
+        manager, trades = asyncio.run(scenario())
+        self.assertEqual(len(manager.get_trades("BTCUSDT")), 500)
+        self.assertEqual(len(manager.get_trades("BTCUSDT", start=int(trades["timestamp"][-10]))), 10)
+
+        one_minute = manager.get_volume_delta("BTCUSDT", "1m")
+        five_minute = manager.get_volume_delta("BTCUSDT", "5m")
+        self.assertEqual(one_minute["trades"].sum(), 900)
+        self.assertAlmostEqual(five_minute["delta"].sum(), one_minute["delta"].sum())
+        # The forming bar spans the reconnect
+        self.assertFalse(one_minute["complete"].iloc[-1])
+        self.assertTrue(manager.get_volume_delta("ETHUSDT", "1m").empty)
+
+        cells = manager.get_footprint("BTCUSDT", "1m", tick_size=0.5, bars=2)
+        self.assertEqual(sorted(set(cells.index.get_level_values("timestamp"))), one_minute.index[-2:].tolist())
+        np.testing.assert_allclose(cells.groupby(level="timestamp")["volume"].sum().values,
+                                   (one_minute["buy_volume"] + one_minute["sell_volume"]).values[-2:])
+        profile = manager.get_volume_profile("BTCUSDT", tick_size=1.0, start=int(one_minute.index[-1]))
+        self.assertAlmostEqual(profile["delta"].sum(), one_minute["delta"].iloc[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for order entry over the WebSocket trade API with REST fallback
+"""
+
+import os
+import sys
+import asyncio
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.latency import LatencyHistogram
+from pybit_bot.core.order_manager_client import OrderManagerClient
+from pybit_bot.managers.order_manager import OrderManager
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+
+async def send_with_dropped_reply(order_client, exchange, op, request):
+    """Run an order request, closing the trade socket while it is in flight"""
+    sent = exchange.get_stats()["requests"].get(f"ws:{op}", 0)
+
+    async def drop():
+        await wait_for(lambda: exchange.get_stats()["requests"].get(f"ws:{op}", 0) > sent)
+        for ws in list(exchange._trade_clients):
+            await ws.close()
+
+    exchange.latency = 0.2
+    dropper = asyncio.ensure_future(drop())
+    try:
+        return await request
+    finally:
+        await dropper
+        exchange.latency = 0.0
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests for LatencyHistogram"""
+
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(buckets_ms=(1, 10))
+        for seconds in (0.0005, 0.002, 0.003, 0.05):
+            histogram.record(seconds)
+
+        stats = histogram.get_stats()
+        self.assertEqual(stats["count"], 4)
+        self.assertEqual(stats["buckets"], {"<=1ms": 1, "<=10ms": 2, "+inf": 1})
+        self.assertAlmostEqual(stats["max_ms"], 50.0)
+        self.assertAlmostEqual(stats["p50_ms"], 3.0)
+
+
+class TestTradeWebSocket(unittest.TestCase):
+    """Tests for OrderManagerClient's trade API transport"""
+
+    def run_scenario(self, scenario):
+        async def runner():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                order_client = OrderManagerClient(client)
+                try:
+                    return await scenario(order_client, exchange)
+                finally:
+                    await order_client.stop_trade_stream()
+                    await client.close()
+        return asyncio.run(runner())
+
+    def test_orders_go_over_websocket(self):
+        async def scenario(order_client, exchange):
+            await order_client.start_trade_stream(url=exchange.trade_ws_url)
+            await wait_for(lambda: order_client.trade_ws.connected)
+
+            created = await order_client.create_order({"category": "linear", "symbol": "BTCUSDT", "side": "Buy",
+                                                       "orderType": "Limit", "qty": "0.01", "price": "49000"})
+            order_id = created["result"]["orderId"]
+            amended = await order_client.amend_order({"category": "linear", "symbol": "BTCUSDT",
+                                                      "orderId": order_id, "price": "49100"})
+            cancelled = await order_client.cancel_order("BTCUSDT", order_id=order_id)
+            missing = await order_client.cancel_order("BTCUSDT", order_id=order_id)
+            return created, amended, cancelled, missing, exchange.get_stats()["requests"], order_client.get_latency_stats()
+
+        created, amended, cancelled, missing, requests, latency = self.run_scenario(scenario)
+        self.assertEqual(created["retCode"], 0)
+        self.assertTrue(created["result"]["orderLinkId"].startswith("pb-"))
+        self.assertEqual(amended["retCode"], 0)
+        self.assertEqual(cancelled["retCode"], 0)
+        self.assertEqual(missing["retCode"], 110001)
+        self.assertEqual(requests["ws:order.create"], 1)
+        self.assertEqual(requests["ws:order.cancel"], 2)
+        self.assertNotIn("/v5/order/create", requests)
+        self.assertEqual(latency["ws"]["count"], 4)
+        self.assertEqual(latency["rest"]["count"], 0)
+
+    def test_falls_back_to_rest_when_socket_is_down(self):
+        async def scenario(order_client, exchange):
+            await order_client.start_trade_stream(url=exchange.trade_ws_url)
+            await wait_for(lambda: order_client.trade_ws.connected)
+            await order_client.stop_trade_stream()
+
+            created = await order_client.create_order({"category": "linear", "symbol": "BTCUSDT", "side": "Sell",
+                                                       "orderType": "Market", "qty": "0.01"})
+            return created, exchange.get_stats()["requests"], order_client.get_latency_stats()
+
+        created, requests, latency = self.run_scenario(scenario)
+        self.assertEqual(created["retCode"], 0)
+        self.assertEqual(requests["/v5/order/create"], 1)
+        self.assertEqual(latency["rest"]["count"], 1)
+        self.assertFalse(latency["ws_connected"])
+
+    def test_dropped_reply_falls_back_without_duplicate_order(self):
+        async def scenario(order_client, exchange):
+            await order_client.start_trade_stream(url=exchange.trade_ws_url)
+            await wait_for(lambda: order_client.trade_ws.connected)
+            created = await send_with_dropped_reply(order_client, exchange, "order.create", order_client.create_order(
+                {"category": "linear", "symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit",
+                 "qty": "0.01", "price": "49000", "orderLinkId": "drop-1"}))
+
+            # Reconnected by the trade socket itself
+            await wait_for(lambda: order_client.trade_ws.connected)
+            cancelled = await send_with_dropped_reply(order_client, exchange, "order.cancel",
+                                                      order_client.cancel_order("BTCUSDT", order_link_id="drop-1"))
+            return created, cancelled, exchange, order_client.get_latency_stats()
+
+        created, cancelled, exchange, latency = self.run_scenario(scenario)
+        self.assertEqual(latency["ws_fallbacks"], 2)
+        self.assertEqual(len(exchange.orders), 1)
+        order = next(iter(exchange.orders.values()))
+        # The REST retries were rejected, but the WebSocket requests went through
+        self.assertEqual(exchange.get_stats()["requests"]["/v5/order/create"], 1)
+        self.assertEqual((created["retCode"], created["result"]["orderId"]), (0, order["orderId"]))
+        self.assertEqual(created["result"]["orderLinkId"], "drop-1")
+        self.assertEqual((cancelled["retCode"], order["orderStatus"]), (0, "Cancelled"))
+
+
+class TestOrderManagerOrderEntry(unittest.TestCase):
+    """Tests for OrderManager's order entry through the trade API transport"""
+
+    def test_place_amend_cancel_over_websocket(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                manager = OrderManager(client, {"execution": {"order_retry_delay": 0.01}})
+                order_client = manager.get_client()
+                try:
+                    await order_client.start_trade_stream(url=exchange.trade_ws_url)
+                    await wait_for(lambda: order_client.trade_ws.connected)
+
+                    placed = await manager.place_limit_order("BTCUSDT", "Buy", 0.01, 49000)
+                    amended = await manager.amend_order("BTCUSDT", placed["orderId"], price=49100)
+                    cancelled = await manager.cancel_order("BTCUSDT", placed["orderId"])
+                    missing = await manager.cancel_order("BTCUSDT", placed["orderId"])
+
+                    # REST takes over while the socket is down
+                    await order_client.stop_trade_stream()
+                    market = await manager.place_market_order("BTCUSDT", "Sell", 0.01)
+                    return manager, exchange, placed, amended, cancelled, missing, market
+                finally:
+                    await order_client.stop_trade_stream()
+                    await client.close()
+
+        manager, exchange, placed, amended, cancelled, missing, market = asyncio.run(scenario())
+        requests = exchange.get_stats()["requests"]
+        self.assertEqual(requests["ws:order.create"], 1)
+        self.assertEqual(requests["ws:order.amend"], 1)
+        self.assertEqual(requests["ws:order.cancel"], 4)  # one per retry of the missing order
+        self.assertEqual(requests["/v5/order/create"], 1)
+        self.assertNotIn("/v5/order/cancel", requests)
+
+        order = exchange.orders[placed["orderId"]]
+        self.assertEqual((order["price"], order["timeInForce"], order["orderStatus"]), ("49100", "GTC", "Cancelled"))
+        self.assertTrue(placed["orderLinkId"].startswith("pb-"))
+        self.assertEqual(amended["orderId"], placed["orderId"])
+        self.assertEqual(cancelled["orderId"], placed["orderId"])
+        self.assertIn("error", missing)
+        self.assertEqual(manager.order_history["BTCUSDT"][0]["price"], "49100")
+        self.assertEqual(manager.order_history["BTCUSDT"][0]["status"], "Cancelled")
+        self.assertEqual(exchange.orders[market["orderId"]]["orderStatus"], "Filled")
+        self.assertEqual(manager.order_client.get_latency_stats()["ws"]["count"], 6)
+
+    def test_dropped_reply_is_reported_as_placed(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                manager = OrderManager(client, {"execution": {"order_retry_delay": 0.01}})
+                order_client = manager.get_client()
+                try:
+                    await order_client.start_trade_stream(url=exchange.trade_ws_url)
+                    await wait_for(lambda: order_client.trade_ws.connected)
+                    placed = await send_with_dropped_reply(order_client, exchange, "order.create",
+                                                           manager.place_limit_order("BTCUSDT", "Buy", 0.01, 49000))
+                    return manager, exchange, placed
+                finally:
+                    await order_client.stop_trade_stream()
+                    await client.close()
+
+        manager, exchange, placed = asyncio.run(scenario())
+        self.assertNotIn("error", placed)
+        self.assertEqual(list(exchange.orders), [placed["orderId"]])
+        self.assertIn(placed["orderId"], manager.active_orders["BTCUSDT"])
+        self.assertEqual(exchange.get_stats()["requests"]["/v5/order/create"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
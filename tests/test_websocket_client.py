@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for the public WebSocket stream and DataManager's streamed caches
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pybit_bot.core.client import BybitClient, APICredentials
+from pybit_bot.core.event_bus import EventType
+from pybit_bot.core.websocket_client import PublicWebSocket
+from pybit_bot.managers.data_manager import DataManager
+from pybit_bot.testing import MockBybitExchange
+from tests.helpers import wait_for
+
+
+def subscribed(exchange, topic):
+    """Whether the mock exchange has registered a public subscription"""
+    return any(topic in topics for topics in exchange._public_clients.values())
+
+
+class TestPublicWebSocket(unittest.TestCase):
+    """Tests for subscriptions, heartbeats and reconnects"""
+
+    def test_topics(self):
+        self.assertEqual(PublicWebSocket.kline_topic("BTCUSDT", "1m"), "kline.1.BTCUSDT")
+        self.assertEqual(PublicWebSocket.kline_topic("BTCUSDT", "1h"), "kline.60.BTCUSDT")
+        self.assertEqual(PublicWebSocket.orderbook_topic("BTCUSDT", 50), "orderbook.50.BTCUSDT")
+
+    def test_receives_and_resubscribes_after_reconnect(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                messages = []
+                reconnects = []
+                ws = PublicWebSocket(messages.append, url=exchange.public_ws_url,
+                                     backoff_base=0.01, on_reconnect=lambda: reconnects.append(1))
+                # More topics than one subscribe request may carry
+                ws.subscribe([f"tickers.SYM{i}" for i in range(12)] + ["tickers.BTCUSDT"])
+                ws.start()
+                try:
+                    await wait_for(lambda: subscribed(exchange, "tickers.BTCUSDT"))
+                    await exchange.set_price("BTCUSDT", 50100.0)
+                    await wait_for(lambda: messages)
+
+                    # Drop the connection from the server side
+                    for client_ws in list(exchange._public_clients):
+                        await client_ws.close()
+                    await wait_for(lambda: reconnects and subscribed(exchange, "tickers.BTCUSDT"))
+
+                    messages.clear()
+                    await exchange.set_price("BTCUSDT", 50200.0)
+                    await wait_for(lambda: messages)
+                    return messages[0], ws.get_stats()
+                finally:
+                    await ws.stop()
+
+        message, stats = asyncio.run(scenario())
+        self.assertEqual(message["topic"], "tickers.BTCUSDT")
+        self.assertEqual(message["data"]["lastPrice"], "50200")
+        self.assertEqual(stats["reconnects"], 1)
+        self.assertEqual(stats["topics"], 13)
+
+    def test_heartbeat_keeps_idle_connection_open(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                ws = PublicWebSocket(lambda message: None, url=exchange.public_ws_url, ping_interval=0.05)
+                ws.start()
+                try:
+                    await wait_for(lambda: ws.connected)
+                    await asyncio.sleep(0.3)
+                    return ws.connected, ws.get_stats()
+                finally:
+                    await ws.stop()
+
+        connected, stats = asyncio.run(scenario())
+        self.assertTrue(connected)
+        self.assertEqual(stats["reconnects"], 0)
+
+    def test_gives_up_after_max_attempts(self):
+        async def scenario():
+            ws = PublicWebSocket(lambda message: None, url="ws://127.0.0.1:9/v5/public/linear",
+                                 max_reconnect_attempts=2, backoff_base=0.01)
+            await asyncio.wait_for(ws.run(), 5)
+            return ws.get_stats()
+
+        stats = asyncio.run(scenario())
+        self.assertEqual(stats["failed_connects"], 3)
+        self.assertFalse(stats["connected"])
+
+
+class TestDataManagerStream(unittest.TestCase):
+    """Tests for DataManager caches fed by the public stream"""
+
+    def test_stream_updates_caches(self):
+        async def scenario():
+            async with MockBybitExchange(seed=1) as exchange:
+                config = {"general": {"system": {"ws_public_url": exchange.public_ws_url},
+                                      "data": {"orderbook_depth": 50}}}
+                manager = DataManager(client=None, config=config)
+                manager.subscribe_klines("BTCUSDT", "1m")
+                manager.subscribe_ticker("BTCUSDT")
+                manager.subscribe_orderbook("BTCUSDT")
+                manager.subscribe_trades("BTCUSDT")
+
+                await manager.start_websocket()
+                try:
+                    await wait_for(lambda: manager.orderbooks["BTCUSDT"].synced and subscribed(exchange, "kline.1.BTCUSDT"))
+                    await exchange.set_price("BTCUSDT", 50321.0)
+                    await wait_for(lambda: manager.tickers["BTCUSDT"] and manager.recent_trades["BTCUSDT"]
+                                   and not manager.klines["BTCUSDT"]["1m"].empty
+                                   and manager.orderbooks["BTCUSDT"].best_bid == 50321.0)
+                    # REST polling is skipped while streaming
+                    self.assertTrue(await manager.update_market_data())
+                    return manager
+                finally:
+                    await manager.stop_websocket()
+
+        manager = asyncio.run(scenario())
+        self.assertFalse(manager.ws_connected)
+        self.assertEqual(manager.get_market_price("BTCUSDT"), 50321.0)
+        book = manager.get_orderbook("BTCUSDT")
+        self.assertEqual(book["asks"][0][0], 50321.1)
+        self.assertEqual([level[0] for level in book["bids"]], sorted((level[0] for level in book["bids"]), reverse=True))
+        self.assertEqual(manager.recent_trades["BTCUSDT"].view(1)[0]["price"], 50321.0)
+        self.assertEqual(manager.get_klines("BTCUSDT", "1m")["close"].iloc[-1], 50321.0)
+
+    def run_with_stale_klines(self, scenario, missing_bars=12):
+        """Run a scenario with 1m klines that stop `missing_bars` bars ago"""
+        async def runner():
+            async with MockBybitExchange(seed=1) as exchange:
+                client = BybitClient(APICredentials(api_key="key", api_secret="secret", testnet=True),
+                                     base_url=exchange.base_url)
+                config = {"general": {"system": {"ws_public_url": exchange.public_ws_url},
+                                      "data": {"lookback_bars": {"1m": 100}}}}
+                manager = DataManager(client=client, config=config)
+                manager.subscribe_klines("BTCUSDT", "1m")
+
+                now = exchange._now_ms()
+                stale = await client.get_klines_array("linear", "BTCUSDT", "1m", limit=50,
+                                                      end=now - missing_bars * 60_000)
+                manager.klines["BTCUSDT"]["1m"].extend(stale)
+
+                repaired = []
+                manager.add_event_handler("data_repaired", lambda **event: repaired.append(event))
+                await manager.start_websocket()
+                try:
+                    await scenario(manager, exchange)
+                    await wait_for(lambda: repaired)
+                    return manager, repaired
+                finally:
+                    await manager.stop_websocket()
+                    await client.close()
+        return asyncio.run(runner())
+
+    def assert_contiguous(self, manager):
+        index = manager.klines["BTCUSDT"]["1m"].column("timestamp")
+        self.assertTrue(np.all(np.diff(index) == 60_000))
+        self.assertEqual(manager.kline_gaps, {})
+
+    def test_backfills_gap_on_reconnect(self):
+        async def scenario(manager, exchange):
+            await wait_for(lambda: manager.ws_connected)
+            for client_ws in list(exchange._public_clients):
+                await client_ws.close()
+
+        manager, repaired = self.run_with_stale_klines(scenario)
+        self.assert_contiguous(manager)
+        self.assertEqual(len(repaired), 1)
+        self.assertIn(repaired[0]["bars"], (12, 13))
+        self.assertEqual(repaired[0]["symbol"], "BTCUSDT")
+
+    def test_backfills_gap_seen_in_live_bars(self):
+        async def scenario(manager, exchange):
+            await wait_for(lambda: subscribed(exchange, "kline.1.BTCUSDT"))
+            await exchange.set_price("BTCUSDT", 50500.0)
+
+        manager, repaired = self.run_with_stale_klines(scenario, missing_bars=300)
+        self.assert_contiguous(manager)
+        # Limited to the lookback
+        self.assertEqual(len(manager.klines["BTCUSDT"]["1m"]), 100)
+        self.assertGreaterEqual(repaired[0]["bars"], 300)
+
+    def test_bars_received_during_backfill_are_replayed(self):
+        now = int(time.time() * 1000)
+        current = now - now % 60_000
+
+        def bar(start, close, confirm=False):
+            return {"start": start, "open": "100", "high": "110", "low": "90", "close": str(close),
+                    "volume": "1", "turnover": "100", "confirm": confirm}
+
+        def message(*bars):
+            return {"topic": "kline.1.BTCUSDT", "type": "snapshot", "data": list(bars)}
+
+        class SlowClient:
+            """Serves the gap over REST once released"""
+            release = None
+
+            async def iter_klines(self, category, symbol, interval, start, end, concurrency=1):
+                await self.release.wait()
+                starts = np.arange(start, current + 1, 60_000, dtype=np.float64)
+                yield np.column_stack([starts] + [np.full(len(starts), 100.0)] * 6)
+
+        async def scenario():
+            client = SlowClient()
+            client.release = asyncio.Event()
+            manager = DataManager(client=client, config={"general": {"data": {"lookback_bars": {"1m": 100}}}})
+            manager.subscribe_klines("BTCUSDT", "1m")
+            manager.klines["BTCUSDT"]["1m"].upsert((current - 10 * 60_000.0,) + (100.0,) * 6)
+            closed = manager.events.subscribe({EventType.BAR_CLOSED})
+
+            # The gap starts a backfill; the bar's final update and confirm arrive before it ends
+            manager._handle_ws_message(message(bar(current, 101)))
+            manager._handle_ws_message(message(bar(current, 102)))
+            manager._handle_ws_message(message(bar(current, 103, confirm=True)))
+            self.assertEqual(manager.klines["BTCUSDT"]["1m"].last_timestamp, current - 10 * 60_000)
+
+            client.release.set()
+            await manager._backfill_tasks[("BTCUSDT", "1m")]
+            events = []
+            while not closed.queue.empty():
+                events.append(closed.queue.get_nowait())
+            return manager, events
+
+        manager, events = asyncio.run(scenario())
+        self.assert_contiguous(manager)
+        self.assertEqual(manager.get_klines("BTCUSDT", "1m")["close"].iloc[-1], 103.0)
+        self.assertEqual(events[-1].timestamp, current)
+        self.assertEqual(events[-1].data["close"], 103.0)
+        self.assertEqual((manager._backfill_tasks, manager._queued_klines), ({}, {}))
+
+    def test_reconnect_does_not_wait_for_backfill(self):
+        now = int(time.time() * 1000)
+        current = now - now % 60_000
+
+        class BlockedClient:
+            """Never answers, like a REST backfill slower than the heartbeat"""
+
+            async def iter_klines(self, category, symbol, interval, start, end, concurrency=1):
+                await asyncio.Event().wait()
+                yield
+
+        async def scenario():
+            manager = DataManager(client=BlockedClient(), config={"general": {"data": {"lookback_bars": {"1m": 100}}}})
+            manager.subscribe_klines("BTCUSDT", "1m")
+            manager.klines["BTCUSDT"]["1m"].upsert((current - 10 * 60_000.0,) + (100.0,) * 6)
+
+            await asyncio.wait_for(manager._on_reconnect(), timeout=1.0)
+            task = manager._backfill_tasks[("BTCUSDT", "1m")]
+            manager._handle_ws_message({"topic": "kline.1.BTCUSDT", "type": "snapshot",
+                                        "data": [{"start": current, "open": "100", "high": "110", "low": "90",
+                                                  "close": "101", "volume": "1", "turnover": "100"}]})
+            await asyncio.sleep(0.05)
+            pending, queued = not task.done(), len(manager._queued_klines[("BTCUSDT", "1m")])
+            await manager.stop_websocket()
+            return pending, queued
+
+        pending, queued = asyncio.run(scenario())
+        self.assertTrue(pending)
+        # Held back until the backfill closes the gap
+        self.assertEqual(queued, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()